@@ -2,7 +2,7 @@ import os
 import logging
 
 from celery import Celery
-from celery.signals import worker_shutting_down
+from celery.signals import task_postrun, worker_shutting_down
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +31,22 @@ def celery_shutdown_handler(sender, **kwargs):
     graceful_shutdown_handler()
 
 
+@task_postrun.connect
+def task_postrun_handler(sender, args=None, **kwargs):
+    """
+    Release the in-flight marker of tasks enqueued through
+    DebouncedTaskDispatcher.
+    """
+    from insights.core.dispatch import DebouncedTaskDispatcher
+
+    try:
+        DebouncedTaskDispatcher().release(sender.name, args or ())
+    except Exception as error:
+        logger.warning(
+            "[ task_postrun_handler ] Failed to release %s: %s", sender.name, error
+        )
+
+
 # Note: Signal handlers are set up in the shutdown module when needed
 # We only set up the Celery worker shutdown handler here
 
@@ -55,4 +71,8 @@ app.conf.beat_schedule = {
         "task": "insights.metrics.conversations.tasks.timeout_reports",
         "schedule": 30,  # 30 seconds
     },
+    "refresh-rooms-rollups": {
+        "task": "insights.human_support.tasks.refresh_rooms_rollups",
+        "schedule": (60 * 15),  # 15 minutes
+    },
 }
@@ -0,0 +1,147 @@
+import logging
+import time
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Generic, TypeVar
+
+from django.conf import settings
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+
+T = TypeVar("T")
+
+
+def calculate_increase_percentage(past_value: float, current_value: float) -> float:
+    if past_value == 0:
+        return 100 if current_value > 0 else 0
+
+    return round(((current_value - past_value) / past_value) * 100, 2)
+
+
+class PeriodComparisonTimeout(TimeoutError):
+    """
+    Raised when the compared windows are not fetched within the timeout.
+    """
+
+
+@dataclass(frozen=True)
+class ComparisonWindow:
+    start: datetime
+    end: datetime
+
+    def get_previous(self) -> "ComparisonWindow":
+        """
+        The window of the same number of days right before this one.
+        """
+        period = timedelta(days=(self.end - self.start).days)
+
+        return ComparisonWindow(start=self.start - period, end=self.end - period)
+
+
+@dataclass(frozen=True)
+class WindowResult(Generic[T]):
+    window: ComparisonWindow
+    value: T
+    elapsed: float
+
+
+@dataclass(frozen=True)
+class PeriodComparison(Generic[T]):
+    current: WindowResult[T]
+    previous: WindowResult[T]
+
+    @property
+    def timings(self) -> dict[str, float]:
+        return {"current": self.current.elapsed, "previous": self.previous.elapsed}
+
+    def get_delta(self, key: str) -> float:
+        return self.current.value.get(key) - self.previous.value.get(key)
+
+    def get_increase_percentage(self, key: str) -> float:
+        """
+        Percentage change of a value from the previous to the current window.
+        """
+        return calculate_increase_percentage(
+            self.previous.value.get(key), self.current.value.get(key)
+        )
+
+
+class PeriodComparisonExecutor:
+    """
+    Fetch a window and the window right before it concurrently.
+
+    Both fetches share the same timeout. If one of them fails or the timeout
+    is reached, the other one is cancelled if it has not started yet and is
+    not waited for otherwise.
+    """
+
+    def __init__(self, timeout: float | None = None):
+        self.timeout = (
+            timeout if timeout is not None else settings.PERIOD_COMPARISON_TIMEOUT
+        )
+
+    def _run(
+        self, fetch: Callable[[datetime, datetime], T], window: ComparisonWindow
+    ) -> WindowResult[T]:
+        started_at = time.monotonic()
+
+        try:
+            value = fetch(window.start, window.end)
+        finally:
+            # Worker threads get their own database connection
+            connection.close()
+
+        return WindowResult(
+            window=window, value=value, elapsed=time.monotonic() - started_at
+        )
+
+    def execute(
+        self,
+        fetch: Callable[[datetime, datetime], T],
+        start_date: datetime,
+        end_date: datetime,
+        name: str = "",
+    ) -> PeriodComparison[T]:
+        current_window = ComparisonWindow(start=start_date, end=end_date)
+        previous_window = current_window.get_previous()
+
+        executor = ThreadPoolExecutor(max_workers=2)
+
+        try:
+            current_future = executor.submit(self._run, fetch, current_window)
+            previous_future = executor.submit(self._run, fetch, previous_window)
+
+            done, not_done = wait(
+                [current_future, previous_future],
+                timeout=self.timeout,
+                return_when=FIRST_EXCEPTION,
+            )
+
+            for future in done:
+                if future.exception() is not None:
+                    raise future.exception()
+
+            if not_done:
+                raise PeriodComparisonTimeout(
+                    "Period comparison %s did not finish in %s seconds"
+                    % (name, self.timeout)
+                )
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        comparison = PeriodComparison(
+            current=current_future.result(), previous=previous_future.result()
+        )
+
+        logger.info(
+            "[PeriodComparisonExecutor] %s current window took %.3fs, "
+            "previous window took %.3fs",
+            name,
+            comparison.current.elapsed,
+            comparison.previous.elapsed,
+        )
+
+        return comparison
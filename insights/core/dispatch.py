@@ -0,0 +1,127 @@
+import logging
+from typing import Callable, Iterable
+
+from celery import Task
+from django.conf import settings
+
+from insights.sources.cache import CacheClient
+
+logger = logging.getLogger(__name__)
+
+
+class DebouncedTaskDispatcher:
+    """
+    Enqueue side-effect Celery tasks at most once per (task, args) and
+    debounce window.
+
+    Windows come from TASK_DISPATCH_DEBOUNCE_WINDOWS, by task name. A
+    dispatch is suppressed while another one of the same (task, args) is in
+    the window, or while it is still queued or running: the in-flight marker
+    is released by the worker when the task finishes, or expires after
+    TASK_DISPATCH_IN_FLIGHT_TTL seconds.
+
+    Published and suppressed dispatches are counted, by task, in the
+    `task_dispatch_stats` Redis hash.
+    """
+
+    key_prefix = "task_dispatch"
+    stats_key = "task_dispatch_stats"
+
+    def __init__(self, cache_client: CacheClient | None = None):
+        self.cache_client = cache_client or CacheClient()
+
+    @classmethod
+    def get_key(cls, kind: str, task_name: str, args: Iterable) -> str:
+        return ":".join([cls.key_prefix, kind, task_name, *map(str, args)])
+
+    @staticmethod
+    def get_window(task_name: str) -> int:
+        return settings.TASK_DISPATCH_DEBOUNCE_WINDOWS.get(task_name, 0)
+
+    def _count(self, task_name: str, outcome: str) -> None:
+        try:
+            self.cache_client.hincrby(self.stats_key, f"{task_name}:{outcome}")
+        except Exception as error:
+            logger.warning(
+                "[DebouncedTaskDispatcher] Failed to count %s dispatch of %s: %s",
+                outcome,
+                task_name,
+                error,
+            )
+
+    def _suppress(self, task_name: str, args: Iterable, reason: str) -> bool:
+        logger.debug(
+            "[DebouncedTaskDispatcher] Suppressed %s %s: %s", task_name, args, reason
+        )
+        self._count(task_name, f"suppressed_{reason}")
+
+        return False
+
+    def dispatch(
+        self,
+        task: Task,
+        args: Iterable = (),
+        should_dispatch: Callable[[], bool] | None = None,
+        **options,
+    ) -> bool:
+        """
+        Enqueue the task unless it is debounced or in flight. should_dispatch
+        is only called when the task would be enqueued, so callers can skip
+        the queries that decide whether it is needed.
+
+        Returns whether the task was enqueued.
+        """
+        task_name = task.name
+        window = self.get_window(task_name)
+
+        if window:
+            in_flight_key = self.get_key("in_flight", task_name, args)
+
+            if self.cache_client.get(in_flight_key) is not None:
+                return self._suppress(task_name, args, "in_flight")
+
+            if not self.cache_client.set(
+                self.get_key("debounce", task_name, args), "1", ex=window, nx=True
+            ):
+                return self._suppress(task_name, args, "debounced")
+
+        if should_dispatch is not None and not should_dispatch():
+            return False
+
+        if window:
+            self.cache_client.set(
+                in_flight_key, "1", ex=settings.TASK_DISPATCH_IN_FLIGHT_TTL
+            )
+
+        try:
+            task.apply_async(args=args, **options)
+        except Exception:
+            if window:
+                self.cache_client.delete(in_flight_key)
+            raise
+
+        self._count(task_name, "published")
+
+        return True
+
+    def release(self, task_name: str, args: Iterable) -> None:
+        """
+        Clear the in-flight marker of a finished task.
+        """
+        if self.get_window(task_name):
+            self.cache_client.delete(self.get_key("in_flight", task_name, args))
+
+    def get_stats(self) -> dict[str, dict[str, int]]:
+        """
+        Dispatch counters by task name and outcome.
+        """
+        stats: dict[str, dict[str, int]] = {}
+
+        for field, value in self.cache_client.hgetall(self.stats_key).items():
+            if isinstance(field, bytes):
+                field = field.decode()
+
+            task_name, outcome = field.rsplit(":", 1)
+            stats.setdefault(task_name, {})[outcome] = int(value)
+
+        return stats
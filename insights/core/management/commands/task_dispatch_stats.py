@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from insights.core.dispatch import DebouncedTaskDispatcher
+
+
+class Command(BaseCommand):
+    """
+    Published and suppressed dispatches of the debounced side-effect tasks.
+    """
+
+    def handle(self, *args, **options):
+        for task_name, outcomes in sorted(
+            DebouncedTaskDispatcher().get_stats().items()
+        ):
+            self.stdout.write(task_name)
+
+            for outcome, count in sorted(outcomes.items()):
+                self.stdout.write(f"  {outcome}: {count}")
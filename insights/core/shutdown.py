@@ -27,6 +27,7 @@ def graceful_shutdown_handler(timeout_seconds=30):
         timeout_seconds: Maximum time to wait for graceful shutdown
     """
     # Import Django models inside the function to avoid AppRegistryNotReady error
+    from insights.reports.cancellation import ReportCancellationToken
     from insights.reports.models import Report
     from insights.reports.choices import ReportStatus
 
@@ -85,6 +86,9 @@ def graceful_shutdown_handler(timeout_seconds=30):
                     config["interrupted_on_host"] = host
                     interrupted_report.config = config
                     interrupted_report.save(update_fields=["config"])
+                    ReportCancellationToken.cancel(
+                        interrupted_report.uuid, "interrupted"
+                    )
 
                 logger.info(
                     "[ shutdown_handler ] Successfully updated %s reports",
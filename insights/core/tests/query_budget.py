@@ -0,0 +1,69 @@
+from typing import Callable
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+class QueryBudgetTestMixin:
+    """
+    Assertions on the number of database queries an endpoint runs.
+
+    assertQueryBudget fails when a call runs more queries than its budget,
+    listing the queries. assertConstantQueries also fails when the number of
+    queries grows with the number of objects listed, catching N+1 queries
+    that a budget measured on small fixtures would miss.
+    """
+
+    def _format_queries(self, context: CaptureQueriesContext) -> str:
+        return "\n".join(
+            f"{index}. {query['sql']}"
+            for index, query in enumerate(context.captured_queries, start=1)
+        )
+
+    def assertQueryBudget(self, budget: int, func: Callable, *args, **kwargs):
+        with CaptureQueriesContext(connection) as context:
+            result = func(*args, **kwargs)
+
+        if len(context) > budget:
+            self.fail(
+                "%d queries executed, budget is %d\n%s"
+                % (len(context), budget, self._format_queries(context))
+            )
+
+        return result
+
+    def assertConstantQueries(
+        self,
+        budget: int,
+        func: Callable,
+        create_objects: Callable[[int], None],
+        sizes: tuple[int, int] = (1, 5),
+    ):
+        """
+        Call func after creating sizes[0] objects and again after creating
+        sizes[1] more. Both calls must be within the budget and run the same
+        number of queries.
+        """
+        counts = []
+        contexts = []
+
+        for size in sizes:
+            create_objects(size)
+
+            with CaptureQueriesContext(connection) as context:
+                func()
+
+            counts.append(len(context))
+            contexts.append(context)
+
+            if len(context) > budget:
+                self.fail(
+                    "%d queries executed with %d more objects, budget is %d\n%s"
+                    % (len(context), size, budget, self._format_queries(context))
+                )
+
+        if len(set(counts)) > 1:
+            self.fail(
+                "Queries grow with the number of objects: %s\n%s"
+                % (counts, self._format_queries(contexts[-1]))
+            )
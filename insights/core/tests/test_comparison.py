@@ -0,0 +1,78 @@
+import threading
+from datetime import datetime, timedelta
+
+from django.test import TestCase
+
+from insights.core.comparison import (
+    ComparisonWindow,
+    PeriodComparisonExecutor,
+    PeriodComparisonTimeout,
+)
+
+
+class TestComparisonWindow(TestCase):
+    def test_get_previous(self):
+        window = ComparisonWindow(
+            start=datetime(2025, 1, 11), end=datetime(2025, 1, 20, 23, 59)
+        )
+
+        self.assertEqual(
+            window.get_previous(),
+            ComparisonWindow(
+                start=datetime(2025, 1, 2), end=datetime(2025, 1, 11, 23, 59)
+            ),
+        )
+
+
+class TestPeriodComparisonExecutor(TestCase):
+    def setUp(self):
+        self.start_date = datetime(2025, 1, 11)
+        self.end_date = datetime(2025, 1, 20)
+
+    def test_fetches_both_windows_concurrently(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fetch(start_date, end_date):
+            # Both windows must be in flight at the same time to pass
+            barrier.wait()
+            return {"total": 150 if start_date == self.start_date else 100}
+
+        comparison = PeriodComparisonExecutor(timeout=5).execute(
+            fetch, self.start_date, self.end_date
+        )
+
+        self.assertEqual(comparison.current.value, {"total": 150})
+        self.assertEqual(comparison.previous.value, {"total": 100})
+        self.assertEqual(
+            comparison.previous.window.start, self.start_date - timedelta(days=9)
+        )
+        self.assertEqual(comparison.get_delta("total"), 50)
+        self.assertEqual(comparison.get_increase_percentage("total"), 50.0)
+        self.assertEqual(set(comparison.timings), {"current", "previous"})
+
+    def test_raises_the_first_error(self):
+        def fetch(start_date, end_date):
+            if start_date != self.start_date:
+                raise ValueError("Error")
+
+            return {}
+
+        with self.assertRaisesMessage(ValueError, "Error"):
+            PeriodComparisonExecutor(timeout=5).execute(
+                fetch, self.start_date, self.end_date
+            )
+
+    def test_raises_on_timeout(self):
+        release = threading.Event()
+
+        def fetch(start_date, end_date):
+            release.wait(5)
+            return {}
+
+        try:
+            with self.assertRaises(PeriodComparisonTimeout):
+                PeriodComparisonExecutor(timeout=0.1).execute(
+                    fetch, self.start_date, self.end_date
+                )
+        finally:
+            release.set()
@@ -0,0 +1,116 @@
+from io import StringIO
+from unittest.mock import Mock
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from insights.core.dispatch import DebouncedTaskDispatcher
+from insights.sources.cache import CacheClient
+
+
+TASK_NAME = "insights.tests.side_effect"
+
+
+def build_task(name: str = TASK_NAME) -> Mock:
+    task = Mock()
+    task.name = name
+
+    return task
+
+
+@override_settings(TASK_DISPATCH_DEBOUNCE_WINDOWS={TASK_NAME: 60})
+class TestDebouncedTaskDispatcher(TestCase):
+    def setUp(self):
+        self.dispatcher = DebouncedTaskDispatcher()
+        self.task = build_task()
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_enqueues_once_per_window(self):
+        self.assertTrue(self.dispatcher.dispatch(self.task, args=("project",)))
+        self.dispatcher.release(TASK_NAME, ("project",))
+        self.assertFalse(self.dispatcher.dispatch(self.task, args=("project",)))
+
+        self.task.apply_async.assert_called_once_with(args=("project",))
+
+    def test_debounces_by_args(self):
+        self.dispatcher.dispatch(self.task, args=("project-1",))
+        self.dispatcher.dispatch(self.task, args=("project-2",))
+
+        self.assertEqual(self.task.apply_async.call_count, 2)
+
+    def test_suppresses_in_flight_task_after_window(self):
+        self.dispatcher.dispatch(self.task, args=("project",))
+        CacheClient().delete(
+            DebouncedTaskDispatcher.get_key("debounce", TASK_NAME, ["project"])
+        )
+
+        self.assertFalse(self.dispatcher.dispatch(self.task, args=("project",)))
+
+        # The worker finished the task
+        self.dispatcher.release(TASK_NAME, ["project"])
+        CacheClient().delete(
+            DebouncedTaskDispatcher.get_key("debounce", TASK_NAME, ["project"])
+        )
+
+        self.assertTrue(self.dispatcher.dispatch(self.task, args=("project",)))
+
+    def test_skips_should_dispatch_while_debounced(self):
+        should_dispatch = Mock(return_value=False)
+
+        self.assertFalse(
+            self.dispatcher.dispatch(
+                self.task, args=("project",), should_dispatch=should_dispatch
+            )
+        )
+        self.dispatcher.dispatch(
+            self.task, args=("project",), should_dispatch=should_dispatch
+        )
+
+        should_dispatch.assert_called_once()
+        self.task.apply_async.assert_not_called()
+
+    def test_does_not_debounce_tasks_without_window(self):
+        task = build_task("insights.tests.other")
+
+        self.dispatcher.dispatch(task, args=("project",))
+        self.dispatcher.dispatch(task, args=("project",))
+
+        self.assertEqual(task.apply_async.call_count, 2)
+
+    def test_releases_in_flight_marker_when_publish_fails(self):
+        self.task.apply_async.side_effect = ConnectionError("broker down")
+
+        with self.assertRaises(ConnectionError):
+            self.dispatcher.dispatch(self.task, args=("project",))
+
+        self.assertIsNone(
+            CacheClient().get(
+                DebouncedTaskDispatcher.get_key("in_flight", TASK_NAME, ["project"])
+            )
+        )
+
+    def test_counts_dispatches(self):
+        self.dispatcher.dispatch(self.task, args=("project",))
+        self.dispatcher.dispatch(self.task, args=("project",))
+        self.dispatcher.release(TASK_NAME, ["project"])
+        self.dispatcher.dispatch(self.task, args=("project",))
+
+        self.assertEqual(
+            self.dispatcher.get_stats(),
+            {
+                TASK_NAME: {
+                    "published": 1,
+                    "suppressed_in_flight": 1,
+                    "suppressed_debounced": 1,
+                }
+            },
+        )
+
+        out = StringIO()
+        call_command("task_dispatch_stats", stdout=out)
+
+        self.assertIn(f"{TASK_NAME}\n  published: 1\n", out.getvalue())
@@ -0,0 +1,93 @@
+from typing import Callable
+
+from django.db import connection
+from django.db.models.query import QuerySet
+from django.test import TestCase
+
+from insights.dashboards.models import Dashboard
+from insights.metrics.conversations.tasks import (
+    get_generating_reports,
+    get_next_reports,
+)
+from insights.projects.models import Project
+from insights.reports.choices import ReportStatus
+from insights.reports.models import Report
+
+
+WABA_ID = "1234567890"
+HOST = "host-1"
+
+# Hot queries that must be served by an index, by name
+HOT_QUERIES: dict[str, Callable[[Project], QuerySet]] = {
+    "dashboard_waba_of_project": lambda project: Dashboard.objects.filter(
+        project=project,
+        config__is_whatsapp_integration=True,
+        config__waba_id=WABA_ID,
+    ),
+    "dashboard_waba_of_project_uuid": lambda project: Dashboard.objects.filter(
+        project__uuid=project.uuid,
+        config__is_whatsapp_integration=True,
+        config__waba_id=WABA_ID,
+    ),
+    "dashboard_waba": lambda project: Dashboard.objects.filter(
+        config__is_whatsapp_integration=True,
+        config__waba_id=WABA_ID,
+    ),
+    "generating_reports": lambda project: get_generating_reports(),
+    "next_reports": lambda project: get_next_reports(HOST),
+}
+
+
+class TestHotQueryPlans(TestCase):
+    """
+    Runs EXPLAIN on the registered hot queries, with sequential scans
+    disabled, and fails when any of them still needs one: PostgreSQL only
+    falls back to a sequential scan then when no index can serve the query.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.project = Project.objects.create(name="Test Project")
+
+        for index in range(20):
+            project = Project.objects.create(name=f"Project {index}")
+            Dashboard.objects.create(
+                project=project,
+                name=f"Dashboard {index}",
+                config={"is_whatsapp_integration": True, "waba_id": str(index)},
+            )
+            Dashboard.objects.create(project=project, name=f"Other {index}")
+
+            for status in ReportStatus.values:
+                Report.objects.create(
+                    project=project,
+                    source="CONVERSATIONS_DASHBOARD",
+                    format="CSV",
+                    status=status,
+                )
+
+        Report.objects.create(
+            project=cls.project,
+            source="CONVERSATIONS_DASHBOARD",
+            format="CSV",
+            status=ReportStatus.IN_PROGRESS,
+            config={"interrupted": True, "interrupted_on_host": "host-2"},
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE dashboards_dashboard, reports_report;")
+
+    def setUp(self):
+        with connection.cursor() as cursor:
+            cursor.execute("SET enable_seqscan = off;")
+
+    def tearDown(self):
+        with connection.cursor() as cursor:
+            cursor.execute("RESET enable_seqscan;")
+
+    def test_hot_queries_do_not_use_sequential_scans(self):
+        for name, get_queryset in HOT_QUERIES.items():
+            with self.subTest(query=name):
+                plan = get_queryset(self.project).explain()
+
+                self.assertNotIn("Seq Scan", plan, f"{name} plan:\n{plan}")
@@ -1,8 +1,11 @@
+import json
 import logging
 from uuid import UUID
 
 from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db.models import Q
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import mixins, status, viewsets
@@ -13,6 +16,7 @@ from rest_framework.response import Response
 from weni.feature_flags.shortcuts import is_feature_active_for_attributes
 
 from insights.authentication.permissions import ProjectAuthPermission
+from insights.core.dispatch import DebouncedTaskDispatcher
 from insights.core.filters import get_filters_from_query_params
 from insights.core.urls.proxy_pagination import get_cursor_based_pagination_urls
 from insights.dashboards.filters import DashboardFilter
@@ -31,7 +35,10 @@ from insights.dashboards.serializers import (
 from insights.dashboards.usecases import dashboard_filters
 from insights.dashboards.usecases.flows_dashboard_creation import CreateFlowsDashboard
 from insights.dashboards.utils import DefaultPagination
-from insights.human_support.services import HumanSupportDashboardService
+from insights.human_support.services import (
+    SNAPSHOT_SECTIONS,
+    HumanSupportDashboardService,
+)
 from insights.metrics.meta.tasks import (
     check_dashboards_marketing_messages_status_for_project,
 )
@@ -43,10 +50,17 @@ from insights.projects.tasks import (
 )
 from insights.projects.usecases.dashboard_dto import FlowsDashboardCreationDTO
 from insights.sources.contacts.clients import FlowsContactsRestClient
+from insights.sources.contacts.exceptions import (
+    FlowsContactsSearchError,
+    InvalidContactsCursor,
+)
 from insights.sources.custom_status.client import CustomStatusRESTClient
 from insights.sources.services import DataSourceService
 from insights.widgets.models import Report, Widget
-from insights.widgets.usecases.get_source_data import get_source_data_from_widget
+from insights.widgets.usecases.get_source_data import (
+    get_source_data_from_widget,
+    get_source_data_from_widgets,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -116,8 +130,8 @@ class DashboardViewSet(
 
         return queryset
 
-    def _check_marketing_messages_status(self, project_uuid: UUID):
-        should_check_marketing_messages_status = Dashboard.objects.filter(
+    def _should_check_marketing_messages_status(self, project_uuid: UUID) -> bool:
+        return Dashboard.objects.filter(
             Q(project__uuid=project_uuid)
             & Q(config__is_whatsapp_integration=True)
             & (
@@ -126,8 +140,14 @@ class DashboardViewSet(
             ),
         ).exists()
 
-        if should_check_marketing_messages_status:
-            check_dashboards_marketing_messages_status_for_project.delay(project_uuid)
+    def _check_marketing_messages_status(self, project_uuid: UUID):
+        DebouncedTaskDispatcher().dispatch(
+            check_dashboards_marketing_messages_status_for_project,
+            args=(project_uuid,),
+            should_dispatch=lambda: self._should_check_marketing_messages_status(
+                project_uuid
+            ),
+        )
 
     def list(self, request, *args, **kwargs):
         project = None
@@ -137,15 +157,22 @@ class DashboardViewSet(
             is_indexer_active = is_project_indexer_active(project)
             is_nexus_multi_agents_active = project.is_nexus_multi_agents_active
 
+            dispatcher = DebouncedTaskDispatcher()
+
             if not is_nexus_multi_agents_active:
-                check_nexus_multi_agents_status.delay(project_uuid)
+                dispatcher.dispatch(
+                    check_nexus_multi_agents_status, args=(project_uuid,)
+                )
 
             if (
                 settings.CONVERSATIONS_DASHBOARD_REQUIRES_INDEXER_ACTIVATION
                 and is_nexus_multi_agents_active
                 and not is_indexer_active
             ):
-                handle_project_created_with_inline_agent_switch.delay(project_uuid)
+                dispatcher.dispatch(
+                    handle_project_created_with_inline_agent_switch,
+                    args=(project_uuid,),
+                )
 
             self._check_marketing_messages_status(project_uuid)
 
@@ -210,7 +237,11 @@ class DashboardViewSet(
     def list_widgets(self, request, pk=None):
         dashboard = self.get_object()
 
-        widgets = Widget.objects.filter(dashboard=dashboard).order_by("created_on")
+        widgets = (
+            Widget.objects.filter(dashboard=dashboard)
+            .select_related("dashboard", "report")
+            .order_by("created_on")
+        )
 
         paginator = DefaultPagination()
         result_page = paginator.paginate_queryset(widgets, request)
@@ -277,6 +308,113 @@ class DashboardViewSet(
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+    @action(detail=True, methods=["get"], url_path="widgets/data")
+    def get_widgets_data(self, request, pk=None):
+        """
+        Data of many widgets, streamed as one JSON line per widget
+        ({"widget", "status", "data" or "detail"}) as each one is loaded.
+        """
+        dashboard = self.get_object()
+        filters = dict(request.query_params)
+        filters.pop("project", None)
+        is_live = filters.pop("is_live", ["false"])[0].lower() in ("true", "1")
+
+        widget_uuids = list(
+            dict.fromkeys(
+                widget_uuid.strip()
+                for value in filters.pop("widgets", [])
+                for widget_uuid in value.split(",")
+                if widget_uuid.strip()
+            )
+        )
+
+        if not widget_uuids:
+            return Response(
+                {"detail": "widgets is required"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if len(widget_uuids) > settings.WIDGET_DATA_BATCH_MAX_WIDGETS:
+            return Response(
+                {
+                    "detail": f"at most {settings.WIDGET_DATA_BATCH_MAX_WIDGETS} widgets are allowed"
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            for widget_uuid in widget_uuids:
+                UUID(widget_uuid)
+        except ValueError:
+            return Response(
+                {"detail": f"invalid widget: {widget_uuid}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        widgets = Widget.objects.filter(
+            dashboard=dashboard, uuid__in=widget_uuids
+        ).select_related("dashboard__project")
+        found_uuids = {str(widget.uuid) for widget in widgets}
+        user_email = request.user.email
+
+        if is_feature_active_for_attributes(
+            settings.DATA_SOURCE_SERVICE_FEATURE_FLAG_KEY,
+            attributes={
+                "projectUUID": str(dashboard.project.uuid),
+                "userEmail": user_email,
+            },
+        ):
+            get_widgets_source_data = (
+                self.source_data_service.get_source_data_from_widgets
+            )
+        else:
+            # TODO: Remove this once the data source service is rolled out to all projects
+            get_widgets_source_data = get_source_data_from_widgets
+
+        def to_line(widget_uuid: str, status_code: int, **content) -> str:
+            return (
+                json.dumps(
+                    {"widget": widget_uuid, "status": status_code, **content},
+                    cls=DjangoJSONEncoder,
+                )
+                + "\n"
+            )
+
+        def stream():
+            for widget_uuid in widget_uuids:
+                if widget_uuid not in found_uuids:
+                    yield to_line(
+                        widget_uuid,
+                        status.HTTP_404_NOT_FOUND,
+                        detail="Widget not found.",
+                    )
+
+            for widget, data, error in get_widgets_source_data(
+                widgets=widgets,
+                is_live=is_live,
+                filters=filters,
+                user_email=user_email,
+            ):
+                if error is None:
+                    yield to_line(str(widget.uuid), status.HTTP_200_OK, data=data)
+                elif isinstance(error, PermissionDenied):
+                    yield to_line(
+                        str(widget.uuid),
+                        status.HTTP_403_FORBIDDEN,
+                        detail=str(error.detail),
+                    )
+                else:
+                    logger.error(
+                        "Error loading widget data: %s", error, exc_info=error
+                    )
+                    yield to_line(
+                        str(widget.uuid),
+                        status.HTTP_400_BAD_REQUEST,
+                        detail="Failed to load widget data",
+                    )
+
+        return StreamingHttpResponse(stream(), content_type="application/x-ndjson")
+
     @action(
         detail=True, methods=["get"], url_path="widgets/(?P<widget_uuid>[^/.]+)/report"
     )
@@ -373,6 +511,48 @@ class DashboardViewSet(
         data = service.get_attendance_status(filters=filters)
         return Response(data, status=status.HTTP_200_OK)
 
+    @action(
+        detail=True,
+        methods=["get"],
+        url_path="human_support/snapshot",
+    )
+    def human_support_snapshot(self, request, pk=None):
+        dashboard = self.get_object()
+        filters = get_filters_from_query_params(request.query_params)
+        raw_sections = request.query_params.getlist("sections")
+        filters.pop("sections", None)
+
+        sections = list(
+            dict.fromkeys(
+                section.strip()
+                for value in raw_sections
+                for section in value.split(",")
+                if section.strip()
+            )
+        )
+
+        if not sections:
+            return Response(
+                {"detail": "sections is required"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        invalid_sections = [
+            section for section in sections if section not in SNAPSHOT_SECTIONS
+        ]
+
+        if invalid_sections:
+            return Response(
+                {"detail": f"invalid sections: {', '.join(invalid_sections)}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        service = HumanSupportDashboardService(project=dashboard.project)
+        data = service.get_snapshot(
+            sections=sections, filters=filters, user_request=request.user.email
+        )
+        return Response(data, status=status.HTTP_200_OK)
+
     @action(
         detail=True,
         methods=["get"],
@@ -461,20 +641,33 @@ class DashboardViewSet(
         user = request.query_params.get("user_email")
         ended_at_gte = request.query_params.get("ended_at__gte")
         ended_at_lte = request.query_params.get("ended_at__lte")
+        cursor = request.query_params.get("cursor")
 
         flows_contact_client = FlowsContactsRestClient()
 
-        contacts_list = flows_contact_client.get_flows_contacts(
-            flow_uuid=flow_uuid,
-            page_number=page_number,
-            page_size=page_size,
-            project_uuid=project_uuid,
-            op_field=op_field,
-            label=label,
-            user=user,
-            ended_at_gte=ended_at_gte,
-            ended_at_lte=ended_at_lte,
-        )
+        try:
+            contacts_list = flows_contact_client.get_flows_contacts(
+                flow_uuid=flow_uuid,
+                page_number=page_number,
+                page_size=page_size,
+                project_uuid=project_uuid,
+                op_field=op_field,
+                label=label,
+                user=user,
+                ended_at_gte=ended_at_gte,
+                ended_at_lte=ended_at_lte,
+                cursor=cursor,
+            )
+        except InvalidContactsCursor:
+            return Response(
+                {"detail": "Invalid cursor"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        except FlowsContactsSearchError:
+            return Response(
+                {"detail": "Failed to load contacts"},
+                status=status.HTTP_502_BAD_GATEWAY,
+            )
         return Response(contacts_list, status.HTTP_200_OK)
 
     @action(
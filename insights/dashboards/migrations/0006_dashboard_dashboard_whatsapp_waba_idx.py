@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:39
+
+import django.db.models.fields.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dashboards", "0005_dashboard_soft_delete"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="dashboard",
+            index=models.Index(
+                django.db.models.fields.json.KeyTransform("waba_id", "config"),
+                condition=models.Q(("config__is_whatsapp_integration", True)),
+                name="dashboard_whatsapp_waba_idx",
+            ),
+        ),
+    ]
@@ -1,5 +1,6 @@
 from contextlib import suppress
 from django.db import models, transaction
+from django.db.models.fields.json import KeyTransform
 from model_utils import FieldTracker
 
 from insights.shared.models import BaseModel, ConfigurableModel, SoftDeletableModel
@@ -70,6 +71,15 @@ class Dashboard(BaseModel, ConfigurableModel, SoftDeletableModel):
                 name="unique_default_dashboard_per_project",
             )
         ]
+        indexes = [
+            # WhatsApp integration lookups by WABA, e.g. when checking
+            # whether a project can access a WABA
+            models.Index(
+                KeyTransform("waba_id", "config"),
+                condition=models.Q(config__is_whatsapp_integration=True),
+                name="dashboard_whatsapp_waba_idx",
+            ),
+        ]
 
     def save(self, *args, **kwargs):
         if self._state.adding or self.tracker.has_changed("name"):
@@ -1,4 +1,6 @@
+import json
 import uuid
+from django.conf import settings
 from django.test import override_settings
 from django.urls import reverse
 from rest_framework import status
@@ -10,6 +12,10 @@ from insights.authentication.authentication import User
 from insights.authentication.tests.decorators import with_project_auth
 from insights.dashboards.models import CTWA_DASHBOARD_NAME, Dashboard
 from insights.projects.models import Project, ProjectAuth
+from insights.sources.contacts.exceptions import (
+    FlowsContactsSearchError,
+    InvalidContactsCursor,
+)
 from insights.widgets.models import Widget, Report
 
 
@@ -47,6 +53,10 @@ class BaseTestDashboardViewSet(APITestCase):
         )
         return self.client.get(url)
 
+    def get_widgets_data(self, dashboard_uuid: str, data: dict) -> Response:
+        url = reverse("dashboard-get-widgets-data", kwargs={"pk": dashboard_uuid})
+        return self.client.get(url, data)
+
     def get_widget_report(self, dashboard_uuid: str, widget_uuid: str) -> Response:
         url = reverse(
             "dashboard-get-widget-report",
@@ -99,6 +109,11 @@ class BaseTestDashboardViewSet(APITestCase):
 
         return self.client.get(url, data)
 
+    def human_support_snapshot(self, dashboard_uuid: str, data: dict) -> Response:
+        url = reverse("dashboard-human-support-snapshot", kwargs={"pk": dashboard_uuid})
+
+        return self.client.get(url, data)
+
 
 class TestDashboardViewSetAsAnonymousUser(BaseTestDashboardViewSet):
     def test_cannot_list_dashboards_when_unauthenticated(self):
@@ -264,6 +279,16 @@ class TestDashboardViewSetAsAuthenticatedUser(BaseTestDashboardViewSet):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         mock_task.delay.assert_not_called()
 
+    @with_project_auth
+    @patch("insights.dashboards.api.v1.viewsets.check_nexus_multi_agents_status")
+    def test_list_debounces_side_effect_tasks(self, mock_task):
+        mock_task.name = "insights.projects.tasks.check_nexus_multi_agents_status"
+        for _ in range(3):
+            response = self.list({"project": str(self.project.uuid)})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        mock_task.apply_async.assert_called_once_with(args=(str(self.project.uuid),))
+
     @with_project_auth
     def test_list_hides_ctwa_dashboard_by_default(self):
         dashboard = Dashboard.objects.create(
@@ -771,8 +796,46 @@ class TestDashboardViewSetAsAuthenticatedUser(BaseTestDashboardViewSet):
             user=self.user.email,
             ended_at_gte=None,
             ended_at_lte=None,
+            cursor=None,
+        )
+
+    @with_project_auth
+    @patch("insights.dashboards.api.v1.viewsets.FlowsContactsRestClient")
+    def test_cannot_get_contacts_results_with_invalid_cursor(
+        self, MockFlowsContactsRestClient
+    ):
+        mock_client_instance = MockFlowsContactsRestClient.return_value
+        mock_client_instance.get_flows_contacts.side_effect = InvalidContactsCursor(
+            "Invalid cursor"
         )
 
+        response = self.get_contacts_results(
+            {
+                "flow_uuid": "some-flow-uuid",
+                "project_uuid": str(self.project.uuid),
+                "cursor": "invalid",
+            }
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @with_project_auth
+    @patch("insights.dashboards.api.v1.viewsets.FlowsContactsRestClient")
+    def test_get_contacts_results_when_search_fails(self, MockFlowsContactsRestClient):
+        mock_client_instance = MockFlowsContactsRestClient.return_value
+        mock_client_instance.get_flows_contacts.side_effect = (
+            FlowsContactsSearchError("Contacts search failed")
+        )
+
+        response = self.get_contacts_results(
+            {
+                "flow_uuid": "some-flow-uuid",
+                "project_uuid": str(self.project.uuid),
+            }
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_502_BAD_GATEWAY)
+
     @with_project_auth
     @patch("insights.dashboards.api.v1.viewsets.CustomStatusRESTClient")
     def test_get_custom_status(self, MockCustomStatusRESTClient):
@@ -969,3 +1032,190 @@ class TestDashboardViewSetAsAuthenticatedUser(BaseTestDashboardViewSet):
                 },
             },
         )
+
+    @with_project_auth
+    @patch("insights.dashboards.api.v1.viewsets.HumanSupportDashboardService")
+    def test_get_human_support_snapshot(self, MockHumanSupportDashboardService):
+        mock_service_instance = MockHumanSupportDashboardService.return_value
+        mock_service_instance.get_snapshot.return_value = {
+            "monitoring_list_status": {"data": {"is_waiting": 1}, "elapsed_ms": 3},
+            "monitoring_csat_ratings": {"error": "timeout", "elapsed_ms": 10000},
+        }
+
+        dashboard = Dashboard.objects.create(
+            name="Test Dashboard", project=self.project
+        )
+        response = self.human_support_snapshot(
+            str(dashboard.uuid),
+            {
+                "sections": "monitoring_list_status,monitoring_csat_ratings",
+                "sectors": "__all__",
+            },
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data, mock_service_instance.get_snapshot.return_value
+        )
+        mock_service_instance.get_snapshot.assert_called_once_with(
+            sections=["monitoring_list_status", "monitoring_csat_ratings"],
+            filters={"sectors": "__all__"},
+            user_request=self.user.email,
+        )
+
+    @with_project_auth
+    @patch("insights.dashboards.api.v1.viewsets.HumanSupportDashboardService")
+    def test_cannot_get_human_support_snapshot_without_valid_sections(
+        self, MockHumanSupportDashboardService
+    ):
+        dashboard = Dashboard.objects.create(
+            name="Test Dashboard", project=self.project
+        )
+
+        response = self.human_support_snapshot(str(dashboard.uuid), {})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.human_support_snapshot(
+            str(dashboard.uuid), {"sections": "monitoring_list_status,unknown"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        MockHumanSupportDashboardService.return_value.get_snapshot.assert_not_called()
+
+    @with_project_auth
+    @patch("insights.dashboards.api.v1.viewsets.DataSourceService")
+    @patch(
+        "insights.dashboards.api.v1.viewsets.is_feature_active_for_attributes",
+        return_value=True,
+    )
+    def test_get_widgets_data(self, mock_feature_flag, MockDataSourceService):
+        dashboard = Dashboard.objects.create(
+            name="Test Dashboard", project=self.project
+        )
+        widget_1, widget_2 = [
+            Widget.objects.create(
+                dashboard=dashboard,
+                name=f"Widget {index}",
+                source="TestSource",
+                type="TestType",
+                config={},
+                position={},
+            )
+            for index in range(2)
+        ]
+        missing_uuid = str(uuid.uuid4())
+        MockDataSourceService.return_value.get_source_data_from_widgets.return_value = [
+            (widget_2, {"value": 2}, None),
+            (widget_1, None, Exception("source down")),
+        ]
+
+        response = self.get_widgets_data(
+            str(dashboard.uuid),
+            {
+                "widgets": f"{widget_1.uuid},{widget_2.uuid},{missing_uuid}",
+                "created_on__gte": "2025-01-01",
+            },
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        lines = [
+            json.loads(line)
+            for line in b"".join(response.streaming_content).decode().splitlines()
+        ]
+        self.assertEqual(
+            lines,
+            [
+                {"widget": missing_uuid, "status": 404, "detail": "Widget not found."},
+                {"widget": str(widget_2.uuid), "status": 200, "data": {"value": 2}},
+                {
+                    "widget": str(widget_1.uuid),
+                    "status": 400,
+                    "detail": "Failed to load widget data",
+                },
+            ],
+        )
+
+        call_kwargs = (
+            MockDataSourceService.return_value.get_source_data_from_widgets.call_args[1]
+        )
+        self.assertEqual(set(call_kwargs["widgets"]), {widget_1, widget_2})
+        self.assertEqual(call_kwargs["filters"], {"created_on__gte": ["2025-01-01"]})
+        self.assertFalse(call_kwargs["is_live"])
+        mock_feature_flag.assert_called_once()
+
+    @with_project_auth
+    @patch("insights.widgets.usecases.get_source_data.get_source_data_from_widget")
+    @patch("insights.dashboards.api.v1.viewsets.DataSourceService")
+    @patch(
+        "insights.dashboards.api.v1.viewsets.is_feature_active_for_attributes",
+        return_value=False,
+    )
+    def test_get_widgets_data_with_feature_flag_disabled(
+        self, mock_feature_flag, MockDataSourceService, mock_get_source_data
+    ):
+        dashboard = Dashboard.objects.create(
+            name="Test Dashboard", project=self.project
+        )
+        widget_1, widget_2 = [
+            Widget.objects.create(
+                dashboard=dashboard,
+                name=f"Widget {index}",
+                source="TestSource",
+                type="TestType",
+                config={},
+                position={},
+            )
+            for index in range(2)
+        ]
+        mock_get_source_data.side_effect = lambda widget, **kwargs: {
+            "value": widget.name
+        }
+
+        response = self.get_widgets_data(
+            str(dashboard.uuid),
+            {
+                "widgets": f"{widget_1.uuid},{widget_2.uuid}",
+                "created_on__gte": "2025-01-01",
+            },
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        lines = [
+            json.loads(line)
+            for line in b"".join(response.streaming_content).decode().splitlines()
+        ]
+        self.assertCountEqual(
+            lines,
+            [
+                {
+                    "widget": str(widget.uuid),
+                    "status": 200,
+                    "data": {"value": widget.name},
+                }
+                for widget in (widget_1, widget_2)
+            ],
+        )
+        mock_feature_flag.assert_called_once_with(
+            settings.DATA_SOURCE_SERVICE_FEATURE_FLAG_KEY,
+            attributes={
+                "projectUUID": str(self.project.uuid),
+                "userEmail": self.user.email,
+            },
+        )
+        self.assertEqual(mock_get_source_data.call_count, 2)
+        self.assertEqual(
+            mock_get_source_data.call_args[1]["filters"],
+            {"created_on__gte": ["2025-01-01"]},
+        )
+        MockDataSourceService.return_value.get_source_data_from_widgets.assert_not_called()
+
+    @with_project_auth
+    @override_settings(WIDGET_DATA_BATCH_MAX_WIDGETS=1)
+    def test_cannot_get_widgets_data_without_valid_widgets(self):
+        dashboard = Dashboard.objects.create(
+            name="Test Dashboard", project=self.project
+        )
+
+        for widgets in ("", "not-a-uuid", f"{uuid.uuid4()},{uuid.uuid4()}"):
+            response = self.get_widgets_data(str(dashboard.uuid), {"widgets": widgets})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,66 @@
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from insights.authentication.authentication import User
+from insights.authentication.tests.decorators import with_project_auth
+from insights.core.tests.query_budget import QueryBudgetTestMixin
+from insights.dashboards.models import Dashboard
+from insights.projects.models import Project
+from insights.widgets.models import Report, Widget
+
+
+class TestDashboardViewSetQueryBudgets(QueryBudgetTestMixin, APITestCase):
+    LIST_BUDGET = 2
+    LIST_WIDGETS_BUDGET = 5
+
+    def setUp(self):
+        self.user = User.objects.create_user(email="testuser@test.com")
+        self.project = Project.objects.create(name="Test Project")
+        self.dashboard = Dashboard.objects.create(
+            name="Test Dashboard", project=self.project
+        )
+
+    def create_widgets(self, count: int) -> None:
+        for index in range(count):
+            widget = Widget.objects.create(
+                name=f"Widget {index}",
+                dashboard=self.dashboard,
+                source="flowruns",
+                type="card",
+                config={},
+                position={},
+            )
+            Report.objects.create(
+                name=f"Report {index}",
+                widget=widget,
+                source="flowruns",
+                type="graph_bar",
+                config={"operation": "recurrence"},
+            )
+
+    def create_dashboards(self, count: int) -> None:
+        for index in range(count):
+            Dashboard.objects.create(name=f"Dashboard {index}", project=self.project)
+
+    def get(self, url: str, params: dict | None = None):
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        return response
+
+    @with_project_auth
+    def test_list_widgets(self):
+        url = reverse("dashboard-list-widgets", kwargs={"pk": self.dashboard.uuid})
+
+        self.assertConstantQueries(
+            self.LIST_WIDGETS_BUDGET, lambda: self.get(url), self.create_widgets
+        )
+
+    @with_project_auth
+    def test_list(self):
+        url = reverse("dashboard-list")
+
+        self.assertConstantQueries(
+            self.LIST_BUDGET, lambda: self.get(url), self.create_dashboards
+        )
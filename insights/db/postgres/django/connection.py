@@ -1,6 +1,10 @@
 from contextlib import contextmanager
 
+from django.conf import settings
 from django.db import connections
+from psycopg.rows import tuple_row
+
+from insights.db.postgres.psycopg.connection import get_cursor as get_pooled_cursor
 
 
 def dictfetchall(cursor):
@@ -24,5 +28,15 @@ def dictfetchone(cursor):
 
 @contextmanager
 def get_cursor(db_name: str):
+    """
+    Cursor of the Django connection to the database, or, for databases in
+    PSYCOPG_POOLED_DATABASES, of a pooled psycopg connection returning the
+    same tuple rows.
+    """
+    if db_name in settings.PSYCOPG_POOLED_DATABASES:
+        with get_pooled_cursor(db_name, row_factory=tuple_row) as cur:
+            yield cur
+        return
+
     with connections[db_name].cursor() as cur:
         yield cur
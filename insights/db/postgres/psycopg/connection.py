@@ -1,31 +1,146 @@
 import logging
+import os
+import threading
+import time
 from contextlib import contextmanager
 
 from django.conf import settings
 from psycopg.rows import dict_row
-from psycopg_pool import ConnectionPool, NullConnectionPool
+from psycopg_pool import ConnectionPool
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 
 logging.getLogger("psycopg.pool").setLevel(logging.INFO)
 
+logger = logging.getLogger(__name__)
+
 pools = {}
+_pools_lock = threading.Lock()
+# Pools created before a fork, in the parent process. Their connections are
+# shared with it, so they are kept referenced and never closed by the child:
+# closing them would terminate the parent's sessions
+_inherited_pools = []
+_stats_logged_at = {}
+
+
+def _reset_pools_after_fork() -> None:
+    global _pools_lock
+
+    _inherited_pools.extend(pools.values())
+    pools.clear()
+    _stats_logged_at.clear()
+    _pools_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_pools_after_fork)
+
+
+def _get_connection_kwargs() -> dict:
+    return {
+        "autocommit": True,
+        # Same session encoding and time zone as the Django connections
+        "client_encoding": "UTF8",
+        "options": "-c TimeZone=UTC",
+        # Queries executed this many times in a connection become server side
+        # prepared statements, so the query builders' parameterized shapes
+        # are not parsed and planned again
+        "prepare_threshold": (
+            settings.PSYCOPG_PREPARE_THRESHOLD
+            if settings.PSYCOPG_PREPARED_STATEMENTS_ENABLED
+            else None
+        ),
+    }
+
+
+def _configure_connection(conn) -> None:
+    conn.prepared_max = settings.PSYCOPG_PREPARED_MAX
+
+
+def get_pool(db_name: str) -> ConnectionPool:
+    """
+    Connection pool of the database for this process, created on first use.
+
+    Pools are per process: a forked process (gunicorn or Celery prefork
+    workers) creates its own instead of using its parent's. Connections are
+    checked before being handed out and replaced after
+    PSYCOPG_POOL_MAX_LIFETIME seconds.
+    """
+    pool = pools.get(db_name)
+
+    if pool is not None:
+        return pool
+
+    with _pools_lock:
+        if db_name not in pools:
+            pools[db_name] = ConnectionPool(
+                conninfo=settings.PSYCOPG_DATABASES.get(db_name),
+                kwargs=_get_connection_kwargs(),
+                min_size=settings.PSYCOPG_POOL_MIN_SIZE,
+                max_size=settings.PSYCOPG_POOL_MAX_SIZE,
+                timeout=settings.PSYCOPG_POOL_TIMEOUT,
+                max_lifetime=settings.PSYCOPG_POOL_MAX_LIFETIME,
+                max_idle=settings.PSYCOPG_POOL_MAX_IDLE,
+                check=ConnectionPool.check_connection,
+                configure=_configure_connection,
+                name=db_name,
+                open=True,
+            )
+
+        return pools[db_name]
+
+
+def get_pool_stats(db_name: str) -> dict:
+    """
+    Counters of the database's pool in this process (psycopg_pool stats):
+    checkouts (requests_num), time waiting for them (requests_wait_ms),
+    checkouts that had to wait (requests_queued) or failed (requests_errors),
+    and the pool size and available connections. Counters restart every
+    PSYCOPG_POOL_STATS_LOG_INTERVAL seconds, when they are logged.
+    """
+    pool = pools.get(db_name)
+
+    return pool.get_stats() if pool is not None else {}
+
+
+def _log_pool_stats(db_name: str, pool: ConnectionPool) -> None:
+    now = time.monotonic()
+
+    if (
+        now - _stats_logged_at.setdefault(db_name, now)
+        < settings.PSYCOPG_POOL_STATS_LOG_INTERVAL
+    ):
+        return
+
+    _stats_logged_at[db_name] = now
+    # Counters since the previous log line of this process
+    logger.info(
+        "[DB POOL] %s stats (pid %s): %s", db_name, os.getpid(), pool.pop_stats()
+    )
 
 
 @contextmanager
 def get_connection(db_name: str):
-    if not pools.get(db_name, None):
-        pools[db_name] = NullConnectionPool(
-            max_size=5,
-            conninfo=settings.PSYCOPG_DATABASES.get(db_name),
-            check=ConnectionPool.check_connection,
-        )
-    with pools.get(db_name).connection() as conn:
+    pool = get_pool(db_name)
+    requested_at = time.monotonic()
+
+    with pool.connection() as conn:
+        wait = time.monotonic() - requested_at
+
+        if wait >= settings.PSYCOPG_POOL_SLOW_CHECKOUT_WARNING:
+            logger.warning(
+                "[DB POOL] %s checkout waited %.3fs (pid %s)",
+                db_name,
+                wait,
+                os.getpid(),
+            )
+
         yield conn
 
+    _log_pool_stats(db_name, pool)
+
 
 @contextmanager
-def get_cursor(db_name: str):
+def get_cursor(db_name: str, row_factory=dict_row):
     with get_connection(db_name) as conn:
-        with conn.cursor(row_factory=dict_row) as cur:
+        with conn.cursor(row_factory=row_factory) as cur:
             yield cur
@@ -0,0 +1,102 @@
+from django.conf import settings
+from django.db import connection
+from django.test import TestCase, override_settings
+
+from insights.db.postgres.django.connection import dictfetchall
+from insights.db.postgres.django.connection import get_cursor as get_django_cursor
+from insights.db.postgres.psycopg import connection as psycopg_connection
+from insights.db.postgres.psycopg.connection import (
+    get_cursor,
+    get_pool,
+    get_pool_stats,
+)
+
+
+def get_test_conninfo() -> str:
+    db = settings.DATABASES["default"]
+
+    return (
+        f"dbname={connection.settings_dict['NAME']} user={db['USER']} "
+        f"password={db['PASSWORD']} host={db['HOST']} port={db['PORT'] or 5432}"
+    )
+
+
+class TestPsycopgConnectionPool(TestCase):
+    def setUp(self):
+        self.override = override_settings(
+            PSYCOPG_DATABASES={"pooled": get_test_conninfo()},
+            PSYCOPG_POOLED_DATABASES=["pooled"],
+            PSYCOPG_POOL_MIN_SIZE=1,
+            PSYCOPG_POOL_MAX_SIZE=1,
+            PSYCOPG_PREPARE_THRESHOLD=1,
+        )
+        self.override.enable()
+
+    def tearDown(self):
+        pool = psycopg_connection.pools.pop("pooled", None)
+
+        if pool is not None:
+            pool.close()
+
+        self.override.disable()
+
+    def test_connections_are_reused(self):
+        with get_cursor("pooled") as cur:
+            first_pid = cur.execute("SELECT pg_backend_pid() AS pid").fetchone()["pid"]
+
+        with get_cursor("pooled") as cur:
+            second_pid = cur.execute("SELECT pg_backend_pid() AS pid").fetchone()["pid"]
+
+        self.assertEqual(first_pid, second_pid)
+        self.assertIs(get_pool("pooled"), get_pool("pooled"))
+        self.assertEqual(get_pool_stats("pooled")["requests_num"], 2)
+
+    def test_repeated_queries_become_prepared_statements(self):
+        query = "SELECT %s::int + 1 AS value"
+
+        for value in range(3):
+            with get_cursor("pooled") as cur:
+                self.assertEqual(
+                    cur.execute(query, [value]).fetchone()["value"], value + 1
+                )
+
+        with get_cursor("pooled") as cur:
+            prepared = cur.execute(
+                "SELECT statement FROM pg_prepared_statements"
+            ).fetchall()
+
+        self.assertIn(
+            "SELECT $1::int + 1 AS value", [row["statement"] for row in prepared]
+        )
+
+    @override_settings(PSYCOPG_PREPARED_STATEMENTS_ENABLED=False)
+    def test_prepared_statements_can_be_disabled(self):
+        for _ in range(3):
+            with get_cursor("pooled") as cur:
+                cur.execute("SELECT %s::int AS value", [1])
+
+        with get_cursor("pooled") as cur:
+            prepared = cur.execute(
+                "SELECT COUNT(*) AS total FROM pg_prepared_statements"
+            ).fetchone()
+
+        self.assertEqual(prepared["total"], 0)
+
+    def test_django_cursor_uses_the_pool_for_pooled_databases(self):
+        with get_django_cursor("pooled") as cur:
+            rows = dictfetchall(cur.execute("SELECT %s AS label, 2 AS value", ["a"]))
+
+        self.assertEqual(rows, [{"label": "a", "value": 2}])
+        self.assertEqual(get_pool_stats("pooled")["requests_num"], 1)
+
+    def test_forked_process_does_not_use_parent_pools(self):
+        parent_pool = get_pool("pooled")
+
+        psycopg_connection._reset_pools_after_fork()
+
+        self.assertNotIn("pooled", psycopg_connection.pools)
+        self.assertIn(parent_pool, psycopg_connection._inherited_pools)
+        self.assertIsNot(get_pool("pooled"), parent_pool)
+
+        psycopg_connection._inherited_pools.remove(parent_pool)
+        parent_pool.close()
@@ -0,0 +1,7 @@
+from django.apps import AppConfig
+
+
+class HumanSupportConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "insights.human_support"
+    label = "insights_human_support"
@@ -0,0 +1,12 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class RoomsRollupStatus(models.TextChoices):
+    """
+    Rooms counted by a rooms rollup: the ones opened (created_on) or closed
+    (ended_at) on its day.
+    """
+
+    OPENED = "OPENED", _("Opened")
+    CLOSED = "CLOSED", _("Closed")
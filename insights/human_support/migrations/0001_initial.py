@@ -0,0 +1,109 @@
+# Generated by Django 5.2.18 on 2026-10-19 10:04
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("projects", "0007_set_multi_agents_for_projects_with_conversations_dashboard"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RoomsRollupWatermark",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_on",
+                    models.DateTimeField(auto_now_add=True, verbose_name="Created on"),
+                ),
+                (
+                    "modified_on",
+                    models.DateTimeField(auto_now=True, verbose_name="Modified on"),
+                ),
+                ("rolled_from", models.DateField(verbose_name="Rolled from")),
+                ("rolled_until", models.DateField(verbose_name="Rolled until")),
+                (
+                    "project",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="rooms_rollup_watermark",
+                        to="projects.project",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="RoomsDailyRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_on",
+                    models.DateTimeField(auto_now_add=True, verbose_name="Created on"),
+                ),
+                (
+                    "modified_on",
+                    models.DateTimeField(auto_now=True, verbose_name="Modified on"),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("OPENED", "Opened"), ("CLOSED", "Closed")],
+                        max_length=16,
+                        verbose_name="Status",
+                    ),
+                ),
+                ("day", models.DateField(verbose_name="Day")),
+                ("sector_uuid", models.UUIDField(verbose_name="Sector UUID")),
+                ("queue_uuid", models.UUIDField(verbose_name="Queue UUID")),
+                (
+                    "tag_uuid",
+                    models.UUIDField(blank=True, null=True, verbose_name="Tag UUID"),
+                ),
+                (
+                    "value",
+                    models.PositiveIntegerField(default=0, verbose_name="Rooms count"),
+                ),
+                (
+                    "project",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="rooms_daily_rollups",
+                        to="projects.project",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("project", "status", "day", "queue_uuid", "tag_uuid"),
+                        name="unique_rooms_daily_rollup",
+                        nulls_distinct=False,
+                    )
+                ],
+            },
+        ),
+    ]
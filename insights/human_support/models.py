@@ -0,0 +1,59 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from insights.human_support.choices import RoomsRollupStatus
+from insights.shared.models import DateTimeModel
+
+
+class RoomsDailyRollup(DateTimeModel):
+    """
+    Rooms of a project, from the Chats database, counted by status, closed
+    day (in the project's timezone), sector and queue.
+
+    Rows without a tag count all rooms of the queue, and rows with a tag the
+    rooms of the queue that have it.
+    """
+
+    project = models.ForeignKey(
+        "projects.Project",
+        on_delete=models.CASCADE,
+        related_name="rooms_daily_rollups",
+    )
+    status = models.CharField(
+        _("Status"), max_length=16, choices=RoomsRollupStatus.choices
+    )
+    day = models.DateField(_("Day"))
+    sector_uuid = models.UUIDField(_("Sector UUID"))
+    queue_uuid = models.UUIDField(_("Queue UUID"))
+    tag_uuid = models.UUIDField(_("Tag UUID"), null=True, blank=True)
+    value = models.PositiveIntegerField(_("Rooms count"), default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["project", "status", "day", "queue_uuid", "tag_uuid"],
+                name="unique_rooms_daily_rollup",
+                nulls_distinct=False,
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.project_id} - {self.status} - {self.day} - {self.queue_uuid}"
+
+
+class RoomsRollupWatermark(DateTimeModel):
+    """
+    Days of a project stored as RoomsDailyRollup rows, from rolled_from to
+    rolled_until.
+    """
+
+    project = models.OneToOneField(
+        "projects.Project",
+        on_delete=models.CASCADE,
+        related_name="rooms_rollup_watermark",
+    )
+    rolled_from = models.DateField(_("Rolled from"))
+    rolled_until = models.DateField(_("Rolled until"))
+
+    def __str__(self):
+        return f"{self.project_id} - {self.rolled_from} - {self.rolled_until}"
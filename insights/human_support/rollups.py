@@ -0,0 +1,306 @@
+import logging
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+
+import pytz
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Sum
+from django.utils import timezone as dj_timezone
+
+from insights.human_support.choices import RoomsRollupStatus
+from insights.human_support.models import RoomsDailyRollup, RoomsRollupWatermark
+from insights.projects.models import Project
+from insights.sources.queues.usecases.query_execute import (
+    QueryExecutor as QueuesQueryExecutor,
+)
+from insights.sources.rooms.usecases.query_execute import (
+    QueryExecutor as RoomsQueryExecutor,
+)
+from insights.sources.tags.usecases.query_execute import (
+    QueryExecutor as TagsQueryExecutor,
+)
+
+logger = logging.getLogger(__name__)
+
+
+ONE_DAY = timedelta(days=1)
+ONE_MICROSECOND = timedelta(microseconds=1)
+# Ranges ending at 23:59:59, like the dashboards' end dates, cover the day
+END_TOLERANCE = timedelta(seconds=1)
+
+STATUS_TIME_FIELDS = {
+    RoomsRollupStatus.OPENED: "created_on",
+    RoomsRollupStatus.CLOSED: "ended_at",
+}
+
+
+class RoomsRollups:
+    """
+    Volume of rooms by queue and by tag answered from per-day rollups.
+
+    Closed days (in the project's timezone) are stored as RoomsDailyRollup
+    rows by a scheduled refresh, which moves the project's watermark forward.
+    The last ROOMS_ROLLUPS_OPEN_DAYS days, including today, are never stored:
+    their rooms can still be transferred or tagged. Parts of a range that are
+    not stored, or do not cover whole days, are queried live.
+    """
+
+    def __init__(
+        self,
+        project: Project,
+        executor=RoomsQueryExecutor,
+        queues_executor=QueuesQueryExecutor,
+        tags_executor=TagsQueryExecutor,
+    ):
+        self.project = project
+        self.executor = executor
+        self.queues_executor = queues_executor
+        self.tags_executor = tags_executor
+        self.tzname = project.timezone or "UTC"
+        self.timezone = pytz.timezone(self.tzname)
+
+    def _get_day_start(self, day: date) -> datetime:
+        return self.timezone.localize(datetime.combine(day, time.min))
+
+    def _query_rows(
+        self,
+        operation: str,
+        status: str,
+        filters: dict,
+        start: datetime,
+        end: datetime,
+    ) -> list[dict]:
+        time_field = STATUS_TIME_FIELDS[status]
+        status_filters = {
+            **filters,
+            f"{time_field}__gte": start.isoformat(),
+            f"{time_field}__lte": end.isoformat(),
+        }
+
+        if status == RoomsRollupStatus.CLOSED:
+            status_filters["is_active"] = False
+
+        return self.executor.execute(
+            filters=status_filters,
+            operation=operation,
+            parser=lambda x: x,
+            project=self.project,
+            query_kwargs={"time_field": time_field, "timezone": self.tzname},
+        ).get("results", [])
+
+    def refresh(self) -> int:
+        """
+        Store the closed days after the watermark, at most
+        ROOMS_ROLLUPS_MAX_DAYS_PER_REFRESH of them, and return how many were
+        stored. The first refresh of a project starts
+        ROOMS_ROLLUPS_BACKFILL_DAYS days before the last closed day.
+        """
+        today = dj_timezone.now().astimezone(self.timezone).date()
+        last_closed_day = today - timedelta(
+            days=max(settings.ROOMS_ROLLUPS_OPEN_DAYS, 1)
+        )
+        watermark = RoomsRollupWatermark.objects.filter(project=self.project).first()
+
+        if watermark:
+            first_day = watermark.rolled_until + ONE_DAY
+        else:
+            first_day = last_closed_day - timedelta(
+                days=max(settings.ROOMS_ROLLUPS_BACKFILL_DAYS, 1) - 1
+            )
+
+        last_day = min(
+            last_closed_day,
+            first_day
+            + timedelta(days=max(settings.ROOMS_ROLLUPS_MAX_DAYS_PER_REFRESH, 1) - 1),
+        )
+
+        if first_day > last_day:
+            return 0
+
+        start = self._get_day_start(first_day)
+        end = self._get_day_start(last_day + ONE_DAY) - ONE_MICROSECOND
+        filters = {"project": str(self.project.uuid)}
+        rollups = []
+
+        for status in STATUS_TIME_FIELDS:
+            for operation in ("day_queue_group_count", "day_queue_tag_group_count"):
+                for row in self._query_rows(operation, status, filters, start, end):
+                    rollups.append(
+                        RoomsDailyRollup(
+                            project=self.project,
+                            status=status,
+                            day=row["day"],
+                            sector_uuid=row["sector_uuid"],
+                            queue_uuid=row["queue_uuid"],
+                            tag_uuid=row.get("tag_uuid"),
+                            value=row["value"],
+                        )
+                    )
+
+        with transaction.atomic():
+            RoomsDailyRollup.objects.filter(
+                project=self.project, day__gte=first_day, day__lte=last_day
+            ).delete()
+            RoomsDailyRollup.objects.bulk_create(rollups, batch_size=1000)
+            RoomsRollupWatermark.objects.update_or_create(
+                project=self.project,
+                defaults={"rolled_until": last_day},
+                create_defaults={"rolled_from": first_day, "rolled_until": last_day},
+            )
+
+        days = (last_day - first_day).days + 1
+
+        logger.info(
+            "[RoomsRollups] Stored %s rollups of %s days (%s to %s) for project %s",
+            len(rollups),
+            days,
+            first_day,
+            last_day,
+            self.project.uuid,
+        )
+
+        return days
+
+    def _get_rolled_days(
+        self, start: datetime, end: datetime
+    ) -> tuple[date, date] | None:
+        if not settings.ROOMS_ROLLUPS_ENABLED:
+            return None
+
+        watermark = RoomsRollupWatermark.objects.filter(project=self.project).first()
+
+        if watermark is None:
+            return None
+
+        first_day = start.astimezone(self.timezone).date()
+
+        if self._get_day_start(first_day) != start:
+            first_day += ONE_DAY
+
+        last_day = (end + END_TOLERANCE).astimezone(self.timezone).date() - ONE_DAY
+
+        first_day = max(first_day, watermark.rolled_from)
+        last_day = min(last_day, watermark.rolled_until)
+
+        if first_day > last_day:
+            return None
+
+        return first_day, last_day
+
+    def _get_counts(
+        self,
+        key_field: str,
+        status: str,
+        filters: dict,
+        start: datetime,
+        end: datetime,
+    ) -> dict[str, int] | None:
+        rolled_days = self._get_rolled_days(start, end)
+
+        if rolled_days is None:
+            return None
+
+        first_day, last_day = rolled_days
+        counts = defaultdict(int)
+
+        rollups = RoomsDailyRollup.objects.filter(
+            project=self.project, status=status, day__gte=first_day, day__lte=last_day
+        )
+
+        if sectors := filters.get("sector__in"):
+            rollups = rollups.filter(sector_uuid__in=sectors)
+
+        if queues := filters.get("queue__in"):
+            rollups = rollups.filter(queue_uuid__in=queues)
+
+        if tags := filters.get("tags__in"):
+            # Same as the live queries: a room counts once for each tag
+            rollups = rollups.filter(tag_uuid__in=tags)
+        elif key_field == "tag_uuid":
+            rollups = rollups.filter(tag_uuid__isnull=False)
+        else:
+            rollups = rollups.filter(tag_uuid__isnull=True)
+
+        for row in rollups.values(key_field).annotate(total=Sum("value")):
+            counts[str(row[key_field])] += row["total"]
+
+        operation = (
+            "day_queue_tag_group_count"
+            if key_field == "tag_uuid"
+            else "day_queue_group_count"
+        )
+        rolled_start = self._get_day_start(first_day)
+        rolled_end = self._get_day_start(last_day + ONE_DAY)
+        live_ranges = []
+
+        if start < rolled_start:
+            live_ranges.append((start, rolled_start - ONE_MICROSECOND))
+
+        if rolled_end <= end:
+            live_ranges.append((rolled_end, end))
+
+        for live_start, live_end in live_ranges:
+            for row in self._query_rows(
+                operation, status, filters, live_start, live_end
+            ):
+                counts[str(row[key_field])] += row["value"]
+
+        return {key: value for key, value in counts.items() if value}
+
+    def _get_rows(self, executor, counts: dict, key: str) -> list[dict]:
+        if not counts:
+            return []
+
+        rows = [
+            {**row, "value": counts[uuid]}
+            for row in executor.execute(
+                filters={"uuid": list(counts)},
+                operation="list_with_sectors",
+                parser=lambda x: x,
+            ).get("results", [])
+            if (uuid := str(row[f"{key}_uuid"])) in counts
+        ]
+
+        # Same order as the group_by operations' queries
+        return sorted(rows, key=lambda row: (-row["value"], row[f"{key}_name"]))
+
+    def get_volume_by_queue(
+        self, filters: dict, status: str, start: datetime, end: datetime
+    ) -> dict | None:
+        """
+        Same results as the group_by_queue_count operation, for rooms
+        matching the filters opened or closed (status) from start to end.
+
+        Returns None when no stored day is in the range.
+        """
+        counts = self._get_counts("queue_uuid", status, filters, start, end)
+
+        if counts is None:
+            return None
+
+        return self.executor.group_queue_rows(
+            self._get_rows(self.queues_executor, counts, "queue")
+        )
+
+    def get_volume_by_tag(
+        self, filters: dict, status: str, start: datetime, end: datetime
+    ) -> dict | None:
+        """
+        Same results as the group_by_tag_count operation, for rooms matching
+        the filters opened or closed (status) from start to end.
+
+        Returns None when no stored day is in the range, or when filtering by
+        tags: the other tags of those rooms are not stored.
+        """
+        if filters.get("tags__in"):
+            return None
+
+        counts = self._get_counts("tag_uuid", status, filters, start, end)
+
+        if counts is None:
+            return None
+
+        return self.executor.group_tag_rows(
+            self._get_rows(self.tags_executor, counts, "tag")
+        )
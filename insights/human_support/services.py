@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import copy
+import json
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
 from typing import Dict
 
 import pytz
+from django.conf import settings
+from django.db import connections
 from django.utils import timezone as dj_timezone
 
 from insights.human_support.clients.chats import ChatsClient
@@ -11,7 +18,9 @@ from insights.human_support.clients.chats_raw_data import ChatsRawDataClient
 from insights.human_support.clients.chats_time_metrics import (
     ChatsTimeMetricsClient,
 )
+from insights.human_support.choices import RoomsRollupStatus
 from insights.human_support.filters import HumanSupportFilterSet
+from insights.human_support.rollups import RoomsRollups
 from insights.projects.models import Project
 from insights.sources.agents.clients import AgentsRESTClient
 from insights.sources.chats.clients import ChatsRESTClient
@@ -19,6 +28,7 @@ from insights.sources.custom_status.client import CustomStatusRESTClient
 from insights.sources.queues.usecases.query_execute import (
     QueryExecutor as QueuesQueryExecutor,
 )
+from insights.sources.rooms.hourly_counts import RoomsHourlyCounts
 from insights.sources.rooms.usecases.query_execute import (
     QueryExecutor as RoomsQueryExecutor,
 )
@@ -29,6 +39,32 @@ from insights.sources.tags.usecases.query_execute import (
     QueryExecutor as TagsQueryExecutor,
 )
 
+logger = logging.getLogger(__name__)
+
+# Snapshot sections, named after the dashboard actions, and the service
+# methods that evaluate them
+SNAPSHOT_SECTIONS = {
+    "monitoring_list_status": "get_attendance_status",
+    "monitoring_average_time_metrics": "get_time_metrics",
+    "monitoring_peaks_in_human_service": "get_peaks_in_human_service",
+    "monitoring_queue_volume": "get_volume_by_queue",
+    "monitoring_tags_volume": "get_volume_by_tag",
+    "monitoring_csat_totals": "csat_score_by_agents",
+    "monitoring_csat_ratings": "get_csat_ratings",
+    "finished": "get_finished_rooms",
+    "analysis_finished_rooms_status": "get_analysis_status",
+    "analysis_peaks_in_human_service": "get_analysis_peaks_in_human_service",
+    "analysis_queue_volume": "get_analysis_volume_by_queue",
+    "analysis_tags_volume": "get_analysis_volume_by_tag",
+    "analysis_csat_totals": "csat_score_by_agents",
+    "analysis_csat_ratings": "get_csat_ratings",
+}
+SNAPSHOT_USER_REQUEST_SECTIONS = {"monitoring_csat_totals", "analysis_csat_totals"}
+SNAPSHOT_RESULTS_SECTIONS = {
+    "monitoring_peaks_in_human_service",
+    "analysis_peaks_in_human_service",
+}
+
 
 class HumanSupportDashboardService:
     def __init__(
@@ -37,6 +73,8 @@ class HumanSupportDashboardService:
         self.project = project
         self.client = ChatsRawDataClient(project)
         self.chats_client = chats_client or ChatsClient(project)
+        # Normalized filters by incoming filters, only kept during a snapshot
+        self._normalized_filters_memo: dict | None = None
 
     def _expand_all_tokens(self, incoming_filters: dict | None) -> dict:
         """
@@ -76,6 +114,20 @@ class HumanSupportDashboardService:
         return filters
 
     def _normalize_filters(self, incoming_filters: dict | None) -> dict:
+        memo = self._normalized_filters_memo
+
+        if memo is None:
+            return self._build_normalized_filters(incoming_filters)
+
+        key = json.dumps(incoming_filters or {}, sort_keys=True, default=str)
+
+        if key not in memo:
+            memo[key] = self._build_normalized_filters(incoming_filters)
+
+        # Sections change the normalized filters they get
+        return copy.deepcopy(memo[key])
+
+    def _build_normalized_filters(self, incoming_filters: dict | None) -> dict:
         expanded = self._expand_all_tokens(incoming_filters)
         filterset = HumanSupportFilterSet(
             data=expanded, queryset=Project.objects.none()
@@ -228,11 +280,10 @@ class HumanSupportDashboardService:
         project_tz = pytz.timezone(tzname)
         start_of_day = project_tz.localize(
             datetime.combine(dj_timezone.now().date(), datetime.min.time())
-        ).isoformat()
+        )
 
         rooms_filters = {
             "project": str(self.project.uuid),
-            "created_on__gte": start_of_day,
         }
         if "sectors" in request_params:
             if not isinstance(request_params["sectors"], list):
@@ -247,20 +298,9 @@ class HumanSupportDashboardService:
                 request_params["tags"] = [request_params["tags"]]
             rooms_filters["tags__in"] = request_params["tags"]
 
-        result = RoomsQueryExecutor.execute(
-            filters=rooms_filters,
-            operation="timeseries_hour_group_count",
-            parser=lambda x: x,
-            project=self.project,
-            query_kwargs={
-                "time_field": "created_on",
-                "start_hour": 0,
-                "end_hour": 23,
-                "limit": 24,
-                "timezone": tzname,
-            },
+        return RoomsHourlyCounts(self.project, executor=RoomsQueryExecutor).get_results(
+            rooms_filters, start_of_day
         )
-        return result.get("results", [])
 
     def get_analysis_peaks_in_human_service(self, filters: dict | None = None):
         request_params = self._normalize_filters(filters)
@@ -269,19 +309,17 @@ class HumanSupportDashboardService:
         project_tz = pytz.timezone(tzname)
 
         if request_params.get("start_date") and request_params.get("end_date"):
-            start_datetime = request_params["start_date"].isoformat()
-            end_datetime = request_params["end_date"].isoformat()
+            start_datetime = request_params["start_date"]
+            end_datetime = request_params["end_date"]
         else:
             today = dj_timezone.now().date()
             start_datetime = project_tz.localize(
                 datetime.combine(today, datetime.min.time())
-            ).isoformat()
-            end_datetime = dj_timezone.now().astimezone(project_tz).isoformat()
+            )
+            end_datetime = dj_timezone.now().astimezone(project_tz)
 
         rooms_filters = {
             "project": str(self.project.uuid),
-            "created_on__gte": start_datetime,
-            "created_on__lte": end_datetime,
         }
         if "sectors" in request_params:
             if not isinstance(request_params["sectors"], list):
@@ -296,17 +334,9 @@ class HumanSupportDashboardService:
                 request_params["tags"] = [request_params["tags"]]
             rooms_filters["tags__in"] = request_params["tags"]
 
-        result = RoomsQueryExecutor.execute(
-            filters=rooms_filters,
-            operation="timeseries_hour_group_count",
-            parser=lambda x: x,
-            project=self.project,
-            query_kwargs={
-                "time_field": "created_on",
-                "timezone": tzname,
-            },
+        return RoomsHourlyCounts(self.project, executor=RoomsQueryExecutor).get_results(
+            rooms_filters, start_datetime, end_datetime
         )
-        return result.get("results", [])
 
     def get_detailed_monitoring_on_going(self, filters: dict | None = None) -> dict:
         normalized = self._normalize_filters(filters)
@@ -1261,20 +1291,38 @@ class HumanSupportDashboardService:
         project_tz = pytz.timezone(tzname)
 
         if normalized.get("start_date") and normalized.get("end_date"):
-            start_datetime = normalized["start_date"].isoformat()
-            end_datetime = normalized["end_date"].isoformat()
+            start = normalized["start_date"]
+            end = normalized["end_date"]
         else:
             today = dj_timezone.now().date()
-            start_datetime = project_tz.localize(
-                datetime.combine(today, datetime.min.time())
-            ).isoformat()
-            end_datetime = dj_timezone.now().astimezone(project_tz).isoformat()
+            start = project_tz.localize(datetime.combine(today, datetime.min.time()))
+            end = dj_timezone.now().astimezone(project_tz)
+
+        start_datetime = start.isoformat()
+        end_datetime = end.isoformat()
 
         base = self._build_volume_by_queue_base_filters(normalized)
 
         chip_name = filters.get("chip_name") if filters else None
         limit = filters.get("limit", 5) if filters else 5
 
+        if chip_name not in ("waiting", "ongoing"):
+            rollups_result = RoomsRollups(
+                self.project, executor=RoomsQueryExecutor
+            ).get_volume_by_queue(
+                base,
+                (
+                    RoomsRollupStatus.CLOSED
+                    if chip_name == "closed"
+                    else RoomsRollupStatus.OPENED
+                ),
+                start,
+                end,
+            )
+
+            if rollups_result is not None:
+                return rollups_result
+
         if chip_name == "waiting":
             base["is_active"] = True
             base["user_id__isnull"] = True
@@ -1371,20 +1419,38 @@ class HumanSupportDashboardService:
         project_tz = pytz.timezone(tzname)
 
         if normalized.get("start_date") and normalized.get("end_date"):
-            start_datetime = normalized["start_date"].isoformat()
-            end_datetime = normalized["end_date"].isoformat()
+            start = normalized["start_date"]
+            end = normalized["end_date"]
         else:
             today = dj_timezone.now().date()
-            start_datetime = project_tz.localize(
-                datetime.combine(today, datetime.min.time())
-            ).isoformat()
-            end_datetime = dj_timezone.now().astimezone(project_tz).isoformat()
+            start = project_tz.localize(datetime.combine(today, datetime.min.time()))
+            end = dj_timezone.now().astimezone(project_tz)
+
+        start_datetime = start.isoformat()
+        end_datetime = end.isoformat()
 
         base = self._build_volume_by_tag_base_filters(normalized)
 
         chip_name = filters.get("chip_name") if filters else None
         limit = filters.get("limit", 5) if filters else 5
 
+        if chip_name != "ongoing":
+            rollups_result = RoomsRollups(
+                self.project, executor=RoomsQueryExecutor
+            ).get_volume_by_tag(
+                base,
+                (
+                    RoomsRollupStatus.CLOSED
+                    if chip_name == "closed"
+                    else RoomsRollupStatus.OPENED
+                ),
+                start,
+                end,
+            )
+
+            if rollups_result is not None:
+                return rollups_result
+
         if chip_name == "ongoing":
             base["is_active"] = True
             base["user_id__isnull"] = False
@@ -1407,3 +1473,118 @@ class HumanSupportDashboardService:
         )
 
         return result
+
+    def _get_snapshot_section(
+        self, section: str, filters: dict, user_request: str | None
+    ):
+        method = getattr(self, SNAPSHOT_SECTIONS[section])
+
+        if section in SNAPSHOT_USER_REQUEST_SECTIONS:
+            data = method(user_request=user_request, filters=filters)
+        else:
+            data = method(filters=filters)
+
+        if section in SNAPSHOT_RESULTS_SECTIONS:
+            return {"results": data}
+
+        return data
+
+    def get_snapshot(
+        self,
+        sections: list[str],
+        filters: dict | None = None,
+        user_request: str | None = None,
+    ) -> dict:
+        """
+        Evaluate the sections concurrently, with filters normalized once.
+
+        Every section has HUMAN_SUPPORT_SNAPSHOT_SECTION_TIMEOUT seconds from
+        when it starts. A section that fails or times out is returned with an
+        error instead of its data, and does not fail the others.
+        """
+        filters = filters or {}
+        timeout = settings.HUMAN_SUPPORT_SNAPSHOT_SECTION_TIMEOUT
+        started_at: dict[str, float] = {}
+        snapshot: dict[str, dict] = {}
+
+        def elapsed_ms(section: str) -> int:
+            return int((time.monotonic() - started_at[section]) * 1000)
+
+        def run(section: str):
+            started_at[section] = time.monotonic()
+
+            try:
+                return self._get_snapshot_section(section, filters, user_request)
+            finally:
+                connections.close_all()
+
+        self._normalized_filters_memo = {}
+        executor = ThreadPoolExecutor(
+            max_workers=max(
+                1, min(len(sections), settings.HUMAN_SUPPORT_SNAPSHOT_MAX_WORKERS)
+            )
+        )
+
+        try:
+            # Expanding "__all__" tokens queries the sectors, queues and tags,
+            # so it is done here once instead of once per section
+            self._normalize_filters(filters)
+
+            futures = {executor.submit(run, section): section for section in sections}
+            pending = set(futures)
+
+            while pending:
+                deadlines = [
+                    started_at[futures[future]] + timeout
+                    for future in pending
+                    if futures[future] in started_at
+                ]
+                done, pending = wait(
+                    pending,
+                    timeout=(
+                        max(0, min(deadlines) - time.monotonic())
+                        if deadlines
+                        else timeout
+                    ),
+                    return_when=FIRST_COMPLETED,
+                )
+
+                for future in done:
+                    section = futures[future]
+
+                    try:
+                        snapshot[section] = {"data": future.result()}
+                    except Exception as error:
+                        logger.exception(
+                            "[HUMAN SUPPORT SNAPSHOT] Section %s failed for project %s: %s",
+                            section,
+                            self.project.uuid,
+                            error,
+                        )
+                        snapshot[section] = {"error": "failed"}
+
+                    snapshot[section]["elapsed_ms"] = elapsed_ms(section)
+
+                for future in list(pending):
+                    section = futures[future]
+
+                    if (
+                        section in started_at
+                        and time.monotonic() - started_at[section] >= timeout
+                    ):
+                        pending.discard(future)
+                        logger.warning(
+                            "[HUMAN SUPPORT SNAPSHOT] Section %s timed out for project %s",
+                            section,
+                            self.project.uuid,
+                        )
+                        snapshot[section] = {
+                            "error": "timeout",
+                            "elapsed_ms": elapsed_ms(section),
+                        }
+        finally:
+            # Sections that timed out are not waited for
+            executor.shutdown(wait=False, cancel_futures=True)
+            self._normalized_filters_memo = None
+
+        return {section: snapshot[section] for section in sections}
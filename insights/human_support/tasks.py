@@ -0,0 +1,61 @@
+import logging
+
+from django.conf import settings
+
+from insights.celery import app
+from insights.core.dispatch import DebouncedTaskDispatcher
+from insights.dashboards.models import HUMAN_SERVICE_DASHBOARD_V2_NAME
+from insights.human_support.rollups import RoomsRollups
+from insights.projects.models import Project
+
+
+logger = logging.getLogger(__name__)
+
+
+@app.task
+def refresh_rooms_rollups():
+    """
+    Scheduled task to store the closed days of rooms rollups of the projects
+    with the human support dashboard, one task per project.
+    """
+    if not settings.ROOMS_ROLLUPS_ENABLED:
+        logger.info("[ refresh_rooms_rollups task ] Rooms rollups are disabled")
+        return
+
+    projects_uuids = (
+        Project.objects.filter(
+            is_active=True, dashboards__name=HUMAN_SERVICE_DASHBOARD_V2_NAME
+        )
+        .values_list("uuid", flat=True)
+        .distinct()
+    )
+
+    dispatcher = DebouncedTaskDispatcher()
+
+    for project_uuid in projects_uuids:
+        dispatcher.dispatch(refresh_project_rooms_rollups, args=[str(project_uuid)])
+
+
+@app.task
+def refresh_project_rooms_rollups(project_uuid: str):
+    """
+    Store the closed days of the project's rooms rollups after its watermark.
+    """
+    try:
+        project = Project.objects.get(uuid=project_uuid)
+    except Project.DoesNotExist:
+        logger.error(
+            "[ refresh_project_rooms_rollups task ] Project %s not found",
+            project_uuid,
+        )
+        return
+
+    try:
+        RoomsRollups(project).refresh()
+    except Exception as error:
+        logger.error(
+            "[ refresh_project_rooms_rollups task ] Failed to refresh project %s: %s",
+            project_uuid,
+            error,
+            exc_info=True,
+        )
@@ -0,0 +1,387 @@
+from datetime import date, datetime, timedelta
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytz
+from django.test import TestCase, override_settings
+
+from insights.dashboards.models import HUMAN_SERVICE_DASHBOARD_V2_NAME, Dashboard
+from insights.human_support.choices import RoomsRollupStatus
+from insights.human_support.models import RoomsDailyRollup, RoomsRollupWatermark
+from insights.human_support.rollups import RoomsRollups
+from insights.human_support.services import HumanSupportDashboardService
+from insights.human_support.tasks import (
+    refresh_project_rooms_rollups,
+    refresh_rooms_rollups,
+)
+from insights.projects.models import Project
+from insights.sources.rooms.usecases.query_execute import (
+    QueryExecutor as RoomsQueryExecutor,
+)
+
+
+TIMEZONE = pytz.timezone("America/Sao_Paulo")
+SECTOR = uuid4()
+QUEUE_1 = uuid4()
+QUEUE_2 = uuid4()
+TAG_1 = uuid4()
+
+
+@override_settings(
+    ROOMS_ROLLUPS_ENABLED=True,
+    ROOMS_ROLLUPS_OPEN_DAYS=2,
+    ROOMS_ROLLUPS_BACKFILL_DAYS=30,
+    ROOMS_ROLLUPS_MAX_DAYS_PER_REFRESH=7,
+)
+class TestRoomsRollups(TestCase):
+    def setUp(self):
+        self.project = Project.objects.create(
+            name="Test Project", timezone="America/Sao_Paulo"
+        )
+        self.rows = {}
+        self.execute = patch.object(
+            RoomsQueryExecutor, "execute", side_effect=self._execute
+        ).start()
+        self.addCleanup(patch.stopall)
+        self.queues_executor = MagicMock()
+        self.queues_executor.execute.return_value = {
+            "results": [
+                {
+                    "queue_uuid": queue,
+                    "queue_name": name,
+                    "queue_is_deleted": False,
+                    "sector_uuid": SECTOR,
+                    "sector_name": "Sector",
+                    "sector_is_deleted": False,
+                }
+                for queue, name in ((QUEUE_1, "Queue 1"), (QUEUE_2, "Queue 2"))
+            ]
+        }
+        self.tags_executor = MagicMock()
+        self.tags_executor.execute.return_value = {
+            "results": [
+                {
+                    "tag_uuid": TAG_1,
+                    "tag_name": "Tag 1",
+                    "tag_is_deleted": False,
+                    "sector_uuid": SECTOR,
+                    "sector_name": "Sector",
+                    "sector_is_deleted": False,
+                }
+            ]
+        }
+        self.rollups = RoomsRollups(
+            self.project,
+            executor=RoomsQueryExecutor,
+            queues_executor=self.queues_executor,
+            tags_executor=self.tags_executor,
+        )
+        self.filters = {"project": str(self.project.uuid)}
+
+    def _execute(self, filters, operation, *args, **kwargs):
+        status = "CLOSED" if "ended_at__gte" in filters else "OPENED"
+
+        return {"results": self.rows.get((operation, status), [])}
+
+    def _get_calls(self, operation: str) -> list:
+        return [
+            call
+            for call in self.execute.call_args_list
+            if call.kwargs["operation"] == operation
+        ]
+
+    def _now(self, day: int):
+        return patch(
+            "insights.human_support.rollups.dj_timezone.now",
+            return_value=TIMEZONE.localize(datetime(2025, 1, day, 10)),
+        )
+
+    def _create_watermark(self, rolled_from: date, rolled_until: date):
+        RoomsRollupWatermark.objects.create(
+            project=self.project, rolled_from=rolled_from, rolled_until=rolled_until
+        )
+
+    def _create_rollup(self, day: date, queue, value: int, **kwargs):
+        RoomsDailyRollup.objects.create(
+            project=self.project,
+            status=kwargs.pop("status", RoomsRollupStatus.OPENED),
+            day=day,
+            sector_uuid=SECTOR,
+            queue_uuid=queue,
+            value=value,
+            **kwargs,
+        )
+
+    def test_first_refresh_backfills_from_the_oldest_day(self):
+        self.rows[("day_queue_group_count", "OPENED")] = [
+            {
+                "day": date(2024, 12, 10),
+                "sector_uuid": SECTOR,
+                "queue_uuid": QUEUE_1,
+                "value": 3,
+            }
+        ]
+        self.rows[("day_queue_tag_group_count", "CLOSED")] = [
+            {
+                "day": date(2024, 12, 11),
+                "sector_uuid": SECTOR,
+                "queue_uuid": QUEUE_1,
+                "tag_uuid": TAG_1,
+                "value": 2,
+            }
+        ]
+
+        with self._now(10):
+            days = self.rollups.refresh()
+
+        self.assertEqual(days, 7)
+        watermark = RoomsRollupWatermark.objects.get(project=self.project)
+        # Backfill of 30 days ending on the last closed day, 2025-01-08
+        self.assertEqual(watermark.rolled_from, date(2024, 12, 10))
+        self.assertEqual(watermark.rolled_until, date(2024, 12, 16))
+
+        calls = self._get_calls("day_queue_group_count")
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(
+            calls[0].kwargs["filters"]["created_on__gte"],
+            TIMEZONE.localize(datetime(2024, 12, 10)).isoformat(),
+        )
+        self.assertFalse(calls[1].kwargs["filters"]["is_active"])
+        self.assertEqual(
+            calls[1].kwargs["query_kwargs"],
+            {"time_field": "ended_at", "timezone": "America/Sao_Paulo"},
+        )
+
+        opened = RoomsDailyRollup.objects.get(status=RoomsRollupStatus.OPENED)
+        self.assertEqual(
+            (opened.day, opened.queue_uuid, opened.tag_uuid, opened.value),
+            (date(2024, 12, 10), QUEUE_1, None, 3),
+        )
+        closed = RoomsDailyRollup.objects.get(status=RoomsRollupStatus.CLOSED)
+        self.assertEqual((closed.tag_uuid, closed.value), (TAG_1, 2))
+
+    def test_refresh_continues_after_the_watermark_until_the_open_days(self):
+        self._create_watermark(date(2024, 12, 1), date(2025, 1, 5))
+
+        with self._now(10):
+            self.assertEqual(self.rollups.refresh(), 3)
+
+            self.execute.reset_mock()
+            self.assertEqual(self.rollups.refresh(), 0)
+
+        self.execute.assert_not_called()
+        watermark = RoomsRollupWatermark.objects.get(project=self.project)
+        self.assertEqual(watermark.rolled_from, date(2024, 12, 1))
+        self.assertEqual(watermark.rolled_until, date(2025, 1, 8))
+
+    def test_volume_by_queue_merges_rollups_and_live_tail(self):
+        self._create_watermark(date(2025, 1, 1), date(2025, 1, 8))
+        self._create_rollup(date(2025, 1, 1), QUEUE_1, 4)
+        self._create_rollup(date(2025, 1, 8), QUEUE_2, 1)
+        self._create_rollup(date(2025, 1, 8), QUEUE_2, 9, tag_uuid=TAG_1)
+        self._create_rollup(
+            date(2025, 1, 8), QUEUE_2, 7, status=RoomsRollupStatus.CLOSED
+        )
+        self.rows[("day_queue_group_count", "OPENED")] = [
+            {
+                "day": date(2025, 1, 9),
+                "sector_uuid": SECTOR,
+                "queue_uuid": QUEUE_2,
+                "value": 5,
+            }
+        ]
+        start = TIMEZONE.localize(datetime(2025, 1, 1))
+        end = TIMEZONE.localize(datetime(2025, 1, 10, 23, 59, 59))
+
+        results = self.rollups.get_volume_by_queue(
+            self.filters, RoomsRollupStatus.OPENED, start, end
+        )
+
+        self.assertEqual(
+            results,
+            {
+                "next": None,
+                "previous": None,
+                "count": 2,
+                "results": [
+                    {
+                        "sector_name": "Sector",
+                        "is_deleted": False,
+                        "queues": [
+                            {"queue_name": "Queue 2", "is_deleted": False, "value": 6},
+                            {"queue_name": "Queue 1", "is_deleted": False, "value": 4},
+                        ],
+                    }
+                ],
+            },
+        )
+
+        live_calls = self._get_calls("day_queue_group_count")
+        self.assertEqual(len(live_calls), 1)
+        self.assertEqual(
+            live_calls[0].kwargs["filters"]["created_on__gte"],
+            TIMEZONE.localize(datetime(2025, 1, 9)).isoformat(),
+        )
+        self.assertEqual(
+            live_calls[0].kwargs["filters"]["created_on__lte"], end.isoformat()
+        )
+        self.assertCountEqual(
+            self.queues_executor.execute.call_args.kwargs["filters"]["uuid"],
+            [str(QUEUE_1), str(QUEUE_2)],
+        )
+
+    def test_partial_first_day_and_days_before_the_watermark_are_live(self):
+        self._create_watermark(date(2025, 1, 3), date(2025, 1, 8))
+        self._create_rollup(date(2025, 1, 3), QUEUE_1, 4)
+        start = TIMEZONE.localize(datetime(2025, 1, 1, 12))
+        end = TIMEZONE.localize(datetime(2025, 1, 5, 23, 59, 59))
+
+        self.rollups.get_volume_by_queue(
+            self.filters, RoomsRollupStatus.OPENED, start, end
+        )
+
+        live_calls = self._get_calls("day_queue_group_count")
+        self.assertEqual(len(live_calls), 1)
+        self.assertEqual(
+            live_calls[0].kwargs["filters"]["created_on__gte"], start.isoformat()
+        )
+        self.assertEqual(
+            live_calls[0].kwargs["filters"]["created_on__lte"],
+            (
+                TIMEZONE.localize(datetime(2025, 1, 3)) - timedelta(microseconds=1)
+            ).isoformat(),
+        )
+
+    def test_volume_by_queue_filtered_by_tags_counts_tagged_rollups(self):
+        self._create_watermark(date(2025, 1, 1), date(2025, 1, 8))
+        self._create_rollup(date(2025, 1, 2), QUEUE_1, 10)
+        self._create_rollup(date(2025, 1, 2), QUEUE_1, 3, tag_uuid=TAG_1)
+        self._create_rollup(date(2025, 1, 2), QUEUE_1, 2, tag_uuid=uuid4())
+        start = TIMEZONE.localize(datetime(2025, 1, 1))
+        end = TIMEZONE.localize(datetime(2025, 1, 8, 23, 59, 59))
+
+        results = self.rollups.get_volume_by_queue(
+            {**self.filters, "tags__in": [str(TAG_1)]},
+            RoomsRollupStatus.OPENED,
+            start,
+            end,
+        )
+
+        self.assertEqual(results["results"][0]["queues"][0]["value"], 3)
+        self.execute.assert_not_called()
+
+    def test_volume_by_tag_uses_tagged_rollups(self):
+        self._create_watermark(date(2025, 1, 1), date(2025, 1, 8))
+        self._create_rollup(date(2025, 1, 2), QUEUE_1, 10)
+        self._create_rollup(date(2025, 1, 2), QUEUE_1, 3, tag_uuid=TAG_1)
+        self._create_rollup(date(2025, 1, 3), QUEUE_2, 2, tag_uuid=TAG_1)
+        start = TIMEZONE.localize(datetime(2025, 1, 1))
+        end = TIMEZONE.localize(datetime(2025, 1, 8, 23, 59, 59))
+
+        results = self.rollups.get_volume_by_tag(
+            self.filters, RoomsRollupStatus.OPENED, start, end
+        )
+
+        self.assertEqual(
+            results["results"],
+            [
+                {
+                    "sector_name": "Sector",
+                    "is_deleted": False,
+                    "tags": [{"tag_name": "Tag 1", "is_deleted": False, "value": 5}],
+                }
+            ],
+        )
+
+    def test_ranges_without_rolled_days_are_not_answered(self):
+        start = TIMEZONE.localize(datetime(2025, 1, 1))
+        end = TIMEZONE.localize(datetime(2025, 1, 8, 23, 59, 59))
+
+        self.assertIsNone(
+            self.rollups.get_volume_by_queue(
+                self.filters, RoomsRollupStatus.OPENED, start, end
+            )
+        )
+
+        self._create_watermark(date(2025, 1, 1), date(2025, 1, 8))
+
+        self.assertIsNone(
+            self.rollups.get_volume_by_tag(
+                {**self.filters, "tags__in": [str(TAG_1)]},
+                RoomsRollupStatus.OPENED,
+                start,
+                end,
+            )
+        )
+        self.assertIsNone(
+            self.rollups.get_volume_by_queue(
+                self.filters,
+                RoomsRollupStatus.OPENED,
+                TIMEZONE.localize(datetime(2025, 1, 9)),
+                TIMEZONE.localize(datetime(2025, 1, 10, 23, 59, 59)),
+            )
+        )
+
+        with override_settings(ROOMS_ROLLUPS_ENABLED=False):
+            self.assertIsNone(
+                self.rollups.get_volume_by_queue(
+                    self.filters, RoomsRollupStatus.OPENED, start, end
+                )
+            )
+
+    @patch("insights.human_support.services.RoomsRollups")
+    def test_service_uses_rollups_except_for_active_chips(self, mock_rollups):
+        rollups_result = {"next": None, "previous": None, "count": 0, "results": []}
+        mock_rollups.return_value.get_volume_by_queue.return_value = rollups_result
+        service = HumanSupportDashboardService(project=self.project)
+        filters = {
+            "start_date": TIMEZONE.localize(datetime(2025, 1, 1)),
+            "end_date": TIMEZONE.localize(datetime(2025, 1, 8)),
+        }
+
+        self.assertEqual(
+            service.get_analysis_volume_by_queue(
+                filters={**filters, "chip_name": "closed"}
+            ),
+            rollups_result,
+        )
+        args = mock_rollups.return_value.get_volume_by_queue.call_args.args
+        self.assertEqual(args[1], RoomsRollupStatus.CLOSED)
+        self.assertNotIn("ended_at__gte", args[0])
+
+        self.execute.return_value = {"results": [], "count": 0}
+        service.get_analysis_volume_by_queue(
+            filters={**filters, "chip_name": "waiting"}
+        )
+
+        self.assertEqual(mock_rollups.return_value.get_volume_by_queue.call_count, 1)
+        self.assertEqual(
+            self.execute.call_args.kwargs["operation"], "group_by_queue_count"
+        )
+
+
+class TestRoomsRollupsTasks(TestCase):
+    def setUp(self):
+        self.project = Project.objects.create(name="Test Project")
+
+    @patch("insights.human_support.tasks.DebouncedTaskDispatcher")
+    def test_refresh_is_dispatched_for_human_support_projects(self, mock_dispatcher):
+        Dashboard.objects.create(
+            project=self.project, name=HUMAN_SERVICE_DASHBOARD_V2_NAME
+        )
+        Project.objects.create(name="Without dashboard")
+
+        refresh_rooms_rollups()
+
+        mock_dispatcher.return_value.dispatch.assert_called_once_with(
+            refresh_project_rooms_rollups, args=[str(self.project.uuid)]
+        )
+
+    @patch("insights.human_support.tasks.RoomsRollups")
+    def test_refresh_project_failure_is_logged(self, mock_rollups):
+        mock_rollups.return_value.refresh.side_effect = Exception("chats down")
+
+        with self.assertLogs("insights.human_support.tasks", level="ERROR"):
+            refresh_project_rooms_rollups(str(self.project.uuid))
+
+        mock_rollups.assert_called_once_with(self.project)
@@ -1,8 +1,9 @@
+import threading
 from datetime import date
 from uuid import uuid4
 from unittest.mock import MagicMock, patch
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
 from insights.human_support.services import HumanSupportDashboardService
 from insights.projects.models import Project
@@ -146,17 +147,27 @@ class TestHumanSupportDashboardService(TestCase):
         )
         self.assertNotIn("conversation_duration_goal", result["average_time_chat"])
 
+    def _mock_rooms_hour_counts(self, mock_rooms, label: str, value: int):
+        def execute(filters, operation, *args, **kwargs):
+            if operation == "timeseries_hour_group_count":
+                return {"results": [{"label": label, "value": value}]}
+            return {"results": []}
+
+        mock_rooms.execute.side_effect = execute
+
     @patch("insights.human_support.services.RoomsQueryExecutor")
     def test_get_peaks_in_human_service(self, mock_rooms):
-        mock_rooms.execute.return_value = {"results": [{"hour": 10, "count": 5}]}
+        self._mock_rooms_hour_counts(mock_rooms, "10h", 5)
         result = self.service.get_peaks_in_human_service()
-        self.assertEqual(result, [{"hour": 10, "count": 5}])
+        self.assertEqual(len(result), 24)
+        self.assertEqual(result[10], {"label": "10h", "value": 5})
 
     @patch("insights.human_support.services.RoomsQueryExecutor")
     def test_get_analysis_peaks_in_human_service(self, mock_rooms):
-        mock_rooms.execute.return_value = {"results": [{"hour": 14, "count": 3}]}
+        self._mock_rooms_hour_counts(mock_rooms, "14h", 3)
         result = self.service.get_analysis_peaks_in_human_service()
-        self.assertEqual(result, [{"hour": 14, "count": 3}])
+        self.assertEqual(len(result), 24)
+        self.assertEqual(result[14], {"label": "14h", "value": 3})
 
     @patch("insights.human_support.services.RoomsQueryExecutor")
     def test_get_detailed_monitoring_on_going(self, mock_rooms):
@@ -1287,3 +1298,103 @@ class TestHumanSupportDashboardService(TestCase):
         )
         self.assertEqual(result["count"], 1)
         self.assertEqual(result["results"][0]["agent"], "a1")
+
+
+@override_settings(
+    HUMAN_SUPPORT_SNAPSHOT_MAX_WORKERS=4, HUMAN_SUPPORT_SNAPSHOT_SECTION_TIMEOUT=5
+)
+class TestHumanSupportDashboardServiceSnapshot(TestCase):
+    def setUp(self):
+        self.project = Project.objects.create(
+            name="Test Project",
+            timezone="America/Sao_Paulo",
+        )
+        self.service = HumanSupportDashboardService(project=self.project)
+
+    def test_get_snapshot_returns_sections_with_timings(self):
+        with patch.object(
+            self.service, "get_attendance_status", return_value={"is_waiting": 1}
+        ), patch.object(
+            self.service, "get_peaks_in_human_service", return_value=[{"value": 2}]
+        ):
+            snapshot = self.service.get_snapshot(
+                ["monitoring_list_status", "monitoring_peaks_in_human_service"]
+            )
+
+        self.assertEqual(
+            list(snapshot),
+            ["monitoring_list_status", "monitoring_peaks_in_human_service"],
+        )
+        self.assertEqual(snapshot["monitoring_list_status"]["data"], {"is_waiting": 1})
+        self.assertEqual(
+            snapshot["monitoring_peaks_in_human_service"]["data"],
+            {"results": [{"value": 2}]},
+        )
+        self.assertIn("elapsed_ms", snapshot["monitoring_list_status"])
+
+    def test_get_snapshot_passes_user_request_to_csat_totals(self):
+        with patch.object(
+            self.service, "csat_score_by_agents", return_value={"results": []}
+        ) as mock_csat:
+            self.service.get_snapshot(
+                ["monitoring_csat_totals"], filters={}, user_request="a@test.com"
+            )
+
+        mock_csat.assert_called_once_with(user_request="a@test.com", filters={})
+
+    def test_get_snapshot_returns_partial_results_when_a_section_fails(self):
+        with patch.object(
+            self.service, "get_attendance_status", side_effect=Exception("down")
+        ), patch.object(self.service, "get_csat_ratings", return_value={"1": {}}):
+            snapshot = self.service.get_snapshot(
+                ["monitoring_list_status", "monitoring_csat_ratings"]
+            )
+
+        self.assertEqual(snapshot["monitoring_list_status"]["error"], "failed")
+        self.assertNotIn("data", snapshot["monitoring_list_status"])
+        self.assertEqual(snapshot["monitoring_csat_ratings"]["data"], {"1": {}})
+
+    @override_settings(HUMAN_SUPPORT_SNAPSHOT_SECTION_TIMEOUT=0.1)
+    def test_get_snapshot_does_not_wait_for_slow_sections(self):
+        release = threading.Event()
+
+        def slow_section(filters=None):
+            release.wait(5)
+            return {}
+
+        try:
+            with patch.object(
+                self.service, "get_time_metrics", side_effect=slow_section
+            ), patch.object(self.service, "get_csat_ratings", return_value={}):
+                snapshot = self.service.get_snapshot(
+                    ["monitoring_average_time_metrics", "monitoring_csat_ratings"]
+                )
+        finally:
+            release.set()
+
+        self.assertEqual(
+            snapshot["monitoring_average_time_metrics"]["error"], "timeout"
+        )
+        self.assertEqual(snapshot["monitoring_csat_ratings"]["data"], {})
+
+    @patch("insights.human_support.services.SectorsQueryExecutor")
+    def test_get_snapshot_expands_all_tokens_once(self, mock_sectors):
+        mock_sectors.execute.return_value = {"results": [{"uuid": str(uuid4())}]}
+
+        def section(filters=None):
+            return self.service._normalize_filters(filters)
+
+        with patch.object(
+            self.service, "get_volume_by_queue", side_effect=section
+        ), patch.object(self.service, "get_volume_by_tag", side_effect=section):
+            snapshot = self.service.get_snapshot(
+                ["monitoring_queue_volume", "monitoring_tags_volume"],
+                filters={"sectors": "__all__"},
+            )
+
+        mock_sectors.execute.assert_called_once()
+        self.assertEqual(
+            snapshot["monitoring_queue_volume"]["data"],
+            snapshot["monitoring_tags_volume"]["data"],
+        )
+        self.assertIsNone(self.service._normalized_filters_memo)
@@ -14,6 +14,8 @@ from insights.authentication.services.tests.test_jwt_service import (
 )
 from insights.authentication.tests.decorators import with_internal_auth
 from insights.projects.models import Project
+from insights.sources.cache import CacheClient
+from insights.sources.vtexcredentials.services import VtexCredentialsService
 
 
 JWT_PRIVATE_KEY = generate_private_key()
@@ -160,3 +162,34 @@ class TestUpdateProjectVTEXAccountViewWithJWTAuthentication(
         other_project.refresh_from_db()
         self.assertEqual(self.project.vtex_account, "xyz")
         self.assertEqual(other_project.vtex_account, "other")
+
+
+@override_settings(JWT_SECRET_KEY=JWT_PRIVATE_KEY_PEM)
+@override_settings(JWT_PUBLIC_KEY=JWT_PUBLIC_KEY_PEM)
+class TestProjectVTEXCredentialsView(APITestCase):
+    def setUp(self):
+        self.project = Project.objects.create(name="Alphabet")
+        self.cache_key = VtexCredentialsService.get_key(self.project.uuid)
+        CacheClient().set(self.cache_key, VtexCredentialsService.not_found_value)
+
+    def tearDown(self):
+        CacheClient().delete(self.cache_key)
+
+    def test_cannot_invalidate_vtex_credentials_when_unauthenticated(self):
+        response = self.client.delete(
+            f"/v1/internal/projects/{self.project.uuid}/vtex-credentials"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertIsNotNone(CacheClient().get(self.cache_key))
+
+    def test_invalidates_vtex_credentials_with_jwt_authentication(self):
+        token = JWTService().generate_jwt_token(self.project.uuid)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+        response = self.client.delete(
+            f"/v1/internal/projects/{self.project.uuid}/vtex-credentials"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertIsNone(CacheClient().get(self.cache_key))
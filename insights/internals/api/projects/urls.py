@@ -1,6 +1,6 @@
 from django.urls import path
 
-from .views import UpdateProjectVTEXAccountView
+from .views import ProjectVTEXCredentialsView, UpdateProjectVTEXAccountView
 
 app_name = "projects"
 
@@ -10,4 +10,9 @@ urlpatterns = [
         UpdateProjectVTEXAccountView.as_view(),
         name="update_vtex_account",
     ),
+    path(
+        "<uuid:project_uuid>/vtex-credentials",
+        ProjectVTEXCredentialsView.as_view(),
+        name="vtex_credentials",
+    ),
 ]
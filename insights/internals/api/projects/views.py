@@ -12,6 +12,7 @@ from insights.authentication.permissions import (
 from insights.authentication.weni_auth import weni_authentication_classes
 from insights.projects.models import Project
 from insights.projects.usecases.update_vtex_account import UpdateProjectVTEXAccount
+from insights.sources.vtexcredentials.services import VtexCredentialsService
 
 from .serializers import (
     ProjectVTEXAccountSerializer,
@@ -51,3 +52,25 @@ class UpdateProjectVTEXAccountView(WeniAuthViewMixin, views.APIView):
         ).data
 
         return Response(response_data, status=status.HTTP_200_OK)
+
+
+class ProjectVTEXCredentialsView(WeniAuthViewMixin, views.APIView):
+    permission_classes = [
+        HasInternalAuthenticationPermission
+        | (IsAuthenticated & InternalAuthenticationPermission)
+    ]
+
+    @property
+    def authentication_classes(self):
+        return weni_authentication_classes(super().authentication_classes)
+
+    def delete(self, request: Request, project_uuid: str) -> Response:
+        """
+        Invalidate the cached VTEX credentials of the project, called when its
+        VTEX integration details change.
+        """
+        project = get_object_or_404(Project, uuid=self.auth.project_uuid)
+
+        VtexCredentialsService().invalidate(project.uuid)
+
+        return Response(status=status.HTTP_204_NO_CONTENT)
@@ -1,3 +1,5 @@
+from urllib.parse import urlsplit
+
 import requests
 
 from django.conf import settings
@@ -7,7 +9,31 @@ class ElasticsearchClient:
     def __init__(self):
         self.base_url = settings.FLOWS_ES_DATABASE
 
+        url = urlsplit(self.base_url)
+        self.host_url = f"{url.scheme}://{url.netloc}"
+
     def get(self, endpoint: str, params: dict, query: dict):
         return requests.get(
             url=f"{self.base_url}/{endpoint}", params=params, json=query
         ).json()
+
+    def open_point_in_time(self, keep_alive: str) -> str:
+        """
+        Open a point in time over the index and return its id.
+        """
+        response = requests.post(
+            url=f"{self.base_url}/_pit", params={"keep_alive": keep_alive}
+        )
+        response.raise_for_status()
+
+        return response.json()["id"]
+
+    def search_point_in_time(self, query: dict) -> dict:
+        """
+        Search a point in time. The index comes from the point in time,
+        so the request goes to the host and not to the index.
+        """
+        return requests.post(url=f"{self.host_url}/_search", json=query).json()
+
+    def close_point_in_time(self, pit_id: str) -> None:
+        requests.delete(url=f"{self.host_url}/_pit", json={"id": pit_id})
@@ -1,9 +1,28 @@
+import logging
+import queue
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from insights.metrics.conversations.integrations.elasticsearch.clients import (
     ElasticsearchClient,
 )
 
+logger = logging.getLogger(__name__)
+
+
+# Fields read by the report worksheets from each flow run
+FLOWSRUN_RESULTS_EXPORT_SOURCE_FIELDS = [
+    "contact_name",
+    "contact_urn",
+    "modified_on",
+    "values.name",
+    "values.value",
+]
+
+_SLICE_DONE = object()
+
 
 class ConversationsElasticsearchService:
     def __init__(self, client: ElasticsearchClient):
@@ -17,7 +36,7 @@ class ConversationsElasticsearchService:
                 date = date
         return date
 
-    def get_flowsrun_results_by_contacts(
+    def _get_flowsrun_results_query(
         self,
         project_uuid: str,
         flow_uuid: str,
@@ -25,9 +44,8 @@ class ConversationsElasticsearchService:
         end_date: str,
         op_field: str,
         page_size: int,
-        search_after: list[str] | None = None,
         include_values: list[str] | None = None,
-    ) -> list[dict]:
+    ) -> dict:
         start_date = self._format_date(start_date)
         end_date = self._format_date(end_date)
 
@@ -80,6 +98,45 @@ class ConversationsElasticsearchService:
             ],
         }
 
+        return query
+
+    def _format_flowsrun_hit(self, hit: dict, op_field: str) -> dict:
+        op_field_value = None
+        values = hit["_source"].get("values", [])
+
+        for value in values:
+            if value.get("name") == op_field:
+                op_field_value = value.get("value")
+                break
+
+        return {
+            "contact": {"name": hit["_source"].get("contact_name", "")},
+            "urn": hit["_source"].get("contact_urn", ""),
+            "modified_on": hit["_source"].get("modified_on", ""),
+            "op_field_value": op_field_value,
+        }
+
+    def get_flowsrun_results_by_contacts(
+        self,
+        project_uuid: str,
+        flow_uuid: str,
+        start_date: str,
+        end_date: str,
+        op_field: str,
+        page_size: int,
+        search_after: list[str] | None = None,
+        include_values: list[str] | None = None,
+    ) -> list[dict]:
+        query = self._get_flowsrun_results_query(
+            project_uuid=project_uuid,
+            flow_uuid=flow_uuid,
+            start_date=start_date,
+            end_date=end_date,
+            op_field=op_field,
+            page_size=page_size,
+            include_values=include_values,
+        )
+
         if search_after:
             query["search_after"] = search_after
 
@@ -90,21 +147,7 @@ class ConversationsElasticsearchService:
         last_sort = []
 
         for hit in response["hits"]["hits"]:
-            op_field_value = None
-            values = hit["_source"].get("values", [])
-
-            for value in values:
-                if value.get("name") == op_field:
-                    op_field_value = value.get("value")
-                    break
-
-            formatted_hit = {
-                "contact": {"name": hit["_source"].get("contact_name", "")},
-                "urn": hit["_source"].get("contact_urn", ""),
-                "modified_on": hit["_source"].get("modified_on", ""),
-                "op_field_value": op_field_value,
-            }
-            data.append(formatted_hit)
+            data.append(self._format_flowsrun_hit(hit, op_field))
 
             last_sort = hit.get("sort", [])
 
@@ -116,3 +159,127 @@ class ConversationsElasticsearchService:
         }
 
         return result
+
+    def _put_until_stopped(
+        self, pages: queue.Queue, stop: threading.Event, item
+    ) -> None:
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _export_flowsrun_results_slice(
+        self,
+        query: dict,
+        op_field: str,
+        pages: queue.Queue,
+        stop: threading.Event,
+    ) -> None:
+        """
+        Page through one slice of a point in time search, putting each page
+        of formatted hits in the queue. Errors are put in the queue too,
+        and the slice always ends with _SLICE_DONE.
+        """
+        try:
+            while not stop.is_set():
+                response = self.client.search_point_in_time(query)
+                hits = response["hits"]["hits"]
+
+                if not hits:
+                    break
+
+                self._put_until_stopped(
+                    pages,
+                    stop,
+                    [self._format_flowsrun_hit(hit, op_field) for hit in hits],
+                )
+
+                query["search_after"] = hits[-1]["sort"]
+                query["pit"] = {
+                    **query["pit"],
+                    "id": response.get("pit_id", query["pit"]["id"]),
+                }
+        except Exception as e:
+            self._put_until_stopped(pages, stop, e)
+        finally:
+            self._put_until_stopped(pages, stop, _SLICE_DONE)
+
+    def iter_flowsrun_results_pages(
+        self,
+        project_uuid: str,
+        flow_uuid: str,
+        start_date: str,
+        end_date: str,
+        op_field: str,
+        page_size: int,
+        slices: int,
+        keep_alive: str,
+        include_values: list[str] | None = None,
+    ) -> Iterator[list[dict]]:
+        """
+        Export every flow run result of the flow over a point in time,
+        reading the given number of slices concurrently.
+
+        Pages are yielded as soon as any slice returns them, so they are not
+        globally sorted. Only the fields the worksheets need are requested.
+        Closing the iterator early stops the slices and the point in time.
+        """
+        query = self._get_flowsrun_results_query(
+            project_uuid=project_uuid,
+            flow_uuid=flow_uuid,
+            start_date=start_date,
+            end_date=end_date,
+            op_field=op_field,
+            page_size=page_size,
+            include_values=include_values,
+        )
+        query["_source"] = FLOWSRUN_RESULTS_EXPORT_SOURCE_FIELDS
+
+        pit_id = self.client.open_point_in_time(keep_alive)
+        pages: queue.Queue = queue.Queue(maxsize=slices * 2)
+        stop = threading.Event()
+
+        executor = ThreadPoolExecutor(max_workers=slices)
+
+        try:
+            for slice_id in range(slices):
+                slice_query = {
+                    **query,
+                    "pit": {"id": pit_id, "keep_alive": keep_alive},
+                }
+
+                if slices > 1:
+                    slice_query["slice"] = {"id": slice_id, "max": slices}
+
+                executor.submit(
+                    self._export_flowsrun_results_slice,
+                    slice_query,
+                    op_field,
+                    pages,
+                    stop,
+                )
+
+            remaining_slices = slices
+
+            while remaining_slices:
+                item = pages.get()
+
+                if item is _SLICE_DONE:
+                    remaining_slices -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            stop.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+            try:
+                self.client.close_point_in_time(pit_id)
+            except Exception as e:
+                logger.warning(
+                    "[ConversationsElasticsearchService] Failed to close point in time: %s",
+                    e,
+                )
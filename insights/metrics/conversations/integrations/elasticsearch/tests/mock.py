@@ -1,3 +1,5 @@
+import threading
+import uuid
 from unittest.mock import MagicMock
 
 
@@ -7,3 +9,91 @@ class MockElasticsearchClient:
 
     def get(self, params: dict, query: dict):
         return MagicMock()
+
+
+class InMemoryElasticsearchClient:
+    """
+    Elasticsearch stand-in for point in time searches over in-memory
+    documents. It honours slice, sort, search_after, size and _source,
+    and ignores the query: every document matches.
+    """
+
+    def __init__(self, documents: list[dict]):
+        self.documents = documents
+        self.open_points_in_time = set()
+        self.searches = []
+        self._lock = threading.Lock()
+
+    def open_point_in_time(self, keep_alive: str) -> str:
+        pit_id = str(uuid.uuid4())
+        self.open_points_in_time.add(pit_id)
+        return pit_id
+
+    def close_point_in_time(self, pit_id: str) -> None:
+        self.open_points_in_time.discard(pit_id)
+
+    def _sort_values(self, document: dict, sort: list[dict]) -> list:
+        return [document[next(iter(field))] for field in sort]
+
+    def _select_source(self, document: dict, fields: list[str]) -> dict:
+        source = {}
+
+        for field in fields:
+            name, _, sub_field = field.partition(".")
+
+            if name not in document:
+                continue
+
+            if not sub_field:
+                source[name] = document[name]
+                continue
+
+            items = source.setdefault(name, [{} for _ in document[name]])
+            for item, value in zip(items, document[name]):
+                if sub_field in value:
+                    item[sub_field] = value[sub_field]
+
+        return source
+
+    def search_point_in_time(self, query: dict) -> dict:
+        with self._lock:
+            self.searches.append(query)
+
+        if query["pit"]["id"] not in self.open_points_in_time:
+            return {"error": "point in time not found"}
+
+        documents = self.documents
+
+        if slice_ := query.get("slice"):
+            documents = [
+                document
+                for index, document in enumerate(documents)
+                if index % slice_["max"] == slice_["id"]
+            ]
+
+        sort = query["sort"]
+        documents = sorted(
+            documents,
+            key=lambda document: self._sort_values(document, sort),
+            reverse=True,
+        )
+
+        if search_after := query.get("search_after"):
+            documents = [
+                document
+                for document in documents
+                if self._sort_values(document, sort) < search_after
+            ]
+
+        return {
+            "pit_id": query["pit"]["id"],
+            "hits": {
+                "hits": [
+                    {
+                        "_source": self._select_source(document, query["_source"]),
+                        "sort": self._sort_values(document, sort),
+                    }
+                    for document in documents[: query["size"]]
+                ]
+            },
+        }
@@ -4,9 +4,11 @@ import uuid
 from django.test import TestCase
 
 from insights.metrics.conversations.integrations.elasticsearch.services import (
+    FLOWSRUN_RESULTS_EXPORT_SOURCE_FIELDS,
     ConversationsElasticsearchService,
 )
 from insights.metrics.conversations.integrations.elasticsearch.tests.mock import (
+    InMemoryElasticsearchClient,
     MockElasticsearchClient,
 )
 
@@ -62,3 +64,103 @@ class TestConversationsElasticsearchService(TestCase):
         self.assertEqual(results["contacts"][0]["urn"], "1234567890")
         self.assertEqual(results["contacts"][0]["op_field_value"], "5")
         self.assertEqual(results["contacts"][0]["modified_on"], "2025-01-01")
+
+
+class TestConversationsElasticsearchServiceSlicedExport(TestCase):
+    def setUp(self):
+        self.op_field = "user_feedback"
+        self.documents = [
+            {
+                "project_uuid": "project",
+                "contact_uuid": f"contact-{index:03d}",
+                "contact_name": f"Contact {index}",
+                "contact_urn": f"whatsapp:{index}",
+                "created_on": "2025-01-01T00:00:00",
+                "modified_on": f"2025-01-01T00:{index % 60:02d}:00",
+                "values": [
+                    {"name": self.op_field, "value": str(index % 5 + 1)},
+                ],
+            }
+            for index in range(53)
+        ]
+        self.client = InMemoryElasticsearchClient(self.documents)
+        self.service = ConversationsElasticsearchService(client=self.client)
+
+    def export(self, **kwargs) -> list[list[dict]]:
+        return list(
+            self.service.iter_flowsrun_results_pages(
+                project_uuid="project",
+                flow_uuid="flow",
+                start_date="2025-01-01",
+                end_date="2025-01-02",
+                op_field=self.op_field,
+                page_size=kwargs.pop("page_size", 10),
+                slices=kwargs.pop("slices", 3),
+                keep_alive="1m",
+                **kwargs,
+            )
+        )
+
+    def test_exports_every_document_once(self):
+        pages = self.export()
+
+        urns = [contact["urn"] for page in pages for contact in page]
+
+        self.assertEqual(len(urns), len(self.documents))
+        self.assertEqual(
+            set(urns), {document["contact_urn"] for document in self.documents}
+        )
+        self.assertEqual(self.client.open_points_in_time, set())
+
+    def test_formats_hits_from_requested_fields_only(self):
+        pages = self.export(slices=1, page_size=100)
+
+        self.assertEqual(
+            pages[0][0],
+            {
+                "contact": {"name": "Contact 52"},
+                "urn": "whatsapp:52",
+                "modified_on": "2025-01-01T00:52:00",
+                "op_field_value": "3",
+            },
+        )
+        self.assertNotIn("slice", self.client.searches[0])
+        self.assertEqual(
+            self.client.searches[0]["_source"], FLOWSRUN_RESULTS_EXPORT_SOURCE_FIELDS
+        )
+
+    def test_reads_slices_concurrently(self):
+        self.export(slices=4)
+
+        slice_ids = {
+            search["slice"]["id"]
+            for search in self.client.searches
+            if "slice" in search
+        }
+
+        self.assertEqual(slice_ids, {0, 1, 2, 3})
+
+    def test_closes_point_in_time_when_closed_early(self):
+        pages = self.service.iter_flowsrun_results_pages(
+            project_uuid="project",
+            flow_uuid="flow",
+            start_date="2025-01-01",
+            end_date="2025-01-02",
+            op_field=self.op_field,
+            page_size=5,
+            slices=2,
+            keep_alive="1m",
+        )
+
+        next(pages)
+        pages.close()
+
+        self.assertEqual(self.client.open_points_in_time, set())
+
+    def test_raises_when_a_slice_fails(self):
+        self.client.search_point_in_time = lambda query: {"error": "boom"}
+
+        with self.assertRaises(KeyError):
+            self.export()
+
+        self.assertEqual(self.client.open_points_in_time, set())
@@ -0,0 +1,203 @@
+import logging
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from django.conf import settings
+from django.utils import timezone
+
+from insights.metrics.conversations.reports.choices import (
+    ConversationsReportSections,
+)
+from insights.reports.models import Report
+from insights.sources.cache import CacheClient
+
+logger = logging.getLogger(__name__)
+
+
+# Relative cost of each section, per day of the report. Sections that page
+# through the datalake conversation classification events weigh the most
+SECTION_COST_WEIGHTS = {
+    ConversationsReportSections.RESOLUTIONS: 3,
+    ConversationsReportSections.CONTACTS: 3,
+    ConversationsReportSections.AGENT_INVOCATION: 2,
+    ConversationsReportSections.TOOL_RESULT: 2,
+    ConversationsReportSections.TOPICS_AI: 1,
+    ConversationsReportSections.TOPICS_HUMAN: 1,
+    ConversationsReportSections.CSAT_AI: 1,
+    ConversationsReportSections.CSAT_HUMAN: 1,
+    ConversationsReportSections.NPS_AI: 1,
+    ConversationsReportSections.NPS_HUMAN: 1,
+    ConversationsReportSections.ADDED_TO_CART: 1,
+    ConversationsReportSections.SEARCH_TERMS: 1,
+}
+CUSTOM_WIDGET_COST_WEIGHT = 1
+CROSSTAB_WIDGET_COST_WEIGHT = 2
+
+
+class ReportTimings:
+    """
+    Seconds spent in each phase of a report generation, and in total since
+    it was created.
+    """
+
+    def __init__(self):
+        self.started_at = time.monotonic()
+        self.phases: dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        phase_started_at = time.monotonic()
+
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0) + (
+                time.monotonic() - phase_started_at
+            )
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            **{name: round(seconds, 3) for name, seconds in self.phases.items()},
+            "total": round(time.monotonic() - self.started_at, 3),
+        }
+
+
+class ReportCostEstimator:
+    """
+    Estimates how many seconds a conversations report takes to generate,
+    and decides which queued report can start within
+    REPORT_GENERATION_COST_BUDGET.
+
+    A report's cost units are the weights of its sections and widgets times
+    the days it covers. Units are converted to seconds with the project's
+    historical seconds per unit, falling back to the global one and then to
+    REPORT_GENERATION_DEFAULT_SECONDS_PER_UNIT. Both are moving averages
+    updated with the timings of every generated report.
+    """
+
+    key_prefix = "report_cost_seconds_per_unit"
+    # Weight of the latest report in the moving averages
+    smoothing = 0.3
+
+    def __init__(self, cache_client: CacheClient | None = None):
+        self.cache_client = cache_client or CacheClient()
+
+    def _get_key(self, project_uuid=None) -> str:
+        if project_uuid is None:
+            return f"{self.key_prefix}:global"
+
+        return f"{self.key_prefix}:{project_uuid}"
+
+    @staticmethod
+    def get_days(report: Report) -> int:
+        filters = report.filters or {}
+
+        try:
+            start_date = datetime.fromisoformat(filters["start"])
+            end_date = datetime.fromisoformat(filters["end"])
+        except (KeyError, TypeError, ValueError):
+            return 1
+
+        return max((end_date - start_date).days + 1, 1)
+
+    @classmethod
+    def get_units(cls, report: Report) -> float:
+        source_config = report.source_config or {}
+
+        weight = (
+            sum(
+                SECTION_COST_WEIGHTS.get(section, 1)
+                for section in source_config.get("sections", [])
+            )
+            + len(source_config.get("custom_widgets", [])) * CUSTOM_WIDGET_COST_WEIGHT
+            + len(source_config.get("crosstab_widgets", []))
+            * CROSSTAB_WIDGET_COST_WEIGHT
+        )
+
+        return max(weight, 1) * cls.get_days(report)
+
+    def _get_cached_float(self, key: str) -> float | None:
+        try:
+            value = self.cache_client.get(key)
+        except Exception as error:
+            logger.warning("[ReportCostEstimator] Failed to get %s: %s", key, error)
+            return None
+
+        if value is None:
+            return None
+
+        return float(value)
+
+    def get_seconds_per_unit(self, project_uuid) -> float:
+        for key in (self._get_key(project_uuid), self._get_key()):
+            if (seconds_per_unit := self._get_cached_float(key)) is not None:
+                return seconds_per_unit
+
+        return settings.REPORT_GENERATION_DEFAULT_SECONDS_PER_UNIT
+
+    def estimate(self, report: Report) -> float:
+        """
+        Estimated generation time of the report, in seconds.
+        """
+        return self.get_units(report) * self.get_seconds_per_unit(report.project_id)
+
+    def record(self, report: Report, timings: dict[str, float]) -> None:
+        """
+        Update the project and global seconds per unit with the timings of a
+        generated report.
+        """
+        seconds_per_unit = timings["total"] / self.get_units(report)
+
+        for key in (self._get_key(report.project_id), self._get_key()):
+            previous = self._get_cached_float(key)
+
+            if previous is not None:
+                value = (
+                    self.smoothing * seconds_per_unit + (1 - self.smoothing) * previous
+                )
+            else:
+                value = seconds_per_unit
+
+            try:
+                self.cache_client.set(
+                    key, value, ex=settings.REPORT_GENERATION_COST_HISTORY_TTL
+                )
+            except Exception as error:
+                logger.warning("[ReportCostEstimator] Failed to set %s: %s", key, error)
+
+    def select(
+        self, candidates: list[Report], running_cost: float
+    ) -> tuple[Report, float] | None:
+        """
+        The first candidate whose cost fits in what is left of the budget,
+        with its cost.
+
+        Smaller reports backfill around a head of the queue that does not
+        fit, unless it has waited for more than
+        REPORT_GENERATION_BACKFILL_MAX_WAIT seconds: then nothing else is
+        admitted until it fits. A report that is bigger than the whole
+        budget is admitted when nothing else is running.
+        """
+        budget = settings.REPORT_GENERATION_COST_BUDGET
+
+        for index, report in enumerate(candidates):
+            cost = self.estimate(report)
+
+            if running_cost + cost <= budget or (index == 0 and not running_cost):
+                return report, cost
+
+            if (
+                index == 0
+                and (timezone.now() - report.created_on).total_seconds()
+                > settings.REPORT_GENERATION_BACKFILL_MAX_WAIT
+            ):
+                logger.info(
+                    "[ReportCostEstimator] Report %s (cost %.0f) waited too long, "
+                    "holding the queue until it fits",
+                    report.uuid,
+                    cost,
+                )
+                return None
+
+        return None
@@ -37,6 +37,10 @@ from insights.metrics.conversations.reports.available_widgets import (
     get_nps_ai_widget,
     get_nps_human_widget,
 )
+from insights.metrics.conversations.reports.cost import (
+    ReportCostEstimator,
+    ReportTimings,
+)
 from insights.metrics.conversations.reports.dataclass import (
     AvailableReportWidgets,
     ConversationsReportFile,
@@ -54,8 +58,10 @@ from insights.metrics.conversations.usecases.get_project_concierge_agent import
 from insights.metrics.conversations.usecases.get_project_payment_agent import (
     GetProjectPaymentAgentUseCase,
 )
+from insights.reports.cancellation import ReportCancellationToken
 from insights.reports.models import Report
 from insights.reports.choices import ReportStatus, ReportFormat, ReportSource
+from insights.reports.usecases.report_status_cache import ReportStatusCacheUseCase
 from insights.users.models import User
 from insights.projects.models import Project
 from insights.sources.dl_events.clients import BaseDataLakeEventsClient
@@ -415,6 +421,8 @@ class ConversationsReportService(BaseConversationsReportService):
         page_limit: int = 100,
         elastic_page_size: int = 1000,
         elastic_page_limit: int = 100,
+        elastic_slices: int | None = None,
+        elastic_pit_keep_alive: str = "2m",
         get_concierge_agent_use_case: GetProjectConciergeAgentUseCase | None = None,
         get_payment_agent_use_case: GetProjectPaymentAgentUseCase | None = None,
     ):
@@ -428,6 +436,8 @@ class ConversationsReportService(BaseConversationsReportService):
         self.nexus_client = nexus_client
         self.elastic_page_size = elastic_page_size
         self.elastic_page_limit = elastic_page_limit
+        self.elastic_slices = elastic_slices
+        self.elastic_pit_keep_alive = elastic_pit_keep_alive
         self.get_concierge_agent_use_case = (
             get_concierge_agent_use_case
             or GetProjectConciergeAgentUseCase(nexus_client=nexus_client)
@@ -437,7 +447,10 @@ class ConversationsReportService(BaseConversationsReportService):
             or GetProjectPaymentAgentUseCase(nexus_client=nexus_client)
         )
 
+        self.cost_estimator = ReportCostEstimator(cache_client=cache_client)
+
         self.cache_keys = {}
+        self._cancellation_tokens: dict[str, ReportCancellationToken] = {}
         self._use_streaming_events = False
         self._streaming_spools: list[_ReplayableDatalakeEventsSpool] = []
 
@@ -472,8 +485,12 @@ class ConversationsReportService(BaseConversationsReportService):
         max_workers = min(
             len(page_indices_list), settings.REPORT_PARALLEL_FETCH_MAX_WORKERS
         )
+        token = self._get_cancellation_token(report)
 
         def fetch_page(page_index: int) -> list[dict]:
+            if token.cancelled:
+                return None
+
             offset = page_index * limit
             return self.datalake_events_client.get_events(
                 **kwargs,
@@ -495,6 +512,12 @@ class ConversationsReportService(BaseConversationsReportService):
 
             for future in as_completed(future_to_index):
                 page_index = future_to_index[future]
+
+                if token.is_cancelled():
+                    for pending_future in future_to_index:
+                        pending_future.cancel()
+                    token.raise_if_cancelled()
+
                 try:
                     page_events = future.result()
                 except Exception as e:
@@ -552,6 +575,20 @@ class ConversationsReportService(BaseConversationsReportService):
 
         self.cache_keys[report_uuid].add(cache_key)
 
+    def _get_cancellation_token(self, report: Report) -> ReportCancellationToken:
+        """
+        Cancellation token of the report, shared by all of its loops.
+        """
+        report_uuid = str(report.uuid)
+
+        if report_uuid not in self._cancellation_tokens:
+            self._cancellation_tokens[report_uuid] = ReportCancellationToken(report)
+
+        token = self._cancellation_tokens[report_uuid]
+        token.report = report
+
+        return token
+
     def _is_agents_tools_urn_list_enabled(self, report: Report) -> bool:
         attributes = {
             "projectUUID": str(report.project.uuid),
@@ -633,6 +670,8 @@ class ConversationsReportService(BaseConversationsReportService):
 
             del self.cache_keys[report_uuid]
 
+        self._cancellation_tokens.pop(report_uuid, None)
+
     def _read_report_file_bytes(self, file: ConversationsReportFile) -> bytes:
         """
         Read report file bytes from memory or disk.
@@ -910,6 +949,26 @@ class ConversationsReportService(BaseConversationsReportService):
 
         return report
 
+    def _set_progress(
+        self, report: Report, sections_done: int, sections_total: int
+    ) -> None:
+        """
+        Publish the progress of a report in its status projection.
+        """
+        try:
+            ReportStatusCacheUseCase.set_progress(
+                str(report.project_id),
+                str(report.uuid),
+                sections_done=sections_done,
+                sections_total=sections_total,
+            )
+        except Exception as e:
+            logger.warning(
+                "[CONVERSATIONS REPORT SERVICE] Failed to set progress of report %s: %s",
+                report.uuid,
+                e,
+            )
+
     def _validate_dates(self, report: Report) -> tuple[datetime, datetime]:
         """
         Validate the dates of a report.
@@ -1044,6 +1103,14 @@ class ConversationsReportService(BaseConversationsReportService):
             ),
         }
 
+        crosstab_widgets = source_config.get("crosstab_widgets", [])
+        sections_total = (
+            len([section for section in worksheets_mapping if section in sections])
+            + len(custom_widgets)
+            + len(crosstab_widgets)
+        )
+        sections_done = 0
+
         for section, (worksheet_function, worksheet_args) in worksheets_mapping.items():
             if section in sections:
                 result = worksheet_function(**worksheet_args)
@@ -1052,6 +1119,9 @@ class ConversationsReportService(BaseConversationsReportService):
                 else:
                     worksheets.append(result)
 
+                sections_done += 1
+                self._set_progress(report, sections_done, sections_total)
+
         if custom_widgets:
             widgets = Widget.objects.filter(
                 uuid__in=custom_widgets, dashboard__project=report.project
@@ -1067,7 +1137,8 @@ class ConversationsReportService(BaseConversationsReportService):
                     )
                 )
 
-        crosstab_widgets = source_config.get("crosstab_widgets", [])
+                sections_done += 1
+                self._set_progress(report, sections_done, sections_total)
 
         if crosstab_widgets:
             widgets = Widget.objects.filter(
@@ -1084,6 +1155,9 @@ class ConversationsReportService(BaseConversationsReportService):
                     )
                 )
 
+                sections_done += 1
+                self._set_progress(report, sections_done, sections_total)
+
         return worksheets
 
     def generate(self, report: Report) -> None:
@@ -1096,6 +1170,7 @@ class ConversationsReportService(BaseConversationsReportService):
         )
 
         report = self._update_report_status(report)
+        ReportCancellationToken.reset(report.uuid)
         use_streaming = (
             report.format in (ReportFormat.XLSX, ReportFormat.CSV)
             and self._is_streaming_mode_enabled(report)
@@ -1107,6 +1182,8 @@ class ConversationsReportService(BaseConversationsReportService):
                 report.uuid,
             )
 
+        timings = ReportTimings()
+
         try:
             start_date, end_date = self._validate_dates(report)
 
@@ -1123,11 +1200,18 @@ class ConversationsReportService(BaseConversationsReportService):
             )
 
             if use_streaming:
-                files = self._generate_streaming(report, start_date, end_date)
+                with timings.phase("streaming"):
+                    files = self._generate_streaming(report, start_date, end_date)
             else:
                 file_processor = get_file_processor(report.format)
-                worksheets = self._get_worksheets(report, start_date, end_date)
-                files = file_processor.process(report=report, worksheets=worksheets)
+
+                with timings.phase("worksheets"):
+                    worksheets = self._get_worksheets(report, start_date, end_date)
+
+                with timings.phase("files"):
+                    files = file_processor.process(
+                        report=report, worksheets=worksheets
+                    )
 
         except Exception as e:
             logger.error(
@@ -1167,7 +1251,8 @@ class ConversationsReportService(BaseConversationsReportService):
         )
 
         try:
-            self.send_email(report, files)
+            with timings.phase("email"):
+                self.send_email(report, files)
         except Exception as e:
             event_id = capture_exception(e)
             logger.error(
@@ -1193,9 +1278,11 @@ class ConversationsReportService(BaseConversationsReportService):
 
         report.status = ReportStatus.READY
         report.completed_at = timezone.now()
-        report.save(update_fields=["status", "completed_at"])
+        report.config = {**config, "timings": timings.as_dict()}
+        report.save(update_fields=["status", "completed_at", "config"])
 
         self._clear_cache_keys(report.uuid)
+        self.cost_estimator.record(report, report.config["timings"])
 
         logger.info(
             "[CONVERSATIONS REPORT SERVICE] Conversations report completed %s",
@@ -1270,6 +1357,7 @@ class ConversationsReportService(BaseConversationsReportService):
         page_limit = self.page_limit
 
         self._normalize_datalake_kwargs(kwargs)
+        token = self._get_cancellation_token(report)
 
         while True:
             if current_page >= page_limit:
@@ -1282,14 +1370,7 @@ class ConversationsReportService(BaseConversationsReportService):
                 )
                 raise ValueError("Report has more than %s pages" % page_limit)
 
-            report.refresh_from_db(fields=["status"])
-
-            if report.status != ReportStatus.IN_PROGRESS:
-                logger.info(
-                    "[CONVERSATIONS REPORT SERVICE] Report %s is not in progress. Finishing datalake events retrieval",
-                    report.uuid,
-                )
-                raise ValueError("Report %s is not in progress" % report.uuid)
+            token.check()
 
             logger.info(
                 "[CONVERSATIONS REPORT SERVICE] Retrieving datalake events for page %s for report %s",
@@ -1335,13 +1416,8 @@ class ConversationsReportService(BaseConversationsReportService):
             )
             raise ValueError("Report has more than %s pages" % page_limit)
 
-        report.refresh_from_db(fields=["status"])
-        if report.status != ReportStatus.IN_PROGRESS:
-            logger.info(
-                "[CONVERSATIONS REPORT SERVICE] Report %s is not in progress. Finishing datalake events retrieval",
-                report.uuid,
-            )
-            raise ValueError("Report %s is not in progress" % report.uuid)
+        token = self._get_cancellation_token(report)
+        token.checkpoint()
 
         max_workers = min(total_pages, settings.REPORT_PARALLEL_FETCH_MAX_WORKERS)
 
@@ -1414,6 +1490,7 @@ class ConversationsReportService(BaseConversationsReportService):
         Generator that yields datalake events one page at a time.
         Used as a fallback when the count query fails.
         """
+        token = self._get_cancellation_token(report)
         limit = self.events_limit_per_page
         offset = 0
         current_page = 1
@@ -1431,15 +1508,7 @@ class ConversationsReportService(BaseConversationsReportService):
                 )
                 raise ValueError("Report has more than %s pages" % page_limit)
 
-            report.refresh_from_db(fields=["status"])
-
-            if report.status != ReportStatus.IN_PROGRESS:
-                logger.info(
-                    "[CONVERSATIONS REPORT SERVICE] Report %s is not in progress (streaming). "
-                    "Finishing datalake events retrieval",
-                    report.uuid,
-                )
-                raise ValueError("Report %s is not in progress" % report.uuid)
+            token.check()
 
             logger.info(
                 "[CONVERSATIONS REPORT SERVICE] Retrieving datalake events for page %s for report %s (streaming)",
@@ -1481,6 +1550,7 @@ class ConversationsReportService(BaseConversationsReportService):
         if total_count == 0:
             return
 
+        token = self._get_cancellation_token(report)
         limit = self.events_limit_per_page
         page_limit = self.page_limit
         total_pages = math.ceil(total_count / limit)
@@ -1494,15 +1564,7 @@ class ConversationsReportService(BaseConversationsReportService):
             )
             raise ValueError("Report has more than %s pages" % page_limit)
 
-        report.refresh_from_db(fields=["status"])
-
-        if report.status != ReportStatus.IN_PROGRESS:
-            logger.info(
-                "[CONVERSATIONS REPORT SERVICE] Report %s is not in progress (streaming). "
-                "Finishing datalake events retrieval",
-                report.uuid,
-            )
-            raise ValueError("Report %s is not in progress" % report.uuid)
+        token.checkpoint()
 
         max_workers = settings.REPORT_PARALLEL_FETCH_MAX_WORKERS
 
@@ -1520,15 +1582,7 @@ class ConversationsReportService(BaseConversationsReportService):
                 report, range(batch_start, batch_end), **kwargs
             )
 
-            report.refresh_from_db(fields=["status"])
-
-            if report.status != ReportStatus.IN_PROGRESS:
-                logger.info(
-                    "[CONVERSATIONS REPORT SERVICE] Report %s is not in progress (streaming). "
-                    "Finishing datalake events retrieval",
-                    report.uuid,
-                )
-                raise ValueError("Report %s is not in progress" % report.uuid)
+            token.checkpoint()
 
             for page_events in batch_results:
                 if page_events:
@@ -1604,6 +1658,7 @@ class ConversationsReportService(BaseConversationsReportService):
                     e,
                 )
 
+        token = self._get_cancellation_token(report)
         data = []
 
         current_page = 1
@@ -1620,14 +1675,7 @@ class ConversationsReportService(BaseConversationsReportService):
                 )
                 raise ValueError("Report has more than %s pages" % page_limit)
 
-            report.refresh_from_db(fields=["status"])
-
-            if report.status != ReportStatus.IN_PROGRESS:
-                logger.info(
-                    "[CONVERSATIONS REPORT SERVICE] Report %s is not in progress. Finishing flowsrun results by contacts retrieval",
-                    report.uuid,
-                )
-                raise ValueError("Report %s is not in progress" % report.uuid)
+            token.check()
 
             logger.info(
                 "[CONVERSATIONS REPORT SERVICE] Retrieving flowsrun results by contacts for page %s for report %s",
@@ -1665,6 +1713,98 @@ class ConversationsReportService(BaseConversationsReportService):
 
         return data
 
+    def _export_flowsrun_results_by_contacts(
+        self,
+        report: Report,
+        flow_uuid: str,
+        start_date: str,
+        end_date: str,
+        op_field: str,
+        include_values: list[str] | None = None,
+    ) -> Iterator[dict]:
+        """
+        Stream flowsrun results by contacts from a sliced point in time
+        export, without keeping them in memory or in the cache.
+        """
+        pages = self.elasticsearch_service.iter_flowsrun_results_pages(
+            project_uuid=report.project.uuid,
+            flow_uuid=flow_uuid,
+            start_date=start_date,
+            end_date=end_date,
+            op_field=op_field,
+            page_size=self.elastic_page_size,
+            slices=self.elastic_slices,
+            keep_alive=self.elastic_pit_keep_alive,
+            include_values=include_values,
+        )
+        page_limit = self.elastic_page_limit * self.elastic_slices
+
+        token = self._get_cancellation_token(report)
+        current_page = 1
+
+        try:
+            for contacts in pages:
+                if current_page >= page_limit:
+                    logger.error(
+                        "[CONVERSATIONS REPORT SERVICE] Report %s has more than %s pages. Finishing flowsrun results by contacts export",
+                        report.uuid,
+                        page_limit,
+                    )
+                    raise ValueError("Report has more than %s pages" % page_limit)
+
+                token.check()
+
+                yield from contacts
+                current_page += 1
+        finally:
+            pages.close()
+
+    def _iter_flowsrun_results_by_contacts(
+        self,
+        report: Report,
+        flow_uuid: str,
+        start_date: str,
+        end_date: str,
+        op_field: str,
+        include_values: list[str] | None = None,
+    ) -> Iterable[dict]:
+        """
+        Flowsrun results by contacts, from the sliced export when slices are
+        configured and from the paginated, cached retrieval otherwise.
+        """
+        kwargs = {
+            "report": report,
+            "flow_uuid": flow_uuid,
+            "start_date": start_date,
+            "end_date": end_date,
+            "op_field": op_field,
+        }
+
+        if include_values is not None:
+            kwargs["include_values"] = include_values
+
+        if self.elastic_slices:
+            return self._export_flowsrun_results_by_contacts(**kwargs)
+
+        return self.get_flowsrun_results_by_contacts(**kwargs)
+
+    def _iter_flowsrun_rating_rows(
+        self,
+        docs: Iterable[dict],
+        report: Report,
+        date_label: str,
+        rating_label: str,
+    ) -> Iterator[dict]:
+        for doc in docs:
+            if doc["op_field_value"] is None:
+                continue
+
+            yield {
+                "URN": doc["urn"],
+                date_label: self._format_date(doc["modified_on"], report),
+                rating_label: doc["op_field_value"],
+            }
+
     def _iter_resolutions_rows(
         self,
         events: Iterable[dict],
@@ -2100,7 +2240,7 @@ class ConversationsReportService(BaseConversationsReportService):
 
         valid_ratings = ["1", "2", "3", "4", "5"]
 
-        docs = self.get_flowsrun_results_by_contacts(
+        docs = self._iter_flowsrun_results_by_contacts(
             report=report,
             flow_uuid=flow_uuid,
             start_date=start_date,
@@ -2114,32 +2254,20 @@ class ConversationsReportService(BaseConversationsReportService):
             date_label = gettext("Date")
             rating_label = gettext("Rating")
 
-        data = []
-
-        for doc in docs:
-            if doc["op_field_value"] is None:
-                continue
-
-            data.append(
-                {
-                    "URN": doc["urn"],
-                    date_label: self._format_date(doc["modified_on"], report),
-                    rating_label: doc["op_field_value"],
-                }
-            )
-
-        if len(data) == 0:
-            data = [
-                {
-                    "URN": "",
-                    date_label: "",
-                    rating_label: "",
-                }
-            ]
+        empty_row = {
+            "URN": "",
+            date_label: "",
+            rating_label: "",
+        }
+        data = self._finalize_worksheet_rows(
+            self._iter_flowsrun_rating_rows(docs, report, date_label, rating_label),
+            empty_row,
+        )
 
         return ConversationsReportWorksheet(
             name=worksheet_name,
             data=data,
+            headers=list(empty_row.keys()),
         )
 
     def get_nps_human_worksheet(
@@ -2170,7 +2298,7 @@ class ConversationsReportService(BaseConversationsReportService):
                 % (report.uuid, ", ".join(missing_fields))
             )
 
-        docs = self.get_flowsrun_results_by_contacts(
+        docs = self._iter_flowsrun_results_by_contacts(
             report=report,
             flow_uuid=flow_uuid,
             start_date=start_date,
@@ -2183,32 +2311,20 @@ class ConversationsReportService(BaseConversationsReportService):
             date_label = gettext("Date")
             rating_label = gettext("Rating")
 
-        data = []
-
-        for doc in docs:
-            if doc["op_field_value"] is None:
-                continue
-
-            data.append(
-                {
-                    "URN": doc["urn"],
-                    date_label: self._format_date(doc["modified_on"], report),
-                    rating_label: doc["op_field_value"],
-                }
-            )
-
-        if len(data) == 0:
-            data = [
-                {
-                    "URN": "",
-                    date_label: "",
-                    rating_label: "",
-                }
-            ]
+        empty_row = {
+            "URN": "",
+            date_label: "",
+            rating_label: "",
+        }
+        data = self._finalize_worksheet_rows(
+            self._iter_flowsrun_rating_rows(docs, report, date_label, rating_label),
+            empty_row,
+        )
 
         return ConversationsReportWorksheet(
             name=worksheet_name,
             data=data,
+            headers=list(empty_row.keys()),
         )
 
     def _iter_custom_widget_rows(
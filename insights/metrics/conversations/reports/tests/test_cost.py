@@ -0,0 +1,123 @@
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from insights.metrics.conversations.reports.cost import (
+    ReportCostEstimator,
+    ReportTimings,
+)
+from insights.projects.models import Project
+from insights.reports.choices import ReportFormat, ReportSource, ReportStatus
+from insights.reports.models import Report
+from insights.sources.cache import CacheClient
+
+
+@override_settings(
+    REPORT_GENERATION_COST_BUDGET=100,
+    REPORT_GENERATION_BACKFILL_MAX_WAIT=600,
+    REPORT_GENERATION_DEFAULT_SECONDS_PER_UNIT=1.0,
+)
+class TestReportCostEstimator(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.project = Project.objects.create(name="Test Project")
+        self.estimator = ReportCostEstimator(cache_client=CacheClient())
+
+    def tearDown(self):
+        cache.clear()
+
+    def _create_report(self, days: int, sections: list[str], **source_config):
+        return Report.objects.create(
+            project=self.project,
+            source=ReportSource.CONVERSATIONS_DASHBOARD,
+            format=ReportFormat.CSV,
+            status=ReportStatus.PENDING,
+            source_config={"sections": sections, **source_config},
+            filters={
+                "start": "2025-01-01",
+                "end": (timezone.datetime(2025, 1, 1) + timedelta(days=days - 1))
+                .date()
+                .isoformat(),
+            },
+        )
+
+    def test_units_grow_with_days_sections_and_widgets(self):
+        report = self._create_report(
+            3,
+            ["RESOLUTIONS", "CSAT_AI"],
+            custom_widgets=["a"],
+            crosstab_widgets=["b"],
+        )
+
+        # (3 + 1 + 1 + 2) weight times 3 days
+        self.assertEqual(ReportCostEstimator.get_units(report), 21)
+
+    def test_units_without_valid_dates_count_one_day(self):
+        report = self._create_report(1, ["CSAT_AI"])
+        report.filters = {}
+
+        self.assertEqual(ReportCostEstimator.get_days(report), 1)
+
+    def test_record_updates_moving_averages(self):
+        report = self._create_report(10, ["CSAT_AI"])
+
+        self.estimator.record(report, {"total": 50})
+        self.assertEqual(self.estimator.get_seconds_per_unit(self.project.uuid), 5)
+
+        self.estimator.record(report, {"total": 150})
+        # 0.3 * 15 + 0.7 * 5
+        self.assertAlmostEqual(
+            self.estimator.get_seconds_per_unit(self.project.uuid), 8
+        )
+        self.assertAlmostEqual(self.estimator.estimate(report), 80)
+
+    def test_other_projects_fall_back_to_the_global_average(self):
+        report = self._create_report(10, ["CSAT_AI"])
+        self.estimator.record(report, {"total": 50})
+
+        other_project = Project.objects.create(name="Other Project")
+
+        self.assertEqual(self.estimator.get_seconds_per_unit(other_project.uuid), 5)
+
+    def test_select_admits_report_that_fits(self):
+        report = self._create_report(10, ["CSAT_AI"])
+
+        self.assertEqual(self.estimator.select([report], 50), (report, 10))
+
+    def test_select_backfills_around_report_that_does_not_fit(self):
+        big_report = self._create_report(30, ["RESOLUTIONS"])
+        small_report = self._create_report(5, ["CSAT_AI"])
+
+        self.assertEqual(
+            self.estimator.select([big_report, small_report], 50), (small_report, 5)
+        )
+
+    def test_select_holds_queue_for_report_waiting_too_long(self):
+        big_report = self._create_report(30, ["RESOLUTIONS"])
+        Report.objects.filter(pk=big_report.pk).update(
+            created_on=timezone.now() - timedelta(hours=1)
+        )
+        big_report.refresh_from_db()
+        small_report = self._create_report(5, ["CSAT_AI"])
+
+        self.assertIsNone(self.estimator.select([big_report, small_report], 50))
+
+    def test_select_admits_report_bigger_than_budget_when_idle(self):
+        big_report = self._create_report(90, ["RESOLUTIONS"])
+
+        self.assertEqual(self.estimator.select([big_report], 0), (big_report, 270))
+
+
+class TestReportTimings(TestCase):
+    def test_as_dict_has_phases_and_total(self):
+        timings = ReportTimings()
+
+        with timings.phase("worksheets"):
+            pass
+
+        result = timings.as_dict()
+
+        self.assertEqual(set(result), {"worksheets", "total"})
+        self.assertGreaterEqual(result["total"], result["worksheets"])
@@ -18,6 +18,7 @@ from insights.metrics.conversations.integrations.elasticsearch.services import (
     ConversationsElasticsearchService,
 )
 from insights.metrics.conversations.integrations.elasticsearch.tests.mock import (
+    InMemoryElasticsearchClient,
     MockElasticsearchClient,
 )
 from insights.metrics.conversations.services import (
@@ -33,6 +34,7 @@ from insights.sources.integrations.tests.mock_clients import (
     MockResponse,
 )
 from insights.users.models import User
+from insights.reports.cancellation import ReportCancelledError
 from insights.reports.models import Report
 from insights.reports.choices import ReportFormat, ReportStatus
 from insights.metrics.conversations.reports.services import (
@@ -2203,6 +2205,54 @@ class TestConversationsReportServiceAdditional(TestCase):
         self.assertEqual(len(worksheets), 1)
         mock_get_search_terms_worksheet.assert_called_once()
 
+    @patch(
+        "insights.metrics.conversations.reports.services.ReportStatusCacheUseCase.set_progress"
+    )
+    @patch(
+        "insights.metrics.conversations.reports.services.ConversationsReportService.get_search_terms_worksheet"
+    )
+    def test_get_worksheets_publishes_progress(
+        self, mock_get_search_terms_worksheet, mock_set_progress
+    ):
+        mock_get_search_terms_worksheet.return_value = ConversationsReportWorksheet(
+            name="Search terms", data=[]
+        )
+
+        report = Report.objects.create(
+            project=self.project,
+            source=self.service.source,
+            source_config={"sections": ["SEARCH_TERMS"]},
+            filters={"start": "2025-01-01", "end": "2025-01-02"},
+            format=ReportFormat.CSV,
+            requested_by=self.user,
+        )
+
+        self.service._get_worksheets(
+            report, datetime(2025, 1, 1), datetime(2025, 1, 2)
+        )
+
+        mock_set_progress.assert_called_once_with(
+            str(self.project.uuid),
+            str(report.uuid),
+            sections_done=1,
+            sections_total=1,
+        )
+
+    @patch(
+        "insights.metrics.conversations.reports.services.ReportStatusCacheUseCase.set_progress"
+    )
+    def test_set_progress_does_not_raise(self, mock_set_progress):
+        mock_set_progress.side_effect = Exception("Redis is down")
+
+        report = Report.objects.create(
+            project=self.project,
+            source=self.service.source,
+            format=ReportFormat.CSV,
+            requested_by=self.user,
+        )
+
+        self.service._set_progress(report, 1, 2)
+
     @patch("insights.metrics.conversations.reports.services.get_crosstab_widgets")
     @patch("insights.metrics.conversations.reports.services.get_custom_widgets")
     @patch("insights.metrics.conversations.reports.services.get_nps_human_widget")
@@ -5155,6 +5205,28 @@ class TestGetDatalakeEventsDispatch(TestCase):
         mock_iter_method.assert_called_once_with(report, key="example")
         self.assertEqual(list(result), [{"id": "1"}])
 
+    @patch(
+        "insights.sources.dl_events.tests.mock_client.MockDataLakeEventsClient.get_events"
+    )
+    def test_fetch_page_indices_stops_when_report_is_cancelled(
+        self, mock_get_events
+    ):
+        report = Report.objects.create(
+            project=self.project,
+            source=self.service.source,
+            source_config={},
+            filters={},
+            format=ReportFormat.CSV,
+            requested_by=self.user,
+            status=ReportStatus.IN_PROGRESS,
+        )
+        self.service._get_cancellation_token(report)._set_cancelled("timeout")
+
+        with self.assertRaises(ReportCancelledError):
+            self.service._fetch_page_indices(report, range(10), key="example")
+
+        mock_get_events.assert_not_called()
+
 
 class TestIterDatalakeEventsStreaming(TestCase):
     def setUp(self):
@@ -6257,3 +6329,94 @@ class TestGetDatalakeEventsInParallel(TestCase):
 
         mock_get_events.assert_called_once()
         self.assertTrue(len(worksheets) >= 3)
+
+
+class TestSlicedFlowsrunResultsExport(TestCase):
+    def setUp(self):
+        self.elasticsearch_client = InMemoryElasticsearchClient(
+            [
+                {
+                    "contact_uuid": f"contact-{index:03d}",
+                    "contact_name": f"Contact {index}",
+                    "contact_urn": f"whatsapp:{index}",
+                    "modified_on": f"2025-01-01T12:{index % 60:02d}:00",
+                    "values": [
+                        {"name": "user_feedback", "value": str(index % 7)},
+                    ],
+                }
+                for index in range(40)
+            ]
+        )
+        self.service = ConversationsReportService(
+            elasticsearch_service=ConversationsElasticsearchService(
+                client=self.elasticsearch_client,
+            ),
+            datalake_events_client=MockDataLakeEventsClient(),
+            metrics_service=MagicMock(spec=ConversationsMetricsService),
+            cache_client=MockCacheClient(),
+            nexus_client=MockNexusClient(),
+            elastic_page_size=3,
+            elastic_slices=4,
+        )
+        self.project = Project.objects.create(name="Test")
+        self.user = User.objects.create(email="test@test.com", language="en")
+        self.report = Report.objects.create(
+            project=self.project,
+            source=self.service.source,
+            source_config={
+                "sections": ["CSAT_HUMAN"],
+                "csat_human_flow_uuid": str(uuid.uuid4()),
+                "csat_human_op_field": "user_feedback",
+            },
+            filters={"start": "2025-01-01", "end": "2025-01-02"},
+            format=ReportFormat.CSV,
+            requested_by=self.user,
+            status=ReportStatus.IN_PROGRESS,
+        )
+
+    def test_csat_human_worksheet_reads_every_slice(self):
+        worksheet = self.service.get_csat_human_worksheet(
+            self.report, "2025-01-01", "2025-01-02"
+        )
+
+        # The stand-in ignores include_values, so every document comes back
+        self.assertEqual(len(worksheet.data), 40)
+        self.assertEqual(worksheet.headers, ["URN", "Date", "Rating"])
+        self.assertEqual(
+            {row["URN"] for row in worksheet.data},
+            {f"whatsapp:{index}" for index in range(40)},
+        )
+        self.assertEqual(self.elasticsearch_client.open_points_in_time, set())
+
+    def test_streams_rows_in_streaming_mode(self):
+        self.service._use_streaming_events = True
+
+        worksheet = self.service.get_csat_human_worksheet(
+            self.report, "2025-01-01", "2025-01-02"
+        )
+
+        self.assertNotIsInstance(worksheet.data, list)
+        self.assertEqual(self.elasticsearch_client.searches, [])
+        self.assertEqual(len(list(worksheet.data)), 40)
+
+    def test_stops_when_report_is_not_in_progress(self):
+        Report.objects.filter(uuid=self.report.uuid).update(
+            status=ReportStatus.FAILED
+        )
+
+        with self.assertRaises(ValueError):
+            self.service.get_csat_human_worksheet(
+                self.report, "2025-01-01", "2025-01-02"
+            )
+
+        self.assertEqual(self.elasticsearch_client.open_points_in_time, set())
+
+    def test_raises_when_page_limit_is_reached(self):
+        self.service.elastic_page_limit = 2
+
+        with self.assertRaises(ValueError) as context:
+            self.service.get_csat_human_worksheet(
+                self.report, "2025-01-01", "2025-01-02"
+            )
+
+        self.assertIn("Report has more than", str(context.exception))
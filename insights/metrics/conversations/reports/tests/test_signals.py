@@ -7,7 +7,7 @@ from insights.reports.models import Report
 from insights.reports.usecases.report_status_cache import ReportStatusCacheUseCase
 
 
-class TestReportStatusCacheInvalidation(APITestCase):
+class TestReportStatusCacheWriteThrough(APITestCase):
     def setUp(self):
         self.user = User.objects.create(email="test@test.com")
         self.project = Project.objects.create(name="Test Project")
@@ -16,33 +16,49 @@ class TestReportStatusCacheInvalidation(APITestCase):
     def tearDown(self):
         ReportStatusCacheUseCase.invalidate(self.project_uuid)
 
-    def test_cache_invalidated_on_report_create(self):
-        ReportStatusCacheUseCase.set(self.project_uuid, None)
-
-        Report.objects.create(
-            project=self.project,
+    def _create_report(self, project=None) -> Report:
+        return Report.objects.create(
+            project=project or self.project,
             source=ReportSource.CONVERSATIONS_DASHBOARD,
             format=ReportFormat.CSV,
             status=ReportStatus.PENDING,
             requested_by=self.user,
         )
 
-        _, cache_hit = ReportStatusCacheUseCase.get(self.project_uuid)
-        self.assertFalse(cache_hit)
+    def test_cache_written_on_report_create(self):
+        ReportStatusCacheUseCase.set(self.project_uuid, None)
 
-    def test_cache_invalidated_on_status_change(self):
-        report = Report.objects.create(
-            project=self.project,
-            source=ReportSource.CONVERSATIONS_DASHBOARD,
-            format=ReportFormat.CSV,
-            status=ReportStatus.PENDING,
-            requested_by=self.user,
-        )
+        report = self._create_report()
 
-        ReportStatusCacheUseCase.set(self.project_uuid, report)
+        projection, cache_hit = ReportStatusCacheUseCase.get(self.project_uuid)
+        self.assertTrue(cache_hit)
+        self.assertEqual(projection["report_uuid"], str(report.uuid))
+        self.assertEqual(projection["status"], ReportStatus.PENDING)
+
+    def test_cache_updated_on_status_change(self):
+        report = self._create_report()
 
         report.status = ReportStatus.IN_PROGRESS
-        report.save()
+        report.save(update_fields=["status"])
+
+        projection, cache_hit = ReportStatusCacheUseCase.get(self.project_uuid)
+        self.assertTrue(cache_hit)
+        self.assertEqual(projection["status"], ReportStatus.IN_PROGRESS)
+
+    def test_cache_has_no_report_after_completion(self):
+        report = self._create_report()
+
+        report.status = ReportStatus.READY
+        report.save(update_fields=["status"])
+
+        projection, cache_hit = ReportStatusCacheUseCase.get(self.project_uuid)
+        self.assertTrue(cache_hit)
+        self.assertIsNone(projection)
+
+    def test_cache_invalidated_on_report_delete(self):
+        report = self._create_report()
+
+        report.delete()
 
         _, cache_hit = ReportStatusCacheUseCase.get(self.project_uuid)
         self.assertFalse(cache_hit)
@@ -52,13 +68,10 @@ class TestReportStatusCacheInvalidation(APITestCase):
 
         ReportStatusCacheUseCase.set(self.project_uuid, None)
 
-        Report.objects.create(
-            project=other_project,
-            source=ReportSource.CONVERSATIONS_DASHBOARD,
-            format=ReportFormat.CSV,
-            status=ReportStatus.PENDING,
-            requested_by=self.user,
-        )
+        self._create_report(project=other_project)
 
-        _, cache_hit = ReportStatusCacheUseCase.get(self.project_uuid)
+        projection, cache_hit = ReportStatusCacheUseCase.get(self.project_uuid)
         self.assertTrue(cache_hit)
+        self.assertIsNone(projection)
+
+        ReportStatusCacheUseCase.invalidate(str(other_project.uuid))
@@ -85,6 +85,7 @@ class TestConversationsReportsViewSetAsAuthenticatedUser(
             status=ReportStatus.PENDING,
             requested_by=self.user,
         )
+        ReportStatusCacheUseCase.invalidate(str(self.project.uuid))
         mock_get_current_report_for_project.return_value = report
 
         response = self.get_status({"project_uuid": self.project.uuid})
@@ -126,18 +127,51 @@ class TestConversationsReportsViewSetAsAuthenticatedUser(
     @patch(
         "insights.metrics.conversations.reports.services.ConversationsReportService.get_current_report_for_project"
     )
-    def test_get_status_sets_cache_on_miss(
+    def test_get_status_follows_report_saves_without_querying(
         self, mock_get_current_report_for_project
     ):
         project_uuid = str(self.project.uuid)
+        report = Report.objects.create(
+            project=self.project,
+            source=ReportSource.CONVERSATIONS_DASHBOARD,
+            status=ReportStatus.PENDING,
+            requested_by=self.user,
+        )
+        report.status = ReportStatus.IN_PROGRESS
+        report.save(update_fields=["status"])
+
+        response = self.get_status({"project_uuid": self.project.uuid})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["status"], ReportStatus.IN_PROGRESS)
+        self.assertEqual(response.data["report_uuid"], str(report.uuid))
+
+        report.status = ReportStatus.READY
+        report.save(update_fields=["status"])
+
+        response = self.get_status({"project_uuid": self.project.uuid})
+
+        self.assertEqual(response.data, {"status": ReportStatus.READY})
+        mock_get_current_report_for_project.assert_not_called()
+
         ReportStatusCacheUseCase.invalidate(project_uuid)
 
+    @with_project_auth
+    @patch(
+        "insights.metrics.conversations.reports.services.ConversationsReportService.get_current_report_for_project"
+    )
+    def test_get_status_sets_cache_on_miss(
+        self, mock_get_current_report_for_project
+    ):
+        project_uuid = str(self.project.uuid)
+
         report = Report.objects.create(
             project=self.project,
             source=ReportSource.CONVERSATIONS_DASHBOARD,
             status=ReportStatus.PENDING,
             requested_by=self.user,
         )
+        ReportStatusCacheUseCase.invalidate(project_uuid)
         mock_get_current_report_for_project.return_value = report
 
         response = self.get_status({"project_uuid": self.project.uuid})
@@ -147,7 +181,7 @@ class TestConversationsReportsViewSetAsAuthenticatedUser(
         cached_report, cache_hit = ReportStatusCacheUseCase.get(project_uuid)
         self.assertTrue(cache_hit)
         self.assertIsNotNone(cached_report)
-        self.assertEqual(cached_report.uuid, report.uuid)
+        self.assertEqual(cached_report["report_uuid"], str(report.uuid))
 
         ReportStatusCacheUseCase.invalidate(project_uuid)
 
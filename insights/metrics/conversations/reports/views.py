@@ -65,15 +65,27 @@ class ConversationsReportsViewSet(APIView):
         project = query_params.validated_data["project"]
         project_uuid = str(project.uuid)
 
-        report, cache_hit = ReportStatusCacheUseCase.get(project_uuid)
+        projection, cache_hit = ReportStatusCacheUseCase.get(project_uuid)
 
         if not cache_hit:
             report = self.service.get_current_report_for_project(project)
             ReportStatusCacheUseCase.set(project_uuid, report)
 
+            response_body = (
+                GetConversationsReportStatusResponseSerializer(instance=report).data
+                if report
+                else {"status": ReportStatus.READY}
+            )
+
+            return Response(response_body)
+
         response_body = (
-            GetConversationsReportStatusResponseSerializer(instance=report).data
-            if report
+            {
+                "email": projection["email"],
+                "report_uuid": projection["report_uuid"],
+                "status": projection["status"],
+            }
+            if projection
             else {"status": ReportStatus.READY}
         )
 
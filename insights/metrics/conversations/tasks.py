@@ -2,18 +2,20 @@ import logging
 from datetime import timedelta
 from uuid import UUID
 
-from django.db.models import Q
+from django.db.models import Case, Q, Value, When
 from django.db.models.query import QuerySet
 from django.conf import settings
 from django.utils import timezone
 
 from insights.celery import app
 
+from insights.reports.cancellation import ReportCancellationToken
 from insights.reports.models import Report
 from insights.reports.choices import ReportStatus
 from insights.sources.cache import CacheClient
 from insights.sources.dl_events.clients import DataLakeEventsClient
 from insights.sources.integrations.clients import NexusClient
+from insights.metrics.conversations.reports.cost import ReportCostEstimator
 from insights.metrics.conversations.reports.services import ConversationsReportService
 from insights.metrics.conversations.services import ConversationsMetricsService
 from insights.metrics.conversations.integrations.elasticsearch.services import (
@@ -46,6 +48,33 @@ def _create_conversations_report_service() -> ConversationsReportService:
         page_limit=settings.CONVERSATIONS_REPORT_PAGE_LIMIT,
         elastic_page_size=settings.CONVERSATIONS_REPORT_ELASTIC_PAGE_SIZE,
         elastic_page_limit=settings.CONVERSATIONS_REPORT_ELASTIC_PAGE_LIMIT,
+        elastic_slices=settings.CONVERSATIONS_REPORT_ELASTIC_SLICES,
+        elastic_pit_keep_alive=settings.CONVERSATIONS_REPORT_ELASTIC_PIT_KEEP_ALIVE,
+    )
+
+
+def get_generating_reports() -> QuerySet[Report]:
+    """
+    Reports being generated, not counting the interrupted ones.
+    """
+    # Containment is false, not null, for configs without the interrupted
+    # key, so those reports are counted too
+    return Report.objects.filter(
+        Q(status=ReportStatus.IN_PROGRESS) & ~Q(config__contains={"interrupted": True})
+    )
+
+
+def get_next_reports(host: str) -> QuerySet[Report]:
+    """
+    Reports to generate next: the ones interrupted on other hosts before the
+    pending ones, each oldest first.
+    """
+    resumable = Q(config__interrupted=True) & ~Q(config__interrupted_on_host=host)
+
+    return (
+        Report.objects.filter(resumable | Q(status=ReportStatus.PENDING))
+        .annotate(priority=Case(When(resumable, then=Value(0)), default=Value(1)))
+        .order_by("priority", "created_on")
     )
 
 
@@ -55,53 +84,45 @@ def generate_conversations_report():
 
     logger.info("[ generate_conversations_report task ] Starting task in host %s", host)
 
-    if (
-        Report.objects.filter(
-            Q(status=ReportStatus.IN_PROGRESS) & ~Q(config__interrupted=True)
-        ).count()
-        >= settings.REPORT_GENERATION_MAX_CONCURRENT_REPORTS
-    ):
+    generating_configs = [
+        config or {}
+        for config in get_generating_reports().values_list("config", flat=True)
+    ]
+
+    if len(generating_configs) >= settings.REPORT_GENERATION_MAX_CONCURRENT_REPORTS:
         logger.info(
             "[ generate_conversations_report task ] Maximum number (%s) of concurrent reports being generated reached. Finishing task",
             settings.REPORT_GENERATION_MAX_CONCURRENT_REPORTS,
         )
         return
 
-    interrupted_reports: QuerySet[Report] = Report.objects.filter(
-        Q(config__interrupted=True) & ~Q(config__interrupted_on_host=host)
+    candidates = list(
+        get_next_reports(host)[: settings.REPORT_GENERATION_ADMISSION_LOOKAHEAD]
     )
-    if interrupted_reports.exists():
-        logger.info(
-            "[ generate_conversations_report task ] Found %s interrupted reports",
-            interrupted_reports.count(),
-        )
-
-        oldest_report: Report = interrupted_reports.order_by("created_on").first()
-
-    else:
-        pending_reports: QuerySet[Report] = Report.objects.filter(
-            status=ReportStatus.PENDING
-        ).order_by("created_on")
-
-        if not pending_reports.exists():
-            logger.info(
-                "[ generate_conversations_report task ] No pending reports found. Finishing task"
-            )
-            return
 
+    if not candidates:
         logger.info(
-            "[ generate_conversations_report task ] Found %s pending reports",
-            pending_reports.count(),
+            "[ generate_conversations_report task ] No report to generate. Finishing task"
         )
+        return
 
-        oldest_report: Report = pending_reports.first()
+    running_cost = sum(
+        config.get("estimated_cost") or 0 for config in generating_configs
+    )
+    admitted = ReportCostEstimator(cache_client=CacheClient()).select(
+        candidates, running_cost
+    )
 
-    if not oldest_report:
+    if not admitted:
         logger.info(
-            "[ generate_conversations_report task ] No report to generate. Finishing task"
+            "[ generate_conversations_report task ] No report fits the remaining cost budget (%s of %s in use). Finishing task",
+            running_cost,
+            settings.REPORT_GENERATION_COST_BUDGET,
         )
         return
 
+    oldest_report, estimated_cost = admitted
+
     logger.info(
         "[ generate_conversations_report task ] Starting generation of oldest report %s",
         oldest_report.uuid,
@@ -112,6 +133,7 @@ def generate_conversations_report():
     try:
         config = oldest_report.config or {}
         config["task_host"] = host
+        config["estimated_cost"] = estimated_cost
 
         if config.get("interrupted"):
             config["interrupted"] = False
@@ -181,6 +203,7 @@ def timeout_reports():
         report.completed_at = completed_at
         report.errors = timeout_errors
         report.save(update_fields=["status", "completed_at", "errors"])
+        ReportCancellationToken.cancel(report.uuid, "timeout")
 
     service = _create_conversations_report_service()
 
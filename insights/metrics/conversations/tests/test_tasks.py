@@ -3,6 +3,7 @@ from unittest.mock import MagicMock, Mock, patch
 
 from uuid import uuid4
 
+from django.core.cache import cache
 from django.test import TestCase, override_settings
 from django.utils import timezone
 
@@ -43,6 +44,30 @@ class TestGenerateConversationsReport(TestCase):
 
         self.assertIsNone(result)
 
+    @override_settings(
+        HOSTNAME="host-1",
+        REPORT_GENERATION_MAX_CONCURRENT_REPORTS=1,
+    )
+    @patch("insights.metrics.conversations.tasks.ConversationsReportService")
+    def test_counts_running_reports_with_config(self, mock_report_service_cls):
+        Report.objects.create(
+            project=self.project,
+            source="CONVERSATIONS_DASHBOARD",
+            format="CSV",
+            status=ReportStatus.IN_PROGRESS,
+            config={"task_host": "host-1"},
+        )
+        Report.objects.create(
+            project=self.project,
+            source="CONVERSATIONS_DASHBOARD",
+            format="CSV",
+            status=ReportStatus.PENDING,
+        )
+
+        generate_conversations_report()
+
+        mock_report_service_cls.return_value.generate.assert_not_called()
+
     @override_settings(
         HOSTNAME="host-2",
         REPORT_GENERATION_MAX_CONCURRENT_REPORTS=5,
@@ -177,6 +202,68 @@ class TestGenerateConversationsReport(TestCase):
         generate_conversations_report()
 
 
+@override_settings(
+    HOSTNAME="host-1",
+    REPORT_GENERATION_MAX_CONCURRENT_REPORTS=5,
+    REPORT_GENERATION_COST_BUDGET=100,
+    REPORT_GENERATION_BACKFILL_MAX_WAIT=600,
+    REPORT_GENERATION_DEFAULT_SECONDS_PER_UNIT=1.0,
+)
+class TestGenerateConversationsReportAdmission(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.project = Project.objects.create(name="Test Project")
+
+    def tearDown(self):
+        cache.clear()
+
+    def _create_report(self, end: str, status=ReportStatus.PENDING, config=None):
+        return Report.objects.create(
+            project=self.project,
+            source="CONVERSATIONS_DASHBOARD",
+            format="CSV",
+            status=status,
+            source_config={"sections": ["CSAT_AI"]},
+            filters={"start": "2025-01-01", "end": end},
+            config=config,
+        )
+
+    @patch("insights.metrics.conversations.tasks.ConversationsReportService")
+    def test_returns_early_when_no_report_fits_the_budget(
+        self, mock_report_service_cls
+    ):
+        self._create_report(
+            "2025-01-10",
+            status=ReportStatus.IN_PROGRESS,
+            config={"estimated_cost": 90},
+        )
+        self._create_report("2025-01-30")
+
+        generate_conversations_report()
+
+        mock_report_service_cls.return_value.generate.assert_not_called()
+
+    @patch("insights.metrics.conversations.tasks.ConversationsReportService")
+    def test_backfills_smaller_report_and_stores_its_cost(
+        self, mock_report_service_cls
+    ):
+        self._create_report(
+            "2025-01-10",
+            status=ReportStatus.IN_PROGRESS,
+            config={"estimated_cost": 60},
+        )
+        self._create_report("2025-02-28")
+        small_report = self._create_report("2025-01-05")
+
+        generate_conversations_report()
+
+        call_arg = mock_report_service_cls.return_value.generate.call_args[0][0]
+        self.assertEqual(call_arg.uuid, small_report.uuid)
+
+        small_report.refresh_from_db()
+        self.assertEqual(small_report.config["estimated_cost"], 5)
+
+
 class TestTimeoutReports(TestCase):
     def setUp(self):
         self.project = Project.objects.create(name="Test Project")
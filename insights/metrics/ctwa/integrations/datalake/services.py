@@ -1,3 +1,4 @@
+import json
 from datetime import date, datetime, time
 from uuid import UUID
 
@@ -8,6 +9,7 @@ from insights.metrics.ctwa.integrations.datalake.dataclass import (
     CTWAConversionsData,
     CTWASummaryData,
 )
+from insights.sources.cache import CacheClient
 
 
 def _to_date(value) -> date:
@@ -81,15 +83,28 @@ def _campaign_source(row: dict) -> str:
     return str(row.get("campaign_source") or row.get("source_id") or "")
 
 
+def _filter_rows(rows: list[dict], campaign: str | None) -> list[dict]:
+    if not campaign:
+        return rows
+    return [row for row in rows if _campaign_source(row) == str(campaign)]
+
+
 class CTWADatalakeService:
     """
     CTWA metrics from Datalake (weni-ctwa-by-campaign).
+
+    The unfiltered rows of a project and date range are fetched once and
+    cached; campaign filtering, aggregation and ranking happen in memory, so
+    the summary, conversions and performance endpoints share one fetch.
     """
 
+    rows_cache_key_prefix = "ctwa_by_campaign_rows"
+
     def __init__(
         self,
         ctwa_by_campaign_client=None,
         conversations_totals_getter=None,
+        cache_client: CacheClient | None = None,
     ):
         self.ctwa_by_campaign_client = (
             ctwa_by_campaign_client or get_ctwa_by_campaign
@@ -97,6 +112,7 @@ class CTWADatalakeService:
         self.conversations_totals_getter = (
             conversations_totals_getter or self._default_conversations_totals
         )
+        self.cache_client = cache_client or CacheClient()
 
     def _default_conversations_totals(self, project_uuid, start_date, end_date):
         from insights.metrics.conversations.integrations.datalake.services import (
@@ -127,6 +143,42 @@ class CTWADatalakeService:
         result = self.ctwa_by_campaign_client(**params)
         return _extract_rows(result)
 
+    def _get_rows_cache_key(self, project_uuid: str, start_date, end_date) -> str:
+        return (
+            f"{self.rows_cache_key_prefix}:{project_uuid}:"
+            f"{_to_date_str(start_date)}:{_to_date_str(end_date)}"
+        )
+
+    def _get_rows_cache_ttl(self, end_date) -> int:
+        if _to_date(end_date) < date.today():
+            return settings.CTWA_ROWS_CLOSED_RANGE_CACHE_TTL
+
+        return settings.CTWA_ROWS_OPEN_RANGE_CACHE_TTL
+
+    def _get_rows(
+        self,
+        project_uuid: str,
+        start_date,
+        end_date,
+        campaign: str | None = None,
+    ) -> list[dict]:
+        """
+        Rows of the project and date range, filtered by campaign.
+        """
+        cache_key = self._get_rows_cache_key(project_uuid, start_date, end_date)
+
+        if cached_rows := self.cache_client.get(cache_key):
+            rows = json.loads(cached_rows)
+        else:
+            rows = self._fetch_rows(project_uuid, start_date, end_date)
+            self.cache_client.set(
+                cache_key,
+                json.dumps(rows, default=str),
+                ex=self._get_rows_cache_ttl(end_date),
+            )
+
+        return _filter_rows(rows, campaign)
+
     def _aggregate_rows(self, rows: list[dict]) -> dict:
         started = sum(
             _as_int(row, "conversation_started", "conversations") for row in rows
@@ -175,13 +227,8 @@ class CTWADatalakeService:
             return CTWASummaryData(currency=settings.CTWA_DEFAULT_CURRENCY)
 
         start_date, end_date = date_range
-        rows = self._fetch_rows(project_uuid, start_date, end_date, campaign)
-        totals = self._aggregate_rows(rows)
-        organic_rows = rows
-        if campaign:
-            organic_rows = self._fetch_rows(
-                project_uuid, start_date, end_date, campaign=None
-            )
+        organic_rows = self._get_rows(project_uuid, start_date, end_date)
+        totals = self._aggregate_rows(_filter_rows(organic_rows, campaign))
         organic_ctwa = self._aggregate_rows(organic_rows)["started"]
 
         return CTWASummaryData(
@@ -207,7 +254,7 @@ class CTWADatalakeService:
 
         start_date, end_date = date_range
         totals = self._aggregate_rows(
-            self._fetch_rows(project_uuid, start_date, end_date, campaign)
+            self._get_rows(project_uuid, start_date, end_date, campaign)
         )
         return CTWAConversionsData(
             conversations_started=totals["started"],
@@ -233,7 +280,7 @@ class CTWADatalakeService:
             }
 
         start_date, end_date = date_range
-        rows = self._fetch_rows(project_uuid, start_date, end_date, campaign)
+        rows = self._get_rows(project_uuid, start_date, end_date, campaign)
         by_campaign: dict[str, dict] = {}
         for row in rows:
             source = _campaign_source(row)
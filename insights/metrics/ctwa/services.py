@@ -2,11 +2,10 @@ import logging
 
 from insights.metrics.ctwa.integrations.datalake.services import CTWADatalakeService
 from insights.sources.meta.campaign.clients import FlowsCampaignClient
+from insights.sources.meta.campaign.index import CTWACampaignIndex
 
 logger = logging.getLogger(__name__)
 
-FLOWS_CAMPAIGN_PAGE_SIZE = 100
-
 
 class CTWADashboardService:
     """
@@ -16,7 +15,8 @@ class CTWADashboardService:
     (weni-ctwa-by-campaign). Organic conversations are conversational totals
     minus CTWA started. Currency is a default until a dedicated endpoint exists.
     Campaign filter uses campaign_source (same id as the Flows campaign list).
-    Performance rows include label.headline from Flows (source_id match).
+    Performance rows include label.headline from the project's CTWA campaign
+    index (source_id match).
     """
 
     def __init__(
@@ -97,7 +97,10 @@ class CTWADashboardService:
             offset=offset,
             campaign=campaign,
         )
-        headlines = self._headlines_by_source_id(project_uuid)
+        headlines = self._headlines_by_source_id(
+            project_uuid,
+            [str(item.get("campaign") or "") for item in data.get("results", [])],
+        )
         for item in data.get("results", []):
             campaign_id = str(item.get("campaign") or "")
             item["label"] = {
@@ -106,25 +109,13 @@ class CTWADashboardService:
             }
         return data
 
-    def _headlines_by_source_id(self, project_uuid: str) -> dict[str, str]:
+    def _headlines_by_source_id(
+        self, project_uuid: str, source_ids: list[str]
+    ) -> dict[str, str]:
         try:
-            client = self.campaign_client_class(project_uuid)
-            headlines: dict[str, str] = {}
-            offset = 0
-            while True:
-                payload = client.list_campaigns(
-                    limit=FLOWS_CAMPAIGN_PAGE_SIZE,
-                    offset=offset,
-                )
-                results = payload.get("results") or []
-                for item in results:
-                    source_id = str(item.get("uuid") or "")
-                    if source_id:
-                        headlines[source_id] = item.get("headline") or ""
-                if len(results) < FLOWS_CAMPAIGN_PAGE_SIZE:
-                    break
-                offset += FLOWS_CAMPAIGN_PAGE_SIZE
-            return headlines
+            return CTWACampaignIndex(
+                project_uuid, client=self.campaign_client_class(project_uuid)
+            ).get_headlines(source_ids)
         except Exception:
             logger.exception(
                 "[ CTWADashboardService ] Failed to list campaign headlines for project %s",
@@ -1,6 +1,7 @@
 from datetime import datetime
 
 import pytz
+from django.core.cache import cache
 from django.test import TestCase
 
 from insights.metrics.conversations.dataclass import (
@@ -113,6 +114,10 @@ class TestCTWADashboardService(TestCase):
             ),
             campaign_client_class=FakeCampaignClient,
         )
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
 
     def test_get_data_aggregates_all_campaigns(self):
         data = self.service.get_data(
@@ -353,3 +358,37 @@ class TestCTWADashboardService(TestCase):
             data["results"][0]["label"],
             {"headline": "", "id": "120250777996740371"},
         )
+
+    def test_fetches_unfiltered_rows_once_for_all_endpoints(self):
+        calls = []
+
+        def capture_client(**params):
+            calls.append(params)
+            return _fake_ctwa_by_campaign(**params)
+
+        service = CTWADashboardService(
+            datalake_service=CTWADatalakeService(
+                ctwa_by_campaign_client=capture_client,
+                conversations_totals_getter=_fake_totals,
+            ),
+            campaign_client_class=FakeCampaignClient,
+        )
+        filters = {
+            "project_uuid": "123e4567-e89b-12d3-a456-426614174000",
+            "start_date": "2026-08-20",
+            "end_date": "2026-08-26",
+        }
+
+        data = service.get_data(**filters, campaign="120250777996740371")
+        conversions = service.get_conversions(**filters)
+        performance = service.get_performance_by_campaign(
+            **filters, campaign="weekend"
+        )
+
+        self.assertEqual(len(calls), 1)
+        self.assertNotIn("campaign_source", calls[0])
+        self.assertEqual(data["ctwa_conversations"], 3200)
+        self.assertEqual(data["organic_conversations"], 22800)
+        self.assertEqual(conversions["conversations_started"]["total"], 19400)
+        self.assertEqual(performance["count"], 1)
+        self.assertEqual(performance["results"][0]["conversations"], 7400)
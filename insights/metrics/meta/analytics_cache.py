@@ -0,0 +1,145 @@
+import json
+from datetime import date, datetime, time, timedelta
+from datetime import timezone as dt_timezone
+
+from django.conf import settings
+from django.utils import timezone
+
+from insights.sources.cache import CacheClient
+
+
+def is_closed_day(day: date) -> bool:
+    """
+    Whether Meta's data points of the (UTC) day are final: Meta keeps filling
+    them in for hours after the day ends, so a day is only closed
+    META_ANALYTICS_CLOSED_DAY_LAG_HOURS after its end.
+    """
+    day_end = datetime.combine(day + timedelta(days=1), time.min, dt_timezone.utc)
+
+    return timezone.now() >= day_end + timedelta(
+        hours=settings.META_ANALYTICS_CLOSED_DAY_LAG_HOURS
+    )
+
+
+def get_day_cache_ttl(day: date) -> int:
+    if is_closed_day(day):
+        return settings.META_ANALYTICS_CLOSED_DAY_CACHE_TTL
+
+    return settings.META_ANALYTICS_OPEN_DAY_CACHE_TTL
+
+
+class TemplateAnalyticsDayCache:
+    """
+    Raw Meta template analytics data points, one entry per
+    (waba, template, product type, day).
+
+    Days that are already closed (see is_closed_day) do not change anymore,
+    so they are kept for a long time and reused by any range that covers
+    them. Open days are kept only for a short time, as Meta keeps updating
+    them.
+
+    A day that Meta returned no data point for is stored as an empty dict, so
+    it is not requested again.
+    """
+
+    key_prefix = "meta_template_analytics_day"
+
+    def __init__(self, cache_client: CacheClient | None = None):
+        self.cache = cache_client or CacheClient()
+
+    def get_key(
+        self, waba_id: str, template_id: str, product_type: str, day: date
+    ) -> str:
+        return (
+            f"{self.key_prefix}:{waba_id}:{template_id}:"
+            f"{product_type}:{day.isoformat()}"
+        )
+
+    def get_ttl(self, day: date) -> int:
+        return get_day_cache_ttl(day)
+
+    def get_many(
+        self,
+        waba_id: str,
+        template_ids: list[str],
+        product_type: str,
+        days: list[date],
+    ) -> dict[tuple[str, date], dict]:
+        """
+        Return the cached data points by (template_id, day).
+
+        Pairs that were never fetched are absent from the result.
+        """
+        pairs = [(template_id, day) for template_id in template_ids for day in days]
+        values = self.cache.get_many(
+            [
+                self.get_key(waba_id, template_id, product_type, day)
+                for template_id, day in pairs
+            ]
+        )
+
+        return {
+            pair: json.loads(value)
+            for pair, value in zip(pairs, values)
+            if value is not None
+        }
+
+    def set_many(
+        self,
+        waba_id: str,
+        product_type: str,
+        data_points: dict[tuple[str, date], dict],
+    ) -> None:
+        values_by_ttl: dict[int, dict[str, str]] = {}
+
+        for (template_id, day), data_point in data_points.items():
+            values_by_ttl.setdefault(self.get_ttl(day), {})[
+                self.get_key(waba_id, template_id, product_type, day)
+            ] = json.dumps(data_point, default=str)
+
+        for ttl, values in values_by_ttl.items():
+            self.cache.set_many(values, ex=ttl)
+
+
+class PricingAnalyticsDayCache:
+    """
+    Meta pricing analytics of a WABA, one entry per (waba, day) holding the
+    volume and cost of each pricing category.
+
+    Like TemplateAnalyticsDayCache, closed days (see is_closed_day) are kept
+    for a long time and open days only for a short time. A day without data
+    points is stored as an empty dict.
+    """
+
+    key_prefix = "meta_pricing_analytics_day"
+
+    def __init__(self, cache_client: CacheClient | None = None):
+        self.cache = cache_client or CacheClient()
+
+    def get_key(self, waba_id: str, day: date) -> str:
+        return f"{self.key_prefix}:{waba_id}:{day.isoformat()}"
+
+    def get_many(self, waba_id: str, days: list[date]) -> dict[date, dict]:
+        """
+        Return the cached categories by day.
+
+        Days that were never fetched are absent from the result.
+        """
+        values = self.cache.get_many([self.get_key(waba_id, day) for day in days])
+
+        return {
+            day: json.loads(value)
+            for day, value in zip(days, values)
+            if value is not None
+        }
+
+    def set_many(self, waba_id: str, categories_by_day: dict[date, dict]) -> None:
+        values_by_ttl: dict[int, dict[str, str]] = {}
+
+        for day, categories in categories_by_day.items():
+            values_by_ttl.setdefault(get_day_cache_ttl(day), {})[
+                self.get_key(waba_id, day)
+            ] = json.dumps(categories)
+
+        for ttl, values in values_by_ttl.items():
+            self.cache.set_many(values, ex=ttl)
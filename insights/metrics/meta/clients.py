@@ -2,12 +2,16 @@ import json
 import logging
 import requests
 
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 
 from django.conf import settings
 from rest_framework.exceptions import NotFound
 from sentry_sdk import capture_exception
 
+from insights.metrics.meta.analytics_cache import (
+    PricingAnalyticsDayCache,
+    TemplateAnalyticsDayCache,
+)
 from insights.metrics.meta.enums import AnalyticsGranularity, MetricsTypes, ProductType
 from insights.metrics.meta.exception import (
     MarketingMessagesStatusError,
@@ -25,6 +29,24 @@ from insights.sources.cache import CacheClient
 logger = logging.getLogger(__name__)
 
 
+MESSAGES_ANALYTICS_METRICS_TYPES = [
+    MetricsTypes.SENT.value,
+    MetricsTypes.DELIVERED.value,
+    MetricsTypes.READ.value,
+    MetricsTypes.CLICKED.value,
+]
+
+
+def is_day_range(start_date, end_date) -> bool:
+    """
+    Whether the range is made of whole days (date objects, not datetimes).
+    """
+    return all(
+        isinstance(value, date) and not isinstance(value, datetime)
+        for value in (start_date, end_date)
+    )
+
+
 class MetaGraphAPIClient:
     base_host_url = settings.META_GRAPH_API_BASE_HOST_URL
     access_token = settings.WHATSAPP_API_ACCESS_TOKEN
@@ -33,6 +55,8 @@ class MetaGraphAPIClient:
     def __init__(self):
         self.cache = CacheClient()
         self.cache_ttl = 3600  # 1h
+        self.analytics_day_cache = TemplateAnalyticsDayCache(self.cache)
+        self.pricing_day_cache = PricingAnalyticsDayCache(self.cache)
 
     @property
     def headers(self):
@@ -122,6 +146,144 @@ class MetaGraphAPIClient:
     ) -> str:
         return f"meta_msgs_analytics:{waba_id}:{template_id}:{json.dumps(params, sort_keys=True)}"
 
+    def _fetch_template_analytics(
+        self,
+        waba_id: str,
+        params: dict,
+        context: str = "getting messages analytics",
+        raise_not_found: bool = False,
+    ) -> dict:
+        url = f"{self.base_host_url}/{self.version}/{waba_id}/template_analytics?"
+
+        try:
+            response = requests.get(
+                url, headers=self.headers, params=params, timeout=60
+            )
+            response.raise_for_status()
+
+        except requests.HTTPError as err:
+            if raise_not_found and err.response.status_code == 404:
+                raise NotFound(
+                    {"error": "Template not found"}, code="template_not_found"
+                ) from err
+
+            self._handle_http_error(err, context)
+
+        return response.json()
+
+    def _fetch_template_analytics_by_day(
+        self,
+        waba_id: str,
+        template_ids: list[str],
+        start_date: date,
+        end_date: date,
+        product_type: str,
+        raise_not_found: bool = False,
+    ) -> dict[tuple[str, date], dict]:
+        """
+        Fetch raw daily data points and index them by (template_id, day).
+
+        Every requested pair is present in the result; pairs without a data
+        point from Meta are empty dicts. With raise_not_found, a 404 from
+        Meta raises NotFound instead of MetaAPIError.
+        """
+        end = min(
+            convert_date_to_unix_timestamp(end_date, use_max_time=True),
+            int(datetime.now().timestamp()),
+        )
+
+        params = {
+            "granularity": AnalyticsGranularity.DAILY.value,
+            "start": convert_date_to_unix_timestamp(start_date),
+            "end": end,
+            "metric_types": ",".join(MESSAGES_ANALYTICS_METRICS_TYPES),
+            "template_ids": ",".join(template_ids),
+            "product_type": product_type,
+            "limit": 9999,
+        }
+
+        meta_response = self._fetch_template_analytics(
+            waba_id, params, raise_not_found=raise_not_found
+        )
+
+        days = [
+            start_date + timedelta(days=offset)
+            for offset in range((end_date - start_date).days + 1)
+        ]
+        data_points_by_day = {
+            (template_id, day): {} for template_id in template_ids for day in days
+        }
+
+        for data in meta_response.get("data") or []:
+            for data_point in data.get("data_points") or []:
+                template_id = str(data_point.get("template_id") or "")
+
+                if not template_id and len(template_ids) == 1:
+                    template_id = template_ids[0]
+
+                day = datetime.fromtimestamp(data_point.get("start")).date()
+
+                if (template_id, day) in data_points_by_day:
+                    data_points_by_day[(template_id, day)] = data_point
+
+        return data_points_by_day
+
+    def get_template_analytics_data_points(
+        self,
+        waba_id: str,
+        template_ids: list[str],
+        start_date: date,
+        end_date: date,
+        product_type: str = ProductType.CLOUD_API.value,
+        raise_not_found: bool = False,
+    ) -> list[dict]:
+        """
+        Raw daily data points for the templates, ordered by day and template.
+
+        Days already in the per-day cache are not requested again; the days
+        missing from it (always including today, once its entry expires) are
+        fetched in a single request covering the missing span.
+        """
+        last_day = min(end_date, date.today())
+
+        if last_day < start_date:
+            return []
+
+        days = [
+            start_date + timedelta(days=offset)
+            for offset in range((last_day - start_date).days + 1)
+        ]
+
+        data_points = self.analytics_day_cache.get_many(
+            waba_id, template_ids, product_type, days
+        )
+
+        missing = [
+            (template_id, day)
+            for template_id in template_ids
+            for day in days
+            if (template_id, day) not in data_points
+        ]
+
+        if missing:
+            fetched = self._fetch_template_analytics_by_day(
+                waba_id=waba_id,
+                template_ids=list(dict.fromkeys(pair[0] for pair in missing)),
+                start_date=min(pair[1] for pair in missing),
+                end_date=max(pair[1] for pair in missing),
+                product_type=product_type,
+                raise_not_found=raise_not_found,
+            )
+            self.analytics_day_cache.set_many(waba_id, product_type, fetched)
+            data_points.update(fetched)
+
+        return [
+            data_points[(template_id, day)]
+            for day in days
+            for template_id in template_ids
+            if data_points.get((template_id, day))
+        ]
+
     def get_messages_analytics(
         self,
         waba_id: str,
@@ -135,18 +297,26 @@ class MetaGraphAPIClient:
         # return_exceptions kept for signature compatibility; Meta HTTP errors
         # always raise MetaAPIError.
         _ = return_exceptions
-        url = f"{self.base_host_url}/{self.version}/{waba_id}/template_analytics?"
-
-        metrics_types = [
-            MetricsTypes.SENT.value,
-            MetricsTypes.DELIVERED.value,
-            MetricsTypes.READ.value,
-            MetricsTypes.CLICKED.value,
-        ]
 
         if isinstance(template_id, list):
             template_id = ",".join(template_id)
 
+        if is_day_range(start_date, end_date):
+            data_points = self.get_template_analytics_data_points(
+                waba_id=waba_id,
+                template_ids=template_id.split(","),
+                start_date=start_date,
+                end_date=end_date,
+                product_type=product_type,
+            )
+
+            return {
+                "data": format_messages_metrics_data(
+                    {"data_points": data_points},
+                    include_data_points=include_data_points,
+                )
+            }
+
         start = (
             int(start_date.timestamp())
             if isinstance(start_date, datetime)
@@ -167,7 +337,7 @@ class MetaGraphAPIClient:
             "granularity": AnalyticsGranularity.DAILY.value,
             "start": start,
             "end": end,
-            "metric_types": ",".join(metrics_types),
+            "metric_types": ",".join(MESSAGES_ANALYTICS_METRICS_TYPES),
             "template_ids": template_id,
             "product_type": product_type,
             "limit": 9999,
@@ -180,16 +350,7 @@ class MetaGraphAPIClient:
         if cached_response := self.cache.get(cache_key):
             return json.loads(cached_response)
 
-        try:
-            response = requests.get(
-                url, headers=self.headers, params=params, timeout=60
-            )
-            response.raise_for_status()
-
-        except requests.HTTPError as err:
-            self._handle_http_error(err, "getting messages analytics")
-
-        meta_response = response.json()
+        meta_response = self._fetch_template_analytics(waba_id, params)
         response = {
             "data": format_messages_metrics_data(
                 meta_response.get("data")[0], include_data_points=include_data_points
@@ -205,6 +366,18 @@ class MetaGraphAPIClient:
     ) -> str:
         return f"meta_button_analytics:{waba_id}:{template_id}:{json.dumps(params, sort_keys=True)}"
 
+    def get_template_buttons(self, template_id: str) -> list[dict]:
+        """
+        Buttons of the template, from its cached preview.
+        """
+        template_data: dict = self.get_template_preview(template_id=template_id)
+
+        for component in template_data.get("components", []):
+            if component.get("type", "") == "BUTTONS":
+                return component.get("buttons", [])
+
+        return []
+
     def get_buttons_analytics(
         self,
         waba_id: str,
@@ -213,6 +386,25 @@ class MetaGraphAPIClient:
         end_date: date,
         product_type: str = ProductType.CLOUD_API.value,
     ):
+        if is_day_range(start_date, end_date):
+            # Served from the same per-day data points as the messages
+            # analytics, which already include the clicked metric
+            buttons = self.get_template_buttons(template_id)
+
+            if buttons == []:
+                return {"data": []}
+
+            data_points = self.get_template_analytics_data_points(
+                waba_id=waba_id,
+                template_ids=[template_id],
+                start_date=start_date,
+                end_date=end_date,
+                product_type=product_type,
+                raise_not_found=True,
+            )
+
+            return {"data": format_button_metrics_data(buttons, data_points)}
+
         metrics_types = [
             MetricsTypes.SENT.value,
             MetricsTypes.CLICKED.value,
@@ -251,15 +443,7 @@ class MetaGraphAPIClient:
         if cached_response := self.cache.get(cache_key):
             return json.loads(cached_response)
 
-        template_data: dict = self.get_template_preview(template_id=template_id)
-        components = template_data.get("components", [])
-
-        buttons = []
-
-        for component in components:
-            if component.get("type", "") == "BUTTONS":
-                buttons = component.get("buttons", [])
-                break
+        buttons = self.get_template_buttons(template_id)
 
         if buttons == []:
             return {"data": []}
@@ -288,20 +472,7 @@ class MetaGraphAPIClient:
 
         return response
 
-    def get_conversations_by_category(
-        self, waba_id: int, start_date: date, end_date: date
-    ):
-        start = (
-            int(start_date.timestamp())
-            if isinstance(start_date, datetime)
-            else convert_date_to_unix_timestamp(start_date)
-        )
-        end = (
-            int(end_date.timestamp())
-            if isinstance(end_date, datetime)
-            else convert_date_to_unix_timestamp(end_date, use_max_time=True)
-        )
-
+    def _fetch_pricing_analytics(self, waba_id, start: int, end: int) -> dict:
         url = f"{self.base_host_url}/{self.version}/{waba_id}/"
         params = {
             "fields": f"pricing_analytics.start({start}).end({end}).granularity(DAILY).dimensions(['PRICING_CATEGORY'])"
@@ -324,6 +495,111 @@ class MetaGraphAPIClient:
 
         return response.json()
 
+    def _fetch_pricing_analytics_by_day(
+        self, waba_id, start_date: date, end_date: date
+    ) -> dict[date, dict]:
+        """
+        Fetch pricing data points and sum them by day and category.
+
+        Every requested day is present in the result; days without data
+        points are empty dicts.
+        """
+        meta_response = self._fetch_pricing_analytics(
+            waba_id,
+            convert_date_to_unix_timestamp(start_date),
+            convert_date_to_unix_timestamp(end_date, use_max_time=True),
+        )
+
+        categories_by_day = {
+            start_date + timedelta(days=offset): {}
+            for offset in range((end_date - start_date).days + 1)
+        }
+
+        for data in meta_response.get("pricing_analytics", {}).get("data") or []:
+            for data_point in data.get("data_points") or []:
+                if data_point.get("start") is not None:
+                    day = datetime.fromtimestamp(data_point["start"]).date()
+                elif start_date == end_date:
+                    day = start_date
+                else:
+                    continue
+
+                if day not in categories_by_day:
+                    continue
+
+                category = categories_by_day[day].setdefault(
+                    data_point.get("pricing_category"), {"volume": 0, "cost": 0}
+                )
+                category["volume"] += data_point.get("volume") or 0
+                category["cost"] += data_point.get("cost") or 0
+
+        return categories_by_day
+
+    def get_pricing_analytics_data_points(
+        self, waba_id, start_date: date, end_date: date
+    ) -> list[dict]:
+        """
+        Pricing data points of the WABA, one per day and category.
+
+        Days already in the per-day cache are not requested again; the days
+        missing from it are fetched in a single request covering the missing
+        span.
+        """
+        days = [
+            start_date + timedelta(days=offset)
+            for offset in range((end_date - start_date).days + 1)
+        ]
+
+        categories_by_day = self.pricing_day_cache.get_many(waba_id, days)
+
+        if missing_days := [day for day in days if day not in categories_by_day]:
+            fetched = self._fetch_pricing_analytics_by_day(
+                waba_id, missing_days[0], missing_days[-1]
+            )
+            self.pricing_day_cache.set_many(waba_id, fetched)
+            categories_by_day.update(fetched)
+
+        return [
+            {
+                "start": convert_date_to_unix_timestamp(day),
+                "end": convert_date_to_unix_timestamp(day + timedelta(days=1)),
+                "pricing_category": category,
+                "volume": values["volume"],
+                "cost": values["cost"],
+            }
+            for day in days
+            for category, values in categories_by_day[day].items()
+        ]
+
+    def get_conversations_by_category(
+        self, waba_id: int, start_date: date, end_date: date
+    ):
+        if is_day_range(start_date, end_date):
+            return {
+                "pricing_analytics": {
+                    "data": [
+                        {
+                            "data_points": self.get_pricing_analytics_data_points(
+                                waba_id, start_date, end_date
+                            )
+                        }
+                    ]
+                }
+            }
+
+        start = (
+            int(start_date.timestamp())
+            if isinstance(start_date, datetime)
+            else convert_date_to_unix_timestamp(start_date)
+        )
+        end = (
+            int(end_date.timestamp())
+            if isinstance(end_date, datetime)
+            else convert_date_to_unix_timestamp(end_date, use_max_time=True)
+        )
+
+        return self._fetch_pricing_analytics(waba_id, start, end)
+
     def check_marketing_messages_status(self, waba_id: str):
         url = f"{self.base_host_url}/{self.version}/{waba_id}/"
 
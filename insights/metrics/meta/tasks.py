@@ -6,6 +6,7 @@ from datetime import datetime
 
 from django.conf import settings
 
+from insights.core.dispatch import DebouncedTaskDispatcher
 from insights.metrics.meta.clients import MetaGraphAPIClient
 from insights.metrics.meta.services import MetaMessageTemplatesService
 from insights.metrics.meta.usecases.waba_migration_analytics import (
@@ -65,7 +66,8 @@ def check_dashboards_marketing_messages_status_for_project(project_uuid: UUID):
                 )
                 continue
 
-        check_marketing_messages_status.apply_async(
+        DebouncedTaskDispatcher().dispatch(
+            check_marketing_messages_status,
             args=[dashboard.uuid],
             expires=timezone.now() + timedelta(minutes=59),
         )
@@ -1,3 +1,8 @@
+import copy
+from datetime import date, timedelta
+
+from insights.utils import convert_date_to_unix_timestamp
+
 MOCK_TEMPLATES_LIST_BODY = {
     "data": [
         {
@@ -148,6 +153,22 @@ MOCK_TEMPLATE_DAILY_ANALYTICS = {
 }
 
 
+def build_template_daily_analytics(template_id: str, start_date: date) -> dict:
+    """
+    MOCK_TEMPLATE_DAILY_ANALYTICS with its data points moved to the given
+    template and to consecutive days starting at start_date.
+    """
+    response = copy.deepcopy(MOCK_TEMPLATE_DAILY_ANALYTICS)
+
+    for offset, data_point in enumerate(response["data"][0]["data_points"]):
+        day = start_date + timedelta(days=offset)
+        data_point["template_id"] = template_id
+        data_point["start"] = convert_date_to_unix_timestamp(day)
+        data_point["end"] = convert_date_to_unix_timestamp(day + timedelta(days=1))
+
+    return response
+
+
 MOCK_TEMPLATE_DAILY_ANALYTICS_INVALID_PERIOD = {
     "error": {
         "message": "Invalid parameter",
@@ -182,3 +203,17 @@ MOCK_CONVERSATIONS_BY_CATEGORY_RESPONSE_BODY = {
         ],
     },
 }
+
+
+def build_conversations_by_category_response(day: date) -> dict:
+    """
+    MOCK_CONVERSATIONS_BY_CATEGORY_RESPONSE_BODY with its data points on the
+    given day.
+    """
+    response = copy.deepcopy(MOCK_CONVERSATIONS_BY_CATEGORY_RESPONSE_BODY)
+
+    for data_point in response["pricing_analytics"]["data"][0]["data_points"]:
+        data_point["start"] = convert_date_to_unix_timestamp(day)
+        data_point["end"] = convert_date_to_unix_timestamp(day + timedelta(days=1))
+
+    return response
@@ -0,0 +1,70 @@
+from datetime import date, datetime
+from datetime import timezone as dt_timezone
+from unittest.mock import MagicMock, patch
+
+from django.test import TestCase, override_settings
+
+from insights.metrics.meta.analytics_cache import (
+    PricingAnalyticsDayCache,
+    get_day_cache_ttl,
+)
+
+
+@override_settings(
+    META_ANALYTICS_CLOSED_DAY_CACHE_TTL=1000,
+    META_ANALYTICS_OPEN_DAY_CACHE_TTL=10,
+    META_ANALYTICS_CLOSED_DAY_LAG_HOURS=24,
+)
+class TestGetDayCacheTTL(TestCase):
+    def _now(self, *args):
+        return patch(
+            "insights.metrics.meta.analytics_cache.timezone.now",
+            return_value=datetime(*args, tzinfo=dt_timezone.utc),
+        )
+
+    def test_day_is_open_until_the_lag_after_it_ends(self):
+        with self._now(2025, 1, 2, 0, 5):
+            self.assertEqual(get_day_cache_ttl(date(2025, 1, 2)), 10)
+            self.assertEqual(get_day_cache_ttl(date(2025, 1, 1)), 10)
+            self.assertEqual(get_day_cache_ttl(date(2024, 12, 31)), 1000)
+
+    def test_day_is_closed_once_the_lag_has_passed(self):
+        with self._now(2025, 1, 3):
+            self.assertEqual(get_day_cache_ttl(date(2025, 1, 1)), 1000)
+
+    @override_settings(META_ANALYTICS_CLOSED_DAY_LAG_HOURS=6)
+    def test_lag_is_configurable(self):
+        with self._now(2025, 1, 2, 6):
+            self.assertEqual(get_day_cache_ttl(date(2025, 1, 1)), 1000)
+
+
+@override_settings(
+    META_ANALYTICS_CLOSED_DAY_CACHE_TTL=1000,
+    META_ANALYTICS_OPEN_DAY_CACHE_TTL=10,
+    META_ANALYTICS_CLOSED_DAY_LAG_HOURS=24,
+)
+class TestPricingAnalyticsDayCache(TestCase):
+    def test_day_that_just_ended_is_cached_as_open(self):
+        cache_client = MagicMock()
+        day_cache = PricingAnalyticsDayCache(cache_client=cache_client)
+
+        with patch(
+            "insights.metrics.meta.analytics_cache.timezone.now",
+            return_value=datetime(2025, 1, 2, 0, 5, tzinfo=dt_timezone.utc),
+        ):
+            day_cache.set_many(
+                "waba",
+                {date(2025, 1, 1): {"SERVICE": {"volume": 1}}, date(2024, 12, 30): {}},
+            )
+
+        ttls = {
+            tuple(call.args[0]): call.kwargs["ex"]
+            for call in cache_client.set_many.call_args_list
+        }
+        self.assertEqual(
+            ttls,
+            {
+                (day_cache.get_key("waba", date(2025, 1, 1)),): 10,
+                (day_cache.get_key("waba", date(2024, 12, 30)),): 1000,
+            },
+        )
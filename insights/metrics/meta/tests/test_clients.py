@@ -1,17 +1,16 @@
 import json
 import responses
+from urllib.parse import unquote
+from datetime import date, timedelta
 
 from django.conf import settings
 from django.core.cache import cache
 from django.test import TestCase
 from rest_framework import status
+from rest_framework.exceptions import NotFound
 
 from insights.metrics.meta.clients import MetaGraphAPIClient
-from insights.metrics.meta.enums import (
-    AnalyticsGranularity,
-    MetricsTypes,
-    ProductType,
-)
+from insights.metrics.meta.enums import ProductType
 from insights.metrics.meta.exception import MetaAPIError
 from insights.metrics.meta.utils import (
     format_button_metrics_data,
@@ -23,6 +22,8 @@ from insights.metrics.meta.tests.mock import (
     MOCK_TEMPLATE_DAILY_ANALYTICS,
     MOCK_TEMPLATE_DAILY_ANALYTICS_INVALID_PERIOD,
     MOCK_TEMPLATES_LIST_BODY,
+    build_conversations_by_category_response,
+    build_template_daily_analytics,
 )
 from insights.utils import (
     convert_date_str_to_datetime_date,
@@ -120,31 +121,14 @@ class TestMetaGraphAPIClient(TestCase):
 
     def test_get_template_daily_analytics(self):
         waba_id = "0000000000000000"
-        template_id = "1234567890987654"
+        template_id = "123456789098765"
         url = f"{self.base_host_url}/{self.version}/0000000000000000/template_analytics"
 
-        metrics_types = [
-            MetricsTypes.SENT.value,
-            MetricsTypes.DELIVERED.value,
-            MetricsTypes.READ.value,
-            MetricsTypes.CLICKED.value,
-        ]
-
         start_date = convert_date_str_to_datetime_date("2024-12-01")
         end_date = convert_date_str_to_datetime_date("2024-12-31")
 
-        params = {
-            "granularity": AnalyticsGranularity.DAILY.value,
-            "start": convert_date_to_unix_timestamp(start_date),
-            "end": convert_date_to_unix_timestamp(end_date, use_max_time=True),
-            "metric_types": ",".join(metrics_types),
-            "template_ids": template_id,
-            "product_type": ProductType.CLOUD_API.value,
-            "limit": 9999,
-        }
-
-        cache_key = self.client.get_analytics_cache_key(
-            waba_id=waba_id, template_id=template_id, params=params
+        cache_key = self.client.analytics_day_cache.get_key(
+            waba_id, template_id, ProductType.CLOUD_API.value, start_date
         )
 
         self.assertIsNone(self.client.cache.get(cache_key))
@@ -175,12 +159,15 @@ class TestMetaGraphAPIClient(TestCase):
 
             self.assertEqual(len(rsps.calls), 1)  # URL called once
 
-            cached_response = self.client.cache.get(cache_key)
-            self.assertIsNotNone(cached_response)
+            cached_data_point = self.client.cache.get(cache_key)
+            self.assertIsNotNone(cached_data_point)
 
-            self.assertEqual(expected_response, json.loads(cached_response))
+            self.assertEqual(
+                json.loads(cached_data_point),
+                MOCK_TEMPLATE_DAILY_ANALYTICS["data"][0]["data_points"][0],
+            )
 
-            # URL should not called again due to cached response
+            # URL should not called again due to cached data points
             self.client.get_messages_analytics(
                 waba_id=waba_id,
                 template_id=template_id,
@@ -190,6 +177,88 @@ class TestMetaGraphAPIClient(TestCase):
 
             self.assertEqual(len(rsps.calls), 1)
 
+    def test_get_template_daily_analytics_fetches_only_missing_days(self):
+        waba_id = "0000000000000000"
+        template_id = "123456789098765"
+        url = f"{self.base_host_url}/{self.version}/0000000000000000/template_analytics"
+
+        with responses.RequestsMock() as rsps:
+            rsps.add(
+                responses.GET,
+                url,
+                status=status.HTTP_200_OK,
+                content_type="application/json",
+                body=json.dumps(MOCK_TEMPLATE_DAILY_ANALYTICS),
+            )
+
+            self.client.get_messages_analytics(
+                waba_id=waba_id,
+                template_id=template_id,
+                start_date=convert_date_str_to_datetime_date("2024-12-01"),
+                end_date=convert_date_str_to_datetime_date("2024-12-02"),
+            )
+
+            response = self.client.get_messages_analytics(
+                waba_id=waba_id,
+                template_id=template_id,
+                start_date=convert_date_str_to_datetime_date("2024-12-01"),
+                end_date=convert_date_str_to_datetime_date("2024-12-05"),
+            )
+
+            self.assertEqual(len(rsps.calls), 2)
+            self.assertIn(
+                f"start={convert_date_to_unix_timestamp(convert_date_str_to_datetime_date('2024-12-03'))}",
+                rsps.calls[1].request.url,
+            )
+
+        self.assertEqual(response["data"]["status_count"]["sent"]["value"], 15)
+        self.assertEqual(len(response["data"]["data_points"]), 2)
+
+    def test_get_template_daily_analytics_refetches_current_day(self):
+        waba_id = "0000000000000000"
+        template_id = "123456789098765"
+        url = f"{self.base_host_url}/{self.version}/0000000000000000/template_analytics"
+        today = date.today()
+
+        with responses.RequestsMock() as rsps:
+            rsps.add(
+                responses.GET,
+                url,
+                status=status.HTTP_200_OK,
+                content_type="application/json",
+                body=json.dumps(
+                    build_template_daily_analytics(
+                        template_id, today - timedelta(days=1)
+                    )
+                ),
+            )
+
+            self.client.get_messages_analytics(
+                waba_id=waba_id,
+                template_id=template_id,
+                start_date=today - timedelta(days=1),
+                end_date=today,
+            )
+            self.client.cache.delete(
+                self.client.analytics_day_cache.get_key(
+                    waba_id, template_id, ProductType.CLOUD_API.value, today
+                )
+            )
+            response = self.client.get_messages_analytics(
+                waba_id=waba_id,
+                template_id=template_id,
+                start_date=today - timedelta(days=1),
+                end_date=today,
+            )
+
+            self.assertEqual(len(rsps.calls), 2)
+            self.assertIn(
+                f"start={convert_date_to_unix_timestamp(today)}",
+                rsps.calls[1].request.url,
+            )
+
+        self.assertEqual(response["data"]["status_count"]["sent"]["value"], 15)
+
     def test_cannot_get_template_daily_analytics_when_an_error_has_occurred(self):
         waba_id = "0000000000000000"
         template_id = "1234567890987654"
@@ -231,28 +300,13 @@ class TestMetaGraphAPIClient(TestCase):
 
     def test_get_template_buttons_analytics(self):
         waba_id = "0000000000000000"
-        template_id = "1234567890987654"
+        template_id = "123456789098765"
 
         start_date = convert_date_str_to_datetime_date("2024-12-01")
         end_date = convert_date_str_to_datetime_date("2024-12-31")
 
-        metrics_types = [
-            MetricsTypes.SENT.value,
-            MetricsTypes.CLICKED.value,
-        ]
-
-        params = {
-            "granularity": AnalyticsGranularity.DAILY.value,
-            "start": convert_date_to_unix_timestamp(start_date),
-            "end": convert_date_to_unix_timestamp(end_date, use_max_time=True),
-            "metric_types": ",".join(metrics_types),
-            "template_ids": template_id,
-            "product_type": ProductType.CLOUD_API.value,
-            "limit": 9999,
-        }
-
-        cache_key = self.client.get_button_analytics_cache_key(
-            waba_id=waba_id, template_id=template_id, params=params
+        cache_key = self.client.analytics_day_cache.get_key(
+            waba_id, template_id, ProductType.CLOUD_API.value, start_date
         )
 
         self.assertIsNone(self.client.cache.get(cache_key))
@@ -300,12 +354,9 @@ class TestMetaGraphAPIClient(TestCase):
 
             self.assertEqual(len(rsps.calls), 2)  # each URL called once
 
-            cached_response = self.client.cache.get(cache_key)
-            self.assertIsNotNone(cached_response)
-
-            self.assertEqual(expected_response, json.loads(cached_response))
+            self.assertIsNotNone(self.client.cache.get(cache_key))
 
-            # URLs should not called again due to cached response
+            # URLs should not called again due to cached preview and data points
             self.client.get_buttons_analytics(
                 waba_id=waba_id,
                 template_id=template_id,
@@ -314,3 +365,132 @@ class TestMetaGraphAPIClient(TestCase):
             )
 
             self.assertEqual(len(rsps.calls), 2)
+
+    def test_get_template_buttons_analytics_when_template_is_not_found(self):
+        waba_id = "0000000000000000"
+        template_id = "123456789098765"
+
+        with responses.RequestsMock() as rsps:
+            rsps.add(
+                responses.GET,
+                f"{self.base_host_url}/{self.version}/{template_id}",
+                status=status.HTTP_200_OK,
+                content_type="application/json",
+                body=json.dumps(MOCK_SUCCESS_RESPONSE_BODY),
+            )
+            rsps.add(
+                responses.GET,
+                f"{self.base_host_url}/{self.version}/{waba_id}/template_analytics",
+                status=status.HTTP_404_NOT_FOUND,
+                content_type="application/json",
+                body=json.dumps(MOCK_ERROR_RESPONSE_BODY),
+            )
+
+            with self.assertRaises(NotFound) as context:
+                self.client.get_buttons_analytics(
+                    waba_id=waba_id,
+                    template_id=template_id,
+                    start_date=convert_date_str_to_datetime_date("2024-12-01"),
+                    end_date=convert_date_str_to_datetime_date("2024-12-31"),
+                )
+
+        self.assertEqual(context.exception.detail["error"], "Template not found")
+        self.assertEqual(context.exception.detail["error"].code, "template_not_found")
+
+    def test_messages_and_buttons_analytics_share_data_points(self):
+        waba_id = "0000000000000000"
+        template_id = "123456789098765"
+
+        start_date = convert_date_str_to_datetime_date("2024-12-01")
+        end_date = convert_date_str_to_datetime_date("2024-12-31")
+
+        with responses.RequestsMock() as rsps:
+            rsps.add(
+                responses.GET,
+                f"{self.base_host_url}/{self.version}/{template_id}",
+                status=status.HTTP_200_OK,
+                content_type="application/json",
+                body=json.dumps(MOCK_SUCCESS_RESPONSE_BODY),
+            )
+            rsps.add(
+                responses.GET,
+                f"{self.base_host_url}/{self.version}/{waba_id}/template_analytics",
+                status=status.HTTP_200_OK,
+                content_type="application/json",
+                body=json.dumps(MOCK_TEMPLATE_DAILY_ANALYTICS),
+            )
+
+            self.client.get_messages_analytics(
+                waba_id=waba_id,
+                template_id=template_id,
+                start_date=start_date,
+                end_date=end_date,
+            )
+            buttons_response = self.client.get_buttons_analytics(
+                waba_id=waba_id,
+                template_id=template_id,
+                start_date=start_date,
+                end_date=end_date,
+            )
+
+            analytics_calls = [
+                call for call in rsps.calls if "template_analytics" in call.request.url
+            ]
+            self.assertEqual(len(analytics_calls), 1)
+
+        self.assertIn(
+            {
+                "label": "Access service",
+                "type": "URL",
+                "total": 3,
+                "click_rate": 20.0,
+            },
+            buttons_response["data"],
+        )
+
+    def test_get_conversations_by_category_fetches_only_missing_days(self):
+        waba_id = "0000000000000000"
+        url = f"{self.base_host_url}/{self.version}/{waba_id}/"
+        first_day = convert_date_str_to_datetime_date("2024-12-01")
+
+        with responses.RequestsMock() as rsps:
+            rsps.add(
+                responses.GET,
+                url,
+                status=status.HTTP_200_OK,
+                content_type="application/json",
+                body=json.dumps(build_conversations_by_category_response(first_day)),
+            )
+
+            self.client.get_conversations_by_category(
+                waba_id=waba_id,
+                start_date=first_day,
+                end_date=first_day + timedelta(days=1),
+            )
+            response = self.client.get_conversations_by_category(
+                waba_id=waba_id,
+                start_date=first_day,
+                end_date=first_day + timedelta(days=4),
+            )
+
+            self.assertEqual(len(rsps.calls), 2)
+            self.assertIn(
+                f"start({convert_date_to_unix_timestamp(first_day + timedelta(days=2))})",
+                unquote(rsps.calls[1].request.url),
+            )
+
+        data_points = response["pricing_analytics"]["data"][0]["data_points"]
+        self.assertEqual(
+            {
+                data_point["pricing_category"]: data_point["volume"]
+                for data_point in data_points
+            },
+            {"SERVICE": 10, "MARKETING": 20},
+        )
+        self.assertIsNotNone(
+            self.client.cache.get(
+                self.client.pricing_day_cache.get_key(
+                    waba_id, first_day + timedelta(days=4)
+                )
+            )
+        )
@@ -0,0 +1,47 @@
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from insights.authentication.authentication import User
+from insights.authentication.tests.decorators import with_project_auth
+from insights.core.tests.query_budget import QueryBudgetTestMixin
+from insights.dashboards.models import Dashboard
+from insights.metrics.meta.models import FavoriteTemplate
+from insights.projects.models import Project
+
+
+class TestMetaMessageTemplatesViewQueryBudgets(QueryBudgetTestMixin, APITestCase):
+    FAVORITES_BUDGET = 3
+
+    def setUp(self):
+        self.user = User.objects.create(language="pt_BR")
+        self.project = Project.objects.create(name="test_project")
+        self.dashboard = Dashboard.objects.create(
+            name="test_dashboard",
+            project=self.project,
+            config={"waba_id": "1234567890987654"},
+        )
+
+    def create_favorites(self, count: int) -> None:
+        start = FavoriteTemplate.objects.count()
+
+        for index in range(start, start + count):
+            FavoriteTemplate.objects.create(
+                dashboard=self.dashboard,
+                template_id=str(index),
+                name=f"template {index}",
+            )
+
+    def get_favorite_templates(self):
+        response = self.client.get(
+            "/v1/metrics/meta/whatsapp-message-templates/favorites/",
+            {"dashboard": self.dashboard.uuid},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        return response
+
+    @with_project_auth
+    def test_get_favorite_templates(self):
+        self.assertConstantQueries(
+            self.FAVORITES_BUDGET, self.get_favorite_templates, self.create_favorites
+        )
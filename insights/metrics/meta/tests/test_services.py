@@ -11,10 +11,10 @@ from rest_framework.exceptions import ValidationError
 
 from insights.metrics.meta.services import MetaMessageTemplatesService
 from insights.metrics.meta.tests.mock import (
-    MOCK_CONVERSATIONS_BY_CATEGORY_RESPONSE_BODY,
     MOCK_SUCCESS_RESPONSE_BODY,
-    MOCK_TEMPLATE_DAILY_ANALYTICS,
     MOCK_TEMPLATES_LIST_BODY,
+    build_conversations_by_category_response,
+    build_template_daily_analytics,
 )
 from insights.metrics.meta.utils import (
     format_button_metrics_data,
@@ -83,6 +83,8 @@ class TestMetaMessageTemplatesService(TestCase):
         waba_id = "0000000000000000"
         template_id = "1234567890987654"
         url = f"{settings.META_GRAPH_API_BASE_HOST_URL}/{settings.META_GRAPH_API_VERSION}/{waba_id}/template_analytics"
+        start_date = timezone.now().date() - timedelta(days=7)
+        analytics = build_template_daily_analytics(template_id, start_date)
 
         with responses.RequestsMock() as rsps:
             rsps.add(
@@ -90,22 +92,20 @@ class TestMetaMessageTemplatesService(TestCase):
                 url,
                 status=status.HTTP_200_OK,
                 content_type="application/json",
-                body=json.dumps(MOCK_TEMPLATE_DAILY_ANALYTICS),
+                body=json.dumps(analytics),
             )
 
             result = self.service.get_messages_analytics(
                 filters={
                     "waba_id": waba_id,
                     "template_id": template_id,
-                    "start_date": str(timezone.now().date() - timedelta(days=7)),
+                    "start_date": str(start_date),
                     "end_date": str(timezone.now().date()),
                 }
             )
 
             expected_response = {
-                "data": format_messages_metrics_data(
-                    MOCK_TEMPLATE_DAILY_ANALYTICS.get("data")[0]
-                )
+                "data": format_messages_metrics_data(analytics.get("data")[0])
             }
 
             self.assertEqual(result, expected_response)
@@ -121,6 +121,8 @@ class TestMetaMessageTemplatesService(TestCase):
     def test_get_template_buttons_analytics(self):
         waba_id = "0000000000000000"
         template_id = "1234567890987654"
+        start_date = timezone.now().date() - timedelta(days=7)
+        analytics = build_template_daily_analytics(template_id, start_date)
 
         with responses.RequestsMock() as rsps:
             rsps.add(
@@ -135,14 +137,14 @@ class TestMetaMessageTemplatesService(TestCase):
                 f"{settings.META_GRAPH_API_BASE_HOST_URL}/{settings.META_GRAPH_API_VERSION}/{waba_id}/template_analytics",
                 status=status.HTTP_200_OK,
                 content_type="application/json",
-                body=json.dumps(MOCK_TEMPLATE_DAILY_ANALYTICS),
+                body=json.dumps(analytics),
             )
 
             result = self.service.get_buttons_analytics(
                 filters={
                     "waba_id": waba_id,
                     "template_id": template_id,
-                    "start_date": str(timezone.now().date() - timedelta(days=7)),
+                    "start_date": str(start_date),
                     "end_date": str(timezone.now().date()),
                 }
             )
@@ -155,9 +157,7 @@ class TestMetaMessageTemplatesService(TestCase):
             expected_response = {
                 "data": format_button_metrics_data(
                     buttons,
-                    MOCK_TEMPLATE_DAILY_ANALYTICS.get("data", {})[0].get(
-                        "data_points", []
-                    ),
+                    analytics.get("data", {})[0].get("data_points", []),
                 )
             }
 
@@ -181,7 +181,7 @@ class TestMetaMessageTemplatesService(TestCase):
                 url,
                 status=status.HTTP_200_OK,
                 content_type="application/json",
-                body=json.dumps(MOCK_CONVERSATIONS_BY_CATEGORY_RESPONSE_BODY),
+                body=json.dumps(build_conversations_by_category_response(start_date)),
             )
 
             result = self.service.get_conversations_by_category(
@@ -1,4 +1,6 @@
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import date
 
@@ -29,31 +31,56 @@ class WabaTemplateIDs:
     template_ids: list[str]
 
 
+@dataclass(frozen=True)
+class AnalyticsRequest:
+    """One Meta template analytics request of the fan-out."""
+
+    waba_id: str
+    template_ids: tuple[str, ...]
+    start_date: date
+    end_date: date
+    product_type: str
+    is_old_waba: bool = False
+
+
 class GetTemplatesMetricsFromMultipleWabasUseCase:
+    """
+    Sum template message metrics across WABAs, migration periods, product
+    types and template id chunks.
+
+    The Meta requests run concurrently, limited by
+    META_ANALYTICS_FAN_OUT_MAX_WORKERS overall and by
+    META_ANALYTICS_MAX_CONCURRENT_REQUESTS_PER_WABA for each WABA. The
+    per-WABA budget is shared by every execution in the process.
+    """
+
+    _waba_semaphores: dict[str, threading.Semaphore] = {}
+    _waba_semaphores_lock = threading.Lock()
+
     def __init__(self, meta_client: MetaGraphAPIClient | None = None):
         self.meta_client = meta_client or MetaGraphAPIClient()
 
-    def _fetch_analytics_in_chunks(
-        self,
-        waba_id: str,
-        template_ids: list[str],
-        start_date: date,
-        end_date: date,
-        product_type: str,
-    ) -> list[dict]:
-        data_points = []
-        chunk_size = settings.WHATSAPP_TEMPLATE_IDS_PER_REQUEST
-        for i in range(0, len(template_ids), chunk_size):
-            chunk = template_ids[i : i + chunk_size]
+    @classmethod
+    def _get_waba_semaphore(cls, waba_id: str) -> threading.Semaphore:
+        with cls._waba_semaphores_lock:
+            if waba_id not in cls._waba_semaphores:
+                cls._waba_semaphores[waba_id] = threading.Semaphore(
+                    settings.META_ANALYTICS_MAX_CONCURRENT_REQUESTS_PER_WABA
+                )
+
+            return cls._waba_semaphores[waba_id]
+
+    def _fetch_analytics(self, request: AnalyticsRequest) -> list[dict]:
+        with self._get_waba_semaphore(request.waba_id):
             metrics = self.meta_client.get_messages_analytics(
-                waba_id=waba_id,
-                template_id=chunk,
-                start_date=start_date,
-                end_date=end_date,
-                product_type=product_type,
+                waba_id=request.waba_id,
+                template_id=list(request.template_ids),
+                start_date=request.start_date,
+                end_date=request.end_date,
+                product_type=request.product_type,
             )
-            data_points.extend(metrics.get("data", {}).get("data_points", []))
-        return data_points
+
+        return metrics.get("data", {}).get("data_points", [])
 
     def _template_ids_for_period(
         self,
@@ -91,43 +118,74 @@ class GetTemplatesMetricsFromMultipleWabasUseCase:
         # Same template name across languages can resolve to the same old ID.
         return list(dict.fromkeys(old_template_ids))
 
-    def _fetch_period_data_points(
+    def _period_requests(
         self,
         *,
         current_waba_id: str,
         period: WabaAnalyticsPeriod,
         template_ids: list[str],
-    ) -> list[dict]:
-        is_old_waba = period.waba_id != current_waba_id
+    ) -> list[AnalyticsRequest]:
+        chunk_size = settings.WHATSAPP_TEMPLATE_IDS_PER_REQUEST
+
+        return [
+            AnalyticsRequest(
+                waba_id=period.waba_id,
+                template_ids=tuple(template_ids[i : i + chunk_size]),
+                start_date=period.start_date,
+                end_date=period.end_date,
+                product_type=product_type,
+                is_old_waba=period.waba_id != current_waba_id,
+            )
+            for product_type in (
+                ProductType.CLOUD_API.value,
+                ProductType.MM_LITE.value,
+            )
+            for i in range(0, len(template_ids), chunk_size)
+        ]
+
+    def _fetch_all(self, analytics_requests: list[AnalyticsRequest]) -> list[dict]:
+        """
+        Run the requests concurrently and return all data points.
+
+        Failures on old (migrated) WABAs are reported and skipped, while a
+        failure on a current WABA cancels the pending requests and is raised.
+        """
         data_points: list[dict] = []
 
-        for product_type in (
-            ProductType.CLOUD_API.value,
-            ProductType.MM_LITE.value,
-        ):
-            try:
-                data_points.extend(
-                    self._fetch_analytics_in_chunks(
-                        waba_id=period.waba_id,
-                        template_ids=template_ids,
-                        start_date=period.start_date,
-                        end_date=period.end_date,
-                        product_type=product_type,
+        if not analytics_requests:
+            return data_points
+
+        max_workers = min(
+            settings.META_ANALYTICS_FAN_OUT_MAX_WORKERS, len(analytics_requests)
+        )
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        try:
+            futures = {
+                executor.submit(self._fetch_analytics, request): request
+                for request in analytics_requests
+            }
+
+            for future in as_completed(futures):
+                request = futures[future]
+
+                try:
+                    data_points.extend(future.result())
+                except Exception as error:
+                    if not request.is_old_waba:
+                        raise
+
+                    capture_exception(error)
+                    logger.warning(
+                        "Failed to fetch analytics for old_waba_id=%s "
+                        "product_type=%s; skipping this period/product. Error: %s",
+                        request.waba_id,
+                        request.product_type,
+                        error,
+                        exc_info=True,
                     )
-                )
-            except Exception as error:
-                if not is_old_waba:
-                    raise
-
-                capture_exception(error)
-                logger.warning(
-                    "Failed to fetch analytics for old_waba_id=%s "
-                    "product_type=%s; skipping this period/product. Error: %s",
-                    period.waba_id,
-                    product_type,
-                    error,
-                    exc_info=True,
-                )
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
 
         return data_points
 
@@ -137,7 +195,7 @@ class GetTemplatesMetricsFromMultipleWabasUseCase:
         start_date: date,
         end_date: date,
     ) -> dict:
-        data_points: list[dict] = []
+        analytics_requests: list[AnalyticsRequest] = []
 
         for group in waba_templates:
             periods = resolve_waba_analytics_periods(
@@ -155,14 +213,16 @@ class GetTemplatesMetricsFromMultipleWabasUseCase:
                 if not template_ids:
                     continue
 
-                data_points.extend(
-                    self._fetch_period_data_points(
+                analytics_requests.extend(
+                    self._period_requests(
                         current_waba_id=group.waba_id,
                         period=period,
                         template_ids=template_ids,
                     )
                 )
 
+        data_points = self._fetch_all(analytics_requests)
+
         result = dict(EMPTY_TEMPLATE_METRICS)
 
         for day_data in data_points:
@@ -1,7 +1,9 @@
+import threading
+import time
 from datetime import date
 from unittest.mock import patch
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
 from insights.dashboards.models import Dashboard
 from insights.metrics.meta.enums import ProductType
@@ -303,14 +305,12 @@ class TestGetTemplatesMetricsFromMultipleWabasUseCase(TestCase):
         # 25 IDs / 10 per chunk = 3 chunks, x2 product types = 6 calls
         self.assertEqual(mock_analytics.call_count, 6)
 
-        cloud_api_calls = [
-            call
+        cloud_api_chunk_sizes = sorted(
+            len(call.kwargs["template_id"])
             for call in mock_analytics.call_args_list
             if call.kwargs["product_type"] == ProductType.CLOUD_API.value
-        ]
-        self.assertEqual(len(cloud_api_calls[0].kwargs["template_id"]), 10)
-        self.assertEqual(len(cloud_api_calls[1].kwargs["template_id"]), 10)
-        self.assertEqual(len(cloud_api_calls[2].kwargs["template_id"]), 5)
+        )
+        self.assertEqual(cloud_api_chunk_sizes, [5, 10, 10])
 
     @patch("insights.metrics.meta.clients.MetaGraphAPIClient.get_messages_analytics")
     def test_returns_zeroed_dict_when_no_data_points(self, mock_analytics):
@@ -327,6 +327,76 @@ class TestGetTemplatesMetricsFromMultipleWabasUseCase(TestCase):
 
         self.assertEqual(result, {"sent": 0, "delivered": 0, "read": 0, "clicked": 0})
 
+    @override_settings(
+        META_ANALYTICS_FAN_OUT_MAX_WORKERS=8,
+        META_ANALYTICS_MAX_CONCURRENT_REQUESTS_PER_WABA=1,
+    )
+    @patch("insights.metrics.meta.clients.MetaGraphAPIClient.get_messages_analytics")
+    def test_respects_concurrent_requests_limit_per_waba(self, mock_analytics):
+        lock = threading.Lock()
+        in_flight: dict[str, int] = {}
+        max_in_flight: dict[str, int] = {}
+
+        def analytics_side_effect(**kwargs):
+            waba_id = kwargs["waba_id"]
+            with lock:
+                in_flight[waba_id] = in_flight.get(waba_id, 0) + 1
+                max_in_flight[waba_id] = max(
+                    max_in_flight.get(waba_id, 0), in_flight[waba_id]
+                )
+            time.sleep(0.01)
+            with lock:
+                in_flight[waba_id] -= 1
+            return {
+                "data": {
+                    "data_points": [
+                        {"sent": 1, "delivered": 1, "read": 1, "clicked": 1}
+                    ]
+                }
+            }
+
+        mock_analytics.side_effect = analytics_side_effect
+
+        usecase = GetTemplatesMetricsFromMultipleWabasUseCase()
+        result = usecase.execute(
+            waba_templates=[
+                WabaTemplateIDs(
+                    waba_id="limited_waba_a",
+                    template_ids=[str(i) for i in range(30)],
+                ),
+                WabaTemplateIDs(
+                    waba_id="limited_waba_b",
+                    template_ids=[str(i) for i in range(30)],
+                ),
+            ],
+            start_date="2024-01-01",
+            end_date="2024-01-31",
+        )
+
+        # 2 WABAs x 3 chunks x 2 product types
+        self.assertEqual(mock_analytics.call_count, 12)
+        self.assertEqual(result["sent"], 12)
+        self.assertEqual(
+            max_in_flight, {"limited_waba_a": 1, "limited_waba_b": 1}
+        )
+
+    @patch("insights.metrics.meta.clients.MetaGraphAPIClient.get_messages_analytics")
+    def test_raises_when_current_waba_analytics_fails(self, mock_analytics):
+        mock_analytics.side_effect = Exception("current waba analytics failed")
+
+        usecase = GetTemplatesMetricsFromMultipleWabasUseCase()
+
+        with self.assertRaises(Exception) as context:
+            usecase.execute(
+                waba_templates=[
+                    WabaTemplateIDs(waba_id="waba_123", template_ids=["t1"]),
+                ],
+                start_date="2024-01-01",
+                end_date="2024-01-31",
+            )
+
+        self.assertEqual(str(context.exception), "current waba analytics failed")
+
     def test_returns_zeroed_dict_when_no_waba_templates(self):
         usecase = GetTemplatesMetricsFromMultipleWabasUseCase()
         result = usecase.execute(
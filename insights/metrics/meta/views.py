@@ -235,7 +235,7 @@ class WhatsAppMessageTemplatesView(WeniAuthViewMixin, GenericViewSet):
 
         favorites_queryset = FavoriteTemplate.objects.filter(
             dashboard=serializer.validated_data["dashboard"]
-        )
+        ).select_related("dashboard__project")
 
         page = self.paginate_queryset(favorites_queryset)
 
@@ -37,6 +37,7 @@ class GetTemplatesAndOrdersMetrics:
         get_project_wabas: GetProjectWabasUseCase | None = None,
         get_templates_from_prefix: GetTemplatesFromPrefixUseCase | None = None,
         get_templates_metrics: GetTemplatesMetricsFromMultipleWabasUseCase | None = None,
+        use_orders_daily_aggregates: bool = False,
     ):
         self.get_project_wabas = get_project_wabas or GetProjectWabasUseCase()
         self.get_templates_from_prefix = (
@@ -45,6 +46,7 @@ class GetTemplatesAndOrdersMetrics:
         self.get_templates_metrics = (
             get_templates_metrics or GetTemplatesMetricsFromMultipleWabasUseCase()
         )
+        self.use_orders_daily_aggregates = use_orders_daily_aggregates
 
     def _get_template_metrics(
         self,
@@ -94,7 +96,9 @@ class GetTemplatesAndOrdersMetrics:
         start_date: date,
         end_date: date,
     ) -> dict:
-        service = OrdersService(project)
+        service = OrdersService(
+            project, use_daily_aggregates=self.use_orders_daily_aggregates
+        )
         start_dt, end_dt = to_utc_range(start_date, end_date, project)
 
         filters = {
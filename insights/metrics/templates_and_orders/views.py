@@ -54,7 +54,7 @@ class InternalTemplatesAndOrdersMetricsView(WeniAuthViewMixin, APIView):
 
         project = get_object_or_404(Project, uuid=self.auth.project_uuid)
 
-        get_metrics = GetTemplatesAndOrdersMetrics()
+        get_metrics = GetTemplatesAndOrdersMetrics(use_orders_daily_aggregates=True)
         format_response = FormatTemplatesAndOrdersResponse()
 
         try:
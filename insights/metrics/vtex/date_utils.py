@@ -15,10 +15,40 @@ def to_utc_range(
     Start is local midnight; end is local 23:59:59. Both are returned in UTC so
     VTEX authorizedDate filters include the full local days selected by the user.
     """
-    project_tz = ZoneInfo(project.timezone) if project.timezone else ZoneInfo("UTC")
+    project_tz = get_project_timezone(project)
     start_local = datetime.combine(start_date, time.min, tzinfo=project_tz)
     end_local = datetime.combine(end_date, END_OF_DAY_TIME, tzinfo=project_tz)
     return (
         start_local.astimezone(timezone.utc),
         end_local.astimezone(timezone.utc),
     )
+
+
+def get_project_timezone(project: Project) -> ZoneInfo:
+    return ZoneInfo(project.timezone) if project.timezone else ZoneInfo("UTC")
+
+
+def to_local_day_range(
+    start: datetime, end: datetime, project: Project
+) -> tuple[date, date] | None:
+    """
+    Convert a datetime range back to calendar dates in the project's timezone.
+
+    Only ranges made of whole local days are converted: start must be local
+    midnight and end either local 23:59:59 (as built by to_utc_range) or local
+    midnight, in which case the end day is included. Returns None otherwise.
+    """
+    project_tz = get_project_timezone(project)
+    start_local = start.astimezone(project_tz)
+    end_local = end.astimezone(project_tz)
+
+    if start_local.time() != time.min:
+        return None
+
+    if end_local.time().replace(microsecond=0) not in (END_OF_DAY_TIME, time.min):
+        return None
+
+    if end_local.date() < start_local.date():
+        return None
+
+    return start_local.date(), end_local.date()
@@ -0,0 +1,88 @@
+# Generated by Django 5.0.4 on 2026-10-19 09:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("projects", "0007_set_multi_agents_for_projects_with_conversations_dashboard"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="VtexOrdersDailyAggregate",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_on",
+                    models.DateTimeField(auto_now_add=True, verbose_name="Created on"),
+                ),
+                (
+                    "modified_on",
+                    models.DateTimeField(auto_now=True, verbose_name="Modified on"),
+                ),
+                (
+                    "utm_source",
+                    models.CharField(max_length=255, verbose_name="UTM source"),
+                ),
+                ("day", models.DateField(verbose_name="Day")),
+                (
+                    "count_sell",
+                    models.PositiveIntegerField(default=0, verbose_name="Orders count"),
+                ),
+                (
+                    "total_value",
+                    models.BigIntegerField(default=0, verbose_name="Total value"),
+                ),
+                (
+                    "min_value",
+                    models.BigIntegerField(
+                        blank=True, null=True, verbose_name="Min value"
+                    ),
+                ),
+                (
+                    "max_value",
+                    models.BigIntegerField(
+                        blank=True, null=True, verbose_name="Max value"
+                    ),
+                ),
+                (
+                    "currency_code",
+                    models.CharField(
+                        blank=True,
+                        default="",
+                        max_length=8,
+                        verbose_name="Currency code",
+                    ),
+                ),
+                (
+                    "project",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="vtex_orders_daily_aggregates",
+                        to="projects.project",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("project", "utm_source", "day"),
+                        name="unique_vtex_orders_daily_aggregate",
+                    )
+                ],
+            },
+        ),
+    ]
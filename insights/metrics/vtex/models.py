@@ -0,0 +1,39 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from insights.shared.models import DateTimeModel
+
+
+class VtexOrdersDailyAggregate(DateTimeModel):
+    """
+    VTEX invoiced orders of a project for one utm_source and one closed day
+    (authorizedDate in the project's timezone).
+
+    Values are stored in cents, as returned by the VTEX orders API.
+    """
+
+    project = models.ForeignKey(
+        "projects.Project",
+        on_delete=models.CASCADE,
+        related_name="vtex_orders_daily_aggregates",
+    )
+    utm_source = models.CharField(_("UTM source"), max_length=255)
+    day = models.DateField(_("Day"))
+    count_sell = models.PositiveIntegerField(_("Orders count"), default=0)
+    total_value = models.BigIntegerField(_("Total value"), default=0)
+    min_value = models.BigIntegerField(_("Min value"), null=True, blank=True)
+    max_value = models.BigIntegerField(_("Max value"), null=True, blank=True)
+    currency_code = models.CharField(
+        _("Currency code"), max_length=8, blank=True, default=""
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["project", "utm_source", "day"],
+                name="unique_vtex_orders_daily_aggregate",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.project_id} - {self.utm_source} - {self.day}"
@@ -0,0 +1,242 @@
+import logging
+from datetime import date, datetime, time, timedelta
+from datetime import timezone as dt_timezone
+from itertools import groupby
+
+from django.conf import settings
+from django.utils import timezone
+
+from insights.metrics.vtex.date_utils import (
+    END_OF_DAY_TIME,
+    get_project_timezone,
+)
+from insights.metrics.vtex.models import VtexOrdersDailyAggregate
+from insights.projects.models import Project
+from insights.sources.orders.clients import VtexOrdersRestClient
+from insights.sources.orders.dataclass import (
+    VTEXOrdersBaseMetrics,
+    VTEXOrdersDailyMetrics,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class VtexOrdersAggregatesService:
+    """
+    Orders metrics for a utm_source answered from per-day aggregates.
+
+    Closed days (in the project's timezone) are fetched from VTEX once and
+    persisted as VtexOrdersDailyAggregate rows. The open days, the last
+    VTEX_ORDERS_DAILY_AGGREGATES_OPEN_DAYS days including today, are always
+    fetched live and never persisted: orders authorized on those days can
+    still be invoiced, and a persisted day is never fetched again.
+
+    Missing closed days are fetched in windows of
+    VTEX_ORDERS_DAILY_AGGREGATES_FETCH_DAYS days. A day that could not be
+    fully fetched (the client's pages cap was reached) is used but not
+    persisted.
+    """
+
+    def __init__(self, project: Project, client: VtexOrdersRestClient):
+        self.project = project
+        self.client = client
+        self.timezone = get_project_timezone(project)
+
+    def _get_first_open_day(self) -> date:
+        today = timezone.now().astimezone(self.timezone).date()
+
+        return today - timedelta(
+            days=max(settings.VTEX_ORDERS_DAILY_AGGREGATES_OPEN_DAYS, 1) - 1
+        )
+
+    def _fetch_days(
+        self, utm_source: str, start_date: date, end_date: date
+    ) -> VTEXOrdersDailyMetrics:
+        start = datetime.combine(start_date, time.min, tzinfo=self.timezone)
+        end = datetime.combine(end_date, END_OF_DAY_TIME, tzinfo=self.timezone)
+
+        return self.client.list_daily(
+            {
+                "utm_source": (utm_source,),
+                "ended_at__gte": str(start.astimezone(dt_timezone.utc)),
+                "ended_at__lte": str(end.astimezone(dt_timezone.utc)),
+            },
+            self.timezone,
+        )
+
+    def _fetch_missing_days(
+        self, utm_source: str, missing_days: list[date]
+    ) -> tuple[dict[date, VTEXOrdersBaseMetrics], set[date]]:
+        """
+        Fetch the missing days in windows of
+        VTEX_ORDERS_DAILY_AGGREGATES_FETCH_DAYS days and return the metrics
+        of each day along with the days that were fully fetched.
+
+        The incomplete days of a truncated window are fetched again one by
+        one; a single day that is still truncated is returned as partial.
+        """
+        window_days = max(settings.VTEX_ORDERS_DAILY_AGGREGATES_FETCH_DAYS, 1)
+        first_day = missing_days[0]
+        fetched = {}
+        complete_days = set()
+
+        for _, window in groupby(
+            missing_days, key=lambda day: (day - first_day).days // window_days
+        ):
+            window = list(window)
+            window_metrics = self._fetch_days(utm_source, window[0], window[-1])
+
+            for day in window:
+                metrics = window_metrics
+
+                if not metrics.is_complete(day) and window[0] != window[-1]:
+                    metrics = self._fetch_days(utm_source, day, day)
+
+                if day in metrics.days:
+                    fetched[day] = metrics.days[day]
+
+                if metrics.is_complete(day):
+                    complete_days.add(day)
+                else:
+                    logger.warning(
+                        "[VtexOrdersAggregatesService] Orders of %s for project %s "
+                        "exceed the pages cap, the day will not be stored",
+                        day,
+                        self.project.uuid,
+                    )
+
+        return fetched, complete_days
+
+    def _fill_closed_days(
+        self, utm_source: str, start_date: date, end_date: date
+    ) -> list[VtexOrdersDailyAggregate]:
+        aggregates = {
+            aggregate.day: aggregate
+            for aggregate in VtexOrdersDailyAggregate.objects.filter(
+                project=self.project,
+                utm_source=utm_source,
+                day__gte=start_date,
+                day__lte=end_date,
+            )
+        }
+
+        days = [
+            start_date + timedelta(days=offset)
+            for offset in range((end_date - start_date).days + 1)
+        ]
+        missing_days = [day for day in days if day not in aggregates]
+
+        if not missing_days:
+            return sorted(aggregates.values(), key=lambda aggregate: aggregate.day)
+
+        fetched, complete_days = self._fetch_missing_days(utm_source, missing_days)
+
+        new_aggregates = []
+        partial_aggregates = []
+
+        for day in missing_days:
+            metrics = fetched.get(day) or VTEXOrdersBaseMetrics()
+            day_aggregates = (
+                new_aggregates if day in complete_days else partial_aggregates
+            )
+            day_aggregates.append(
+                VtexOrdersDailyAggregate(
+                    project=self.project,
+                    utm_source=utm_source,
+                    day=day,
+                    count_sell=metrics.total_sell,
+                    total_value=metrics.total_value,
+                    min_value=metrics.min_value if metrics.total_sell else None,
+                    max_value=metrics.max_value if metrics.total_sell else None,
+                    currency_code=metrics.currency_code or "",
+                )
+            )
+
+        VtexOrdersDailyAggregate.objects.bulk_create(
+            new_aggregates,
+            update_conflicts=True,
+            unique_fields=["project", "utm_source", "day"],
+            update_fields=[
+                "count_sell",
+                "total_value",
+                "min_value",
+                "max_value",
+                "currency_code",
+                "modified_on",
+            ],
+        )
+
+        logger.info(
+            "[VtexOrdersAggregatesService] Stored %s daily aggregates for project %s",
+            len(new_aggregates),
+            self.project.uuid,
+        )
+
+        return sorted(
+            [*aggregates.values(), *new_aggregates, *partial_aggregates],
+            key=lambda aggregate: aggregate.day,
+        )
+
+    def get_metrics(self, utm_source: str, start_date: date, end_date: date) -> dict:
+        """
+        Orders metrics for the local days between start_date and end_date,
+        in the same format as VtexOrdersRestClient.list.
+        """
+        first_open_day = self._get_first_open_day()
+        days_metrics: list[VTEXOrdersBaseMetrics] = []
+
+        if start_date < first_open_day:
+            for aggregate in self._fill_closed_days(
+                utm_source,
+                start_date,
+                min(end_date, first_open_day - timedelta(days=1)),
+            ):
+                days_metrics.append(
+                    VTEXOrdersBaseMetrics(
+                        total_value=aggregate.total_value,
+                        total_sell=aggregate.count_sell,
+                        max_value=(
+                            aggregate.max_value
+                            if aggregate.max_value is not None
+                            else float("-inf")
+                        ),
+                        min_value=(
+                            aggregate.min_value
+                            if aggregate.min_value is not None
+                            else float("inf")
+                        ),
+                        currency_code=aggregate.currency_code,
+                    )
+                )
+
+        if end_date >= first_open_day:
+            open_days = self._fetch_days(
+                utm_source, max(start_date, first_open_day), end_date
+            ).days
+            days_metrics.extend(open_days[day] for day in sorted(open_days))
+
+        total_value = sum(metrics.total_value for metrics in days_metrics) / 100
+        total_sell = sum(metrics.total_sell for metrics in days_metrics)
+        max_value = max(
+            (metrics.max_value for metrics in days_metrics), default=float("-inf")
+        )
+        min_value = min(
+            (metrics.min_value for metrics in days_metrics), default=float("inf")
+        )
+        currency_code = next(
+            (
+                metrics.currency_code
+                for metrics in reversed(days_metrics)
+                if metrics.currency_code
+            ),
+            None,
+        )
+
+        return {
+            "countSell": total_sell,
+            "accumulatedTotal": total_value,
+            "ticketMax": (max_value / 100) if max_value != float("-inf") else 0,
+            "ticketMin": (min_value / 100) if min_value != float("inf") else 0,
+            "medium_ticket": (total_value / total_sell) if total_sell > 0 else 0,
+            "currencyCode": currency_code,
+        }
@@ -1,15 +1,21 @@
 import logging
+from datetime import datetime
 
-from django.utils.timezone import timedelta
-
+from insights.core.comparison import (
+    ComparisonWindow,
+    PeriodComparisonExecutor,
+    calculate_increase_percentage,
+)
 from insights.internals.base import InternalAuthentication
+from insights.metrics.vtex.date_utils import to_local_day_range
+from insights.metrics.vtex.services.orders_aggregates_service import (
+    VtexOrdersAggregatesService,
+)
 from insights.projects.models import Project
 from insights.sources.cache import CacheClient
 from insights.sources.orders.clients import VtexOrdersRestClient
-from insights.sources.vtexcredentials.clients import (
-    AuthRestClient as VtexAuthClient,
-)
 from insights.sources.vtexcredentials.exceptions import VtexCredentialsNotFound
+from insights.sources.vtexcredentials.services import VtexCredentialsService
 from insights.sources.vtexcredentials.typing import VtexCredentialsDTO
 from insights.authentication.services.jwt_service import JWTService
 
@@ -17,14 +23,16 @@ logger = logging.getLogger(__name__)
 
 
 class OrdersService:
-    def __init__(self, project: Project) -> None:
+    def __init__(self, project: Project, use_daily_aggregates: bool = False) -> None:
         self.project = project
+        self.use_daily_aggregates = use_daily_aggregates
+        self._client: VtexOrdersRestClient | None = None
 
     def _get_credentials(self) -> VtexCredentialsDTO:
         """
         Get the credentials for the project
         """
-        return VtexAuthClient(self.project.uuid).get_vtex_auth()
+        return VtexCredentialsService().get_credentials(self.project.uuid)
 
     def _get_internal_token(self):
         """
@@ -34,8 +42,14 @@ class OrdersService:
 
     def _get_client(self) -> VtexOrdersRestClient:
         """
-        Get the client for the project
+        Get the client for the project, built once per service instance
         """
+        if self._client is None:
+            self._client = self._build_client()
+
+        return self._client
+
+    def _build_client(self) -> VtexOrdersRestClient:
         if self.project.vtex_account:
             return VtexOrdersRestClient(
                 {
@@ -51,61 +65,78 @@ class OrdersService:
 
         return VtexOrdersRestClient(credentials, CacheClient())
 
-    def _get_past_dates(self, start_date, end_date):
-        period = (end_date - start_date).days
+    def _list_orders(
+        self,
+        client: VtexOrdersRestClient,
+        utm_source: str,
+        start_date,
+        end_date,
+        filters: dict,
+    ) -> dict:
+        """
+        Orders metrics for the utm_source between start_date and end_date.
 
-        past_start_date = start_date - timedelta(days=period)
-        past_end_date = end_date - timedelta(days=period)
+        With use_daily_aggregates, periods made of whole local days and no
+        other filters are answered from the persisted daily aggregates.
+        """
+        if (
+            self.use_daily_aggregates
+            and not filters
+            and isinstance(start_date, datetime)
+            and isinstance(end_date, datetime)
+            and (days := to_local_day_range(start_date, end_date, self.project))
+        ):
+            return VtexOrdersAggregatesService(self.project, client).get_metrics(
+                utm_source, *days
+            )
 
-        return past_start_date, past_end_date
+        return client.list(
+            {
+                **filters,
+                "utm_source": (utm_source,),
+                "ended_at__gte": str(start_date),
+                "ended_at__lte": str(end_date),
+            }
+        )
 
-    def _calculate_increase_percentage(self, past_value, current_value):
-        if past_value == 0:
-            return 100 if current_value > 0 else 0
+    def _get_past_dates(self, start_date, end_date):
+        past_window = ComparisonWindow(start=start_date, end=end_date).get_previous()
 
-        return round(((current_value - past_value) / past_value) * 100, 2)
+        return past_window.start, past_window.end
 
-    def get_metrics_from_utm_source(self, utm_source, filters: dict) -> int:
-        filters["utm_source"] = (utm_source,)
+    def _calculate_increase_percentage(self, past_value, current_value):
+        return calculate_increase_percentage(past_value, current_value)
 
+    def get_metrics_from_utm_source(self, utm_source, filters: dict) -> int:
         start_date = filters.pop("start_date")
         end_date = filters.pop("end_date")
 
-        filters["ended_at__gte"] = str(start_date)
-        filters["ended_at__lte"] = str(end_date)
-
         client = self._get_client()
 
         try:
-            # for the current period:
-            data = client.list(filters)
-            current_value = data.get("accumulatedTotal")
-            current_orders_placed = data.get("countSell")
-            currency_code = data.get("currencyCode")
-
-            # for the past period:
-            past_start_date, past_end_date = self._get_past_dates(start_date, end_date)
-
-            filters["utm_source"] = (utm_source,)
-            filters["ended_at__gte"] = str(past_start_date)
-            filters["ended_at__lte"] = str(past_end_date)
-
-            past_data = self._get_client().list(filters)
-            past_value = past_data.get("accumulatedTotal")
-            past_orders_placed = past_data.get("countSell")
+            # the current and the past period are fetched concurrently
+            comparison = PeriodComparisonExecutor().execute(
+                lambda window_start, window_end: self._list_orders(
+                    client, utm_source, window_start, window_end, filters
+                ),
+                start_date,
+                end_date,
+                name="orders %s %s" % (self.project.uuid, utm_source),
+            )
+            data = comparison.current.value
 
             response = {
                 "revenue": {
-                    "value": current_value,
-                    "currency_code": currency_code,
-                    "increase_percentage": self._calculate_increase_percentage(
-                        past_value, current_value
+                    "value": data.get("accumulatedTotal"),
+                    "currency_code": data.get("currencyCode"),
+                    "increase_percentage": comparison.get_increase_percentage(
+                        "accumulatedTotal"
                     ),
                 },
                 "orders_placed": {
                     "value": data.get("countSell"),
-                    "increase_percentage": self._calculate_increase_percentage(
-                        past_orders_placed, current_orders_placed
+                    "increase_percentage": comparison.get_increase_percentage(
+                        "countSell"
                     ),
                 },
             }
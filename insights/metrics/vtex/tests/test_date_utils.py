@@ -3,7 +3,11 @@ from zoneinfo import ZoneInfo
 
 from django.test import TestCase
 
-from insights.metrics.vtex.date_utils import END_OF_DAY_TIME, to_utc_range
+from insights.metrics.vtex.date_utils import (
+    END_OF_DAY_TIME,
+    to_local_day_range,
+    to_utc_range,
+)
 from insights.projects.models import Project
 
 
@@ -41,3 +45,35 @@ class TestToUtcRange(TestCase):
             end,
             datetime.combine(end_date, END_OF_DAY_TIME, tzinfo=timezone.utc),
         )
+
+
+class TestToLocalDayRange(TestCase):
+    def setUp(self):
+        self.project = Project.objects.create(
+            name="Test Project",
+            timezone="America/Sao_Paulo",
+        )
+
+    def test_converts_range_built_by_to_utc_range(self):
+        start, end = to_utc_range(date(2023, 9, 1), date(2023, 9, 4), self.project)
+
+        self.assertEqual(
+            to_local_day_range(start, end, self.project),
+            (date(2023, 9, 1), date(2023, 9, 4)),
+        )
+
+    def test_includes_end_day_when_end_is_local_midnight(self):
+        project_tz = ZoneInfo(self.project.timezone)
+        start = datetime(2023, 9, 1, tzinfo=project_tz)
+        end = datetime(2023, 9, 4, tzinfo=project_tz)
+
+        self.assertEqual(
+            to_local_day_range(start, end, self.project),
+            (date(2023, 9, 1), date(2023, 9, 4)),
+        )
+
+    def test_returns_none_when_range_is_not_made_of_whole_days(self):
+        start = datetime(2023, 9, 1, tzinfo=timezone.utc)
+        end = datetime(2023, 9, 4, 23, 59, 59, tzinfo=timezone.utc)
+
+        self.assertIsNone(to_local_day_range(start, end, self.project))
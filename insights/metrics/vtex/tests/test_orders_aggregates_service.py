@@ -0,0 +1,190 @@
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from insights.metrics.vtex.models import VtexOrdersDailyAggregate
+from insights.metrics.vtex.services.orders_aggregates_service import (
+    VtexOrdersAggregatesService,
+)
+from insights.projects.models import Project
+from insights.sources.orders.dataclass import VTEXOrdersDailyMetrics
+
+
+def build_order(order_id: str, total_value: int, authorized_date) -> dict:
+    return {
+        "orderId": order_id,
+        "totalValue": total_value,
+        "currencyCode": "BRL",
+        "authorizedDate": authorized_date.isoformat(),
+    }
+
+
+@override_settings(VTEX_ORDERS_DAILY_AGGREGATES_OPEN_DAYS=1)
+class TestVtexOrdersAggregatesService(TestCase):
+    def setUp(self):
+        self.project = Project.objects.create(name="Test Project", timezone="UTC")
+        self.client = Mock()
+        self.client.list_daily.side_effect = self.list_daily
+        self.service = VtexOrdersAggregatesService(self.project, self.client)
+        # Orders returned per list_daily call, like the client's pages cap
+        self.max_orders = None
+
+        self.today = timezone.now().date()
+        self.orders = [
+            build_order("1", 1000, timezone.now() - timedelta(days=3)),
+            build_order("2", 3000, timezone.now() - timedelta(days=2)),
+            build_order("3", 500, timezone.now()),
+        ]
+
+    def list_daily(self, query_filters: dict, tz) -> VTEXOrdersDailyMetrics:
+        metrics = VTEXOrdersDailyMetrics(timezone=tz)
+        orders = sorted(
+            (
+                order
+                for order in self.orders
+                if query_filters["ended_at__gte"]
+                <= str(datetime.fromisoformat(order["authorizedDate"]))
+                <= query_filters["ended_at__lte"]
+            ),
+            key=lambda order: order["authorizedDate"],
+            reverse=True,
+        )
+
+        if self.max_orders is not None and len(orders) > self.max_orders:
+            orders = orders[: self.max_orders]
+            metrics.truncated = True
+
+        for order in orders:
+            metrics.add_order(order)
+
+        return metrics
+
+    def test_get_metrics(self):
+        metrics = self.service.get_metrics(
+            "source", self.today - timedelta(days=3), self.today
+        )
+
+        self.assertEqual(
+            metrics,
+            {
+                "countSell": 3,
+                "accumulatedTotal": 45.0,
+                "ticketMax": 30.0,
+                "ticketMin": 5.0,
+                "medium_ticket": 15.0,
+                "currencyCode": "BRL",
+            },
+        )
+
+    def test_persists_closed_days_only(self):
+        self.service.get_metrics("source", self.today - timedelta(days=3), self.today)
+
+        aggregates = VtexOrdersDailyAggregate.objects.filter(
+            project=self.project, utm_source="source"
+        ).order_by("day")
+
+        self.assertEqual(
+            [aggregate.day for aggregate in aggregates],
+            [self.today - timedelta(days=offset) for offset in (3, 2, 1)],
+        )
+        self.assertEqual([aggregate.count_sell for aggregate in aggregates], [1, 1, 0])
+        self.assertIsNone(aggregates[2].min_value)
+
+    def test_does_not_fetch_stored_closed_days_again(self):
+        start_date = self.today - timedelta(days=3)
+        end_date = self.today - timedelta(days=1)
+
+        first = self.service.get_metrics("source", start_date, end_date)
+        second = self.service.get_metrics("source", start_date, end_date)
+
+        self.assertEqual(first, second)
+        self.client.list_daily.assert_called_once()
+
+    def test_always_fetches_open_days(self):
+        self.service.get_metrics("source", self.today, self.today)
+        self.service.get_metrics("source", self.today, self.today)
+
+        self.assertEqual(self.client.list_daily.call_count, 2)
+        self.assertFalse(VtexOrdersDailyAggregate.objects.exists())
+
+    def test_fetches_truncated_window_days_one_by_one(self):
+        self.max_orders = 2
+        self.orders = [
+            build_order("1", 1000, timezone.now() - timedelta(days=5)),
+            build_order("2", 2000, timezone.now() - timedelta(days=4)),
+            build_order("3", 3000, timezone.now() - timedelta(days=3)),
+            build_order("4", 4000, timezone.now() - timedelta(days=2)),
+        ]
+
+        metrics = self.service.get_metrics(
+            "source", self.today - timedelta(days=5), self.today - timedelta(days=1)
+        )
+
+        self.assertEqual(metrics["countSell"], 4)
+        self.assertEqual(metrics["accumulatedTotal"], 100.0)
+        # The window, then its incomplete days (up to the oldest order seen)
+        self.assertEqual(self.client.list_daily.call_count, 4)
+        self.assertEqual(
+            list(
+                VtexOrdersDailyAggregate.objects.filter(project=self.project)
+                .order_by("day")
+                .values_list("count_sell", flat=True)
+            ),
+            [1, 1, 1, 1, 0],
+        )
+
+    def test_does_not_persist_truncated_days(self):
+        self.max_orders = 1
+        self.orders = [
+            build_order("1", 1000, timezone.now() - timedelta(days=2)),
+            build_order("2", 3000, timezone.now() - timedelta(days=2)),
+        ]
+        start_date = self.today - timedelta(days=3)
+        end_date = self.today - timedelta(days=1)
+
+        metrics = self.service.get_metrics("source", start_date, end_date)
+
+        self.assertEqual(metrics["countSell"], 1)
+        self.assertEqual(
+            list(
+                VtexOrdersDailyAggregate.objects.filter(project=self.project)
+                .order_by("day")
+                .values_list("day", flat=True)
+            ),
+            [start_date, end_date],
+        )
+
+    @override_settings(VTEX_ORDERS_DAILY_AGGREGATES_FETCH_DAYS=2)
+    def test_fetches_missing_days_in_windows(self):
+        self.service.get_metrics(
+            "source", self.today - timedelta(days=5), self.today - timedelta(days=1)
+        )
+
+        self.assertEqual(self.client.list_daily.call_count, 3)
+        self.assertEqual(
+            VtexOrdersDailyAggregate.objects.filter(project=self.project).count(), 5
+        )
+
+    @override_settings(VTEX_ORDERS_DAILY_AGGREGATES_OPEN_DAYS=3)
+    def test_counts_orders_invoiced_after_their_day(self):
+        self.orders = [build_order("1", 1000, timezone.now() - timedelta(days=3))]
+        start_date = self.today - timedelta(days=3)
+        end_date = self.today - timedelta(days=1)
+
+        before = self.service.get_metrics("source", start_date, end_date)
+        # Authorized two days ago, only listed by VTEX once invoiced
+        self.orders.append(build_order("2", 3000, timezone.now() - timedelta(days=2)))
+        after = self.service.get_metrics("source", start_date, end_date)
+
+        self.assertEqual(before["countSell"], 1)
+        self.assertEqual(after["countSell"], 2)
+        self.assertEqual(
+            list(
+                VtexOrdersDailyAggregate.objects.filter(
+                    project=self.project
+                ).values_list("day", flat=True)
+            ),
+            [start_date],
+        )
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from django.test import TestCase
 from django.utils import timezone
 from django.utils.timezone import timedelta
@@ -35,3 +37,18 @@ class TestOrdersService(TestCase):
         )
 
         self.assertEqual(increase_percentage, 50.0)
+
+    @patch("insights.metrics.vtex.services.orders_service.VtexCredentialsService")
+    def test_builds_client_once(self, mock_credentials_service):
+        mock_credentials_service.return_value.get_credentials.return_value = {
+            "app_key": "fake_key",
+            "app_token": "fake_token",
+            "domain": "fake_domain",
+        }
+
+        client = self.service._get_client()
+
+        self.assertIs(self.service._get_client(), client)
+        mock_credentials_service.return_value.get_credentials.assert_called_once_with(
+            self.project.uuid
+        )
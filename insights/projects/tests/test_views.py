@@ -195,6 +195,23 @@ class TestProjectViewSetAsAuthenticatedUser(BaseProjectViewSetTestCase):
             self.assertEqual(call_args[1]["operation"], "list")
             self.assertEqual(call_args[1]["query_kwargs"]["op_field"], "test_field")
 
+    @with_project_auth
+    @patch("insights.projects.viewsets.FilterDimensionCatalog.list")
+    def test_retrieve_source_data_from_filter_dimension_catalog(self, mock_list):
+        mock_list.return_value = {"next": None, "previous": None, "results": []}
+        url = reverse(
+            "project-retrieve-source-data",
+            kwargs={"pk": self.project.uuid, "source_slug": "sectors"},
+        )
+
+        response = self.client.get(url, {"search": "support", "limit": 10})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"], [])
+        args, kwargs = mock_list.call_args
+        self.assertEqual(args[:2], (str(self.project.uuid), "sectors"))
+        self.assertEqual(kwargs, {"search": "support", "limit": "10"})
+
     @with_project_auth
     def test_retrieve_source_data_source_not_found(self):
         url = reverse(
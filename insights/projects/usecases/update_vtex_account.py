@@ -4,6 +4,7 @@ from django.db import transaction
 
 from insights.projects.dataclass import UnlinkedProject
 from insights.projects.models import Project
+from insights.sources.vtexcredentials.services import VtexCredentialsService
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +55,11 @@ class UpdateProjectVTEXAccount:
             project.vtex_account = vtex_account
             project.save(update_fields=["vtex_account"])
 
+        credentials_service = VtexCredentialsService()
+
+        for uuid in [project.uuid, *(uuid for _, uuid in removed_projects)]:
+            credentials_service.invalidate(uuid)
+
         for name, uuid in removed_projects:
             logger.info(
                 "[UpdateProjectVTEXAccount] Removed VTEX Account '%s' "
@@ -47,6 +47,7 @@ from insights.sources.agents.usecases.query_execute import (
 )
 from insights.sources.chats.clients import ChatsRESTClient
 from insights.sources.custom_status.client import CustomStatusRESTClient
+from insights.sources.dimensions import FilterDimensionCatalog, get_filter_value
 from insights.sources.meta.campaign.usecases.query_execute import (
     QueryExecutor as MetaCampaignQueryExecutor,
 )
@@ -90,6 +91,12 @@ class ProjectViewSet(mixins.RetrieveModelMixin, viewsets.GenericViewSet):
         if op_field:
             query_kwargs["op_field"] = op_field
         filters["project"] = str(self.get_object().uuid)
+
+        if not query_kwargs and FilterDimensionCatalog.supports(
+            source_slug, operation, filters
+        ):
+            return self._list_filter_dimension(SourceQuery, source_slug, filters)
+
         try:
             serialized_source = SourceQuery.execute(
                 filters=filters,
@@ -107,6 +114,36 @@ class ProjectViewSet(mixins.RetrieveModelMixin, viewsets.GenericViewSet):
             )
         return Response(serialized_source, status.HTTP_200_OK)
 
+    def _list_filter_dimension(self, SourceQuery, dimension: str, filters: dict):
+        project_uuid = filters["project"]
+
+        def load() -> list[dict]:
+            return SourceQuery.execute(
+                filters={"project": project_uuid},
+                operation="list",
+                parser=parse_dict_to_json,
+                user_email=self.request.user.email,
+                return_format="select_input",
+                query_kwargs={},
+            )["results"]
+
+        try:
+            results = FilterDimensionCatalog().list(
+                project_uuid,
+                dimension,
+                load,
+                search=get_filter_value(filters.get("search")),
+                limit=get_filter_value(filters.get("limit")),
+            )
+        except Exception as error:
+            logger.exception(f"Error listing filter dimension {dimension}: {error}")
+            return Response(
+                {"detail": "Failed to retrieve source data"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        return Response(results, status.HTTP_200_OK)
+
     @action(
         detail=True,
         methods=["get"],
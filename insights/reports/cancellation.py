@@ -0,0 +1,143 @@
+import logging
+import threading
+import time
+from uuid import UUID
+
+from django.conf import settings
+
+from insights.reports.choices import ReportStatus
+from insights.reports.models import Report
+from insights.sources.cache import CacheClient
+
+logger = logging.getLogger(__name__)
+
+
+class ReportCancelledError(ValueError):
+    """
+    Raised by generation loops when their report was cancelled.
+    """
+
+
+class ReportCancellationToken:
+    """
+    Cooperative cancellation for a report being generated.
+
+    Timeout and interrupt paths call cancel, which sets a Redis key for the
+    report. Generation loops call check between pages: the key is read at
+    most every REPORT_CANCELLATION_CHECK_INTERVAL seconds, and the report
+    status is only read from the database every
+    REPORT_STATUS_DB_CHECKPOINT_PAGES checks, or at explicit checkpoints.
+
+    Once cancelled, the token stays cancelled in this process, so thread
+    pool workers can stop on `cancelled` without any I/O.
+    """
+
+    key_prefix = "report_cancellation"
+
+    def __init__(self, report: Report, cache_client: CacheClient | None = None):
+        self.report = report
+        self.cache_client = cache_client or CacheClient()
+        self.reason: str | None = None
+        self._event = threading.Event()
+        self._last_cache_check: float | None = None
+        self._checks = 0
+
+    @classmethod
+    def get_key(cls, report_uuid: UUID | str) -> str:
+        return f"{cls.key_prefix}:{report_uuid}"
+
+    @classmethod
+    def cancel(
+        cls,
+        report_uuid: UUID | str,
+        reason: str,
+        cache_client: CacheClient | None = None,
+    ) -> None:
+        """
+        Ask the process generating the report to stop.
+        """
+        (cache_client or CacheClient()).set(
+            cls.get_key(report_uuid),
+            reason,
+            ex=settings.REPORT_GENERATION_TIMEOUT,
+        )
+
+    @classmethod
+    def reset(
+        cls, report_uuid: UUID | str, cache_client: CacheClient | None = None
+    ) -> None:
+        """
+        Forget a previous cancellation, e.g. when an interrupted report is
+        generated again.
+        """
+        (cache_client or CacheClient()).delete(cls.get_key(report_uuid))
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def _set_cancelled(self, reason: str) -> None:
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+            logger.info(
+                "[ReportCancellationToken] Report %s was cancelled: %s",
+                self.report.uuid,
+                reason,
+            )
+
+    def is_cancelled(self) -> bool:
+        """
+        Whether the report was cancelled, reading the Redis key at most
+        every REPORT_CANCELLATION_CHECK_INTERVAL seconds.
+        """
+        if self._event.is_set():
+            return True
+
+        now = time.monotonic()
+
+        if (
+            self._last_cache_check is None
+            or now - self._last_cache_check
+            >= settings.REPORT_CANCELLATION_CHECK_INTERVAL
+        ):
+            self._last_cache_check = now
+
+            if reason := self.cache_client.get(self.get_key(self.report.uuid)):
+                if isinstance(reason, bytes):
+                    reason = reason.decode()
+                self._set_cancelled(reason)
+
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        if self.is_cancelled():
+            raise ReportCancelledError(
+                "Report %s is not in progress" % self.report.uuid
+            )
+
+    def checkpoint(self) -> None:
+        """
+        Check the report status in the database, then the token.
+        """
+        self.report.refresh_from_db(fields=["status"])
+
+        if self.report.status != ReportStatus.IN_PROGRESS:
+            self._set_cancelled("status %s" % self.report.status)
+
+        self.raise_if_cancelled()
+
+    def check(self) -> None:
+        """
+        Cheap check for page loops. The first check, and then every
+        REPORT_STATUS_DB_CHECKPOINT_PAGES checks, is a database checkpoint.
+        """
+        is_db_checkpoint = (
+            self._checks % settings.REPORT_STATUS_DB_CHECKPOINT_PAGES == 0
+        )
+        self._checks += 1
+
+        if is_db_checkpoint:
+            self.checkpoint()
+        else:
+            self.raise_if_cancelled()
@@ -36,6 +36,18 @@ class Report(BaseModel, ConfigurableModel):
         verbose_name = _("Report")
         verbose_name_plural = _("Reports")
         ordering = ["-created_on"]
+        indexes = [
+            # Pending and in progress reports polled by the report generation
+            # tasks, oldest first
+            models.Index(
+                fields=["status", "created_on"], name="report_status_created_idx"
+            ),
+            models.Index(
+                fields=["created_on"],
+                condition=models.Q(config__interrupted=True),
+                name="report_interrupted_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.uuid} - {self.source} - {self.format} - {self.status}"
@@ -1,10 +1,33 @@
-from django.db.models.signals import post_save
+import logging
+
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
+from insights.reports.choices import ReportSource
 from insights.reports.models import Report
 from insights.reports.usecases.report_status_cache import ReportStatusCacheUseCase
 
+logger = logging.getLogger(__name__)
+
 
 @receiver(post_save, sender=Report)
+def update_report_status_cache(sender, instance, **kwargs):
+    if instance.source != ReportSource.CONVERSATIONS_DASHBOARD:
+        return
+
+    project_uuid = str(instance.project_id)
+
+    try:
+        ReportStatusCacheUseCase.set(project_uuid, instance)
+    except Exception as error:
+        logger.error(
+            "[update_report_status_cache] Failed to update the report status of project %s: %s",
+            project_uuid,
+            error,
+        )
+        ReportStatusCacheUseCase.invalidate(project_uuid)
+
+
+@receiver(post_delete, sender=Report)
 def invalidate_report_status_cache(sender, instance, **kwargs):
     ReportStatusCacheUseCase.invalidate(str(instance.project_id))
@@ -0,0 +1,74 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from insights.projects.models import Project
+from insights.reports.cancellation import (
+    ReportCancellationToken,
+    ReportCancelledError,
+)
+from insights.reports.choices import ReportFormat, ReportSource, ReportStatus
+from insights.reports.models import Report
+from insights.users.models import User
+
+
+@override_settings(
+    REPORT_CANCELLATION_CHECK_INTERVAL=0, REPORT_STATUS_DB_CHECKPOINT_PAGES=5
+)
+class TestReportCancellationToken(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.report = Report.objects.create(
+            project=Project.objects.create(name="Test"),
+            source=ReportSource.CONVERSATIONS_DASHBOARD,
+            source_config={},
+            filters={},
+            format=ReportFormat.CSV,
+            requested_by=User.objects.create(email="test@test.com"),
+            status=ReportStatus.IN_PROGRESS,
+        )
+        self.token = ReportCancellationToken(self.report)
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_check_raises_after_cancel(self):
+        self.token.check()
+
+        ReportCancellationToken.cancel(self.report.uuid, "timeout")
+
+        with self.assertRaises(ReportCancelledError):
+            self.token.check()
+
+        self.assertTrue(self.token.cancelled)
+        self.assertEqual(self.token.reason, "timeout")
+
+    def test_reset_forgets_cancellation(self):
+        ReportCancellationToken.cancel(self.report.uuid, "interrupted")
+        ReportCancellationToken.reset(self.report.uuid)
+
+        self.assertFalse(ReportCancellationToken(self.report).is_cancelled())
+
+    def test_reads_status_from_database_only_at_checkpoints(self):
+        with self.assertNumQueries(1):
+            for _ in range(5):
+                self.token.check()
+
+        with self.assertNumQueries(1):
+            self.token.check()
+
+    def test_checkpoint_cancels_when_report_is_not_in_progress(self):
+        Report.objects.filter(uuid=self.report.uuid).update(status=ReportStatus.FAILED)
+
+        with self.assertRaisesMessage(
+            ReportCancelledError, "Report %s is not in progress" % self.report.uuid
+        ):
+            self.token.checkpoint()
+
+    @override_settings(REPORT_CANCELLATION_CHECK_INTERVAL=60)
+    def test_reads_cancellation_key_at_most_once_per_interval(self):
+        self.assertFalse(self.token.is_cancelled())
+
+        ReportCancellationToken.cancel(self.report.uuid, "timeout")
+
+        self.assertFalse(self.token.is_cancelled())
+        self.assertTrue(ReportCancellationToken(self.report).is_cancelled())
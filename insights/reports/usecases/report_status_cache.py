@@ -1,39 +1,166 @@
+import json
 from typing import Optional, Tuple
 
 from django.conf import settings
-from django.core.cache import cache
+from django_redis import get_redis_connection
 
+from insights.reports.choices import ReportStatus
 from insights.reports.models import Report
 
 
-SENTINEL_NO_REPORT = "NO_REPORT"
+# Reports move forward through these ranks, never back
+STATUS_RANKS = {
+    ReportStatus.PENDING: 0,
+    ReportStatus.IN_PROGRESS: 1,
+    ReportStatus.READY: 2,
+    ReportStatus.FAILED: 2,
+}
+ACTIVE_STATUSES = (ReportStatus.PENDING, ReportStatus.IN_PROGRESS)
+
+# Sets the projection unless the stored one has a greater version
+SET_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if current then
+    local ok, decoded = pcall(cjson.decode, current)
+    if ok and type(decoded) == 'table' and type(decoded['version']) == 'string'
+        and decoded['version'] > ARGV[2] then
+        return 0
+    end
+end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[3])
+return 1
+"""
+
+# Replaces the progress of the projection if it is still for the report
+SET_PROGRESS_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if not current then
+    return 0
+end
+local decoded = cjson.decode(current)
+if decoded['report_uuid'] ~= ARGV[1] then
+    return 0
+end
+decoded['progress'] = cjson.decode(ARGV[2])
+redis.call('SET', KEYS[1], cjson.encode(decoded), 'EX', ARGV[3])
+return 1
+"""
 
 
 class ReportStatusCacheUseCase:
+    """
+    Per project projection of the current conversations report status, kept
+    in Redis so status polling does not query the database.
+
+    The projection is written through on every report save, and only
+    replaces the stored one when its version is not older: the version
+    orders reports by creation and, for the same report, by status, so a
+    slow writer cannot bring back a status the report already left.
+    """
+
     @staticmethod
     def get_cache_key(project_uuid: str) -> str:
         return settings.CONVERSATIONS_REPORT_STATUS_CACHE_KEY.format(
             project_uuid=project_uuid
         )
 
+    @staticmethod
+    def get_version(report: Optional[Report]) -> str:
+        if report is None:
+            return ""
+
+        return "%020d:%d" % (
+            int(report.created_on.timestamp() * 1_000_000),
+            STATUS_RANKS.get(report.status, 0),
+        )
+
     @classmethod
-    def get(cls, project_uuid: str) -> Tuple[Optional[Report], bool]:
-        """Returns (report_or_none, cache_hit)."""
-        cached = cache.get(cls.get_cache_key(project_uuid))
+    def build_projection(cls, report: Optional[Report]) -> dict:
+        if report is None:
+            return {
+                "version": cls.get_version(None),
+                "report_uuid": None,
+                "status": ReportStatus.READY,
+                "email": None,
+                "created_on": None,
+                "started_at": None,
+                "completed_at": None,
+                "progress": {},
+            }
+
+        return {
+            "version": cls.get_version(report),
+            "report_uuid": str(report.uuid),
+            "status": report.status,
+            "email": report.requested_by.email if report.requested_by else None,
+            "created_on": report.created_on.isoformat(),
+            "started_at": (
+                report.started_at.isoformat() if report.started_at else None
+            ),
+            "completed_at": (
+                report.completed_at.isoformat() if report.completed_at else None
+            ),
+            "progress": {},
+        }
+
+    @classmethod
+    def get(cls, project_uuid: str) -> Tuple[Optional[dict], bool]:
+        """
+        Returns (projection_or_none, cache_hit). The projection is None when
+        the project has no report being generated.
+        """
+        with get_redis_connection() as redis_connection:
+            cached = redis_connection.get(cls.get_cache_key(project_uuid))
+
         if cached is None:
             return None, False
-        if cached == SENTINEL_NO_REPORT:
+
+        projection = json.loads(cached)
+
+        if projection["status"] not in ACTIVE_STATUSES:
             return None, True
-        return cached, True
+
+        return projection, True
 
     @classmethod
-    def set(cls, project_uuid: str, report: Optional[Report]) -> None:
-        cache.set(
-            cls.get_cache_key(project_uuid),
-            report if report is not None else SENTINEL_NO_REPORT,
-            settings.CONVERSATIONS_REPORT_STATUS_CACHE_TTL,
-        )
+    def set(cls, project_uuid: str, report: Optional[Report]) -> bool:
+        """
+        Write the projection of the report, or of no report. Returns whether
+        it was written, i.e. the stored one was not newer.
+        """
+        projection = cls.build_projection(report)
+
+        with get_redis_connection() as redis_connection:
+            return bool(
+                redis_connection.eval(
+                    SET_SCRIPT,
+                    1,
+                    cls.get_cache_key(project_uuid),
+                    json.dumps(projection),
+                    projection["version"],
+                    settings.CONVERSATIONS_REPORT_STATUS_CACHE_TTL,
+                )
+            )
+
+    @classmethod
+    def set_progress(cls, project_uuid: str, report_uuid: str, **counters) -> bool:
+        """
+        Replace the progress counters of the report's projection, without
+        touching the database.
+        """
+        with get_redis_connection() as redis_connection:
+            return bool(
+                redis_connection.eval(
+                    SET_PROGRESS_SCRIPT,
+                    1,
+                    cls.get_cache_key(project_uuid),
+                    str(report_uuid),
+                    json.dumps(counters),
+                    settings.CONVERSATIONS_REPORT_STATUS_CACHE_TTL,
+                )
+            )
 
     @classmethod
     def invalidate(cls, project_uuid: str) -> None:
-        cache.delete(cls.get_cache_key(project_uuid))
+        with get_redis_connection() as redis_connection:
+            redis_connection.delete(cls.get_cache_key(project_uuid))
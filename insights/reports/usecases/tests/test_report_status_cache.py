@@ -1,12 +1,13 @@
-from unittest.mock import patch
+import json
 
-from django.core.cache import cache
 from django.test import TestCase, override_settings
+from django_redis import get_redis_connection
 
-from insights.reports.usecases.report_status_cache import (
-    ReportStatusCacheUseCase,
-    SENTINEL_NO_REPORT,
-)
+from insights.projects.models import Project
+from insights.reports.choices import ReportFormat, ReportSource, ReportStatus
+from insights.reports.models import Report
+from insights.reports.usecases.report_status_cache import ReportStatusCacheUseCase
+from insights.users.models import User
 
 
 class TestReportStatusCacheUseCaseGetCacheKey(TestCase):
@@ -23,67 +24,156 @@ class TestReportStatusCacheUseCaseGetCacheKey(TestCase):
         self.assertEqual(key, "custom_prefix:my-uuid")
 
 
-class TestReportStatusCacheUseCaseGet(TestCase):
+class BaseReportStatusCacheTestCase(TestCase):
     def setUp(self):
-        self.project_uuid = "test-project-uuid"
+        self.user = User.objects.create(email="test@test.com")
+        self.project = Project.objects.create(name="Test Project")
+        self.project_uuid = str(self.project.uuid)
         self.cache_key = ReportStatusCacheUseCase.get_cache_key(self.project_uuid)
+        ReportStatusCacheUseCase.invalidate(self.project_uuid)
 
     def tearDown(self):
-        cache.delete(self.cache_key)
+        ReportStatusCacheUseCase.invalidate(self.project_uuid)
 
+    def _create_report(self, status=ReportStatus.PENDING) -> Report:
+        report = Report.objects.create(
+            project=self.project,
+            source=ReportSource.CONVERSATIONS_DASHBOARD,
+            format=ReportFormat.CSV,
+            status=status,
+            requested_by=self.user,
+        )
+        ReportStatusCacheUseCase.invalidate(self.project_uuid)
+
+        return report
+
+    def _get_stored(self) -> dict | None:
+        with get_redis_connection() as redis_connection:
+            cached = redis_connection.get(self.cache_key)
+
+        return json.loads(cached) if cached else None
+
+
+class TestReportStatusCacheUseCaseGet(BaseReportStatusCacheTestCase):
     def test_get_returns_miss_when_cache_is_empty(self):
-        cache.delete(self.cache_key)
         result, cache_hit = ReportStatusCacheUseCase.get(self.project_uuid)
         self.assertIsNone(result)
         self.assertFalse(cache_hit)
 
-    def test_get_returns_none_and_hit_for_sentinel(self):
-        cache.set(self.cache_key, SENTINEL_NO_REPORT)
+    def test_get_returns_none_and_hit_without_report(self):
+        ReportStatusCacheUseCase.set(self.project_uuid, None)
+
         result, cache_hit = ReportStatusCacheUseCase.get(self.project_uuid)
+
         self.assertIsNone(result)
         self.assertTrue(cache_hit)
 
-    def test_get_returns_cached_value_and_hit(self):
-        cached_value = {"some": "data"}
-        cache.set(self.cache_key, cached_value)
+    def test_get_returns_projection_of_active_report(self):
+        report = self._create_report()
+        ReportStatusCacheUseCase.set(self.project_uuid, report)
+
         result, cache_hit = ReportStatusCacheUseCase.get(self.project_uuid)
-        self.assertEqual(result, cached_value)
+
         self.assertTrue(cache_hit)
+        self.assertEqual(result["report_uuid"], str(report.uuid))
+        self.assertEqual(result["status"], ReportStatus.PENDING)
+        self.assertEqual(result["email"], self.user.email)
 
+    def test_get_returns_none_and_hit_for_finished_report(self):
+        report = self._create_report(status=ReportStatus.READY)
+        ReportStatusCacheUseCase.set(self.project_uuid, report)
 
-class TestReportStatusCacheUseCaseSet(TestCase):
-    def setUp(self):
-        self.project_uuid = "test-project-uuid"
-        self.cache_key = ReportStatusCacheUseCase.get_cache_key(self.project_uuid)
+        result, cache_hit = ReportStatusCacheUseCase.get(self.project_uuid)
 
-    def tearDown(self):
-        cache.delete(self.cache_key)
+        self.assertIsNone(result)
+        self.assertTrue(cache_hit)
 
-    def test_set_stores_value_in_cache(self):
-        value = {"status": "PENDING"}
-        ReportStatusCacheUseCase.set(self.project_uuid, value)
-        self.assertEqual(cache.get(self.cache_key), value)
 
-    def test_set_stores_sentinel_for_none(self):
-        ReportStatusCacheUseCase.set(self.project_uuid, None)
-        self.assertEqual(cache.get(self.cache_key), SENTINEL_NO_REPORT)
+class TestReportStatusCacheUseCaseSet(BaseReportStatusCacheTestCase):
+    def test_set_stores_projection(self):
+        report = self._create_report()
+
+        self.assertTrue(ReportStatusCacheUseCase.set(self.project_uuid, report))
+        self.assertEqual(self._get_stored()["report_uuid"], str(report.uuid))
+
+    def test_set_does_not_overwrite_newer_status(self):
+        report = self._create_report()
+        report.status = ReportStatus.IN_PROGRESS
+        ReportStatusCacheUseCase.set(self.project_uuid, report)
+
+        stale_report = Report.objects.get(pk=report.pk)
+        stale_report.status = ReportStatus.PENDING
+
+        self.assertFalse(ReportStatusCacheUseCase.set(self.project_uuid, stale_report))
+        self.assertEqual(self._get_stored()["status"], ReportStatus.IN_PROGRESS)
+
+    def test_set_does_not_overwrite_report_with_no_report(self):
+        report = self._create_report()
+        ReportStatusCacheUseCase.set(self.project_uuid, report)
+
+        self.assertFalse(ReportStatusCacheUseCase.set(self.project_uuid, None))
+        self.assertEqual(self._get_stored()["report_uuid"], str(report.uuid))
+
+    def test_set_overwrites_older_report(self):
+        old_report = self._create_report(status=ReportStatus.READY)
+        ReportStatusCacheUseCase.set(self.project_uuid, old_report)
+        new_report = self._create_report()
+
+        self.assertTrue(ReportStatusCacheUseCase.set(self.project_uuid, new_report))
+        self.assertEqual(self._get_stored()["report_uuid"], str(new_report.uuid))
 
     @override_settings(CONVERSATIONS_REPORT_STATUS_CACHE_TTL=42)
     def test_set_uses_ttl_from_settings(self):
-        with patch.object(cache, "set", wraps=cache.set) as mock_set:
-            ReportStatusCacheUseCase.set(self.project_uuid, None)
-            mock_set.assert_called_once_with(self.cache_key, SENTINEL_NO_REPORT, 42)
+        ReportStatusCacheUseCase.set(self.project_uuid, None)
+
+        with get_redis_connection() as redis_connection:
+            ttl = redis_connection.ttl(self.cache_key)
 
+        self.assertTrue(0 < ttl <= 42)
 
-class TestReportStatusCacheUseCaseInvalidate(TestCase):
+
+class TestReportStatusCacheUseCaseSetProgress(BaseReportStatusCacheTestCase):
+    def test_set_progress_updates_projection_of_report(self):
+        report = self._create_report(status=ReportStatus.IN_PROGRESS)
+        ReportStatusCacheUseCase.set(self.project_uuid, report)
+
+        self.assertTrue(
+            ReportStatusCacheUseCase.set_progress(
+                self.project_uuid, str(report.uuid), sections_done=1, sections_total=3
+            )
+        )
+
+        stored = self._get_stored()
+        self.assertEqual(stored["progress"], {"sections_done": 1, "sections_total": 3})
+        self.assertEqual(stored["status"], ReportStatus.IN_PROGRESS)
+
+    def test_set_progress_ignores_other_report(self):
+        report = self._create_report(status=ReportStatus.IN_PROGRESS)
+        ReportStatusCacheUseCase.set(self.project_uuid, report)
+
+        self.assertFalse(
+            ReportStatusCacheUseCase.set_progress(
+                self.project_uuid, "other-report", sections_done=1
+            )
+        )
+        self.assertEqual(self._get_stored()["progress"], {})
+
+    def test_set_progress_without_projection(self):
+        self.assertFalse(
+            ReportStatusCacheUseCase.set_progress(
+                self.project_uuid, "some-report", sections_done=1
+            )
+        )
+        self.assertIsNone(self._get_stored())
+
+
+class TestReportStatusCacheUseCaseInvalidate(BaseReportStatusCacheTestCase):
     def test_invalidate_deletes_cache_entry(self):
-        project_uuid = "test-project-uuid"
-        cache_key = ReportStatusCacheUseCase.get_cache_key(project_uuid)
-        cache.set(cache_key, "some-value")
+        ReportStatusCacheUseCase.set(self.project_uuid, None)
 
-        ReportStatusCacheUseCase.invalidate(project_uuid)
+        ReportStatusCacheUseCase.invalidate(self.project_uuid)
 
-        self.assertIsNone(cache.get(cache_key))
+        self.assertIsNone(self._get_stored())
 
     def test_invalidate_does_not_error_on_missing_key(self):
         ReportStatusCacheUseCase.invalidate("nonexistent-uuid")
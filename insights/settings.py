@@ -68,6 +68,7 @@ INSTALLED_APPS = [
     "insights.core",
     "insights.feedback",
     "insights.commerce",
+    "insights.human_support",
     # 3rd party apps
     "django_filters",
     "corsheaders",
@@ -150,7 +151,35 @@ DATABASES = {
 TEST_RUNNER = "insights.core.test_runner.IsolatedCacheTestRunner"
 PSYCOPG_DATABASES = {
     "flows": env.str(var="FLOWS_PG_DATABASE", default="sqlite:///flows_db.sqlite3"),
+    "chats": env.str(var="CHATS_PG_DATABASE", default="sqlite:///chats_db.sqlite3"),
 }
+# Databases queried through get_cursor that use the psycopg pools below
+# instead of Django connections (which are opened on every request when
+# CONN_MAX_AGE is 0)
+PSYCOPG_POOLED_DATABASES = env.list("PSYCOPG_POOLED_DATABASES", default=["chats"])
+# Pools are per process: connections kept open, maximum connections, seconds
+# to wait for one, and seconds before a connection is replaced or closed
+# when idle
+PSYCOPG_POOL_MIN_SIZE = env.int("PSYCOPG_POOL_MIN_SIZE", default=1)
+PSYCOPG_POOL_MAX_SIZE = env.int("PSYCOPG_POOL_MAX_SIZE", default=10)
+PSYCOPG_POOL_TIMEOUT = env.float("PSYCOPG_POOL_TIMEOUT", default=30.0)
+PSYCOPG_POOL_MAX_LIFETIME = env.int("PSYCOPG_POOL_MAX_LIFETIME", default=60 * 30)
+PSYCOPG_POOL_MAX_IDLE = env.int("PSYCOPG_POOL_MAX_IDLE", default=60 * 5)
+# Seconds between pool stats log lines, and checkout waits logged as slow
+PSYCOPG_POOL_STATS_LOG_INTERVAL = env.int(
+    "PSYCOPG_POOL_STATS_LOG_INTERVAL", default=60
+)
+PSYCOPG_POOL_SLOW_CHECKOUT_WARNING = env.float(
+    "PSYCOPG_POOL_SLOW_CHECKOUT_WARNING", default=1.0
+)
+# Server side prepared statements: executions of a query before it is
+# prepared, and prepared queries kept per connection. Disable them behind
+# poolers that do not support them (e.g. PgBouncer in transaction mode)
+PSYCOPG_PREPARED_STATEMENTS_ENABLED = env.bool(
+    "PSYCOPG_PREPARED_STATEMENTS_ENABLED", default=True
+)
+PSYCOPG_PREPARE_THRESHOLD = env.int("PSYCOPG_PREPARE_THRESHOLD", default=2)
+PSYCOPG_PREPARED_MAX = env.int("PSYCOPG_PREPARED_MAX", default=100)
 
 FLOWS_ES_DATABASE = env.str(var="FLOWS_ES_DATABASE", default="https://localhost:9000")
 
@@ -371,6 +400,18 @@ GROQ_OPEN_AI_URL = env.str("GROQ_OPEN_AI_URL", default="")
 GROQ_CHATGPT_TOKEN = env.str("GROQ_CHATGPT_TOKEN", default="")
 GROQ_OPEN_AI_GPT_VERSION = env.str("GROQ_OPEN_AI_GPT_VERSION", default="")
 
+# Chat completion responses cache, by prompt and model
+CHAT_COMPLETION_CACHE_TTL = env.int("CHAT_COMPLETION_CACHE_TTL", default=60 * 60)
+# Seconds an expired response is still served while it is refreshed
+CHAT_COMPLETION_CACHE_STALE_TTL = env.int(
+    "CHAT_COMPLETION_CACHE_STALE_TTL", default=60 * 60 * 24
+)
+# Single-flight lock, longer than the completion request timeout
+CHAT_COMPLETION_CACHE_LOCK_TTL = env.int("CHAT_COMPLETION_CACHE_LOCK_TTL", default=70)
+CHAT_COMPLETION_CACHE_POLL_INTERVAL = env.float(
+    "CHAT_COMPLETION_CACHE_POLL_INTERVAL", default=0.1
+)
+
 INTEGRATIONS_URL = env("INTEGRATIONS_URL", default="")
 RETAIL_URL = env("RETAIL_URL", default="")
 BILLING_URL = env("BILLING_URL", default="")
@@ -407,6 +448,30 @@ CELERY_TASK_TIME_LIMIT = 30 * 60
 CELERY_BEAT_SCHEDULER = "celery.beat:PersistentScheduler"
 CELERY_BEAT_MAX_LOOP_INTERVAL = 10
 
+# Debounce windows, in seconds and by task name, for side-effect tasks
+# enqueued on reads through DebouncedTaskDispatcher
+TASK_DISPATCH_DEBOUNCE_WINDOWS = {
+    "insights.projects.tasks.check_nexus_multi_agents_status": env.int(
+        "CHECK_NEXUS_MULTI_AGENTS_STATUS_DEBOUNCE_WINDOW", default=5 * 60
+    ),
+    "insights.projects.tasks.handle_project_created_with_inline_agent_switch": env.int(
+        "HANDLE_INLINE_AGENT_SWITCH_DEBOUNCE_WINDOW", default=5 * 60
+    ),
+    "insights.metrics.meta.tasks.check_dashboards_marketing_messages_status_for_project": env.int(
+        "CHECK_PROJECT_MARKETING_MESSAGES_STATUS_DEBOUNCE_WINDOW", default=5 * 60
+    ),
+    "insights.metrics.meta.tasks.check_marketing_messages_status": env.int(
+        "CHECK_MARKETING_MESSAGES_STATUS_DEBOUNCE_WINDOW", default=15 * 60
+    ),
+    "insights.human_support.tasks.refresh_project_rooms_rollups": env.int(
+        "REFRESH_PROJECT_ROOMS_ROLLUPS_DEBOUNCE_WINDOW", default=10 * 60
+    ),
+}
+# Seconds after which an in-flight marker expires if its task never finished
+TASK_DISPATCH_IN_FLIGHT_TTL = env.int(
+    "TASK_DISPATCH_IN_FLIGHT_TTL", default=CELERY_TASK_TIME_LIMIT
+)
+
 PROJECTS_VTEX = json.loads(os.getenv("PROJECTS_VTEX", "[]"))
 PROJECT_TOKENS_VTEX = json.loads(os.getenv("PROJECT_TOKENS_VTEX", "{}"))
 
@@ -446,9 +511,39 @@ REPORT_GENERATION_MAX_CONCURRENT_REPORTS = env.int(
 REPORT_GENERATION_TIMEOUT = env.int(
     "REPORT_GENERATION_TIMEOUT", default=60 * 60
 )  # 1 hour
+# Cost based admission of reports: the estimated seconds of all the reports
+# being generated must fit in the budget. Smaller reports can start before a
+# bigger one that does not fit, unless it has been waiting for longer than
+# the backfill max wait (in seconds)
+REPORT_GENERATION_COST_BUDGET = env.int(
+    "REPORT_GENERATION_COST_BUDGET", default=60 * 60
+)
+REPORT_GENERATION_BACKFILL_MAX_WAIT = env.int(
+    "REPORT_GENERATION_BACKFILL_MAX_WAIT", default=30 * 60
+)
+# Queued reports considered for admission on each run
+REPORT_GENERATION_ADMISSION_LOOKAHEAD = env.int(
+    "REPORT_GENERATION_ADMISSION_LOOKAHEAD", default=20
+)
+# Seconds per cost unit (section weight times days) before any report of
+# the project or globally is generated, and for how long history is kept
+REPORT_GENERATION_DEFAULT_SECONDS_PER_UNIT = env.float(
+    "REPORT_GENERATION_DEFAULT_SECONDS_PER_UNIT", default=2.0
+)
+REPORT_GENERATION_COST_HISTORY_TTL = env.int(
+    "REPORT_GENERATION_COST_HISTORY_TTL", default=60 * 60 * 24 * 30
+)
 REPORT_PARALLEL_FETCH_MAX_WORKERS = env.int(
     "REPORT_PARALLEL_FETCH_MAX_WORKERS", default=5
 )
+# Report cancellation tokens: seconds between reads of the Redis key, and
+# checks between database status checkpoints in page loops
+REPORT_CANCELLATION_CHECK_INTERVAL = env.float(
+    "REPORT_CANCELLATION_CHECK_INTERVAL", default=1.0
+)
+REPORT_STATUS_DB_CHECKPOINT_PAGES = env.int(
+    "REPORT_STATUS_DB_CHECKPOINT_PAGES", default=10
+)
 
 SEND_EMAILS = env.bool("SEND_EMAILS", default=False)
 
@@ -501,8 +596,17 @@ CONVERSATIONS_REPORT_ELASTIC_PAGE_SIZE = env.int(
 CONVERSATIONS_REPORT_ELASTIC_PAGE_LIMIT = env.int(
     "CONVERSATIONS_REPORT_ELASTIC_PAGE_LIMIT", default=100
 )
+# Concurrent slices of the point in time export of flow run results
+CONVERSATIONS_REPORT_ELASTIC_SLICES = env.int(
+    "CONVERSATIONS_REPORT_ELASTIC_SLICES", default=4
+)
+CONVERSATIONS_REPORT_ELASTIC_PIT_KEEP_ALIVE = env.str(
+    "CONVERSATIONS_REPORT_ELASTIC_PIT_KEEP_ALIVE", default="2m"
+)
+# The report status is written through on every report save, so it can be
+# kept for long
 CONVERSATIONS_REPORT_STATUS_CACHE_TTL = env.int(
-    "CONVERSATIONS_REPORT_STATUS_CACHE_TTL", default=120
+    "CONVERSATIONS_REPORT_STATUS_CACHE_TTL", default=60 * 60 * 24
 )
 CONVERSATIONS_REPORT_STATUS_CACHE_KEY = env.str(
     "CONVERSATIONS_REPORT_STATUS_CACHE_KEY",
@@ -579,6 +683,25 @@ CTWA_BY_CAMPAIGN_METRIC_NAME = env.str(
 os.environ.setdefault(
     "CTWA_BY_CAMPAIGN_METRIC_NAME", CTWA_BY_CAMPAIGN_METRIC_NAME
 )
+# Per project index of CTWA campaigns synced from Flows: incremental syncs
+# run every SYNC_INTERVAL seconds and full syncs every FULL_SYNC_INTERVAL
+CTWA_CAMPAIGN_INDEX_TTL = env.int("CTWA_CAMPAIGN_INDEX_TTL", default=60 * 60 * 24 * 7)
+CTWA_CAMPAIGN_INDEX_SYNC_INTERVAL = env.int(
+    "CTWA_CAMPAIGN_INDEX_SYNC_INTERVAL", default=5 * 60
+)
+CTWA_CAMPAIGN_INDEX_FULL_SYNC_INTERVAL = env.int(
+    "CTWA_CAMPAIGN_INDEX_FULL_SYNC_INTERVAL", default=60 * 60 * 6
+)
+CTWA_CAMPAIGN_INDEX_SYNC_LOCK_TTL = env.int(
+    "CTWA_CAMPAIGN_INDEX_SYNC_LOCK_TTL", default=60
+)
+# Unfiltered CTWA rows of a date range; ranges that include today change
+CTWA_ROWS_CLOSED_RANGE_CACHE_TTL = env.int(
+    "CTWA_ROWS_CLOSED_RANGE_CACHE_TTL", default=60 * 60 * 24
+)
+CTWA_ROWS_OPEN_RANGE_CACHE_TTL = env.int(
+    "CTWA_ROWS_OPEN_RANGE_CACHE_TTL", default=5 * 60
+)
 
 # Feature flags
 INSIGHTS_SHOW_HUMAN_SUPPORT_DASHBOARD_V1_FEATURE_FLAG_KEY = env.str(
@@ -639,10 +762,100 @@ ABANDONED_CART_MAX_WABAS = env.int("ABANDONED_CART_MAX_WABAS", default=20)
 # VTEX Orders API Cache TTL
 VTEX_ORDERS_API_CACHE_TTL = env.int("VTEX_ORDERS_API_CACHE_TTL", default=60 * 60)
 
+# Seconds to wait for both windows of a period-over-period comparison
+PERIOD_COMPARISON_TIMEOUT = env.int("PERIOD_COMPARISON_TIMEOUT", default=120)
+
+# VTEX orders conversions results, for ranges ending before or on the days
+# whose orders are still fetched live
+VTEX_ORDERS_CONVERSIONS_CLOSED_RANGE_CACHE_TTL = env.int(
+    "VTEX_ORDERS_CONVERSIONS_CLOSED_RANGE_CACHE_TTL", default=60 * 60 * 24
+)
+VTEX_ORDERS_CONVERSIONS_OPEN_RANGE_CACHE_TTL = env.int(
+    "VTEX_ORDERS_CONVERSIONS_OPEN_RANGE_CACHE_TTL", default=5 * 60
+)
+
+# Flow contacts results: seconds the total hit count of a query is cached, and
+# the point in time keep alive used to pin cursor pages (empty to disable)
+FLOWS_CONTACTS_TOTAL_CACHE_TTL = env.int(
+    "FLOWS_CONTACTS_TOTAL_CACHE_TTL", default=5 * 60
+)
+FLOWS_CONTACTS_POINT_IN_TIME_KEEP_ALIVE = env.str(
+    "FLOWS_CONTACTS_POINT_IN_TIME_KEEP_ALIVE", default=""
+)
+
+# Per project filter dimensions (agents, sectors, queues, tags and flows):
+# seconds they are cached, and seconds between checks of their version
+FILTER_DIMENSIONS_CACHE_TTL = env.int("FILTER_DIMENSIONS_CACHE_TTL", default=60 * 60)
+FILTER_DIMENSIONS_VERSION_CHECK_INTERVAL = env.int(
+    "FILTER_DIMENSIONS_VERSION_CHECK_INTERVAL", default=60
+)
+
+# Seconds the rooms counts of closed hours (peaks in human service) are
+# cached. They do not change, but rooms can still be moved between queues
+ROOMS_HOURLY_COUNTS_CACHE_TTL = env.int(
+    "ROOMS_HOURLY_COUNTS_CACHE_TTL", default=60 * 60 * 24 * 7
+)
+# Counts filtered by sectors, queues or tags change when rooms are tagged or
+# transferred: hours that ended less than these hours ago are not cached, and
+# older ones are cached for fewer seconds
+ROOMS_HOURLY_COUNTS_FILTERED_GRACE_HOURS = env.int(
+    "ROOMS_HOURLY_COUNTS_FILTERED_GRACE_HOURS", default=48
+)
+ROOMS_HOURLY_COUNTS_FILTERED_CACHE_TTL = env.int(
+    "ROOMS_HOURLY_COUNTS_FILTERED_CACHE_TTL", default=60 * 60
+)
+
+# Rooms rollups (volume by queue and by tag in human support analysis).
+# Days, including today, that are only queried live because their rooms can
+# still change; days backfilled for a project on its first refresh; days
+# stored per project on each refresh
+ROOMS_ROLLUPS_ENABLED = env.bool("ROOMS_ROLLUPS_ENABLED", default=True)
+ROOMS_ROLLUPS_OPEN_DAYS = env.int("ROOMS_ROLLUPS_OPEN_DAYS", default=2)
+ROOMS_ROLLUPS_BACKFILL_DAYS = env.int("ROOMS_ROLLUPS_BACKFILL_DAYS", default=90)
+ROOMS_ROLLUPS_MAX_DAYS_PER_REFRESH = env.int(
+    "ROOMS_ROLLUPS_MAX_DAYS_PER_REFRESH", default=7
+)
+
+# Human support snapshot: sections evaluated at the same time, and seconds
+# each section has before it is returned as timed out
+HUMAN_SUPPORT_SNAPSHOT_MAX_WORKERS = env.int(
+    "HUMAN_SUPPORT_SNAPSHOT_MAX_WORKERS", default=6
+)
+HUMAN_SUPPORT_SNAPSHOT_SECTION_TIMEOUT = env.float(
+    "HUMAN_SUPPORT_SNAPSHOT_SECTION_TIMEOUT", default=10.0
+)
+
+# VTEX credentials resolved from the integrations service
+VTEX_CREDENTIALS_CACHE_TTL = env.int("VTEX_CREDENTIALS_CACHE_TTL", default=60 * 60)
+VTEX_CREDENTIALS_NOT_FOUND_CACHE_TTL = env.int(
+    "VTEX_CREDENTIALS_NOT_FOUND_CACHE_TTL", default=5 * 60
+)
+VTEX_CREDENTIALS_REQUEST_TIMEOUT = env.int(
+    "VTEX_CREDENTIALS_REQUEST_TIMEOUT", default=30
+)
+
+# VTEX orders daily aggregates
+# Number of days, including today, that are still fetched live from VTEX
+# instead of being persisted. Only invoiced orders are counted, on the day
+# they were authorized, so a day is stored once its orders had time to be
+# invoiced. Increase it if orders take longer to be invoiced.
+VTEX_ORDERS_DAILY_AGGREGATES_OPEN_DAYS = env.int(
+    "VTEX_ORDERS_DAILY_AGGREGATES_OPEN_DAYS", default=7
+)
+# Number of days fetched from VTEX per request when filling closed days,
+# keeping each request under VTEX_ORDERS_MAX_PAGES_CLIENT_DEFINED pages
+VTEX_ORDERS_DAILY_AGGREGATES_FETCH_DAYS = env.int(
+    "VTEX_ORDERS_DAILY_AGGREGATES_FETCH_DAYS", default=7
+)
+
 # Data source service
 DATA_SOURCE_SERVICE_FEATURE_FLAG_KEY = env.str(
     "DATA_SOURCE_SERVICE_FEATURE_FLAG_KEY", default="insightsDataSourceService"
 )
+# Batch widget data: widgets per request, and distinct source queries
+# executed at the same time
+WIDGET_DATA_BATCH_MAX_WIDGETS = env.int("WIDGET_DATA_BATCH_MAX_WIDGETS", default=50)
+WIDGET_DATA_BATCH_MAX_WORKERS = env.int("WIDGET_DATA_BATCH_MAX_WORKERS", default=8)
 
 # Contacts worksheet detailed list
 CONTACTS_WORKSHEET_DETAILED_LIST_FEATURE_FLAG_KEY = env.str(
@@ -655,6 +868,27 @@ WHATSAPP_TEMPLATE_IDS_PER_REQUEST = env.int(
     "WHATSAPP_TEMPLATE_IDS_PER_REQUEST", default=10
 )
 
+# Meta template and pricing analytics
+# Per-day data points cache: closed days are kept longer than the current day
+META_ANALYTICS_CLOSED_DAY_CACHE_TTL = env.int(
+    "META_ANALYTICS_CLOSED_DAY_CACHE_TTL", default=60 * 60 * 24 * 7
+)
+META_ANALYTICS_OPEN_DAY_CACHE_TTL = env.int(
+    "META_ANALYTICS_OPEN_DAY_CACHE_TTL", default=60 * 5
+)
+# Hours after a (UTC) day ends before its data points are cached as closed,
+# as Meta keeps filling them in after that
+META_ANALYTICS_CLOSED_DAY_LAG_HOURS = env.int(
+    "META_ANALYTICS_CLOSED_DAY_LAG_HOURS", default=24
+)
+# Concurrent requests when fetching analytics from multiple WABAs
+META_ANALYTICS_FAN_OUT_MAX_WORKERS = env.int(
+    "META_ANALYTICS_FAN_OUT_MAX_WORKERS", default=8
+)
+META_ANALYTICS_MAX_CONCURRENT_REQUESTS_PER_WABA = env.int(
+    "META_ANALYTICS_MAX_CONCURRENT_REQUESTS_PER_WABA", default=2
+)
+
 # External project authorization service
 PROJECT_AUTH_API_BASE_URL = env.str("PROJECT_AUTH_API_BASE_URL", default="")
 PROJECT_AUTH_API_TIMEOUT = env.int("PROJECT_AUTH_API_TIMEOUT", default=3)
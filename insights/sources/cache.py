@@ -10,10 +10,37 @@ class CacheClient:
         with get_redis_connection() as redis_connection:
             return redis_connection.get(key)
 
-    def set(self, key: str, value: Any, ex: Optional[int] = None) -> bool:
+    def set(
+        self, key: str, value: Any, ex: Optional[int] = None, nx: bool = False
+    ) -> bool:
         with get_redis_connection() as redis_connection:
-            return redis_connection.set(key, value, ex=ex)
+            return redis_connection.set(key, value, ex=ex, nx=nx)
 
     def delete(self, key: str) -> bool:
         with get_redis_connection() as redis_connection:
             return redis_connection.delete(key)
+
+    def get_many(self, keys: list[str]) -> list[Optional[Any]]:
+        if not keys:
+            return []
+
+        with get_redis_connection() as redis_connection:
+            return redis_connection.mget(keys)
+
+    def set_many(self, values: dict[str, Any], ex: Optional[int] = None) -> None:
+        if not values:
+            return
+
+        with get_redis_connection() as redis_connection:
+            pipeline = redis_connection.pipeline(transaction=False)
+            for key, value in values.items():
+                pipeline.set(key, value, ex=ex)
+            pipeline.execute()
+
+    def hincrby(self, name: str, key: str, amount: int = 1) -> int:
+        with get_redis_connection() as redis_connection:
+            return redis_connection.hincrby(name, key, amount)
+
+    def hgetall(self, name: str) -> dict:
+        with get_redis_connection() as redis_connection:
+            return redis_connection.hgetall(name)
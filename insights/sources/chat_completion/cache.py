@@ -0,0 +1,149 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+import uuid
+from typing import Callable
+
+from django.conf import settings
+
+from insights.sources.cache import CacheClient
+
+logger = logging.getLogger(__name__)
+
+
+class ChatCompletionCache:
+    """
+    Chat completion responses cached by a hash of the normalized prompt and
+    model parameters.
+
+    A response is fresh for CHAT_COMPLETION_CACHE_TTL seconds and then served
+    stale for up to CHAT_COMPLETION_CACHE_STALE_TTL more seconds while a
+    background thread fetches a new one.
+
+    Upstream calls for the same key are single-flight: only the holder of a
+    short Redis lock calls the completion API, while concurrent callers wait
+    for its response (or get the stale one) instead of calling it again.
+    """
+
+    key_prefix = "chat_completion"
+
+    def __init__(self, cache_client: CacheClient | None = None):
+        self.cache_client = cache_client or CacheClient()
+
+    @staticmethod
+    def normalize_prompt(prompt: str) -> str:
+        return " ".join(prompt.split())
+
+    def get_key(self, prompt: str, model_params: dict) -> str:
+        payload = json.dumps(
+            {"prompt": self.normalize_prompt(prompt), **model_params},
+            sort_keys=True,
+        )
+        digest = hashlib.sha256(payload.encode()).hexdigest()
+
+        return f"{self.key_prefix}:{digest}"
+
+    def _get_entry(self, key: str) -> dict | None:
+        if cached := self.cache_client.get(key):
+            return json.loads(cached)
+
+        return None
+
+    def _set_entry(self, key: str, response: dict) -> None:
+        self.cache_client.set(
+            key,
+            json.dumps(
+                {
+                    "response": response,
+                    "fresh_until": time.time() + settings.CHAT_COMPLETION_CACHE_TTL,
+                }
+            ),
+            ex=settings.CHAT_COMPLETION_CACHE_TTL
+            + settings.CHAT_COMPLETION_CACHE_STALE_TTL,
+        )
+
+    def _acquire_lock(self, key: str) -> str | None:
+        token = uuid.uuid4().hex
+
+        if self.cache_client.set(
+            f"{key}:lock",
+            token,
+            ex=settings.CHAT_COMPLETION_CACHE_LOCK_TTL,
+            nx=True,
+        ):
+            return token
+
+        return None
+
+    def _release_lock(self, key: str, token: str) -> None:
+        current = self.cache_client.get(f"{key}:lock")
+
+        if isinstance(current, bytes):
+            current = current.decode()
+
+        if current == token:
+            self.cache_client.delete(f"{key}:lock")
+
+    def _fetch(self, key: str, token: str, fetch: Callable[[], dict]) -> dict:
+        try:
+            response = fetch()
+
+            # Error responses are not cached
+            if response.get("choices"):
+                self._set_entry(key, response)
+
+            return response
+        finally:
+            self._release_lock(key, token)
+
+    def _revalidate(self, key: str, token: str, fetch: Callable[[], dict]) -> None:
+        try:
+            self._fetch(key, token, fetch)
+        except Exception as error:
+            logger.error(
+                "[ChatCompletionCache] Failed to revalidate %s: %s", key, error
+            )
+
+    def _wait_for_entry(self, key: str) -> dict | None:
+        deadline = time.monotonic() + settings.CHAT_COMPLETION_CACHE_LOCK_TTL
+
+        while time.monotonic() < deadline:
+            time.sleep(settings.CHAT_COMPLETION_CACHE_POLL_INTERVAL)
+
+            if entry := self._get_entry(key):
+                return entry
+
+            if self.cache_client.get(f"{key}:lock") is None:
+                # The lock holder finished without caching a response
+                return None
+
+        return None
+
+    def get_or_fetch(
+        self, prompt: str, model_params: dict, fetch: Callable[[], dict]
+    ) -> dict:
+        key = self.get_key(prompt, model_params)
+        entry = self._get_entry(key)
+
+        if entry and entry["fresh_until"] > time.time():
+            return entry["response"]
+
+        if entry:
+            # Stale: serve it and let a single caller refresh it
+            if token := self._acquire_lock(key):
+                threading.Thread(
+                    target=self._revalidate, args=(key, token, fetch), daemon=True
+                ).start()
+
+            return entry["response"]
+
+        if token := self._acquire_lock(key):
+            return self._fetch(key, token, fetch)
+
+        if entry := self._wait_for_entry(key):
+            return entry["response"]
+
+        # The lock holder failed or took too long
+        return fetch()
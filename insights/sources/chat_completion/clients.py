@@ -1,10 +1,15 @@
 import requests
 from django.conf import settings
 
+from insights.sources.chat_completion.cache import ChatCompletionCache
+
 
 class ChatCompletionClient:
     base_url = settings.GROQ_OPEN_AI_URL
 
+    def __init__(self, cache: ChatCompletionCache | None = None):
+        self.cache = cache or ChatCompletionCache()
+
     @property
     def headers(self):
         return {
@@ -12,16 +17,13 @@ class ChatCompletionClient:
             "Authorization": f"Bearer {settings.GROQ_CHATGPT_TOKEN}",
         }
 
-    def chat_completion(self, filters: dict):
-        prompt = filters.get("prompt")
-        if prompt is None:
-            return {}
+    def _request_chat_completion(self, prompt: str, model: str) -> dict:
         url = f"{self.base_url}chat/completions"
         response = requests.post(
             url=url,
             headers=self.headers,
             json={
-                "model": settings.GROQ_OPEN_AI_GPT_VERSION,
+                "model": model,
                 "messages": [
                     {
                         "role": "user",
@@ -29,5 +31,19 @@ class ChatCompletionClient:
                     }
                 ],
             },
+            timeout=60,
         )
         return response.json()
+
+    def chat_completion(self, filters: dict):
+        prompt = filters.get("prompt")
+        if prompt is None:
+            return {}
+
+        model = settings.GROQ_OPEN_AI_GPT_VERSION
+
+        return self.cache.get_or_fetch(
+            prompt,
+            {"model": model},
+            lambda: self._request_chat_completion(prompt, model),
+        )
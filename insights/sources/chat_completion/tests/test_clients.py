@@ -0,0 +1,141 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from insights.sources.chat_completion.clients import ChatCompletionClient
+
+
+class FakeCompletionServer:
+    """
+    Local chat completion API answering after a fixed latency.
+    """
+
+    def __init__(self, latency: float, status_code: int = 200):
+        self.latency = latency
+        self.status_code = status_code
+        self.requests = 0
+        self._lock = threading.Lock()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+
+                with server._lock:
+                    server.requests += 1
+
+                time.sleep(server.latency)
+
+                if server.status_code == 200:
+                    content = {
+                        "choices": [
+                            {"message": {"content": body["messages"][0]["content"]}}
+                        ]
+                    }
+                else:
+                    content = {"error": {"message": "Rate limit reached"}}
+
+                payload = json.dumps(content).encode()
+                self.send_response(server.status_code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/"
+
+    def __enter__(self):
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *args):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@override_settings(
+    CHAT_COMPLETION_CACHE_TTL=60,
+    CHAT_COMPLETION_CACHE_STALE_TTL=60,
+    CHAT_COMPLETION_CACHE_LOCK_TTL=5,
+    CHAT_COMPLETION_CACHE_POLL_INTERVAL=0.01,
+)
+class TestChatCompletionClient(TestCase):
+    latency = 0.2
+
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    def timed_completion(self, server, prompt: str) -> tuple[dict, float]:
+        started_at = time.monotonic()
+
+        with patch.object(ChatCompletionClient, "base_url", server.url):
+            response = ChatCompletionClient().chat_completion({"prompt": prompt})
+
+        return response, time.monotonic() - started_at
+
+    def test_repeated_prompts_are_served_from_cache(self):
+        with FakeCompletionServer(self.latency) as server:
+            results = [
+                self.timed_completion(server, prompt)
+                for prompt in ["How many rooms?", "  How many\nrooms? "] * 5
+            ]
+
+        self.assertEqual(server.requests, 1)
+        hit_latencies = [elapsed for _, elapsed in results[1:]]
+        self.assertLess(max(hit_latencies), self.latency)
+        self.assertEqual(
+            results[-1][0]["choices"][0]["message"]["content"], "How many rooms?"
+        )
+
+    def test_concurrent_viewers_trigger_one_upstream_call(self):
+        with FakeCompletionServer(self.latency) as server:
+            with ThreadPoolExecutor(max_workers=10) as executor:
+                results = list(
+                    executor.map(
+                        lambda _: self.timed_completion(server, "Summarize"),
+                        range(10),
+                    )
+                )
+
+        self.assertEqual(server.requests, 1)
+        latencies = sorted(elapsed for _, elapsed in results)
+        # Waiting viewers finish shortly after the single upstream call
+        self.assertLess(latencies[-1], self.latency * 3)
+        self.assertTrue(all(response.get("choices") for response, _ in results))
+
+    def test_stale_response_is_served_while_revalidating(self):
+        with FakeCompletionServer(self.latency) as server:
+            with override_settings(CHAT_COMPLETION_CACHE_TTL=0):
+                self.timed_completion(server, "Summarize")
+                response, elapsed = self.timed_completion(server, "Summarize")
+
+                self.assertTrue(response.get("choices"))
+                self.assertLess(elapsed, self.latency)
+
+                deadline = time.monotonic() + 5
+                while server.requests < 2 and time.monotonic() < deadline:
+                    time.sleep(0.01)
+
+        self.assertEqual(server.requests, 2)
+
+    def test_error_responses_are_not_cached(self):
+        with FakeCompletionServer(0, status_code=429) as server:
+            self.timed_completion(server, "Summarize")
+            response, _ = self.timed_completion(server, "Summarize")
+
+        self.assertEqual(server.requests, 2)
+        self.assertIn("error", response)
@@ -1,13 +1,116 @@
+import base64
+import binascii
+import hashlib
+import json
+import logging
 import requests
 import math
 from django.conf import settings
 
 from insights.authentication.authentication import FlowsInternalAuthentication
 from insights.dashboards.usecases.get_flows_token import UpdateContactName
+from insights.metrics.conversations.integrations.elasticsearch.clients import (
+    ElasticsearchClient,
+)
+from insights.sources.cache import CacheClient
+from insights.sources.contacts.exceptions import (
+    FlowsContactsSearchError,
+    InvalidContactsCursor,
+)
 from insights.utils import get_token_flows_authentication, format_to_iso_utc
 
+logger = logging.getLogger(__name__)
+
+
+def encode_contacts_cursor(
+    search_after: list, page_number: int, pit_id: str | None = None
+) -> str:
+    payload = {"search_after": search_after, "page": page_number}
+
+    if pit_id:
+        payload["pit"] = pit_id
+
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def decode_contacts_cursor(cursor: str) -> dict:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeError, ValueError) as error:
+        raise InvalidContactsCursor("Invalid cursor") from error
+
+    if (
+        not isinstance(payload, dict)
+        or not isinstance(payload.get("search_after"), list)
+        or not isinstance(payload.get("page"), int)
+    ):
+        raise InvalidContactsCursor("Invalid cursor")
+
+    return payload
+
 
 class FlowsContactsRestClient(FlowsInternalAuthentication):
+    """
+    Flow contacts results, paged either by page_number (from/size) or by an
+    opaque cursor.
+
+    Every page returns a next_cursor. Following it pages with search_after
+    on a stable sort, so deep pages cost the same as the first one and are
+    not limited by the index max_result_window. When
+    FLOWS_CONTACTS_POINT_IN_TIME_KEEP_ALIVE is set, cursors are pinned to a
+    point in time opened on the first page.
+
+    The total number of hits is counted once per query and cached for
+    FLOWS_CONTACTS_TOTAL_CACHE_TTL seconds.
+    """
+
+    total_key_prefix = "flows_contacts_total"
+
+    def __init__(self, cache_client: CacheClient | None = None):
+        self.cache_client = cache_client or CacheClient()
+
+    def _get_total_key(self, query: dict) -> str:
+        digest = hashlib.sha256(
+            json.dumps(query, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+        return f"{self.total_key_prefix}:{digest}"
+
+    def _get_cached_total(self, key: str) -> int | None:
+        if (cached := self.cache_client.get(key)) is not None:
+            return int(cached)
+
+        return None
+
+    def _search(self, params: dict, query: dict) -> dict:
+        return requests.get(
+            f"{settings.FLOWS_ES_DATABASE}/_search", params=params, json=query
+        ).json()
+
+    def _search_point_in_time(self, query: dict) -> dict | None:
+        response = ElasticsearchClient().search_point_in_time(query)
+
+        if "hits" not in response:
+            # The point in time expired, continue without it
+            logger.warning(
+                "[FlowsContactsRestClient] Point in time search failed: %s",
+                response.get("error"),
+            )
+            return None
+
+        return response
+
+    def _open_point_in_time(self) -> str | None:
+        try:
+            return ElasticsearchClient().open_point_in_time(
+                settings.FLOWS_CONTACTS_POINT_IN_TIME_KEEP_ALIVE
+            )
+        except Exception as error:
+            logger.warning(
+                "[FlowsContactsRestClient] Failed to open point in time: %s", error
+            )
+            return None
+
     def get_flows_contacts(
         self,
         pk=None,
@@ -20,15 +123,21 @@ class FlowsContactsRestClient(FlowsInternalAuthentication):
         user=None,
         ended_at_gte=None,
         ended_at_lte=None,
+        cursor=None,
     ):
-        page_number = int(page_number) if page_number else 1
+        cursor_payload = decode_contacts_cursor(cursor) if cursor else None
+
+        if cursor_payload:
+            page_number = cursor_payload["page"]
+        else:
+            page_number = int(page_number) if page_number else 1
+
         page_size = int(page_size) if page_size else 10
         page_from = (page_number - 1) * page_size
 
-        url = f"{settings.FLOWS_ES_DATABASE}/_search"
-
+        source = "project_uuid,contact_uuid,created_on,contact_name,contact_urn"
         params = {
-            "_source": "project_uuid,contact_uuid,created_on,contact_name,contact_urn",
+            "_source": source,
             "from": page_from,
             "size": page_size,
         }
@@ -66,17 +175,75 @@ class FlowsContactsRestClient(FlowsInternalAuthentication):
                     ]
                 }
             },
-            "sort": [{"created_on": {"order": "desc"}}],
+            "sort": [
+                {"created_on": {"order": "desc"}},
+                {"contact_uuid": {"order": "desc"}},
+            ],
         }
-        response = requests.get(url, params=params, json=query).json()
 
-        total_items = response["hits"]["total"]["value"]
+        total_key = self._get_total_key(query)
+        total_items = self._get_cached_total(total_key)
+
+        # Counted exactly once, past the default 10,000 hits, then cached
+        query["track_total_hits"] = total_items is None
+
+        pit_id = None
+        response = None
+
+        if cursor_payload:
+            query["search_after"] = cursor_payload["search_after"]
+            pit_id = cursor_payload.get("pit")
+        elif page_number == 1 and settings.FLOWS_CONTACTS_POINT_IN_TIME_KEEP_ALIVE:
+            pit_id = self._open_point_in_time()
+
+        if pit_id:
+            response = self._search_point_in_time(
+                {
+                    **query,
+                    "_source": source.split(","),
+                    "size": page_size,
+                    "pit": {
+                        "id": pit_id,
+                        "keep_alive": settings.FLOWS_CONTACTS_POINT_IN_TIME_KEEP_ALIVE,
+                    },
+                }
+            )
+            pit_id = response.get("pit_id", pit_id) if response else None
+
+        if response is None:
+            if cursor_payload:
+                params["from"] = 0
+                # Point in time pages also sort by the implicit _shard_doc
+                # tiebreaker, which a search without it does not accept
+                query["search_after"] = query["search_after"][: len(query["sort"])]
+            response = self._search(params, query)
+
+        if "hits" not in response:
+            logger.error(
+                "[FlowsContactsRestClient] Contacts search failed: %s",
+                response.get("error"),
+            )
+            raise FlowsContactsSearchError("Contacts search failed")
+
+        if total_items is None:
+            total_items = response["hits"]["total"]["value"]
+            self.cache_client.set(
+                total_key, total_items, ex=settings.FLOWS_CONTACTS_TOTAL_CACHE_TTL
+            )
+
         total_pages = math.ceil(total_items / page_size)
 
+        hits = response["hits"]["hits"]
+        next_cursor = None
+
+        if hits and len(hits) == page_size and page_number < total_pages:
+            if last_sort := hits[-1].get("sort"):
+                next_cursor = encode_contacts_cursor(last_sort, page_number + 1, pit_id)
+
         data = []
         flows_token = get_token_flows_authentication(project_uuid, user)
 
-        for hit in response["hits"]["hits"]:
+        for hit in hits:
             project_uuid_value = hit["_source"].get("project_uuid", "")
             contact_uuid_value = hit["_source"].get("contact_uuid", "")
             link = f"{settings.WENI_DASHBOARD}projects/{project_uuid_value}/studio/contact/read/{contact_uuid_value}"
@@ -97,6 +264,7 @@ class FlowsContactsRestClient(FlowsInternalAuthentication):
                 "total_pages": total_pages,
                 "page_size": page_size,
                 "total_items": total_items,
+                "next_cursor": next_cursor,
             },
             "contacts": data,
         }
@@ -0,0 +1,6 @@
+class InvalidContactsCursor(ValueError):
+    pass
+
+
+class FlowsContactsSearchError(Exception):
+    pass
@@ -1,9 +1,18 @@
 from unittest.mock import patch, MagicMock
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 from django.conf import settings
 from datetime import datetime, timezone
 
-from insights.sources.contacts.clients import FlowsContactsRestClient
+from insights.sources.contacts.clients import (
+    FlowsContactsRestClient,
+    decode_contacts_cursor,
+    encode_contacts_cursor,
+)
+from insights.sources.contacts.exceptions import (
+    FlowsContactsSearchError,
+    InvalidContactsCursor,
+)
 
 
 class TestFlowsContactsRestClient(TestCase):
@@ -17,6 +26,10 @@ class TestFlowsContactsRestClient(TestCase):
         self.user = "test_user"
         self.ended_at_gte = datetime(2023, 1, 1, tzinfo=timezone.utc)
         self.ended_at_lte = datetime(2023, 12, 31, tzinfo=timezone.utc)
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
 
     @patch("insights.sources.contacts.clients.requests.get")
     @patch("insights.sources.contacts.clients.get_token_flows_authentication")
@@ -678,3 +691,203 @@ class TestFlowsContactsRestClient(TestCase):
         self.assertEqual(
             result["pagination"]["total_pages"], 2
         )  # 20 items / 10 per page = 2 pages exactly
+
+
+def build_contact_hits(count: int, offset: int = 0) -> list[dict]:
+    return [
+        {
+            "_source": {
+                "project_uuid": "test-project-uuid",
+                "contact_uuid": f"contact-{index}",
+                "created_on": "2023-06-15T10:30:00Z",
+                "contact_name": f"Contact {index}",
+                "contact_urn": f"tel:+{index}",
+            },
+            "sort": [1686825000000 - index, f"contact-{index}"],
+        }
+        for index in range(offset, offset + count)
+    ]
+
+
+@patch("insights.sources.contacts.clients.get_token_flows_authentication")
+@patch("insights.sources.contacts.clients.UpdateContactName")
+class TestFlowsContactsRestClientCursor(TestCase):
+    def setUp(self):
+        self.client = FlowsContactsRestClient()
+        self.filters = {
+            "project_uuid": "test-project-uuid",
+            "flow_uuid": "test-flow-uuid",
+            "op_field": "test_field",
+            "label": "test_label",
+            "user": "test_user",
+            "ended_at_gte": "2023-01-01",
+            "ended_at_lte": "2023-12-31",
+        }
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_cursor_round_trip(self, mock_update_contact, mock_get_token):
+        cursor = encode_contacts_cursor([1, "contact-1"], 2, "pit-id")
+
+        self.assertEqual(
+            decode_contacts_cursor(cursor),
+            {"search_after": [1, "contact-1"], "page": 2, "pit": "pit-id"},
+        )
+
+    def test_invalid_cursor(self, mock_update_contact, mock_get_token):
+        with self.assertRaises(InvalidContactsCursor):
+            self.client.get_flows_contacts(cursor="not-a-cursor", **self.filters)
+
+    @patch("insights.sources.contacts.clients.requests.get")
+    def test_follows_cursor_with_search_after(
+        self, mock_requests_get, mock_update_contact, mock_get_token
+    ):
+        mock_update_contact.return_value.get_contact_name.return_value = None
+        first_page = MagicMock()
+        first_page.json.return_value = {
+            "hits": {"total": {"value": 25}, "hits": build_contact_hits(10)}
+        }
+        second_page = MagicMock()
+        second_page.json.return_value = {"hits": {"hits": build_contact_hits(10, 10)}}
+        mock_requests_get.side_effect = [first_page, second_page]
+
+        first = self.client.get_flows_contacts(**self.filters)
+        second = self.client.get_flows_contacts(
+            cursor=first["pagination"]["next_cursor"], **self.filters
+        )
+
+        self.assertEqual(second["pagination"]["current_page"], 2)
+        self.assertEqual(second["pagination"]["total_items"], 25)
+        self.assertEqual(second["pagination"]["total_pages"], 3)
+        self.assertEqual(second["contacts"][0]["contact"]["name"], "Contact 10")
+
+        second_call = mock_requests_get.call_args_list[1][1]
+        self.assertEqual(second_call["params"]["from"], 0)
+        self.assertEqual(
+            second_call["json"]["search_after"], [1686824999991, "contact-9"]
+        )
+        # The total was counted by the first page only
+        self.assertFalse(second_call["json"]["track_total_hits"])
+
+        self.assertEqual(
+            decode_contacts_cursor(second["pagination"]["next_cursor"]),
+            {"search_after": [1686824999981, "contact-19"], "page": 3},
+        )
+
+    @patch("insights.sources.contacts.clients.requests.get")
+    def test_counts_and_pages_past_ten_thousand_hits(
+        self, mock_requests_get, mock_update_contact, mock_get_token
+    ):
+        mock_update_contact.return_value.get_contact_name.return_value = None
+        first_page = MagicMock()
+        first_page.json.return_value = {
+            "hits": {"total": {"value": 25000}, "hits": build_contact_hits(10)}
+        }
+        deep_page = MagicMock()
+        deep_page.json.return_value = {"hits": {"hits": build_contact_hits(10, 10000)}}
+        mock_requests_get.side_effect = [first_page, deep_page]
+
+        first = self.client.get_flows_contacts(page_size=10, **self.filters)
+        cursor = encode_contacts_cursor([1686814000001, "contact-9999"], 1001)
+        deep = self.client.get_flows_contacts(
+            page_size=10, cursor=cursor, **self.filters
+        )
+
+        first_call, deep_call = [
+            call[1]["json"] for call in mock_requests_get.call_args_list
+        ]
+        self.assertTrue(first_call["track_total_hits"])
+        self.assertFalse(deep_call["track_total_hits"])
+        self.assertEqual(first["pagination"]["total_items"], 25000)
+        self.assertEqual(deep["pagination"]["total_pages"], 2500)
+        self.assertEqual(
+            decode_contacts_cursor(deep["pagination"]["next_cursor"])["page"], 1002
+        )
+
+    @patch("insights.sources.contacts.clients.requests.get")
+    def test_last_page_has_no_next_cursor(
+        self, mock_requests_get, mock_update_contact, mock_get_token
+    ):
+        mock_update_contact.return_value.get_contact_name.return_value = None
+        mock_requests_get.return_value.json.return_value = {
+            "hits": {"total": {"value": 5}, "hits": build_contact_hits(5)}
+        }
+
+        result = self.client.get_flows_contacts(**self.filters)
+
+        self.assertIsNone(result["pagination"]["next_cursor"])
+
+    @override_settings(FLOWS_CONTACTS_POINT_IN_TIME_KEEP_ALIVE="5m")
+    @patch("insights.sources.contacts.clients.ElasticsearchClient")
+    def test_pins_cursor_to_point_in_time(
+        self, mock_es_client, mock_update_contact, mock_get_token
+    ):
+        mock_update_contact.return_value.get_contact_name.return_value = None
+        es_client = mock_es_client.return_value
+        es_client.open_point_in_time.return_value = "pit-1"
+        es_client.search_point_in_time.side_effect = [
+            {
+                "pit_id": "pit-2",
+                "hits": {"total": {"value": 25}, "hits": build_contact_hits(10)},
+            },
+            {"pit_id": "pit-3", "hits": {"hits": build_contact_hits(10, 10)}},
+        ]
+
+        first = self.client.get_flows_contacts(**self.filters)
+        second = self.client.get_flows_contacts(
+            cursor=first["pagination"]["next_cursor"], **self.filters
+        )
+
+        es_client.open_point_in_time.assert_called_once_with("5m")
+        first_query, second_query = [
+            call[0][0] for call in es_client.search_point_in_time.call_args_list
+        ]
+        self.assertEqual(first_query["pit"], {"id": "pit-1", "keep_alive": "5m"})
+        self.assertEqual(second_query["pit"], {"id": "pit-2", "keep_alive": "5m"})
+        self.assertEqual(second_query["search_after"], [1686824999991, "contact-9"])
+        self.assertEqual(
+            decode_contacts_cursor(second["pagination"]["next_cursor"])["pit"],
+            "pit-3",
+        )
+
+    @override_settings(FLOWS_CONTACTS_POINT_IN_TIME_KEEP_ALIVE="5m")
+    @patch("insights.sources.contacts.clients.requests.get")
+    @patch("insights.sources.contacts.clients.ElasticsearchClient")
+    def test_expired_point_in_time_trims_cursor_search_after(
+        self, mock_es_client, mock_requests_get, mock_update_contact, mock_get_token
+    ):
+        mock_update_contact.return_value.get_contact_name.return_value = None
+        mock_es_client.return_value.search_point_in_time.return_value = {
+            "error": {"type": "search_context_missing_exception"}
+        }
+        mock_requests_get.return_value.json.return_value = {
+            "hits": {"total": {"value": 25}, "hits": build_contact_hits(10, 10)}
+        }
+        # Point in time hits also carry the _shard_doc tiebreaker
+        cursor = encode_contacts_cursor([1686824999991, "contact-9", 42], 2, "pit-1")
+
+        result = self.client.get_flows_contacts(cursor=cursor, **self.filters)
+
+        self.assertEqual(result["contacts"][0]["contact"]["name"], "Contact 10")
+        search_call = mock_requests_get.call_args[1]
+        self.assertEqual(search_call["params"]["from"], 0)
+        self.assertEqual(
+            search_call["json"]["search_after"], [1686824999991, "contact-9"]
+        )
+        self.assertNotIn(
+            "pit", decode_contacts_cursor(result["pagination"]["next_cursor"])
+        )
+
+    @patch("insights.sources.contacts.clients.requests.get")
+    def test_failed_search_raises_search_error(
+        self, mock_requests_get, mock_update_contact, mock_get_token
+    ):
+        mock_requests_get.return_value.json.return_value = {
+            "error": {"type": "illegal_argument_exception"},
+            "status": 400,
+        }
+
+        with self.assertRaises(FlowsContactsSearchError):
+            self.client.get_flows_contacts(**self.filters)
@@ -0,0 +1,205 @@
+import json
+import logging
+import time
+from dataclasses import dataclass
+from typing import Callable
+from uuid import UUID
+
+from django.conf import settings
+
+from insights.db.postgres.django.connection import get_cursor as get_django_cursor
+from insights.db.postgres.psycopg.connection import get_cursor as get_psycopg_cursor
+from insights.sources.cache import CacheClient
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class FilterDimension:
+    db_name: str
+    # Returns a single "version" column that changes whenever the dimension
+    # changes for the project given as the only parameter
+    version_query: str
+    search_fields: tuple[str, ...] = ("name",)
+
+
+FILTER_DIMENSIONS = {
+    "agents": FilterDimension(
+        db_name="chats",
+        version_query=(
+            "SELECT CONCAT(MAX(pp.modified_on), ':', COUNT(*)) AS version "
+            "FROM public.projects_projectpermission AS pp "
+            "WHERE pp.project_id = %s;"
+        ),
+        search_fields=("name", "email"),
+    ),
+    "sectors": FilterDimension(
+        db_name="chats",
+        version_query=(
+            "SELECT CONCAT(MAX(s.modified_on), ':', COUNT(*)) AS version "
+            "FROM public.sectors_sector AS s WHERE s.project_id = %s;"
+        ),
+    ),
+    "queues": FilterDimension(
+        db_name="chats",
+        version_query=(
+            "SELECT CONCAT(MAX(q.modified_on), ':', COUNT(*)) AS version "
+            "FROM public.queues_queue AS q "
+            "INNER JOIN public.sectors_sector AS s ON s.uuid=q.sector_id "
+            "WHERE s.project_id = %s;"
+        ),
+    ),
+    "tags": FilterDimension(
+        db_name="chats",
+        version_query=(
+            "SELECT CONCAT(MAX(tg.modified_on), ':', COUNT(*)) AS version "
+            "FROM public.sectors_sectortag AS tg "
+            "INNER JOIN public.sectors_sector AS s ON s.uuid=tg.sector_id "
+            "WHERE s.project_id = %s;"
+        ),
+    ),
+    "flows": FilterDimension(
+        db_name="flows",
+        version_query=(
+            "SELECT CONCAT(MAX(f.modified_on), ':', COUNT(*)) AS version "
+            "FROM public.flows_flow AS f "
+            "INNER JOIN public.orgs_org AS o ON o.id=f.org_id "
+            "WHERE o.proj_uuid = %s;"
+        ),
+    ),
+}
+
+# Filters the catalog can answer by itself, besides the project
+CATALOG_FILTERS = {"project", "search", "limit"}
+
+
+def get_filter_value(value):
+    """
+    Query params arrive as lists, JSON bodies as plain values.
+    """
+    if isinstance(value, list):
+        return value[0] if value else None
+
+    return value
+
+
+class FilterDimensionCatalog:
+    """
+    Per project catalog of the filter dimensions (agents, sectors, queues,
+    tags and flows) shown in the dashboards' filter dropdowns.
+
+    Each dimension is cached in Redis for FILTER_DIMENSIONS_CACHE_TTL
+    seconds, with the version it was loaded at. After
+    FILTER_DIMENSIONS_VERSION_CHECK_INTERVAL seconds, a cheap
+    max(modified_on) and count query checks the version, and the dimension
+    is only loaded again when it changed. Search and limit are applied to
+    the cached items.
+    """
+
+    key_prefix = "filter_dimensions"
+
+    def __init__(self, cache_client: CacheClient | None = None):
+        self.cache_client = cache_client or CacheClient()
+
+    @classmethod
+    def get_key(cls, project_uuid: UUID | str, dimension: str) -> str:
+        return f"{cls.key_prefix}:{project_uuid}:{dimension}"
+
+    @staticmethod
+    def supports(dimension: str, operation: str, filters: dict) -> bool:
+        return (
+            dimension in FILTER_DIMENSIONS
+            and operation == "list"
+            and set(filters) <= CATALOG_FILTERS
+        )
+
+    def get_version(self, project_uuid: UUID | str, dimension: str) -> str:
+        filter_dimension = FILTER_DIMENSIONS[dimension]
+        params = [str(project_uuid)]
+
+        if filter_dimension.db_name == "flows":
+            with get_psycopg_cursor(db_name="flows") as cur:
+                row = cur.execute(filter_dimension.version_query, params).fetchone()
+                return row["version"]
+
+        with get_django_cursor(db_name=filter_dimension.db_name) as cur:
+            cur.execute(filter_dimension.version_query, params)
+            return cur.fetchone()[0]
+
+    def _set_entry(
+        self, project_uuid: UUID | str, dimension: str, version: str, items: list
+    ) -> dict:
+        entry = {"version": version, "checked_at": time.time(), "items": items}
+        self.cache_client.set(
+            self.get_key(project_uuid, dimension),
+            json.dumps(entry, default=str),
+            ex=settings.FILTER_DIMENSIONS_CACHE_TTL,
+        )
+
+        return entry
+
+    def get_items(
+        self,
+        project_uuid: UUID | str,
+        dimension: str,
+        load: Callable[[], list[dict]],
+    ) -> list[dict]:
+        """
+        All the items of a dimension, loading them with load when they are
+        not cached or their version changed.
+        """
+        key = self.get_key(project_uuid, dimension)
+        entry = None
+
+        if cached := self.cache_client.get(key):
+            entry = json.loads(cached)
+
+            if (
+                time.time() - entry["checked_at"]
+                < settings.FILTER_DIMENSIONS_VERSION_CHECK_INTERVAL
+            ):
+                return entry["items"]
+
+        version = self.get_version(project_uuid, dimension)
+
+        if entry and entry["version"] == version:
+            return self._set_entry(project_uuid, dimension, version, entry["items"])[
+                "items"
+            ]
+
+        logger.info(
+            "[FilterDimensionCatalog] Loading %s of project %s at version %s",
+            dimension,
+            project_uuid,
+            version,
+        )
+        items = json.loads(json.dumps(load(), default=str))
+
+        return self._set_entry(project_uuid, dimension, version, items)["items"]
+
+    def list(
+        self,
+        project_uuid: UUID | str,
+        dimension: str,
+        load: Callable[[], list[dict]],
+        search: str | None = None,
+        limit: int | None = None,
+    ) -> dict:
+        items = self.get_items(project_uuid, dimension, load)
+
+        if search:
+            search = search.lower()
+            search_fields = FILTER_DIMENSIONS[dimension].search_fields
+            items = [
+                item
+                for item in items
+                if any(
+                    search in str(item.get(field) or "").lower()
+                    for field in search_fields
+                )
+            ]
+
+        if limit:
+            items = items[: int(limit)]
+
+        return {"next": None, "previous": None, "results": items}
@@ -20,12 +20,13 @@ class FlowsCampaignClient(InternalAuthentication):
         search: str | None = None,
         limit: int = 10,
         offset: int = 0,
+        after: str | None = None,
     ) -> dict:
         params = {
             "project_uuid": self.project_uuid,
             "limit": limit,
             "offset": offset,
-            "after": settings.CTWA_CAMPAIGNS_AFTER,
+            "after": after or settings.CTWA_CAMPAIGNS_AFTER,
         }
         if search:
             params["search"] = search
@@ -0,0 +1,214 @@
+import json
+import logging
+import time
+from datetime import datetime, timezone
+from uuid import UUID
+
+from django.conf import settings
+
+from insights.sources.cache import CacheClient
+from insights.sources.meta.campaign.clients import FlowsCampaignClient
+
+logger = logging.getLogger(__name__)
+
+FLOWS_CAMPAIGN_PAGE_SIZE = 100
+
+
+class CTWACampaignIndex:
+    """
+    Per project index of the CTWA referral campaigns stored in Flows, kept in
+    Redis so the campaign picker and the performance table are served
+    without paging through Flows.
+
+    The index is fully synced when missing or older than
+    CTWA_CAMPAIGN_INDEX_FULL_SYNC_INTERVAL seconds. In between, it is synced
+    incrementally every CTWA_CAMPAIGN_INDEX_SYNC_INTERVAL seconds, asking
+    Flows only for campaigns after the previous sync. While one process
+    refreshes an index, the others keep serving the current one.
+    """
+
+    key_prefix = "ctwa_campaign_index"
+
+    def __init__(
+        self,
+        project_uuid: str | UUID,
+        client: FlowsCampaignClient | None = None,
+        cache_client: CacheClient | None = None,
+    ):
+        self.project_uuid = str(project_uuid)
+        self.client = client or FlowsCampaignClient(self.project_uuid)
+        self.cache_client = cache_client or CacheClient()
+
+    @property
+    def key(self) -> str:
+        return f"{self.key_prefix}:{self.project_uuid}"
+
+    def _get_index(self) -> dict | None:
+        if cached := self.cache_client.get(self.key):
+            return json.loads(cached)
+
+        return None
+
+    def _set_index(self, index: dict) -> None:
+        self.cache_client.set(
+            self.key, json.dumps(index), ex=settings.CTWA_CAMPAIGN_INDEX_TTL
+        )
+
+    def _fetch_campaigns(self, after: str | None = None) -> list[dict]:
+        campaigns = []
+        offset = 0
+
+        while True:
+            kwargs = {"limit": FLOWS_CAMPAIGN_PAGE_SIZE, "offset": offset}
+
+            if after:
+                kwargs["after"] = after
+
+            results = self.client.list_campaigns(**kwargs).get("results") or []
+            campaigns.extend(results)
+
+            if len(results) < FLOWS_CAMPAIGN_PAGE_SIZE:
+                return campaigns
+
+            offset += FLOWS_CAMPAIGN_PAGE_SIZE
+
+    def _full_sync(self) -> dict:
+        synced_at = time.time()
+        index = {
+            "campaigns": self._fetch_campaigns(),
+            "synced_at": synced_at,
+            "full_synced_at": synced_at,
+        }
+        self._set_index(index)
+
+        return index
+
+    def _incremental_sync(self, index: dict) -> dict:
+        synced_at = time.time()
+        after = datetime.fromtimestamp(index["synced_at"], tz=timezone.utc)
+
+        new_campaigns = self._fetch_campaigns(after=after.isoformat())
+        new_ids = {campaign["uuid"] for campaign in new_campaigns}
+
+        index = {
+            **index,
+            "campaigns": new_campaigns
+            + [
+                campaign
+                for campaign in index["campaigns"]
+                if campaign["uuid"] not in new_ids
+            ],
+            "synced_at": synced_at,
+        }
+        self._set_index(index)
+
+        return index
+
+    def _acquire_sync_lock(self) -> bool:
+        return bool(
+            self.cache_client.set(
+                f"{self.key}:lock",
+                "1",
+                ex=settings.CTWA_CAMPAIGN_INDEX_SYNC_LOCK_TTL,
+                nx=True,
+            )
+        )
+
+    def _refresh(self, index: dict) -> dict:
+        now = time.time()
+
+        if now - index["synced_at"] < settings.CTWA_CAMPAIGN_INDEX_SYNC_INTERVAL:
+            return index
+
+        if not self._acquire_sync_lock():
+            return index
+
+        try:
+            if (
+                now - index["full_synced_at"]
+                >= settings.CTWA_CAMPAIGN_INDEX_FULL_SYNC_INTERVAL
+            ):
+                return self._full_sync()
+
+            return self._incremental_sync(index)
+        except Exception as error:
+            logger.error(
+                "[CTWACampaignIndex] Failed to sync campaigns of project %s: %s",
+                self.project_uuid,
+                error,
+            )
+            return index
+        finally:
+            self.cache_client.delete(f"{self.key}:lock")
+
+    def get_campaigns(self) -> list[dict]:
+        """
+        All indexed campaigns, syncing the index first when needed.
+        """
+        if index := self._get_index():
+            return self._refresh(index)["campaigns"]
+
+        return self._full_sync()["campaigns"]
+
+    def get_headlines(self, source_ids: list[str]) -> dict[str, str]:
+        """
+        Headlines of the given campaigns, by source_id.
+        """
+        source_ids = set(source_ids)
+
+        return {
+            campaign["uuid"]: campaign.get("headline") or ""
+            for campaign in self.get_campaigns()
+            if campaign["uuid"] in source_ids
+        }
+
+    def search(self, search: str | None = None) -> list[dict]:
+        """
+        Campaigns whose name or source_id matches the search, case
+        insensitive. Prefix matches come before substring matches.
+        """
+        campaigns = self.get_campaigns()
+
+        if not search:
+            return campaigns
+
+        search = search.lower()
+        prefix_matches = []
+        substring_matches = []
+
+        for campaign in campaigns:
+            values = (campaign.get("name", "").lower(), campaign["uuid"].lower())
+
+            if any(value.startswith(search) for value in values):
+                prefix_matches.append(campaign)
+            elif any(search in value for value in values):
+                substring_matches.append(campaign)
+
+        return prefix_matches + substring_matches
+
+    def list_campaigns(
+        self,
+        search: str | None = None,
+        limit: int = 10,
+        offset: int = 0,
+    ) -> dict:
+        """
+        Same payload as FlowsCampaignClient.list_campaigns, paginated locally.
+        """
+        limit = int(limit)
+        offset = int(offset)
+        campaigns = self.search(search)
+        count = len(campaigns)
+
+        return {
+            "count": count,
+            "next": (
+                f"?limit={limit}&offset={offset + limit}"
+                if offset + limit < count
+                else None
+            ),
+            "previous": (
+                f"?limit={limit}&offset={max(offset - limit, 0)}" if offset else None
+            ),
+            "results": campaigns[offset : offset + limit],
+        }
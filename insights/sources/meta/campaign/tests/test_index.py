@@ -0,0 +1,130 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from insights.sources.meta.campaign.index import CTWACampaignIndex
+
+
+def build_campaign(source_id: str, headline: str) -> dict:
+    return {"name": headline or source_id, "uuid": source_id, "headline": headline}
+
+
+class FakeCampaignClient:
+    def __init__(self, campaigns: list[dict]):
+        self.campaigns = campaigns
+        self.calls = []
+
+    def list_campaigns(self, search=None, limit=10, offset=0, after=None):
+        self.calls.append({"limit": limit, "offset": offset, "after": after})
+
+        return {
+            "count": len(self.campaigns),
+            "results": self.campaigns[offset : offset + limit],
+        }
+
+
+@override_settings(
+    CTWA_CAMPAIGN_INDEX_SYNC_INTERVAL=60,
+    CTWA_CAMPAIGN_INDEX_FULL_SYNC_INTERVAL=3600,
+)
+class TestCTWACampaignIndex(TestCase):
+    def setUp(self):
+        self.client = FakeCampaignClient(
+            [
+                build_campaign(str(source_id), f"Campaign {source_id}")
+                for source_id in range(150)
+            ]
+            + [
+                build_campaign("black-friday", "Black Friday sale"),
+                build_campaign("weekend", "Weekend sale"),
+                build_campaign("store", ""),
+            ]
+        )
+        self.index = CTWACampaignIndex("project-uuid", client=self.client)
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_full_sync_pages_through_flows_once(self):
+        self.index.list_campaigns()
+        self.index.list_campaigns(search="sale")
+        self.index.get_headlines(["weekend"])
+
+        self.assertEqual([call["offset"] for call in self.client.calls], [0, 100])
+        self.assertIsNone(self.client.calls[0]["after"])
+
+    def test_get_headlines(self):
+        self.assertEqual(
+            self.index.get_headlines(["weekend", "store", "unknown"]),
+            {"weekend": "Weekend sale", "store": ""},
+        )
+
+    def test_search_lists_prefix_matches_first(self):
+        data = self.index.list_campaigns(search="WEEK")
+
+        self.assertEqual(data["count"], 1)
+        self.assertEqual(data["results"][0]["uuid"], "weekend")
+
+        data = self.index.list_campaigns(search="sale")
+
+        self.assertEqual(
+            [campaign["uuid"] for campaign in data["results"]],
+            ["black-friday", "weekend"],
+        )
+
+        data = self.index.list_campaigns(search="st")
+
+        self.assertEqual(data["results"][0]["uuid"], "store")
+
+    def test_paginates_locally(self):
+        data = self.index.list_campaigns(search="campaign 1", limit=5, offset=5)
+
+        self.assertEqual(data["count"], 61)
+        self.assertEqual(
+            [campaign["uuid"] for campaign in data["results"]],
+            ["14", "15", "16", "17", "18"],
+        )
+        self.assertEqual(data["next"], "?limit=5&offset=10")
+        self.assertEqual(data["previous"], "?limit=5&offset=0")
+
+    @patch("insights.sources.meta.campaign.index.time.time")
+    def test_incremental_sync_merges_new_campaigns(self, mock_time):
+        mock_time.return_value = 1_000_000
+        self.index.get_campaigns()
+
+        self.client.campaigns = [build_campaign("weekend", "Weekend mega sale")]
+        mock_time.return_value += 120
+
+        headlines = self.index.get_headlines(["weekend", "store"])
+
+        self.assertEqual(headlines, {"weekend": "Weekend mega sale", "store": ""})
+        self.assertEqual(self.client.calls[-1]["after"], "1970-01-12T13:46:40+00:00")
+        self.assertEqual(len(self.index.get_campaigns()), 153)
+
+    @patch("insights.sources.meta.campaign.index.time.time")
+    def test_does_not_sync_while_index_is_fresh(self, mock_time):
+        mock_time.return_value = 1_000_000
+        self.index.get_campaigns()
+        calls = len(self.client.calls)
+
+        mock_time.return_value += 30
+        self.index.get_campaigns()
+
+        self.assertEqual(len(self.client.calls), calls)
+
+    @patch("insights.sources.meta.campaign.index.time.time")
+    def test_serves_index_when_sync_fails(self, mock_time):
+        mock_time.return_value = 1_000_000
+        self.index.get_campaigns()
+
+        def fail(**kwargs):
+            raise Exception("flows down")
+
+        self.client.list_campaigns = fail
+        mock_time.return_value += 120
+
+        self.assertEqual(
+            self.index.get_headlines(["weekend"]), {"weekend": "Weekend sale"}
+        )
@@ -114,14 +114,14 @@ class TestFlowsCampaignClient(TestCase):
 
 
 class TestMetaCampaignQueryExecutor(TestCase):
-    @patch("insights.sources.meta.campaign.usecases.query_execute.FlowsCampaignClient")
-    def test_execute_passes_filters_to_client(self, mock_client_class):
-        mock_client = MagicMock()
-        mock_client.list_campaigns.return_value = {
+    @patch("insights.sources.meta.campaign.usecases.query_execute.CTWACampaignIndex")
+    def test_execute_passes_filters_to_index(self, mock_index_class):
+        mock_index = MagicMock()
+        mock_index.list_campaigns.return_value = {
             "count": 1,
             "results": [{"name": "Our new product", "uuid": "12345678901"}],
         }
-        mock_client_class.return_value = mock_client
+        mock_index_class.return_value = mock_index
 
         data = QueryExecutor.execute(
             filters={
@@ -132,10 +132,10 @@ class TestMetaCampaignQueryExecutor(TestCase):
             }
         )
 
-        mock_client_class.assert_called_once_with(
+        mock_index_class.assert_called_once_with(
             project_uuid="cec2f6a2-885f-49ed-914d-329762aeb8e5"
         )
-        mock_client.list_campaigns.assert_called_once_with(
+        mock_index.list_campaigns.assert_called_once_with(
             search="product",
             limit=10,
             offset=0,
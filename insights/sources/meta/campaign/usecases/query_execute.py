@@ -1,5 +1,5 @@
 from insights.sources.base import BaseQueryExecutor
-from insights.sources.meta.campaign.clients import FlowsCampaignClient
+from insights.sources.meta.campaign.index import CTWACampaignIndex
 
 
 class QueryExecutor(BaseQueryExecutor):
@@ -14,8 +14,8 @@ class QueryExecutor(BaseQueryExecutor):
         **kwargs,
     ):
         project_uuid = filters.get("project")
-        client = FlowsCampaignClient(project_uuid=project_uuid)
-        return client.list_campaigns(
+        index = CTWACampaignIndex(project_uuid=project_uuid)
+        return index.list_campaigns(
             search=filters.get("search"),
             limit=filters.get("limit", 10),
             offset=filters.get("offset", 0),
@@ -1,6 +1,7 @@
 import json
 import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import tzinfo
 from urllib.parse import urlencode
 
 from django.conf import settings
@@ -11,7 +12,10 @@ from rest_framework import status
 
 from insights.internals.base import VtexAuthentication
 from insights.sources.cache import CacheClient
-from insights.sources.orders.dataclass import VTEXOrdersBaseMetrics
+from insights.sources.orders.dataclass import (
+    VTEXOrdersBaseMetrics,
+    VTEXOrdersDailyMetrics,
+)
 from insights.sources.orders.exceptions import VTEXOrdersAPIError
 from insights.utils import redact_headers
 
@@ -235,25 +239,7 @@ class VtexOrdersRestClient(VtexAuthentication):
                     results = response.json()
 
                     for result in results["list"]:
-                        if result["orderId"] not in metrics.processed_orders:
-                            metrics.total_value += result["totalValue"]
-                            metrics.total_sell += 1
-                            metrics.max_value = max(
-                                metrics.max_value, result["totalValue"]
-                            )
-                            metrics.min_value = min(
-                                metrics.min_value, result["totalValue"]
-                            )
-                            metrics.currency_code = result["currencyCode"]
-
-                            authorized_date = result["authorizedDate"]
-                            metrics.processed_orders.add(result["orderId"])
-
-                            if (
-                                metrics.last_authorized_date is None
-                                or authorized_date < metrics.last_authorized_date
-                            ):
-                                metrics.last_authorized_date = authorized_date
+                        metrics.add_order(result)
 
                 except Exception as exc:
                     logger.error(f"VTEX API error processing page: {exc}")
@@ -275,14 +261,56 @@ class VtexOrdersRestClient(VtexAuthentication):
 
         return metrics
 
-    def list(self, query_filters: dict):
-        cache_key = self.get_cache_key(query_filters)
+    def collect_pages(
+        self,
+        query_filters: dict,
+        pages: int,
+        metrics: VTEXOrdersBaseMetrics,
+    ) -> VTEXOrdersBaseMetrics:
+        """
+        Fold every page of the orders list into the metrics.
 
-        if cached_list := self.get_cached_list(cache_key):
-            return cached_list
+        Pages are fetched in blocks of VTEX_ORDERS_API_MAX_PAGES; after each
+        block the end of the window moves to the oldest authorizedDate seen,
+        as VTEX does not return pages past that limit.
+
+        At most VTEX_ORDERS_MAX_PAGES_CLIENT_DEFINED pages are fetched, the
+        metrics are flagged as truncated when there were more.
+        """
+        max_page = min(pages, settings.VTEX_ORDERS_MAX_PAGES_CLIENT_DEFINED)
+        metrics.truncated = pages > max_page
+
+        vtex_max_pages = settings.VTEX_ORDERS_API_MAX_PAGES
+        processed_pages = 0
 
+        for _ in range(1, ((max_page // vtex_max_pages) + 2)):
+            page_qty = min(vtex_max_pages, (max_page - processed_pages))
+
+            metrics = self.get_pages(query_filters, page_qty, metrics)
+            processed_pages += page_qty
+
+            if metrics.last_authorized_date is not None:
+                query_filters["ended_at__lte"] = self.parse_datetime(
+                    metrics.last_authorized_date
+                ).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+        return metrics
+
+    def list_daily(
+        self, query_filters: dict, timezone: tzinfo
+    ) -> VTEXOrdersDailyMetrics:
+        """
+        Page through the orders of the window like list does, but keep
+        the metrics of each day, days being taken from the orders'
+        authorizedDate in the given timezone.
+
+        Days without orders are absent from the result's days, and the
+        oldest days are only partial when the pages cap was reached (see
+        VTEXOrdersDailyMetrics.is_complete). Nothing is cached here, callers
+        keep the days they need.
+        """
         if not query_filters.get("utm_source", None):
-            return {"error": "utm_source field is mandatory"}
+            raise VTEXOrdersAPIError("utm_source field is mandatory")
 
         query_filters = self.handle_query_filters(query_filters)
 
@@ -290,40 +318,38 @@ class VtexOrdersRestClient(VtexAuthentication):
         data = response.json()
 
         if "list" not in data:
-            return response.status_code, data
+            raise VTEXOrdersAPIError(
+                f"VTEX API error listing orders: status={response.status_code}, response={data}"
+            )
 
         pages = data["paging"]["pages"] if "paging" in data else 1
 
-        currency_code = None
+        metrics = VTEXOrdersDailyMetrics(timezone=timezone)
+        metrics = self.collect_pages(query_filters, pages, metrics)
 
-        total_value = 0
-        total_sell = 0
-        max_value = float("-inf")
-        min_value = float("inf")
+        return metrics
 
-        metrics = VTEXOrdersBaseMetrics(
-            total_value=total_value,
-            total_sell=total_sell,
-            max_value=max_value,
-            min_value=min_value,
-            currency_code=currency_code,
-        )
+    def list(self, query_filters: dict):
+        cache_key = self.get_cache_key(query_filters)
 
-        max_page = min(pages, settings.VTEX_ORDERS_MAX_PAGES_CLIENT_DEFINED)
+        if cached_list := self.get_cached_list(cache_key):
+            return cached_list
 
-        vtex_max_pages = settings.VTEX_ORDERS_API_MAX_PAGES
-        processed_pages = 0
+        if not query_filters.get("utm_source", None):
+            return {"error": "utm_source field is mandatory"}
 
-        for _ in range(1, ((max_page // vtex_max_pages) + 2)):
-            page_qty = min(vtex_max_pages, (max_page - processed_pages))
+        query_filters = self.handle_query_filters(query_filters)
 
-            metrics = self.get_pages(query_filters, page_qty, metrics)
-            processed_pages += page_qty
+        response = self.get_orders_list(query_filters.copy(), 1)
+        data = response.json()
 
-            if metrics.last_authorized_date is not None:
-                query_filters["ended_at__lte"] = self.parse_datetime(
-                    metrics.last_authorized_date
-                ).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+        if "list" not in data:
+            return response.status_code, data
+
+        pages = data["paging"]["pages"] if "paging" in data else 1
+
+        metrics = VTEXOrdersBaseMetrics(currency_code=None)
+        metrics = self.collect_pages(query_filters, pages, metrics)
 
         total_value = metrics.total_value
         total_sell = metrics.total_sell
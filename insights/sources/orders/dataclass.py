@@ -1,6 +1,9 @@
 from dataclasses import dataclass, field
+from datetime import date, timezone, tzinfo
 from typing import Optional
 
+from dateutil.parser import parse as date_parser
+
 
 @dataclass
 class VTEXOrdersBaseMetrics:
@@ -15,3 +18,68 @@ class VTEXOrdersBaseMetrics:
     currency_code: str = ""
     last_authorized_date: Optional[str] = None
     processed_orders: set = field(default_factory=set)
+    # Set when the pages cap stopped the fetch before the oldest orders
+    truncated: bool = False
+
+    def add_order(self, order: dict) -> bool:
+        """
+        Fold an order from the VTEX orders list into the metrics.
+
+        Returns False when the order was already processed.
+        """
+        if order["orderId"] in self.processed_orders:
+            return False
+
+        self.total_value += order["totalValue"]
+        self.total_sell += 1
+        self.max_value = max(self.max_value, order["totalValue"])
+        self.min_value = min(self.min_value, order["totalValue"])
+        self.currency_code = order["currencyCode"]
+        self.processed_orders.add(order["orderId"])
+
+        authorized_date = order["authorizedDate"]
+
+        if (
+            self.last_authorized_date is None
+            or authorized_date < self.last_authorized_date
+        ):
+            self.last_authorized_date = authorized_date
+
+        return True
+
+
+@dataclass
+class VTEXOrdersDailyMetrics(VTEXOrdersBaseMetrics):
+    """
+    VTEX orders metrics that also keep one VTEXOrdersBaseMetrics per day,
+    the day being the order's authorizedDate in the given timezone.
+    """
+
+    timezone: tzinfo = timezone.utc
+    days: dict[date, VTEXOrdersBaseMetrics] = field(default_factory=dict)
+
+    def add_order(self, order: dict) -> bool:
+        if not super().add_order(order):
+            return False
+
+        day = date_parser(order["authorizedDate"]).astimezone(self.timezone).date()
+        self.days.setdefault(day, VTEXOrdersBaseMetrics()).add_order(order)
+
+        return True
+
+    def is_complete(self, day: date) -> bool:
+        """
+        Whether every order of the day was fetched. When the fetch was
+        truncated, only the days after the oldest order seen are complete.
+        """
+        if not self.truncated:
+            return True
+
+        if self.last_authorized_date is None:
+            return False
+
+        oldest_day = (
+            date_parser(self.last_authorized_date).astimezone(self.timezone).date()
+        )
+
+        return day > oldest_day
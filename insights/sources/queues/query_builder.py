@@ -26,3 +26,13 @@ class QueueSQLQueryBuilder:
         query = f"SELECT q.uuid,q.name FROM public.queues_queue AS q {self.join_clause} WHERE {self.where_clause} AND q.is_deleted=false;"
 
         return query, self.params
+
+    def list_with_sectors(self):
+        """
+        Queues, deleted or not, with their sectors.
+        """
+        if not self.is_valid:
+            self.build_query()
+        query = f"SELECT q.uuid AS queue_uuid, q.name AS queue_name, q.is_deleted AS queue_is_deleted, sec.uuid AS sector_uuid, sec.name AS sector_name, sec.is_deleted AS sector_is_deleted FROM public.queues_queue AS q INNER JOIN public.sectors_sector AS sec ON sec.uuid=q.sector_id {self.join_clause} WHERE {self.where_clause};"
+
+        return query, self.params
@@ -0,0 +1,226 @@
+import hashlib
+import json
+from datetime import datetime, timedelta
+
+import pytz
+from django.conf import settings
+from django.utils import timezone as dj_timezone
+
+from insights.projects.models import Project
+from insights.sources.cache import CacheClient
+from insights.sources.rooms.usecases.query_execute import (
+    QueryExecutor as RoomsQueryExecutor,
+)
+
+
+ONE_HOUR = timedelta(hours=1)
+ONE_MICROSECOND = timedelta(microseconds=1)
+# Ranges ending at hh:59:59, like the dashboards' end dates, cover the hour
+END_TOLERANCE = timedelta(seconds=1)
+# Filters whose matching rooms change after the rooms are created
+MUTABLE_FILTERS = ("sector__in", "queue__in", "tags__in")
+
+
+class RoomsHourlyCounts:
+    """
+    Rooms created by hour of the day, in the project timezone, for a range.
+
+    Counts of closed hours never change, so they are cached per (project,
+    filters, local day) in Redis for ROOMS_HOURLY_COUNTS_CACHE_TTL seconds,
+    and only the hours missing from the cache are queried, in one query.
+    The open hour, and ranges that do not start on the hour, are queried
+    live.
+
+    Rooms are tagged when they close and can be transferred between queues
+    and sectors, so counts filtered by them are only cached for hours that
+    ended ROOMS_HOURLY_COUNTS_FILTERED_GRACE_HOURS ago, for
+    ROOMS_HOURLY_COUNTS_FILTERED_CACHE_TTL seconds.
+    """
+
+    key_prefix = "rooms_hourly_counts"
+
+    def __init__(
+        self,
+        project: Project,
+        executor=RoomsQueryExecutor,
+        cache_client: CacheClient | None = None,
+    ):
+        self.project = project
+        self.executor = executor
+        self.cache_client = cache_client or CacheClient()
+        self.tzname = project.timezone or "UTC"
+        self.timezone = pytz.timezone(self.tzname)
+
+    def _get_filters_digest(self, filters: dict) -> str:
+        normalized = {
+            key: sorted(map(str, value)) if isinstance(value, list) else value
+            for key, value in filters.items()
+        }
+
+        return hashlib.sha256(
+            json.dumps(normalized, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    def _has_mutable_filters(self, filters: dict) -> bool:
+        return any(filters.get(key) for key in MUTABLE_FILTERS)
+
+    def _get_key(self, digest: str, day: str) -> str:
+        return f"{self.key_prefix}:{self.project.uuid}:{digest}:{day}"
+
+    def _get_bucket(self, bucket_start: datetime) -> tuple[str, int]:
+        local_start = bucket_start.astimezone(self.timezone)
+
+        return local_start.date().isoformat(), local_start.hour
+
+    def _query_live(
+        self, filters: dict, start: datetime, end: datetime | None
+    ) -> list[dict]:
+        live_filters = {**filters, "created_on__gte": start.isoformat()}
+
+        if end:
+            live_filters["created_on__lte"] = end.isoformat()
+
+        return self.executor.execute(
+            filters=live_filters,
+            operation="timeseries_hour_group_count",
+            parser=lambda x: x,
+            project=self.project,
+            query_kwargs={
+                "time_field": "created_on",
+                "start_hour": 0,
+                "end_hour": 23,
+                "limit": 24,
+                "timezone": self.tzname,
+            },
+        ).get("results", [])
+
+    def _query_buckets(
+        self, filters: dict, start: datetime, end: datetime
+    ) -> dict[tuple[str, int], int]:
+        rows = self.executor.execute(
+            filters={
+                **filters,
+                "created_on__gte": start.isoformat(),
+                "created_on__lte": (end - ONE_MICROSECOND).isoformat(),
+            },
+            operation="timeseries_day_hour_group_count",
+            parser=lambda x: x,
+            project=self.project,
+            query_kwargs={"time_field": "created_on", "timezone": self.tzname},
+        ).get("results", [])
+
+        return {(str(row["day"]), int(row["hour"])): int(row["value"]) for row in rows}
+
+    def _get_closed_counts(
+        self,
+        filters: dict,
+        bucket_starts: list[datetime],
+        skip_cache: set[tuple[str, int]],
+    ) -> dict[tuple[str, int], int]:
+        digest = self._get_filters_digest(filters)
+        buckets = {}
+
+        for bucket_start in bucket_starts:
+            buckets.setdefault(self._get_bucket(bucket_start), []).append(bucket_start)
+
+        days = sorted({day for day, _ in buckets})
+        cached_days = {
+            day: json.loads(cached) if cached else {}
+            for day, cached in zip(
+                days,
+                self.cache_client.get_many(
+                    [self._get_key(digest, day) for day in days]
+                ),
+            )
+        }
+
+        counts = {}
+        missing_starts = []
+
+        for (day, hour), starts in buckets.items():
+            if (value := cached_days[day].get(str(hour))) is not None:
+                counts[(day, hour)] = value
+            else:
+                missing_starts.extend(starts)
+
+        if not missing_starts:
+            return counts
+
+        fetched = self._query_buckets(
+            filters, min(missing_starts), max(missing_starts) + ONE_HOUR
+        )
+        changed_days = set()
+
+        for bucket in buckets:
+            if bucket in counts:
+                continue
+
+            counts[bucket] = fetched.get(bucket, 0)
+
+            if bucket not in skip_cache:
+                day, hour = bucket
+                cached_days[day][str(hour)] = counts[bucket]
+                changed_days.add(day)
+
+        self.cache_client.set_many(
+            {
+                self._get_key(digest, day): json.dumps(cached_days[day])
+                for day in changed_days
+            },
+            ex=(
+                settings.ROOMS_HOURLY_COUNTS_FILTERED_CACHE_TTL
+                if self._has_mutable_filters(filters)
+                else settings.ROOMS_HOURLY_COUNTS_CACHE_TTL
+            ),
+        )
+
+        return counts
+
+    def get_results(
+        self, filters: dict, start: datetime, end: datetime | None = None
+    ) -> list[dict]:
+        """
+        Same results as the timeseries_hour_group_count operation, for rooms
+        matching the filters created from start to end (or until now).
+        """
+        local_start = start.astimezone(self.timezone)
+
+        if local_start.replace(minute=0, second=0, microsecond=0) != local_start:
+            return self._query_live(filters, start, end)
+
+        now = dj_timezone.now()
+        closed_until = min(end + END_TOLERANCE, now) if end else now
+
+        bucket_starts = []
+        bucket_start = start
+
+        while bucket_start + ONE_HOUR <= closed_until:
+            bucket_starts.append(bucket_start)
+            bucket_start += ONE_HOUR
+
+        totals = [0] * 24
+        # The open hour can share its local (day, hour) with a closed one when
+        # clocks go back, so that bucket is not complete yet
+        skip_cache = {self._get_bucket(bucket_start)}
+
+        if self._has_mutable_filters(filters):
+            cacheable_until = now - timedelta(
+                hours=settings.ROOMS_HOURLY_COUNTS_FILTERED_GRACE_HOURS
+            )
+            skip_cache.update(
+                self._get_bucket(closed_start)
+                for closed_start in bucket_starts
+                if closed_start + ONE_HOUR > cacheable_until
+            )
+
+        if bucket_starts:
+            closed_counts = self._get_closed_counts(filters, bucket_starts, skip_cache)
+
+            for (_, hour), value in closed_counts.items():
+                totals[hour] += value
+
+        if not end or bucket_start <= end:
+            for row in self._query_live(filters, bucket_start, end):
+                totals[int(row["label"][:-1])] += int(row["value"])
+
+        return [{"label": f"{hour}h", "value": totals[hour]} for hour in range(24)]
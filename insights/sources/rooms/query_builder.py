@@ -44,6 +44,18 @@ class RoomSQLQueryBuilder:
         query = f"WITH hourly_data AS (SELECT EXTRACT(HOUR FROM r.{time_field} AT TIME ZONE '{timezone}') AS hour, COUNT(*) AS rooms_count FROM public.rooms_room as r {self.join_clause} WHERE {self.where_clause} GROUP BY hour) SELECT CONCAT(hours.label, 'h') AS label, COALESCE(hourly_data.rooms_count, 0) AS value FROM generate_series({time_range[0]}, {time_range[1]}) AS hours(label) LEFT JOIN hourly_data ON hours.label::int = hourly_data.hour ORDER BY value DESC FETCH FIRST {limit} ROWS ONLY;"
         return query, self.params
 
+    def timeseries_day_hour_group_count(
+        self,
+        time_field: str = "created_on",
+        timezone: str = "UTC",
+        *args,
+        **kwargs,
+    ):
+        if not self.is_valid:
+            self.build_query()
+        query = f"SELECT DATE(r.{time_field} AT TIME ZONE '{timezone}') AS day, EXTRACT(HOUR FROM r.{time_field} AT TIME ZONE '{timezone}')::int AS hour, COUNT(*) AS value FROM public.rooms_room as r {self.join_clause} WHERE {self.where_clause} GROUP BY day, hour ORDER BY day ASC, hour ASC;"
+        return query, self.params
+
     def timeseries_day_group_count(
         self,
         time_field: str = "created_on",
@@ -56,6 +68,45 @@ class RoomSQLQueryBuilder:
         query = f"SELECT DATE(r.{time_field} AT TIME ZONE '{timezone}') AS label, COUNT(*) AS value FROM public.rooms_room as r {self.join_clause} WHERE {self.where_clause} GROUP BY DATE(r.{time_field} AT TIME ZONE '{timezone}') ORDER BY label ASC;"
         return query, self.params
 
+    def _get_queue_join_clause(self) -> str:
+        if "q" in self.joins:
+            return self.join_clause
+
+        return f"INNER JOIN public.queues_queue AS q ON q.uuid=r.queue_id {self.join_clause}"
+
+    def day_queue_group_count(
+        self,
+        time_field: str = "created_on",
+        timezone: str = "UTC",
+        *args,
+        **kwargs,
+    ):
+        """
+        Groups rooms by local day of time_field, sector and queue (rooms rollups).
+        Returns: day, sector_uuid, queue_uuid, value (count)
+        """
+        if not self.is_valid:
+            self.build_query()
+        query = f"SELECT DATE(r.{time_field} AT TIME ZONE '{timezone}') AS day, q.sector_id AS sector_uuid, r.queue_id AS queue_uuid, COUNT(r.*) AS value FROM public.rooms_room as r {self._get_queue_join_clause()} WHERE {self.where_clause} GROUP BY day, q.sector_id, r.queue_id;"
+        return query, self.params
+
+    def day_queue_tag_group_count(
+        self,
+        time_field: str = "created_on",
+        timezone: str = "UTC",
+        *args,
+        **kwargs,
+    ):
+        """
+        Groups tagged rooms by local day of time_field, sector, queue and tag
+        (rooms rollups).
+        Returns: day, sector_uuid, queue_uuid, tag_uuid, value (count)
+        """
+        if not self.is_valid:
+            self.build_query()
+        query = f"SELECT DATE(r.{time_field} AT TIME ZONE '{timezone}') AS day, q.sector_id AS sector_uuid, r.queue_id AS queue_uuid, rt.sectortag_id AS tag_uuid, COUNT(DISTINCT r.uuid) AS value FROM public.rooms_room as r INNER JOIN public.rooms_room_tags AS rt ON rt.room_id=r.uuid {self._get_queue_join_clause()} WHERE {self.where_clause} GROUP BY day, q.sector_id, r.queue_id, rt.sectortag_id;"
+        return query, self.params
+
     def count(self, *args, **kwargs):
         if not self.is_valid:
             self.build_query()
@@ -53,6 +53,106 @@ class QueryExecutor(BaseQueryExecutor):
 
         return query_results
 
+    @classmethod
+    def group_queue_rows(cls, rows: list[dict]) -> dict:
+        """
+        Results of the group_by_queue_count operation from its rows: queues
+        grouped by sector, sectors sorted by their total.
+        """
+        grouped = {}
+        for row in rows:
+            sector_uuid = row["sector_uuid"]
+            if sector_uuid not in grouped:
+                sector_name = row["sector_name"]
+                sector_is_deleted = row["sector_is_deleted"]
+
+                if sector_is_deleted and "_is_deleted_" in sector_name:
+                    sector_name = sector_name.split("_is_deleted_")[0]
+
+                grouped[sector_uuid] = {
+                    "sector_name": sector_name,
+                    "is_deleted": sector_is_deleted,
+                    "queues": [],
+                }
+
+            queue_name = row["queue_name"]
+            queue_is_deleted = row["queue_is_deleted"]
+
+            if queue_is_deleted and "_is_deleted_" in queue_name:
+                queue_name = queue_name.split("_is_deleted_")[0]
+
+            grouped[sector_uuid]["queues"].append(
+                {
+                    "queue_name": queue_name,
+                    "is_deleted": queue_is_deleted,
+                    "value": row["value"],
+                }
+            )
+
+        results = sorted(
+            grouped.values(),
+            key=lambda sector: sum(queue["value"] for queue in sector["queues"]),
+            reverse=True,
+        )
+        total_queues = sum(len(sector["queues"]) for sector in results)
+
+        return {
+            "next": None,
+            "previous": None,
+            "count": total_queues,
+            "results": results,
+        }
+
+    @classmethod
+    def group_tag_rows(cls, rows: list[dict]) -> dict:
+        """
+        Results of the group_by_tag_count operation from its rows: tags
+        grouped by sector, sectors sorted by their total.
+        """
+        grouped = {}
+        for row in rows:
+            sector_uuid = row["sector_uuid"]
+            if sector_uuid not in grouped:
+                sector_name = row["sector_name"]
+                sector_is_deleted = row["sector_is_deleted"]
+
+                if sector_is_deleted and "_is_deleted_" in sector_name:
+                    sector_name = sector_name.split("_is_deleted_")[0]
+
+                grouped[sector_uuid] = {
+                    "sector_name": sector_name,
+                    "is_deleted": sector_is_deleted,
+                    "tags": [],
+                }
+
+            tag_name = row["tag_name"]
+            tag_is_deleted = row["tag_is_deleted"]
+
+            if tag_is_deleted and "_is_deleted_" in tag_name:
+                tag_name = tag_name.split("_is_deleted_")[0]
+
+            grouped[sector_uuid]["tags"].append(
+                {
+                    "tag_name": tag_name,
+                    "is_deleted": tag_is_deleted or grouped[sector_uuid]["is_deleted"],
+                    "value": row["value"],
+                }
+            )
+
+        results = sorted(
+            grouped.values(),
+            key=lambda sector: sum(tag["value"] for tag in sector["tags"]),
+            reverse=True,
+        )
+        total_tags = sum(len(sector["tags"]) for sector in results)
+
+        return {
+            "next": None,
+            "previous": None,
+            "count": total_tags,
+            "results": results,
+        }
+
     @classmethod
     def execute(
         cls,
@@ -77,101 +177,19 @@ class QueryExecutor(BaseQueryExecutor):
                 "previous": None,
                 "results": sorted(query_results, key=lambda x: int(x["label"][:-1])),
             }
-        elif operation == "timeseries_day_group_count":
+        elif operation in [
+            "timeseries_day_group_count",
+            "timeseries_day_hour_group_count",
+        ]:
             paginated_results = {
                 "next": None,
                 "previous": None,
                 "results": query_results,
             }
         elif operation == "group_by_queue_count":
-            grouped = {}
-            for row in query_results:
-                sector_uuid = row["sector_uuid"]
-                if sector_uuid not in grouped:
-                    sector_name = row["sector_name"]
-                    sector_is_deleted = row["sector_is_deleted"]
-
-                    if sector_is_deleted and "_is_deleted_" in sector_name:
-                        sector_name = sector_name.split("_is_deleted_")[0]
-
-                    grouped[sector_uuid] = {
-                        "sector_name": sector_name,
-                        "is_deleted": sector_is_deleted,
-                        "queues": [],
-                    }
-
-                queue_name = row["queue_name"]
-                queue_is_deleted = row["queue_is_deleted"]
-
-                if queue_is_deleted and "_is_deleted_" in queue_name:
-                    queue_name = queue_name.split("_is_deleted_")[0]
-
-                grouped[sector_uuid]["queues"].append(
-                    {
-                        "queue_name": queue_name,
-                        "is_deleted": queue_is_deleted,
-                        "value": row["value"],
-                    }
-                )
-
-            results = sorted(
-                grouped.values(),
-                key=lambda sector: sum(queue["value"] for queue in sector["queues"]),
-                reverse=True,
-            )
-            total_queues = sum(len(sector["queues"]) for sector in results)
-
-            paginated_results = {
-                "next": None,
-                "previous": None,
-                "count": total_queues,
-                "results": results,
-            }
+            paginated_results = cls.group_queue_rows(query_results)
         elif operation == "group_by_tag_count":
-            grouped = {}
-            for row in query_results:
-                sector_uuid = row["sector_uuid"]
-                if sector_uuid not in grouped:
-                    sector_name = row["sector_name"]
-                    sector_is_deleted = row["sector_is_deleted"]
-
-                    if sector_is_deleted and "_is_deleted_" in sector_name:
-                        sector_name = sector_name.split("_is_deleted_")[0]
-
-                    grouped[sector_uuid] = {
-                        "sector_name": sector_name,
-                        "is_deleted": sector_is_deleted,
-                        "tags": [],
-                    }
-
-                tag_name = row["tag_name"]
-                tag_is_deleted = row["tag_is_deleted"]
-
-                if tag_is_deleted and "_is_deleted_" in tag_name:
-                    tag_name = tag_name.split("_is_deleted_")[0]
-
-                grouped[sector_uuid]["tags"].append(
-                    {
-                        "tag_name": tag_name,
-                        "is_deleted": tag_is_deleted
-                        or grouped[sector_uuid]["is_deleted"],
-                        "value": row["value"],
-                    }
-                )
-
-            results = sorted(
-                grouped.values(),
-                key=lambda sector: sum(tag["value"] for tag in sector["tags"]),
-                reverse=True,
-            )
-            total_tags = sum(len(sector["tags"]) for sector in results)
-
-            paginated_results = {
-                "next": None,
-                "previous": None,
-                "count": total_tags,
-                "results": results,
-            }
+            paginated_results = cls.group_tag_rows(query_results)
         else:
             paginated_results = {
                 "next": None,
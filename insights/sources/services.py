@@ -1,7 +1,12 @@
+import copy
 from abc import ABC, abstractmethod
-from typing import Optional, Type
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+from typing import Callable, Iterable, Iterator, Optional, Type
 
+from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import connections
 from rest_framework.exceptions import PermissionDenied
 
 from insights.authentication.services.jwt_service import JWTService
@@ -11,10 +16,17 @@ from insights.sources.factories import SourceQueryExecutorFactory
 from insights.sources.vtexcredentials.exceptions import VtexCredentialsNotFound
 from insights.widgets.models import Widget
 from insights.widgets.usecases.get_source_data import (
+    SourceQueryMemo,
+    build_simple_source_query,
     cross_source_data_operation,
+    get_source_query_key,
     simple_source_data_operation,
 )
 
+SUBWIDGETS_OPERATION_ERROR = (
+    "The subwidgets operation needs to be one that returns only one object value."
+)
+
 
 class BaseDataSourceService(ABC):
     """
@@ -143,6 +155,128 @@ class DataSourceService(BaseDataSourceService):
             raise Exception("Widget not found.")
 
         except KeyError:
+            raise Exception(SUBWIDGETS_OPERATION_ERROR)
+
+    def _get_widget_query(
+        self,
+        widget: Widget,
+        is_live: bool,
+        filters: dict,
+        user_email: str,
+        memo: SourceQueryMemo,
+    ) -> tuple[str, Callable]:
+        """
+        Key identifying the widget's source query, and the function executing
+        it through the memo. Widgets with the same key get the same data.
+        """
+        source_query_executor = self.get_source_query_executor(widget.source)
+        if source_query_executor is None:
             raise Exception(
-                "The subwidgets operation needs to be one that returns only one object value."
+                f"could not find a source with the slug {widget.source}, make sure that the widget is configured with a supported source"
             )
+
+        serialized_auth = self._handle_serialized_auth(widget)
+        extra_query_kwargs = self._get_extra_query_kwargs(widget, is_report=False)
+
+        if widget.is_crossing_data:
+            return f"widget:{widget.uuid}", partial(
+                cross_source_data_operation,
+                widget=widget,
+                source_query=source_query_executor,
+                is_live=is_live,
+                filters=filters,
+                user_email=user_email,
+                auth_params=serialized_auth,
+                extra_query_kwargs=extra_query_kwargs,
+                memo=memo,
+            )
+
+        try:
+            query = build_simple_source_query(
+                widget, is_live, filters, extra_query_kwargs
+            )
+        except KeyError:
+            raise Exception(SUBWIDGETS_OPERATION_ERROR)
+
+        key = get_source_query_key(
+            source_query_executor,
+            widget.project,
+            query,
+            user_email,
+            serialized_auth,
+        )
+
+        return key, partial(
+            memo.execute,
+            key,
+            partial(
+                source_query_executor.execute,
+                filters=query["filters"],
+                operation=query["operation"],
+                parser=parse_dict_to_json,
+                project=widget.project,
+                user_email=user_email,
+                query_kwargs=query["query_kwargs"],
+                auth_params=serialized_auth,
+            ),
+        )
+
+    @staticmethod
+    def _execute_widget_query(execute: Callable):
+        try:
+            return execute()
+        except KeyError:
+            raise Exception(SUBWIDGETS_OPERATION_ERROR)
+        finally:
+            connections.close_all()
+
+    def get_source_data_from_widgets(
+        self,
+        widgets: Iterable[Widget],
+        is_live: bool = False,
+        filters: Optional[dict] = None,
+        user_email: str = "",
+    ) -> Iterator[tuple[Widget, Optional[dict], Optional[Exception]]]:
+        """
+        Yield (widget, data, error) for each widget, as their data is loaded.
+
+        Widgets with identical source queries share one execution, and the
+        distinct queries run concurrently on up to
+        WIDGET_DATA_BATCH_MAX_WORKERS threads. Subwidgets of crossing data
+        widgets share executions with the other widgets too. A widget that
+        fails yields its error and does not affect the others.
+        """
+        filters = filters or {}
+        memo = SourceQueryMemo()
+        queries: dict[str, tuple[Callable, list[Widget]]] = {}
+
+        for widget in widgets:
+            try:
+                key, execute = self._get_widget_query(
+                    widget, is_live, copy.deepcopy(filters), user_email, memo
+                )
+            except Exception as error:
+                yield widget, None, error
+                continue
+
+            queries.setdefault(key, (execute, []))[1].append(widget)
+
+        if not queries:
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(queries), settings.WIDGET_DATA_BATCH_MAX_WORKERS)
+        ) as executor:
+            futures = {
+                executor.submit(self._execute_widget_query, execute): query_widgets
+                for execute, query_widgets in queries.values()
+            }
+
+            for future in as_completed(futures):
+                try:
+                    data, error = future.result(), None
+                except Exception as exception:
+                    data, error = None, exception
+
+                for widget in futures[future]:
+                    yield widget, data, error
@@ -16,6 +16,10 @@ class TagFilterSet:
         table_alias="tg",
     )
     sector_id = sector
+    uuid = GenericSQLFilter(
+        source_field="uuid",
+        table_alias="tg",
+    )
 
     def get_field(self, field_name):
         try:
@@ -26,3 +26,13 @@ class TagSQLQueryBuilder:
         query = f"SELECT tg.uuid,tg.name FROM public.sectors_sectortag AS tg {self.join_clause} WHERE {self.where_clause} AND tg.is_deleted=false;"
 
         return query, self.params
+
+    def list_with_sectors(self):
+        """
+        Tags, deleted or not, with their sectors, when those are not deleted.
+        """
+        if not self.is_valid:
+            self.build_query()
+        query = f"SELECT tg.uuid AS tag_uuid, tg.name AS tag_name, tg.is_deleted AS tag_is_deleted, sec.uuid AS sector_uuid, sec.name AS sector_name, sec.is_deleted AS sector_is_deleted FROM public.sectors_sectortag AS tg INNER JOIN public.sectors_sector AS sec ON sec.uuid=tg.sector_id AND sec.is_deleted=false {self.join_clause} WHERE {self.where_clause};"
+
+        return query, self.params
@@ -5,8 +5,22 @@ class MockCacheClient:
     def get(self, key: str) -> Optional[Any]:
         return None
 
-    def set(self, key: str, value: Any, ex: Optional[int] = None) -> bool:
+    def set(
+        self, key: str, value: Any, ex: Optional[int] = None, nx: bool = False
+    ) -> bool:
         return True
 
     def delete(self, key: str) -> bool:
         return True
+
+    def get_many(self, keys: list[str]) -> list[Optional[Any]]:
+        return [None for _ in keys]
+
+    def set_many(self, values: dict[str, Any], ex: Optional[int] = None) -> None:
+        return None
+
+    def hincrby(self, name: str, key: str, amount: int = 1) -> int:
+        return amount
+
+    def hgetall(self, name: str) -> dict:
+        return {}
@@ -1,9 +1,9 @@
 import json
 from concurrent.futures import Future
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
 from insights.sources.cache import CacheClient
 from insights.sources.orders.clients import VtexOrdersRestClient
@@ -371,6 +371,65 @@ class TestVtexOrdersRestClient(TestCase):
             cache_key, json.dumps(expected_result), ex=3600
         )
 
+    def mock_daily_pages(self, pages: int):
+        def get_orders_list(query_filters, page_number):
+            response = MagicMock()
+            response.status_code = 200
+            response.json.return_value = {
+                "list": [
+                    {
+                        "authorizedDate": f"2023-01-{11 - page_number:02d}T12:00:00+00:00",
+                        "orderId": str(page_number),
+                        "totalValue": 1000,
+                        "currencyCode": "BRL",
+                    }
+                ],
+                "paging": {"pages": pages},
+            }
+            return response
+
+        return get_orders_list
+
+    @override_settings(VTEX_ORDERS_MAX_PAGES_CLIENT_DEFINED=2)
+    @patch("insights.sources.orders.clients.VtexOrdersRestClient.get_orders_list")
+    def test_list_daily_truncated_over_max_pages(self, mock_get_orders_list):
+        mock_get_orders_list.side_effect = self.mock_daily_pages(pages=3)
+
+        metrics = self.client_direct.list_daily(
+            {
+                "utm_source": ["wenivtex"],
+                "ended_at__gte": "2023-01-01T00:00:00.000000+00:00",
+                "ended_at__lte": "2023-01-10T23:59:59.999999+00:00",
+            },
+            timezone.utc,
+        )
+
+        # The paging request and the first 2 pages, page 3 is never fetched
+        self.assertEqual(mock_get_orders_list.call_count, 3)
+        self.assertTrue(metrics.truncated)
+        self.assertEqual(sorted(metrics.days), [date(2023, 1, 9), date(2023, 1, 10)])
+        self.assertTrue(metrics.is_complete(date(2023, 1, 10)))
+        self.assertFalse(metrics.is_complete(date(2023, 1, 9)))
+        self.assertFalse(metrics.is_complete(date(2023, 1, 8)))
+
+    @override_settings(VTEX_ORDERS_MAX_PAGES_CLIENT_DEFINED=2)
+    @patch("insights.sources.orders.clients.VtexOrdersRestClient.get_orders_list")
+    def test_list_daily_within_max_pages(self, mock_get_orders_list):
+        mock_get_orders_list.side_effect = self.mock_daily_pages(pages=2)
+
+        metrics = self.client_direct.list_daily(
+            {
+                "utm_source": ["wenivtex"],
+                "ended_at__gte": "2023-01-01T00:00:00.000000+00:00",
+                "ended_at__lte": "2023-01-10T23:59:59.999999+00:00",
+            },
+            timezone.utc,
+        )
+
+        self.assertFalse(metrics.truncated)
+        self.assertEqual(sorted(metrics.days), [date(2023, 1, 9), date(2023, 1, 10)])
+        self.assertTrue(metrics.is_complete(date(2023, 1, 1)))
+
     @patch("insights.sources.orders.clients.as_completed")
     @patch("insights.sources.orders.clients.ThreadPoolExecutor")
     @patch("insights.sources.orders.clients.VtexOrdersRestClient.get_orders_list")
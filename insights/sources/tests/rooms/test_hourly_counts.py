@@ -0,0 +1,171 @@
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytz
+from django.test import TestCase, override_settings
+
+from insights.projects.models import Project
+from insights.sources.cache import CacheClient
+from insights.sources.rooms.hourly_counts import RoomsHourlyCounts
+
+
+TIMEZONE = pytz.timezone("America/Sao_Paulo")
+
+
+@override_settings(ROOMS_HOURLY_COUNTS_CACHE_TTL=60)
+class TestRoomsHourlyCounts(TestCase):
+    def setUp(self):
+        self.project = Project.objects.create(
+            name="Test Project", timezone="America/Sao_Paulo"
+        )
+        self.executor = MagicMock()
+        self.executor.execute.side_effect = self._execute
+        self.bucket_rows = []
+        self.live_rows = []
+        self.hourly_counts = RoomsHourlyCounts(
+            self.project, executor=self.executor, cache_client=CacheClient()
+        )
+        self.filters = {"project": str(self.project.uuid), "sector__in": ["s1"]}
+
+    def _execute(self, filters, operation, *args, **kwargs):
+        if operation == "timeseries_day_hour_group_count":
+            return {"results": self.bucket_rows}
+        return {"results": self.live_rows}
+
+    def _get_calls(self, operation: str) -> list:
+        return [
+            call
+            for call in self.executor.execute.call_args_list
+            if call.kwargs["operation"] == operation
+        ]
+
+    def _now(self, hour: int, minute: int = 30):
+        return patch(
+            "insights.sources.rooms.hourly_counts.dj_timezone.now",
+            return_value=TIMEZONE.localize(datetime(2025, 1, 10, hour, minute)),
+        )
+
+    def test_monitoring_queries_closed_hours_once_and_open_hour_live(self):
+        start = TIMEZONE.localize(datetime(2025, 1, 10))
+        self.bucket_rows = [
+            {"day": "2025-01-10", "hour": 8, "value": 4},
+            {"day": "2025-01-10", "hour": 9, "value": 2},
+        ]
+        self.live_rows = [{"label": "10h", "value": 1}]
+
+        filters = {"project": str(self.project.uuid)}
+
+        with self._now(10):
+            results = self.hourly_counts.get_results(filters, start)
+
+        self.assertEqual(len(results), 24)
+        self.assertEqual(results[8], {"label": "8h", "value": 4})
+        self.assertEqual(results[9], {"label": "9h", "value": 2})
+        self.assertEqual(results[10], {"label": "10h", "value": 1})
+
+        bucket_calls = self._get_calls("timeseries_day_hour_group_count")
+        self.assertEqual(len(bucket_calls), 1)
+        self.assertEqual(
+            bucket_calls[0].kwargs["filters"]["created_on__gte"], start.isoformat()
+        )
+
+        live_calls = self._get_calls("timeseries_hour_group_count")
+        self.assertEqual(
+            live_calls[0].kwargs["filters"]["created_on__gte"],
+            (start + timedelta(hours=10)).isoformat(),
+        )
+
+        self.executor.execute.reset_mock()
+        self.bucket_rows = []
+
+        with self._now(11):
+            results = self.hourly_counts.get_results(filters, start)
+
+        # Only the hour closed since the previous request is queried
+        bucket_calls = self._get_calls("timeseries_day_hour_group_count")
+        self.assertEqual(len(bucket_calls), 1)
+        self.assertEqual(
+            bucket_calls[0].kwargs["filters"]["created_on__gte"],
+            (start + timedelta(hours=10)).isoformat(),
+        )
+        self.assertEqual(results[8]["value"], 4)
+        self.assertEqual(results[9]["value"], 2)
+
+    def test_closed_analysis_range_is_served_from_cache(self):
+        start = TIMEZONE.localize(datetime(2025, 1, 1))
+        end = TIMEZONE.localize(datetime(2025, 1, 2, 23, 59, 59))
+        self.bucket_rows = [
+            {"day": "2025-01-01", "hour": 14, "value": 3},
+            {"day": "2025-01-02", "hour": 14, "value": 2},
+        ]
+
+        with self._now(10):
+            first_results = self.hourly_counts.get_results(self.filters, start, end)
+
+        self.assertEqual(first_results[14], {"label": "14h", "value": 5})
+        self.assertEqual(len(self._get_calls("timeseries_hour_group_count")), 0)
+
+        self.executor.execute.reset_mock()
+
+        with self._now(10):
+            second_results = self.hourly_counts.get_results(self.filters, start, end)
+
+        self.assertEqual(second_results, first_results)
+        self.executor.execute.assert_not_called()
+
+    def test_recent_filtered_hours_are_not_cached(self):
+        start = TIMEZONE.localize(datetime(2025, 1, 10))
+        filters = {"project": str(self.project.uuid), "tags__in": ["t1"]}
+        self.bucket_rows = [{"day": "2025-01-10", "hour": 8, "value": 1}]
+
+        with self._now(10):
+            first_results = self.hourly_counts.get_results(filters, start)
+
+        # A room created at 8h is tagged when it closes, after that request
+        self.bucket_rows = [{"day": "2025-01-10", "hour": 8, "value": 2}]
+
+        with self._now(11):
+            second_results = self.hourly_counts.get_results(filters, start)
+
+        self.assertEqual(first_results[8]["value"], 1)
+        self.assertEqual(second_results[8]["value"], 2)
+        self.assertEqual(len(self._get_calls("timeseries_day_hour_group_count")), 2)
+
+    @override_settings(ROOMS_HOURLY_COUNTS_FILTERED_CACHE_TTL=30)
+    def test_filtered_hours_past_the_grace_period_are_cached_shorter(self):
+        start = TIMEZONE.localize(datetime(2025, 1, 1))
+        end = TIMEZONE.localize(datetime(2025, 1, 1, 23, 59, 59))
+        cache_client = MagicMock()
+        cache_client.get_many.return_value = [None]
+        hourly_counts = RoomsHourlyCounts(
+            self.project, executor=self.executor, cache_client=cache_client
+        )
+
+        with self._now(10):
+            hourly_counts.get_results(self.filters, start, end)
+
+        cache_client.set_many.assert_called_once()
+        self.assertEqual(cache_client.set_many.call_args.kwargs["ex"], 30)
+
+    def test_filters_have_their_own_buckets(self):
+        start = TIMEZONE.localize(datetime(2025, 1, 1))
+        end = TIMEZONE.localize(datetime(2025, 1, 1, 23, 59, 59))
+
+        with self._now(10):
+            self.hourly_counts.get_results(self.filters, start, end)
+            self.hourly_counts.get_results(
+                {**self.filters, "sector__in": ["s2"]}, start, end
+            )
+
+        self.assertEqual(len(self._get_calls("timeseries_day_hour_group_count")), 2)
+
+    def test_range_not_starting_on_the_hour_is_queried_live(self):
+        start = TIMEZONE.localize(datetime(2025, 1, 1, 8, 15))
+        end = TIMEZONE.localize(datetime(2025, 1, 1, 18))
+        self.live_rows = [{"label": "9h", "value": 7}]
+
+        with self._now(10):
+            results = self.hourly_counts.get_results(self.filters, start, end)
+
+        self.assertEqual(results, self.live_rows)
+        self.assertEqual(len(self._get_calls("timeseries_day_hour_group_count")), 0)
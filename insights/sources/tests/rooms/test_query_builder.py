@@ -60,6 +60,34 @@ class TestRoomSQLQueryBuilder(TestCase):
         self.assertEqual(query, expected_query)
         self.assertEqual(params, [123])
 
+    def test_timeseries_day_hour_group_count(self):
+        self.builder.add_filter(self.strategy, "user_id", "eq", 123)
+        query, params = self.builder.timeseries_day_hour_group_count(
+            timezone="America/Sao_Paulo"
+        )
+        expected_query = "SELECT DATE(r.created_on AT TIME ZONE 'America/Sao_Paulo') AS day, EXTRACT(HOUR FROM r.created_on AT TIME ZONE 'America/Sao_Paulo')::int AS hour, COUNT(*) AS value FROM public.rooms_room as r  WHERE r.user_id = (%s) GROUP BY day, hour ORDER BY day ASC, hour ASC;"
+        self.assertEqual(query, expected_query)
+        self.assertEqual(params, [123])
+
+    def test_day_queue_group_count(self):
+        self.builder.add_filter(self.strategy, "user_id", "eq", 123)
+        query, params = self.builder.day_queue_group_count(
+            time_field="ended_at", timezone="America/Sao_Paulo"
+        )
+        expected_query = "SELECT DATE(r.ended_at AT TIME ZONE 'America/Sao_Paulo') AS day, q.sector_id AS sector_uuid, r.queue_id AS queue_uuid, COUNT(r.*) AS value FROM public.rooms_room as r INNER JOIN public.queues_queue AS q ON q.uuid=r.queue_id  WHERE r.user_id = (%s) GROUP BY day, q.sector_id, r.queue_id;"
+        self.assertEqual(query, expected_query)
+        self.assertEqual(params, [123])
+
+    def test_day_queue_tag_group_count_reuses_queue_join(self):
+        self.builder.add_joins(
+            {"q": "INNER JOIN public.queues_queue AS q ON q.uuid=r.queue_id"}
+        )
+        self.builder.add_filter(self.strategy, "sector_id", "eq", "s1", "q")
+        query, params = self.builder.day_queue_tag_group_count()
+        expected_query = "SELECT DATE(r.created_on AT TIME ZONE 'UTC') AS day, q.sector_id AS sector_uuid, r.queue_id AS queue_uuid, rt.sectortag_id AS tag_uuid, COUNT(DISTINCT r.uuid) AS value FROM public.rooms_room as r INNER JOIN public.rooms_room_tags AS rt ON rt.room_id=r.uuid INNER JOIN public.queues_queue AS q ON q.uuid=r.queue_id WHERE q.sector_id = (%s) GROUP BY day, q.sector_id, r.queue_id, rt.sectortag_id;"
+        self.assertEqual(query, expected_query)
+        self.assertEqual(params, ["s1"])
+
     def test_count(self):
         self.builder.add_filter(self.strategy, "user_id", "eq", 123)
         query, params = self.builder.count()
@@ -0,0 +1,114 @@
+from unittest.mock import Mock, patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from insights.sources.dimensions import FilterDimensionCatalog, get_filter_value
+
+
+AGENTS = [
+    {"email": "john@weni.ai", "name": "John Doe"},
+    {"email": "jane@weni.ai", "name": "Jane Smith"},
+    {"email": "bob@weni.ai", "name": "Bob Johnson"},
+]
+
+
+@override_settings(FILTER_DIMENSIONS_VERSION_CHECK_INTERVAL=60)
+@patch("insights.sources.dimensions.time.time")
+@patch.object(FilterDimensionCatalog, "get_version")
+class TestFilterDimensionCatalog(TestCase):
+    def setUp(self):
+        self.catalog = FilterDimensionCatalog()
+        self.load = Mock(return_value=AGENTS)
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_loads_once_while_version_is_fresh(self, mock_get_version, mock_time):
+        mock_time.return_value = 1000
+        mock_get_version.return_value = "v1"
+
+        for _ in range(3):
+            data = self.catalog.list("project", "agents", self.load)
+
+        self.assertEqual(data, {"next": None, "previous": None, "results": AGENTS})
+        self.load.assert_called_once()
+        mock_get_version.assert_called_once_with("project", "agents")
+
+    def test_checks_version_after_interval(self, mock_get_version, mock_time):
+        mock_time.return_value = 1000
+        mock_get_version.return_value = "v1"
+        self.catalog.list("project", "agents", self.load)
+
+        mock_time.return_value += 120
+        self.catalog.list("project", "agents", self.load)
+
+        self.assertEqual(mock_get_version.call_count, 2)
+        self.load.assert_called_once()
+
+    def test_reloads_when_version_changes(self, mock_get_version, mock_time):
+        mock_time.return_value = 1000
+        mock_get_version.return_value = "v1"
+        self.catalog.list("project", "agents", self.load)
+
+        mock_time.return_value += 120
+        mock_get_version.return_value = "v2"
+        self.load.return_value = AGENTS[:1]
+
+        data = self.catalog.list("project", "agents", self.load)
+
+        self.assertEqual(data["results"], AGENTS[:1])
+        self.assertEqual(self.load.call_count, 2)
+
+    def test_search_and_limit(self, mock_get_version, mock_time):
+        mock_time.return_value = 1000
+        mock_get_version.return_value = "v1"
+
+        data = self.catalog.list("project", "agents", self.load, search="JOHN")
+
+        self.assertEqual(
+            [item["email"] for item in data["results"]],
+            ["john@weni.ai", "bob@weni.ai"],
+        )
+
+        data = self.catalog.list("project", "agents", self.load, limit="2")
+
+        self.assertEqual(data["results"], AGENTS[:2])
+
+    def test_caches_by_project_and_dimension(self, mock_get_version, mock_time):
+        mock_time.return_value = 1000
+        mock_get_version.return_value = "v1"
+
+        self.catalog.list("project", "agents", self.load)
+        self.catalog.list("project", "sectors", self.load)
+        self.catalog.list("other-project", "agents", self.load)
+
+        self.assertEqual(self.load.call_count, 3)
+
+
+class TestFilterDimensionCatalogSupports(TestCase):
+    def test_supports_project_search_and_limit_filters(self):
+        self.assertTrue(
+            FilterDimensionCatalog.supports(
+                "queues", "list", {"project": "uuid", "search": ["q"], "limit": ["5"]}
+            )
+        )
+
+    def test_does_not_support_other_filters(self):
+        self.assertFalse(
+            FilterDimensionCatalog.supports(
+                "queues", "list", {"project": "uuid", "sector": ["uuid"]}
+            )
+        )
+        self.assertFalse(
+            FilterDimensionCatalog.supports("queues", "count", {"project": "uuid"})
+        )
+        self.assertFalse(
+            FilterDimensionCatalog.supports("rooms", "list", {"project": "uuid"})
+        )
+
+    def test_get_filter_value(self):
+        self.assertEqual(get_filter_value(["value"]), "value")
+        self.assertEqual(get_filter_value("value"), "value")
+        self.assertIsNone(get_filter_value([]))
@@ -273,3 +273,114 @@ class TestDataSourceServiceGetSourceDataFromWidget(TestCase):
 
         call_kwargs = mock_simple_op.call_args[1]
         self.assertEqual(call_kwargs["filters"], {})
+
+
+class TestDataSourceServiceGetSourceDataFromWidgets(TestCase):
+    def setUp(self):
+        self.executor = MagicMock()
+        self.executor.execute.side_effect = lambda **kwargs: {
+            "operation": kwargs["operation"]
+        }
+
+        self.factory = MagicMock()
+        self.factory.get_source_query_executor.return_value = self.executor
+
+        self.service = DataSourceService(source_query_executor_factory=self.factory)
+
+    def _make_widget(self, operation="count", **kwargs):
+        widget = _make_widget(**kwargs)
+        widget.uuid = uuid.uuid4()
+        widget.source_config.side_effect = lambda sub_widget=None, is_live=False: (
+            {},
+            operation,
+            None,
+            None,
+            None,
+        )
+
+        return widget
+
+    def test_widgets_with_the_same_query_share_one_execution(self):
+        project = _make_widget().project
+        widget_1 = self._make_widget()
+        widget_2 = self._make_widget()
+        widget_3 = self._make_widget(operation="list")
+
+        for widget in (widget_1, widget_2, widget_3):
+            widget.project = project
+
+        results = {
+            widget: (data, error)
+            for widget, data, error in self.service.get_source_data_from_widgets(
+                [widget_1, widget_2, widget_3], filters={"slug": ["x"]}
+            )
+        }
+
+        self.assertEqual(self.executor.execute.call_count, 2)
+        self.assertEqual(results[widget_1], ({"operation": "count"}, None))
+        self.assertEqual(results[widget_2], ({"operation": "count"}, None))
+        self.assertEqual(results[widget_3], ({"operation": "list"}, None))
+
+    def test_widget_errors_do_not_affect_other_widgets(self):
+        failing_widget = self._make_widget(source_slug="missing")
+        widget = self._make_widget()
+        self.factory.get_source_query_executor.side_effect = lambda name: (
+            None if name == "missing" else self.executor
+        )
+
+        results = {
+            widget: (data, error)
+            for widget, data, error in self.service.get_source_data_from_widgets(
+                [failing_widget, widget]
+            )
+        }
+
+        self.assertIsNone(results[failing_widget][0])
+        self.assertIn("could not find a source", str(results[failing_widget][1]))
+        self.assertEqual(results[widget], ({"operation": "count"}, None))
+
+    def test_failed_execution_is_returned_for_its_widgets(self):
+        widget = self._make_widget()
+        self.executor.execute.side_effect = Exception("source down")
+
+        [(result_widget, data, error)] = list(
+            self.service.get_source_data_from_widgets([widget])
+        )
+
+        self.assertEqual(result_widget, widget)
+        self.assertIsNone(data)
+        self.assertEqual(str(error), "source down")
+
+    @patch("insights.sources.services.cross_source_data_operation")
+    def test_crossing_widgets_are_executed_on_their_own(self, mock_cross_op):
+        mock_cross_op.return_value = {"value": 50}
+        widget_1 = self._make_widget(is_crossing_data=True)
+        widget_2 = self._make_widget(is_crossing_data=True)
+
+        results = list(self.service.get_source_data_from_widgets([widget_1, widget_2]))
+
+        self.assertEqual(mock_cross_op.call_count, 2)
+        self.assertEqual(
+            {widget: data for widget, data, _ in results},
+            {widget_1: {"value": 50}, widget_2: {"value": 50}},
+        )
+
+    def test_crossing_widgets_share_subqueries_with_other_widgets(self):
+        project = _make_widget().project
+        widget = self._make_widget()
+        crossing_widget = self._make_widget(is_crossing_data=True)
+        crossing_widget.config = {"operator": "sum"}
+        self.executor.execute.side_effect = lambda **kwargs: {"value": 3}
+
+        for each_widget in (widget, crossing_widget):
+            each_widget.project = project
+
+        results = {
+            result_widget: data
+            for result_widget, data, _ in self.service.get_source_data_from_widgets(
+                [widget, crossing_widget]
+            )
+        }
+
+        self.executor.execute.assert_called_once()
+        self.assertEqual(results, {widget: {"value": 3}, crossing_widget: {"value": 6}})
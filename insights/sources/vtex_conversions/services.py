@@ -1,7 +1,12 @@
+import json
 import pytz
-from datetime import date, datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 from logging import getLogger
 
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from rest_framework.exceptions import PermissionDenied
 from sentry_sdk import capture_message
@@ -9,7 +14,12 @@ from sentry_sdk import capture_message
 from insights.dashboards.models import Dashboard
 from insights.metrics.meta.clients import MetaGraphAPIClient
 from insights.metrics.meta.enums import ProductType
+from insights.metrics.vtex.date_utils import get_project_timezone, to_local_day_range
+from insights.metrics.vtex.services.orders_aggregates_service import (
+    VtexOrdersAggregatesService,
+)
 from insights.projects.models import Project
+from insights.sources.cache import CacheClient
 from insights.sources.integrations.clients import WeniIntegrationsClient
 from insights.sources.orders.clients import VtexOrdersRestClient
 from insights.sources.vtex_conversions.dataclass import (
@@ -29,19 +39,29 @@ logger = getLogger(__name__)
 class VTEXOrdersConversionsService:
     """
     Service to get orders conversions from Meta Graph API and VTEX API.
+
+    The WABA's dashboard config is read in a single query, then the Meta
+    analytics calls and the VTEX orders aggregation run concurrently. The
+    combined result is cached per (waba, template, utm_source, date range).
     """
 
+    cache_key_prefix = "vtex_orders_conversions"
+
     def __init__(
         self,
         project: Project,
         meta_api_client: MetaGraphAPIClient,
         integrations_client: WeniIntegrationsClient,
         orders_client: VtexOrdersRestClient,
+        orders_aggregates: VtexOrdersAggregatesService | None = None,
+        cache_client: CacheClient | None = None,
     ):
         self.project = project
         self.meta_api_client = meta_api_client
         self.integrations_client = integrations_client
         self.orders_client = orders_client
+        self.orders_aggregates = orders_aggregates
+        self.cache_client = cache_client or CacheClient()
 
     def project_has_permission_to_access_waba(self, waba_id: str) -> bool:
         """
@@ -53,6 +73,50 @@ class VTEXOrdersConversionsService:
             config__waba_id=waba_id,
         ).exists()
 
+    def get_waba_dashboard_flags(self, waba_id: str) -> tuple[bool, bool]:
+        """
+        Whether the project has permission to access the WABA and whether
+        MM Lite is active for it, from a single query.
+        """
+        configs = list(
+            Dashboard.objects.filter(
+                project=self.project,
+                config__is_whatsapp_integration=True,
+                config__waba_id=waba_id,
+            ).values_list("config", flat=True)
+        )
+
+        use_mm_lite = any(config.get("is_mm_lite_active") is True for config in configs)
+
+        return bool(configs), use_mm_lite
+
+    def _raise_waba_permission_denied(self, waba_id: str):
+        logger.error(
+            "Verified that project %s does not have permission to access WABA %s while checking permissions in the VTEX orders conversions service",
+            self.project.uuid,
+            waba_id,
+        )
+        raise PermissionDenied(
+            detail=_("Project does not have permission to access WABA"),
+            code="project_without_waba_permission",
+        )
+
+    def _get_message_status_count(
+        self,
+        waba_id: str,
+        template_id: str,
+        start_date: date,
+        end_date: date,
+        product_type: str = ProductType.CLOUD_API.value,
+    ) -> dict:
+        return (
+            self.meta_api_client.get_messages_analytics(
+                waba_id, template_id, start_date, end_date, product_type=product_type
+            )
+            .get("data", {})
+            .get("status_count")
+        )
+
     def get_message_metrics(
         self,
         waba_id: str,
@@ -66,31 +130,45 @@ class VTEXOrdersConversionsService:
         """
 
         if not self.project_has_permission_to_access_waba(waba_id):
-            logger.error(
-                "Verified that project %s does not have permission to access WABA %s while checking permissions in the VTEX orders conversions service",
-                self.project.uuid,
-                waba_id,
-            )
-            raise PermissionDenied(
-                detail=_("Project does not have permission to access WABA"),
-                code="project_without_waba_permission",
-            )
+            self._raise_waba_permission_denied(waba_id)
 
-        metrics_data = (
-            self.meta_api_client.get_messages_analytics(
-                waba_id, template_id, start_date, end_date, product_type=product_type
-            )
-            .get("data", {})
-            .get("status_count")
+        return self._get_message_status_count(
+            waba_id, template_id, start_date, end_date, product_type
         )
 
-        return metrics_data
+    def _get_aggregates_days(
+        self, start_date: datetime, end_date: datetime
+    ) -> tuple[date, date] | None:
+        """
+        Days of the range to read from the daily aggregates, if any.
+
+        The date filters are read as UTC (see _localize_date_filters) while
+        the aggregates are stored per day in the project's timezone, so only
+        whole days of a project whose timezone matches UTC over the range can
+        be answered from them. Other projects fetch their orders live.
+        """
+        project_tz = get_project_timezone(self.project)
+
+        if any(
+            value.astimezone(project_tz).utcoffset() for value in (start_date, end_date)
+        ):
+            return None
+
+        return to_local_day_range(start_date, end_date, self.project)
 
     def get_orders_metrics(self, start_date: date, end_date: date, utm_source: str):
         """
         Get orders metrics from VTEX API.
+
+        Ranges made of whole days are answered from the daily aggregates,
+        when available (see _get_aggregates_days).
         """
 
+        if self.orders_aggregates and (
+            days := self._get_aggregates_days(start_date, end_date)
+        ):
+            return self.orders_aggregates.get_metrics(utm_source, *days)
+
         orders_data = self.orders_client.list(
             query_filters={
                 "utm_source": (utm_source,),
@@ -101,32 +179,65 @@ class VTEXOrdersConversionsService:
 
         return orders_data
 
-    def get_metrics(self, filters: dict):
+    def _get_orders_metrics_in_thread(
+        self, start_date: date, end_date: date, utm_source: str
+    ):
+        try:
+            return self.get_orders_metrics(start_date, end_date, utm_source)
+        finally:
+            # The daily aggregates use this thread's own database connection
+            connection.close()
+
+    def get_cache_key(
+        self,
+        waba_id: str,
+        template_id: str,
+        utm_source: str,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> str:
+        return (
+            f"{self.cache_key_prefix}:{self.project.uuid}:{waba_id}:{template_id}:"
+            f"{utm_source}:{start_date.isoformat()}:{end_date.isoformat()}"
+        )
+
+    def get_cache_ttl(self, end_date: datetime) -> int:
         """
-        Get metrics from Meta Graph API and VTEX API.
+        Ranges ending before the days whose orders are still fetched live
+        are kept longer.
         """
+        today = timezone.now().astimezone(get_project_timezone(self.project)).date()
+        first_open_day = today - timedelta(
+            days=max(settings.VTEX_ORDERS_DAILY_AGGREGATES_OPEN_DAYS, 1) - 1
+        )
+
+        if end_date.date() < first_open_day:
+            return settings.VTEX_ORDERS_CONVERSIONS_CLOSED_RANGE_CACHE_TTL
+
+        return settings.VTEX_ORDERS_CONVERSIONS_OPEN_RANGE_CACHE_TTL
+
+    def _localize_date_filters(self, filters: dict) -> None:
         tz_name = "UTC"
         tz = pytz.timezone(tz_name)
 
-        if "ended_at__gte" in filters:
-            start_date = datetime.fromisoformat(filters["ended_at__gte"])
-
-            if start_date and start_date.tzinfo is None:
-                start_date = tz.localize(start_date)
-            elif start_date and start_date.tzinfo:
-                start_date = start_date.replace(tzinfo=tz)
+        for key in ("ended_at__gte", "ended_at__lte"):
+            if key not in filters:
+                continue
 
-            filters["ended_at__gte"] = start_date
+            value = datetime.fromisoformat(filters[key])
 
-        if "ended_at__lte" in filters:
-            end_date = datetime.fromisoformat(filters["ended_at__lte"])
+            if value and value.tzinfo is None:
+                value = tz.localize(value)
+            elif value and value.tzinfo:
+                value = value.replace(tzinfo=tz)
 
-            if end_date and end_date.tzinfo is None:
-                end_date = tz.localize(end_date)
-            elif end_date and end_date.tzinfo:
-                end_date = end_date.replace(tzinfo=tz)
+            filters[key] = value
 
-            filters["ended_at__lte"] = end_date
+    def get_metrics(self, filters: dict):
+        """
+        Get metrics from Meta Graph API and VTEX API.
+        """
+        self._localize_date_filters(filters)
 
         serializer = OrdersConversionsFiltersSerializer(data=filters)
         serializer.is_valid(raise_exception=True)
@@ -135,21 +246,47 @@ class VTEXOrdersConversionsService:
         end_date = serializer.validated_data["end_date"]
 
         waba_id = serializer.validated_data["waba_id"]
+        template_id = serializer.validated_data["template_id"]
+        utm_source = serializer.validated_data["utm_source"]
 
-        use_mm_lite = Dashboard.objects.filter(
-            project=self.project,
-            config__is_whatsapp_integration=True,
-            config__waba_id=waba_id,
-            config__is_mm_lite_active=True,
-        ).exists()
+        has_permission, use_mm_lite = self.get_waba_dashboard_flags(waba_id)
 
-        cloud_api_metrics_data = self.get_message_metrics(
-            waba_id,
-            serializer.validated_data["template_id"],
-            start_date.date(),
-            end_date.date(),
+        if not has_permission:
+            self._raise_waba_permission_denied(waba_id)
+
+        cache_key = self.get_cache_key(
+            waba_id, template_id, utm_source, start_date, end_date
         )
 
+        if cached_data := self.cache_client.get(cache_key):
+            return json.loads(cached_data)
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            cloud_api_future = executor.submit(
+                self._get_message_status_count,
+                waba_id,
+                template_id,
+                start_date.date(),
+                end_date.date(),
+            )
+            mm_lite_future = (
+                executor.submit(
+                    self._get_message_status_count,
+                    waba_id,
+                    template_id,
+                    start_date.date(),
+                    end_date.date(),
+                    product_type=ProductType.MM_LITE.value,
+                )
+                if use_mm_lite
+                else None
+            )
+            orders_future = executor.submit(
+                self._get_orders_metrics_in_thread, start_date, end_date, utm_source
+            )
+
+        cloud_api_metrics_data = cloud_api_future.result()
+
         raw_graph_data_fields = {}
         sent_total = 0
 
@@ -163,14 +300,8 @@ class VTEXOrdersConversionsService:
             if status == "sent":
                 sent_total += status_data.get("value", 0)
 
-        if use_mm_lite:
-            mm_lite_metrics_data = self.get_message_metrics(
-                waba_id,
-                serializer.validated_data["template_id"],
-                start_date.date(),
-                end_date.date(),
-                product_type=ProductType.MM_LITE.value,
-            )
+        if mm_lite_future:
+            mm_lite_metrics_data = mm_lite_future.result()
 
             for status in ("sent", "delivered", "read", "clicked"):
                 status_data = mm_lite_metrics_data.get(status, {})
@@ -191,11 +322,7 @@ class VTEXOrdersConversionsService:
                 ),
             )
 
-        orders_data = self.get_orders_metrics(
-            start_date,
-            end_date,
-            serializer.validated_data["utm_source"],
-        )
+        orders_data = orders_future.result()
 
         if not isinstance(orders_data, dict):
             error_msg = "Error fetching orders. Orders data is not a dictionary. Orders data: %s"
@@ -232,4 +359,10 @@ class VTEXOrdersConversionsService:
             instance=orders_conversions
         )
 
-        return orders_conversions_serializer.data
+        data = orders_conversions_serializer.data
+
+        self.cache_client.set(
+            cache_key, json.dumps(data), ex=self.get_cache_ttl(end_date)
+        )
+
+        return data
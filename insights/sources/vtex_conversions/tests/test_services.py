@@ -1,11 +1,16 @@
+import time
+from datetime import date, datetime
+from datetime import timezone as dt_timezone
 from unittest.mock import Mock
 
+from django.core.cache import cache
 from django.test import TestCase
 from django.utils import timezone
 from django.utils.timezone import timedelta
 from rest_framework import serializers
 
 from insights.dashboards.models import Dashboard
+from insights.metrics.meta.enums import ProductType
 from insights.metrics.meta.tests.mock import MOCK_TEMPLATE_DAILY_ANALYTICS
 from insights.metrics.meta.utils import format_messages_metrics_data
 from insights.projects.models import Project
@@ -15,6 +20,7 @@ from rest_framework.exceptions import PermissionDenied
 
 class VTEXConversionsServiceTestCase(TestCase):
     def setUp(self) -> None:
+        cache.clear()
         self.project = Project.objects.create(timezone="America/Sao_Paulo")
 
         self.meta_api_client = Mock()
@@ -28,6 +34,9 @@ class VTEXConversionsServiceTestCase(TestCase):
             self.orders_client,
         )
 
+    def tearDown(self) -> None:
+        cache.clear()
+
     def test_cannot_get_metrics_without_required_filters(self):
         filters = {}
 
@@ -149,3 +158,156 @@ class VTEXConversionsServiceTestCase(TestCase):
                 2,
             ),
         )
+
+    def test_get_orders_metrics_fetches_live_for_non_utc_project(self):
+        orders_aggregates = Mock()
+        self.service.orders_aggregates = orders_aggregates
+        self.orders_client.list.return_value = {"countSell": 1}
+        start_date = datetime(2026, 10, 1, tzinfo=dt_timezone.utc)
+        end_date = datetime(2026, 10, 7, 23, 59, 59, tzinfo=dt_timezone.utc)
+
+        metrics = self.service.get_orders_metrics(start_date, end_date, "example")
+
+        # Whole UTC days are not whole days in America/Sao_Paulo
+        self.assertEqual(metrics, {"countSell": 1})
+        orders_aggregates.get_metrics.assert_not_called()
+        self.orders_client.list.assert_called_once_with(
+            query_filters={
+                "utm_source": ("example",),
+                "ended_at__gte": str(start_date),
+                "ended_at__lte": str(end_date),
+            }
+        )
+
+    def test_get_orders_metrics_uses_aggregates_for_utc_project(self):
+        self.project.timezone = "UTC"
+        orders_aggregates = Mock()
+        orders_aggregates.get_metrics.return_value = {"countSell": 2}
+        self.service.orders_aggregates = orders_aggregates
+
+        metrics = self.service.get_orders_metrics(
+            datetime(2026, 10, 1, tzinfo=dt_timezone.utc),
+            datetime(2026, 10, 7, 23, 59, 59, tzinfo=dt_timezone.utc),
+            "example",
+        )
+
+        self.assertEqual(metrics, {"countSell": 2})
+        orders_aggregates.get_metrics.assert_called_once_with(
+            "example", date(2026, 10, 1), date(2026, 10, 7)
+        )
+        self.orders_client.list.assert_not_called()
+
+
+class SlowMetaAPIClient:
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.calls = []
+
+    def get_messages_analytics(
+        self, waba_id, template_id, start_date, end_date, product_type
+    ):
+        self.calls.append(product_type)
+        time.sleep(self.latency)
+
+        return {
+            "data": format_messages_metrics_data(
+                MOCK_TEMPLATE_DAILY_ANALYTICS.get("data")[0]
+            )
+        }
+
+
+class SlowOrdersClient:
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.calls = 0
+
+    def list(self, query_filters: dict):
+        self.calls += 1
+        time.sleep(self.latency)
+
+        return {
+            "countSell": 10,
+            "accumulatedTotal": 10000,
+            "ticketMax": 1000,
+            "ticketMin": 100,
+            "medium_ticket": 1000,
+            "currencyCode": "BRL",
+        }
+
+
+class VTEXConversionsServicePipelineTestCase(TestCase):
+    latency = 0.3
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.project = Project.objects.create(timezone="America/Sao_Paulo")
+        self.waba_id = "123"
+        Dashboard.objects.create(
+            project=self.project,
+            config={
+                "is_whatsapp_integration": True,
+                "waba_id": self.waba_id,
+                "is_mm_lite_active": True,
+            },
+        )
+
+        self.meta_api_client = SlowMetaAPIClient(self.latency)
+        self.orders_client = SlowOrdersClient(self.latency)
+        self.service = VTEXOrdersConversionsService(
+            self.project,
+            self.meta_api_client,
+            Mock(),
+            self.orders_client,
+        )
+
+    def tearDown(self) -> None:
+        cache.clear()
+
+    def get_filters(self) -> dict:
+        return {
+            "waba_id": self.waba_id,
+            "template_id": "456",
+            "utm_source": "example",
+            "ended_at__gte": (timezone.now() - timedelta(days=7)).strftime("%Y-%m-%d"),
+            "ended_at__lte": (timezone.now()).strftime("%Y-%m-%d"),
+        }
+
+    def test_fetches_meta_and_vtex_concurrently(self):
+        started_at = time.monotonic()
+
+        with self.assertNumQueries(1):
+            metrics = self.service.get_metrics(self.get_filters())
+
+        elapsed = time.monotonic() - started_at
+
+        # Three calls of `latency` each: sequentially they would take 3x
+        self.assertLess(elapsed, self.latency * 2)
+        self.assertEqual(
+            sorted(self.meta_api_client.calls),
+            sorted([ProductType.CLOUD_API.value, ProductType.MM_LITE.value]),
+        )
+        self.assertEqual(self.orders_client.calls, 1)
+        self.assertEqual(metrics["utm_data"]["count_sell"], 10)
+
+        sent = (
+            format_messages_metrics_data(MOCK_TEMPLATE_DAILY_ANALYTICS.get("data")[0])
+            .get("status_count")
+            .get("sent")
+            .get("value")
+        )
+        self.assertEqual(metrics["graph_data"]["sent"]["value"], sent * 2)
+
+    def test_caches_conversions_result(self):
+        first = self.service.get_metrics(self.get_filters())
+        second = self.service.get_metrics(self.get_filters())
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.meta_api_client.calls), 2)
+        self.assertEqual(self.orders_client.calls, 1)
+
+    def test_checks_waba_permission_before_reading_cache(self):
+        self.service.get_metrics(self.get_filters())
+        Dashboard.objects.filter(project=self.project).delete()
+
+        with self.assertRaises(PermissionDenied):
+            self.service.get_metrics(self.get_filters())
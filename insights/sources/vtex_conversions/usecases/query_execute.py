@@ -6,13 +6,16 @@ from rest_framework.exceptions import PermissionDenied
 
 from insights.authentication.services.jwt_service import JWTService
 from insights.metrics.meta.clients import MetaGraphAPIClient
+from insights.metrics.vtex.services.orders_aggregates_service import (
+    VtexOrdersAggregatesService,
+)
 from insights.projects.models import Project
 from insights.sources.cache import CacheClient
 from insights.sources.integrations.clients import WeniIntegrationsClient
 from insights.sources.orders.clients import VtexOrdersRestClient
 from insights.sources.vtex_conversions.services import VTEXOrdersConversionsService
-from insights.sources.vtexcredentials.clients import AuthRestClient
 from insights.sources.vtexcredentials.exceptions import VtexCredentialsNotFound
+from insights.sources.vtexcredentials.services import VtexCredentialsService
 from insights.sources.base import BaseQueryExecutor
 
 logger = logging.getLogger(__name__)
@@ -21,8 +24,6 @@ logger = logging.getLogger(__name__)
 class QueryExecutor(BaseQueryExecutor):
     @classmethod
     def get_vtex_credentials(cls, project: Project):
-        vtex_credentials_client = AuthRestClient(project=project.uuid)
-
         if project.vtex_account:
             return {
                 "domain": project.vtex_account,
@@ -32,7 +33,7 @@ class QueryExecutor(BaseQueryExecutor):
             }
 
         try:
-            credentials = vtex_credentials_client.get_vtex_auth()
+            credentials = VtexCredentialsService().get_credentials(project.uuid)
         except VtexCredentialsNotFound as e:
             logger.error(
                 "VTEX credentials not found for project %s while checking permissions in the VTEX orders conversions service",
@@ -63,7 +64,11 @@ class QueryExecutor(BaseQueryExecutor):
         )
 
         service = VTEXOrdersConversionsService(
-            project, meta_api_client, integrations_client, orders_client
+            project,
+            meta_api_client,
+            integrations_client,
+            orders_client,
+            orders_aggregates=VtexOrdersAggregatesService(project, orders_client),
         )
 
         return service.get_metrics(filters)
@@ -14,7 +14,11 @@ class AuthRestClient(InternalAuthentication):
         self.url = f"{settings.INTEGRATIONS_URL}/api/v1/apptypes/vtex/integration-details/{project}"
 
     def get_vtex_auth(self) -> VtexCredentialsDTO:
-        response = requests.get(url=self.url, headers=self.headers)
+        response = requests.get(
+            url=self.url,
+            headers=self.headers,
+            timeout=settings.VTEX_CREDENTIALS_REQUEST_TIMEOUT,
+        )
 
         if not status.is_success(response.status_code):
             if response.status_code == status.HTTP_404_NOT_FOUND:
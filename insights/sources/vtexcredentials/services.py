@@ -0,0 +1,75 @@
+import json
+import logging
+from uuid import UUID
+
+from django.conf import settings
+
+from insights.sources.cache import CacheClient
+from insights.sources.vtexcredentials.clients import AuthRestClient
+from insights.sources.vtexcredentials.exceptions import VtexCredentialsNotFound
+from insights.sources.vtexcredentials.typing import VtexCredentialsDTO
+
+logger = logging.getLogger(__name__)
+
+
+class VtexCredentialsService:
+    """
+    Per project VTEX credentials, resolved from the integrations service and
+    cached for VTEX_CREDENTIALS_CACHE_TTL seconds.
+
+    Projects without credentials are cached as well, for
+    VTEX_CREDENTIALS_NOT_FOUND_CACHE_TTL seconds, so they keep raising
+    VtexCredentialsNotFound without calling the integrations service again.
+    """
+
+    key_prefix = "vtex_credentials"
+    not_found_value = "not_found"
+
+    def __init__(self, cache_client: CacheClient | None = None):
+        self.cache_client = cache_client or CacheClient()
+
+    @classmethod
+    def get_key(cls, project_uuid: UUID | str) -> str:
+        return f"{cls.key_prefix}:{project_uuid}"
+
+    def get_credentials(self, project_uuid: UUID | str) -> VtexCredentialsDTO:
+        key = self.get_key(project_uuid)
+
+        if cached := self.cache_client.get(key):
+            if isinstance(cached, bytes):
+                cached = cached.decode()
+
+            if cached == self.not_found_value:
+                raise VtexCredentialsNotFound(
+                    f"Credentials not found for project {project_uuid}"
+                )
+
+            return json.loads(cached)
+
+        try:
+            credentials = AuthRestClient(project_uuid).get_vtex_auth()
+        except VtexCredentialsNotFound:
+            self.cache_client.set(
+                key,
+                self.not_found_value,
+                ex=settings.VTEX_CREDENTIALS_NOT_FOUND_CACHE_TTL,
+            )
+            raise
+
+        self.cache_client.set(
+            key, json.dumps(credentials), ex=settings.VTEX_CREDENTIALS_CACHE_TTL
+        )
+
+        return credentials
+
+    def invalidate(self, project_uuid: UUID | str) -> None:
+        """
+        Forget the cached credentials, e.g. when the project's VTEX
+        integration changes.
+        """
+        self.cache_client.delete(self.get_key(project_uuid))
+
+        logger.info(
+            "[VtexCredentialsService] Invalidated credentials for project %s",
+            project_uuid,
+        )
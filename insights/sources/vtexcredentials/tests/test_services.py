@@ -0,0 +1,65 @@
+from unittest.mock import patch
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from insights.sources.vtexcredentials.exceptions import VtexCredentialsNotFound
+from insights.sources.vtexcredentials.services import VtexCredentialsService
+
+
+@patch("insights.sources.vtexcredentials.clients.AuthRestClient.get_vtex_auth")
+class TestVtexCredentialsService(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.service = VtexCredentialsService()
+        self.project_uuid = uuid4()
+        self.credentials = {
+            "app_key": "fake_key",
+            "app_token": "fake_token",
+            "domain": "fake_domain",
+        }
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_resolves_credentials_once(self, mock_get_vtex_auth):
+        mock_get_vtex_auth.return_value = self.credentials
+
+        for _ in range(3):
+            self.assertEqual(
+                self.service.get_credentials(self.project_uuid), self.credentials
+            )
+
+        mock_get_vtex_auth.assert_called_once()
+
+    def test_caches_missing_credentials(self, mock_get_vtex_auth):
+        mock_get_vtex_auth.side_effect = VtexCredentialsNotFound()
+
+        for _ in range(2):
+            with self.assertRaises(VtexCredentialsNotFound):
+                self.service.get_credentials(self.project_uuid)
+
+        mock_get_vtex_auth.assert_called_once()
+
+    def test_does_not_cache_failures(self, mock_get_vtex_auth):
+        mock_get_vtex_auth.side_effect = [Exception("Error"), self.credentials]
+
+        with self.assertRaises(Exception):
+            self.service.get_credentials(self.project_uuid)
+
+        self.assertEqual(
+            self.service.get_credentials(self.project_uuid), self.credentials
+        )
+
+    def test_invalidate(self, mock_get_vtex_auth):
+        mock_get_vtex_auth.side_effect = [VtexCredentialsNotFound(), self.credentials]
+
+        with self.assertRaises(VtexCredentialsNotFound):
+            self.service.get_credentials(self.project_uuid)
+
+        self.service.invalidate(self.project_uuid)
+
+        self.assertEqual(
+            self.service.get_credentials(self.project_uuid), self.credentials
+        )
@@ -1,5 +1,5 @@
 from insights.sources.base import BaseQueryExecutor
-from insights.sources.vtexcredentials.clients import AuthRestClient
+from insights.sources.vtexcredentials.services import VtexCredentialsService
 
 
 class QueryExecutor(BaseQueryExecutor):
@@ -13,6 +13,4 @@ class QueryExecutor(BaseQueryExecutor):
         *args,
         **kwargs
     ):
-        client = AuthRestClient(project=filters["project"])
-        tokens = client.get_vtex_auth()
-        return tokens
+        return VtexCredentialsService().get_credentials(filters["project"])
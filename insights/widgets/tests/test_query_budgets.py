@@ -0,0 +1,44 @@
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from insights.authentication.authentication import User
+from insights.authentication.tests.decorators import with_project_auth
+from insights.core.tests.query_budget import QueryBudgetTestMixin
+from insights.dashboards.models import Dashboard
+from insights.projects.models import Project
+from insights.widgets.models import Widget
+
+
+class TestWidgetViewSetQueryBudgets(QueryBudgetTestMixin, APITestCase):
+    LIST_BUDGET = 2
+
+    def setUp(self):
+        self.user = User.objects.create_user(email="test@email.com")
+        self.project = Project.objects.create(name="testproject")
+        self.dashboard = Dashboard.objects.create(
+            name="testdashboard", project=self.project
+        )
+
+    def create_widgets(self, count: int) -> None:
+        for index in range(count):
+            Widget.objects.create(
+                name=f"testwidget {index}",
+                dashboard=self.dashboard,
+                source="test",
+                position=[],
+                config={},
+                type="test",
+            )
+
+    def list_widgets(self):
+        response = self.client.get(reverse("widget-list"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        return response
+
+    @with_project_auth
+    def test_list(self):
+        self.assertConstantQueries(
+            self.LIST_BUDGET, self.list_widgets, self.create_widgets
+        )
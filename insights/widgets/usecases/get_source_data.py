@@ -1,7 +1,14 @@
+import copy
+import json
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime
+from typing import Callable, Iterable, Iterator
 
 import pytz
+from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import connections
 from django.utils import timezone
 from rest_framework.exceptions import PermissionDenied
 
@@ -86,15 +93,15 @@ class Calculator:
         return getattr(self, self.operator)()
 
 
-def simple_source_data_operation(
-    source_query,
+def build_simple_source_query(
     widget: Widget,
     is_live: bool = False,
     filters: dict = {},
-    user_email: str = "",
-    auth_params: dict = {},
     extra_query_kwargs: dict = {},
-):
+) -> dict:
+    """
+    Filters, operation and query kwargs the widget's source is executed with
+    """
     query_kwargs = {}
 
     sub = filters.pop("slug", [None])
@@ -138,16 +145,99 @@ def simple_source_data_operation(
             query_kwargs[field] = timeseries_hour_kwargs.get(field)
 
     default_filters["project"] = str(widget.project.uuid)
-    serialized_source = source_query.execute(
-        filters=default_filters,
-        operation=operation,
-        parser=parse_dict_to_json,
-        project=widget.project,
-        user_email=user_email,
-        query_kwargs=query_kwargs,
-        auth_params=auth_params,
+
+    return {
+        "filters": default_filters,
+        "operation": operation,
+        "query_kwargs": query_kwargs,
+    }
+
+
+def get_source_query_key(
+    source_query, project, query: dict, user_email: str = "", auth_params: dict = {}
+) -> str:
+    """
+    Canonical key of a source query: the same key means the same results
+    """
+    source_name = (
+        f"{source_query.__module__}.{source_query.__qualname__}"
+        if isinstance(source_query, type)
+        else repr(source_query)
+    )
+
+    return json.dumps(
+        {
+            "source": source_name,
+            "project": str(project.uuid),
+            "user_email": user_email,
+            "auth_params": auth_params,
+            **query,
+        },
+        sort_keys=True,
+        default=str,
+    )
+
+
+class SourceQueryMemo:
+    """
+    Source query results by key, kept for a single request, so widgets and
+    subwidgets sharing a query execute it once. A query requested while it
+    is being executed waits for that execution.
+    """
+
+    def __init__(self):
+        self._futures: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def execute(self, key: str, function: Callable):
+        with self._lock:
+            future = self._futures.get(key)
+            is_owner = future is None
+
+            if is_owner:
+                future = self._futures[key] = Future()
+
+        if is_owner:
+            try:
+                future.set_result(function())
+            except Exception as error:
+                future.set_exception(error)
+
+        return future.result()
+
+
+def simple_source_data_operation(
+    source_query,
+    widget: Widget,
+    is_live: bool = False,
+    filters: dict = {},
+    user_email: str = "",
+    auth_params: dict = {},
+    extra_query_kwargs: dict = {},
+    memo: SourceQueryMemo | None = None,
+):
+    query = build_simple_source_query(widget, is_live, filters, extra_query_kwargs)
+
+    def execute():
+        return source_query.execute(
+            filters=query["filters"],
+            operation=query["operation"],
+            parser=parse_dict_to_json,
+            project=widget.project,
+            user_email=user_email,
+            query_kwargs=query["query_kwargs"],
+            auth_params=auth_params,
+        )
+
+    if memo is None:
+        return execute()
+
+    return memo.execute(
+        get_source_query_key(
+            source_query, widget.project, query, user_email, auth_params
+        ),
+        execute,
     )
-    return serialized_source
 
 
 def get_subwidget_data(data={}) -> dict:
@@ -169,25 +259,43 @@ def cross_source_data_operation(
     calculator=Calculator,
     auth_params: dict = {},
     extra_query_kwargs: dict = None,
+    memo: SourceQueryMemo | None = None,
 ):
     """
     there will always be two subwidgets to make a cross operation,
     until the business rule is updated.
     so we save then in fixed positions(subwidget slug) on the config dict
+
+    The subwidgets are queried concurrently, through the memo of the request
+    when given, so queries shared with other widgets are executed once.
     """
-    # The subwidget needs to have a operation that returns a value(count, sum, avg...), cannot be a list of values
-    filters["slug"] = "subwidget_1"
+    memo = memo or SourceQueryMemo()
+    # Loaded before the subwidget threads, so they do not query it
+    widget.project
+
+    def get_subwidget_value(slug: str):
+        try:
+            # The subwidget needs to have a operation that returns a value(count, sum, avg...), cannot be a list of values
+            result = simple_source_data_operation(
+                source_query=source_query,
+                widget=widget,
+                is_live=is_live,
+                filters={**filters, "slug": slug},
+                user_email=user_email,
+                auth_params=auth_params,
+                memo=memo,
+            )
+        finally:
+            connections.close_all()
 
-    subwidget_1_result = simple_source_data_operation(
-        source_query, widget, is_live, filters, user_email, auth_params
-    )
-    subwidget_1_data = get_subwidget_data(subwidget_1_result).get("value")
+        return get_subwidget_data(result).get("value")
 
-    filters["slug"] = "subwidget_2"
-    subwidget_2_result = simple_source_data_operation(
-        source_query, widget, is_live, filters, user_email, auth_params
-    )
-    subwidget_2_data = get_subwidget_data(subwidget_2_result).get("value")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        subwidget_1_future = executor.submit(get_subwidget_value, "subwidget_1")
+        subwidget_2_future = executor.submit(get_subwidget_value, "subwidget_2")
+
+    subwidget_1_data = subwidget_1_future.result()
+    subwidget_2_data = subwidget_2_future.result()
 
     operator = widget.config.get("operator")
 
@@ -272,3 +380,49 @@ def get_source_data_from_widget(
         raise Exception(
             "The subwidgets operation needs to be one that returns only one object value."
         )
+
+
+def get_source_data_from_widgets(
+    widgets: Iterable[Widget],
+    is_live: bool = False,
+    filters: dict | None = None,
+    user_email: str = "",
+) -> Iterator[tuple[Widget, dict | None, Exception | None]]:
+    """
+    Yield (widget, data, error) for each widget, as their data is loaded,
+    like DataSourceService.get_source_data_from_widgets does but loading
+    each widget with get_source_data_from_widget, on up to
+    WIDGET_DATA_BATCH_MAX_WORKERS threads.
+    """
+    # TODO: Remove this function once the data source service is rolled out to all projects
+    filters = filters or {}
+    widgets = list(widgets)
+
+    if not widgets:
+        return
+
+    def get_widget_data(widget: Widget):
+        try:
+            return get_source_data_from_widget(
+                widget=widget,
+                is_live=is_live,
+                filters=copy.deepcopy(filters),
+                user_email=user_email,
+            )
+        finally:
+            connections.close_all()
+
+    with ThreadPoolExecutor(
+        max_workers=min(len(widgets), settings.WIDGET_DATA_BATCH_MAX_WORKERS)
+    ) as executor:
+        futures = {
+            executor.submit(get_widget_data, widget): widget for widget in widgets
+        }
+
+        for future in as_completed(futures):
+            try:
+                data, error = future.result(), None
+            except Exception as exception:
+                data, error = None, exception
+
+            yield futures[future], data, error
@@ -1,3 +1,5 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from django.test import TestCase
 from unittest.mock import MagicMock, patch, PropertyMock
@@ -14,6 +16,7 @@ from insights.widgets.usecases.get_source_data import (
     cross_source_data_operation,
     get_source_data_from_widget,
     Calculator,
+    SourceQueryMemo,
 )
 from insights.projects.parsers import parse_dict_to_json
 from insights.sources.vtexcredentials.exceptions import VtexCredentialsNotFound
@@ -283,9 +286,9 @@ class TestDataSourceOperations(TestCase):
 
     @patch("insights.widgets.usecases.get_source_data.simple_source_data_operation")
     def test_cross_source_data_operation(self, mock_simple_operation):
-        mock_simple_operation.side_effect = [
-            {"value": 100},
-            {"value": 50},
+        values = {"subwidget_1": {"value": 100}, "subwidget_2": {"value": 50}}
+        mock_simple_operation.side_effect = lambda **kwargs: values[
+            kwargs["filters"]["slug"]
         ]
         self.widget_mock.config = {"operator": "sum"}
 
@@ -298,9 +301,9 @@ class TestDataSourceOperations(TestCase):
 
     @patch("insights.widgets.usecases.get_source_data.simple_source_data_operation")
     def test_cross_source_data_operation_percentage(self, mock_simple_operation):
-        mock_simple_operation.side_effect = [
-            {"value": 50},
-            {"value": 100},
+        values = {"subwidget_1": {"value": 50}, "subwidget_2": {"value": 100}}
+        mock_simple_operation.side_effect = lambda **kwargs: values[
+            kwargs["filters"]["slug"]
         ]
         self.widget_mock.config = {"operator": "percentage"}
 
@@ -310,6 +313,76 @@ class TestDataSourceOperations(TestCase):
 
         self.assertEqual(result, {"value": 50.0})
 
+    def test_cross_source_data_operation_queries_subwidgets_concurrently(self):
+        delay = 0.2
+
+        def execute(**kwargs):
+            time.sleep(delay)
+            return {"value": 10 if kwargs["operation"] == "count" else 40}
+
+        self.source_query_mock.execute.side_effect = execute
+        self.widget_mock.config = {"operator": "percentage"}
+        self.widget_mock.source_config.side_effect = (
+            lambda sub_widget=None, is_live=False: (
+                {},
+                "count" if sub_widget == "subwidget_1" else "sum",
+                None,
+                None,
+                None,
+            )
+        )
+
+        started_at = time.perf_counter()
+        result = cross_source_data_operation(
+            source_query=self.source_query_mock, widget=self.widget_mock
+        )
+        elapsed = time.perf_counter() - started_at
+
+        self.assertEqual(result, {"value": 25.0})
+        self.assertEqual(self.source_query_mock.execute.call_count, 2)
+        # Close to the slowest subquery, not to their sum
+        self.assertLess(elapsed, delay * 1.75)
+
+    def test_cross_source_data_operations_share_memoized_subqueries(self):
+        self.widget_mock.config = {"operator": "sum"}
+        self.widget_mock.source_config.side_effect = (
+            lambda sub_widget=None, is_live=False: ({}, "count", None, None, None)
+        )
+        self.source_query_mock.execute.return_value = {"value": 5}
+        memo = SourceQueryMemo()
+
+        for _ in range(2):
+            result = cross_source_data_operation(
+                source_query=self.source_query_mock,
+                widget=self.widget_mock,
+                memo=memo,
+            )
+
+        self.assertEqual(result, {"value": 10})
+        self.source_query_mock.execute.assert_called_once()
+
+    def test_source_query_memo_executes_concurrent_identical_queries_once(self):
+        memo = SourceQueryMemo()
+        function = MagicMock(side_effect=lambda: time.sleep(0.1) or {"value": 1})
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(
+                executor.map(lambda _: memo.execute("key", function), range(4))
+            )
+
+        self.assertEqual(results, [{"value": 1}] * 4)
+        function.assert_called_once()
+
+    def test_source_query_memo_shares_errors(self):
+        memo = SourceQueryMemo()
+        function = MagicMock(side_effect=ValueError("failed"))
+
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                memo.execute("key", function)
+
+        function.assert_called_once()
+
     def test_simple_source_data_operation_slug_as_list(self):
         filters = {"slug": ["subwidget_list_case"]}
         self.widget_mock.source_config.return_value = (
@@ -39,7 +39,7 @@ class WidgetViewSet(
         return self.queryset.filter(
             Q(dashboard__project__in=project_auths)
             | Q(parent__dashboard__project__in=project_auths),
-        )
+        ).select_related("dashboard")
 
     def _update(self, widget, update_data, partial):
         serializer = self.get_serializer(widget, data=update_data, partial=partial)